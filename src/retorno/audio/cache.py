@@ -0,0 +1,155 @@
+"""On-disk cache for decoded audio and ffprobe metadata.
+
+Decoded PCM is stored as raw files named by a hash of (source path, mtime,
+size, sample rate, channels, format) and memory-mapped on load. Probe
+results live in one JSON index keyed by source path and checked against the
+file's mtime and size. Editing or replacing an asset changes its key, so
+stale entries are never served; they are just left behind.
+
+The cache sits under the save dir (`<save dir>/cache/audio`), or under
+`RETORNO_AUDIO_CACHE_DIR` if that is set. Set `RETORNO_AUDIO_CACHE=0` to
+disable it. Cache I/O errors are swallowed: the caller falls back to decoding.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+from pathlib import Path
+from typing import Callable
+
+_CACHE_VERSION = 1
+_PROBE_INDEX_FILENAME = "probe_index.json"
+
+ProbeResult = tuple[float | None, int | None, int | None]
+
+
+def default_audio_cache_dir() -> Path:
+    env_dir = os.environ.get("RETORNO_AUDIO_CACHE_DIR", "").strip()
+    if env_dir:
+        return Path(env_dir).expanduser()
+    from retorno.io.save_load import save_base_dir
+
+    return save_base_dir() / "cache" / "audio"
+
+
+def _source_stamp(path: Path) -> tuple[str, int, int] | None:
+    try:
+        resolved = path.resolve()
+        stat = resolved.stat()
+    except OSError:
+        return None
+    return str(resolved), stat.st_mtime_ns, stat.st_size
+
+
+class AudioCache:
+    def __init__(self, root: str | Path | None = None) -> None:
+        self.root = Path(root) if root is not None else default_audio_cache_dir()
+        self._probe_index: dict[str, dict] | None = None
+        self._probe_dirty = False
+
+    def pcm_path(self, source: Path, sample_rate: int, channels: int, fmt: str) -> Path | None:
+        stamp = _source_stamp(source)
+        if stamp is None:
+            return None
+        key = "|".join(str(part) for part in (_CACHE_VERSION, *stamp, sample_rate, channels, fmt))
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self.root / "pcm" / digest[:2] / f"{digest}.{fmt}"
+
+    def load_pcm(self, source: Path, sample_rate: int, channels: int, fmt: str) -> memoryview | None:
+        """Memory-mapped PCM bytes for `source`, or None on a miss."""
+        cache_path = self.pcm_path(source, sample_rate, channels, fmt)
+        if cache_path is None:
+            return None
+        try:
+            with cache_path.open("rb") as fh:
+                # The mapping stays valid after the file is closed.
+                mapped = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        return memoryview(mapped)
+
+    def store_pcm(self, source: Path, sample_rate: int, channels: int, fmt: str, data: bytes) -> None:
+        cache_path = self.pcm_path(source, sample_rate, channels, fmt)
+        if cache_path is None or not data:
+            return
+        _write_atomic(cache_path, data)
+
+    def decoded_pcm(
+        self, source: Path, sample_rate: int, channels: int, fmt: str, decode: Callable[[], bytes]
+    ) -> bytes | memoryview:
+        """Cached PCM for `source`, running `decode` and storing its output on a miss."""
+        cached = self.load_pcm(source, sample_rate, channels, fmt)
+        if cached is not None:
+            return cached
+        raw = decode()
+        self.store_pcm(source, sample_rate, channels, fmt, raw)
+        return raw
+
+    def probe(self, source: Path) -> ProbeResult | None:
+        stamp = _source_stamp(source)
+        if stamp is None:
+            return None
+        entry = self._probe_entries().get(stamp[0])
+        if not isinstance(entry, dict) or entry.get("stamp") != [stamp[1], stamp[2]]:
+            return None
+        result = entry.get("result")
+        if not isinstance(result, list) or len(result) != 3:
+            return None
+        return result[0], result[1], result[2]
+
+    def store_probe(self, source: Path, result: ProbeResult) -> None:
+        stamp = _source_stamp(source)
+        if stamp is None:
+            return
+        self._probe_entries()[stamp[0]] = {"stamp": [stamp[1], stamp[2]], "result": list(result)}
+        self._probe_dirty = True
+
+    def flush(self) -> None:
+        """Write the probe index if it changed since it was loaded."""
+        if not self._probe_dirty or self._probe_index is None:
+            return
+        payload = {"version": _CACHE_VERSION, "entries": self._probe_index}
+        if _write_atomic(self.root / _PROBE_INDEX_FILENAME, json.dumps(payload, sort_keys=True).encode("utf-8")):
+            self._probe_dirty = False
+
+    def _probe_entries(self) -> dict[str, dict]:
+        if self._probe_index is None:
+            self._probe_index = {}
+            try:
+                raw = json.loads((self.root / _PROBE_INDEX_FILENAME).read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                raw = None
+            if isinstance(raw, dict) and raw.get("version") == _CACHE_VERSION and isinstance(raw.get("entries"), dict):
+                self._probe_index = raw["entries"]
+        return self._probe_index
+
+
+def _write_atomic(path: Path, data: bytes) -> bool:
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        return False
+    return True
+
+
+_DEFAULT_CACHE: AudioCache | None = None
+
+
+def default_audio_cache() -> AudioCache | None:
+    """Process-wide cache, or None when disabled via RETORNO_AUDIO_CACHE=0."""
+    global _DEFAULT_CACHE
+    if os.environ.get("RETORNO_AUDIO_CACHE", "").strip().lower() in {"0", "false", "off", "no"}:
+        return None
+    if _DEFAULT_CACHE is None:
+        _DEFAULT_CACHE = AudioCache()
+    return _DEFAULT_CACHE
@@ -3,9 +3,11 @@ from __future__ import annotations
 import json
 import re
 import subprocess
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 
+from retorno.audio.cache import default_audio_cache
+
 
 _DATA_ROOT = Path(__file__).resolve().parents[3] / "data"
 _DEFAULT_AUDIO_CONFIG_PATH = _DATA_ROOT / "audio_config.json"
@@ -211,6 +213,7 @@ def load_audio_config(path: str | Path | None = None) -> AudioConfig:
             default_event_route = None
 
     music = _load_music_config(raw.get("music"), warnings)
+    flush_audio_probe_cache()
 
     return AudioConfig(
         version=version,
@@ -238,6 +241,18 @@ def _float_value(entry: dict, key: str, default: float) -> float:
 
 
 def _probe_audio_asset(path: Path) -> tuple[float | None, int | None, int | None]:
+    cache = default_audio_cache()
+    if cache is not None:
+        cached = cache.probe(path)
+        if cached is not None:
+            return cached
+    result = _run_ffprobe(path)
+    if cache is not None and result != (None, None, None):
+        cache.store_probe(path, result)
+    return result
+
+
+def _run_ffprobe(path: Path) -> tuple[float | None, int | None, int | None]:
     cmd = [
         "ffprobe",
         "-v",
@@ -327,14 +342,13 @@ def _scan_music_tracks(warnings: list[str]) -> tuple[AudioMusicTrack, ...]:
         if not path.is_file() or path.suffix.lower() not in _MUSIC_EXTENSIONS:
             continue
         try:
-            duration_s, _, _ = _probe_audio_asset(path)
+            # Durations are probed lazily (probe_music_track) when a listing first needs them.
             track_id = _unique_track_id(_slugify_track_id(path.stem), seen_ids)
             tracks.append(
                 AudioMusicTrack(
                     track_id=track_id,
                     title=path.stem,
                     path=path.resolve(),
-                    duration_s=duration_s,
                 )
             )
         except Exception as exc:
@@ -342,6 +356,19 @@ def _scan_music_tracks(warnings: list[str]) -> tuple[AudioMusicTrack, ...]:
     return tuple(tracks)
 
 
+def probe_music_track(track: AudioMusicTrack) -> AudioMusicTrack:
+    if track.duration_s is not None:
+        return track
+    duration_s, _, _ = _probe_audio_asset(track.path)
+    return replace(track, duration_s=duration_s)
+
+
+def flush_audio_probe_cache() -> None:
+    cache = default_audio_cache()
+    if cache is not None:
+        cache.flush()
+
+
 def _slugify_track_id(value: str) -> str:
     slug = re.sub(r"[^a-z0-9]+", "_", value.strip().lower()).strip("_")
     return slug or "track"
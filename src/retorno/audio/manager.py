@@ -6,12 +6,28 @@ import shutil
 import subprocess
 import threading
 import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass
 from typing import Iterable
 
-from retorno.audio.config import AudioConfig, AudioCueConfig, AudioMusicTrack
+from retorno.audio.cache import default_audio_cache
+from retorno.audio.config import (
+    AudioConfig,
+    AudioConfigError,
+    AudioCueConfig,
+    AudioMusicTrack,
+    flush_audio_probe_cache,
+    load_audio_config,
+    probe_music_track,
+)
 from retorno.model.events import Event, EventType, Severity
 
+try:  # Optional: the PCM block mixer falls back to `array` slicing without it.
+    import numpy as _np
+except ImportError:
+    _np = None
+
 
 @dataclass(slots=True)
 class _PlaybackHandle:
@@ -21,10 +37,13 @@ class _PlaybackHandle:
 
 @dataclass(slots=True)
 class _DecodedCue:
-    samples: array.array
+    # Interleaved float32 samples; a memoryview over the mmapped cache file when cached.
+    samples: array.array | memoryview
     frame_count: int
     sample_rate: int
     channels: int
+    # Zero-copy (frames, channels) float32 view over `samples`; NumPy mixer only.
+    frames: object | None = None
 
 
 @dataclass(slots=True)
@@ -243,10 +262,14 @@ class PygameMixerAudioBackend(_AudioBackend):
             str(self._SAMPLE_RATE),
             "pipe:1",
         ]
-        try:
-            raw = subprocess.check_output(command)
-        except subprocess.CalledProcessError as exc:
-            raise AudioPlaybackError(f"pygame decode failed for {cue.path.name}: {exc}") from exc
+
+        def _decode() -> bytes:
+            try:
+                return subprocess.check_output(command)
+            except subprocess.CalledProcessError as exc:
+                raise AudioPlaybackError(f"pygame decode failed for {cue.path.name}: {exc}") from exc
+
+        raw = _cached_pcm(cue.path, self._SAMPLE_RATE, self._CHANNELS, "s16le", _decode)
         if not raw:
             raise AudioPlaybackError(f"pygame decode returned no audio for {cue.path.name}")
         try:
@@ -255,6 +278,183 @@ class PygameMixerAudioBackend(_AudioBackend):
             raise AudioPlaybackError(f"pygame sound load failed for {cue.path.name}: {exc}") from exc
 
 
+def _cached_pcm(path, sample_rate: int, channels: int, fmt: str, decode) -> bytes | memoryview:
+    cache = default_audio_cache()
+    if cache is None:
+        return decode()
+    return cache.decoded_pcm(path, sample_rate, channels, fmt, decode)
+
+
+def _decoded_frames_view(samples: array.array | memoryview, frame_count: int, channels: int):
+    return _np.frombuffer(samples, dtype=_np.float32, count=frame_count * channels).reshape(frame_count, channels)
+
+
+class _PcmBlockMixer:
+    """Mixes active voices one chunk at a time.
+
+    Each voice is rendered in contiguous source segments (a loop wrap starts a
+    new one). Fades and the loop crossfade only touch the frames inside their
+    window, so the common case is a single scaled slice add per channel. Uses
+    NumPy when it is installed and `array`/list slicing otherwise.
+    """
+
+    def __init__(self, sample_rate: int, channels: int, chunk_frames: int, *, use_numpy: bool | None = None) -> None:
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.chunk_frames = chunk_frames
+        self.use_numpy = (_np is not None) if use_numpy is None else (bool(use_numpy) and _np is not None)
+
+    def mix(self, voices: Iterable[_Voice], channel_gains: dict[str, float]) -> tuple[memoryview, list[str]]:
+        """Render one chunk, advance each voice, and return (f32 payload, finished channels)."""
+        chunk_frames = self.chunk_frames
+        if self.use_numpy:
+            acc = _np.zeros((chunk_frames, self.channels), dtype=_np.float64)
+            add_segment = self._add_segment_numpy
+        else:
+            acc = [0.0] * (chunk_frames * self.channels)
+            add_segment = self._add_segment_list
+        finished: list[str] = []
+        for voice in voices:
+            cue = voice.cue
+            total_frames = voice.decoded.frame_count
+            fade_in_frames = max(0, int(round(cue.fade_in_s * self.sample_rate)))
+            base_gain = float(cue.volume) * float(channel_gains.get(voice.channel.split("#", 1)[0], 1.0))
+            if not voice.loop:
+                fade_out_frames = max(0, int(round(cue.fade_out_s * self.sample_rate)))
+                count = max(0, min(chunk_frames, total_frames - voice.position_frames))
+                if count:
+                    add_segment(
+                        acc, voice.decoded, 0, voice.position_frames, count,
+                        base_gain, fade_in_frames, voice.position_frames, fade_out_frames, 0,
+                    )
+                voice.position_frames += count
+                voice.played_frames_total += count
+                if count < chunk_frames or voice.position_frames >= total_frames:
+                    finished.append(voice.channel)
+                continue
+            crossfade_frames = max(0, int(round(cue.loop_crossfade_s * self.sample_rate)))
+            if total_frames > 1:
+                crossfade_frames = min(crossfade_frames, max(0, total_frames // 2))
+            else:
+                crossfade_frames = 0
+            out_frame = 0
+            while out_frame < chunk_frames:
+                count = min(chunk_frames - out_frame, total_frames - voice.position_frames)
+                add_segment(
+                    acc, voice.decoded, out_frame, voice.position_frames, count,
+                    base_gain, fade_in_frames, voice.played_frames_total + out_frame, 0, crossfade_frames,
+                )
+                out_frame += count
+                voice.position_frames += count
+                if voice.position_frames >= total_frames:
+                    voice.position_frames = crossfade_frames
+            voice.played_frames_total += chunk_frames
+        if self.use_numpy:
+            _np.clip(acc, -1.0, 1.0, out=acc)
+            return memoryview(acc.astype(_np.float32).reshape(-1)).cast("B"), finished
+        clipped = [1.0 if sample > 1.0 else (-1.0 if sample < -1.0 else sample) for sample in acc]
+        return memoryview(array.array("f", clipped)).cast("B"), finished
+
+    @staticmethod
+    def _segment_gains(
+        count: int,
+        base_gain: float,
+        fade_in_frames: int,
+        age_start: int,
+        src_start: int,
+        total_frames: int,
+        fade_out_frames: int,
+    ) -> list[float] | None:
+        """Per-frame gains for a segment, or None when the whole segment sits at `base_gain`."""
+        fade_in_count = min(count, fade_in_frames - age_start) if fade_in_frames > 0 else 0
+        fade_out_first = count
+        if fade_out_frames > 0:
+            fade_out_first = max(0, max(0, total_frames - fade_out_frames) - src_start)
+        if fade_in_count <= 0 and fade_out_first >= count:
+            return None
+        gains = [base_gain] * count
+        for idx in range(max(0, fade_in_count)):
+            gains[idx] *= (age_start + idx) / fade_in_frames
+        for idx in range(fade_out_first, count):
+            gains[idx] *= max(0.0, (total_frames - (src_start + idx)) / fade_out_frames)
+        return gains
+
+    def _add_segment_list(
+        self,
+        acc: list[float],
+        decoded: _DecodedCue,
+        out_frame: int,
+        src_start: int,
+        count: int,
+        base_gain: float,
+        fade_in_frames: int,
+        age_start: int,
+        fade_out_frames: int,
+        crossfade_frames: int,
+    ) -> None:
+        channels = self.channels
+        samples = decoded.samples
+        total_frames = decoded.frame_count
+        gains = self._segment_gains(
+            count, base_gain, fade_in_frames, age_start, src_start, total_frames, fade_out_frames
+        )
+        crossfade_first = count
+        if crossfade_frames > 0:
+            crossfade_first = max(0, total_frames - crossfade_frames - src_start)
+        for ch in range(channels):
+            src = samples[src_start * channels + ch:(src_start + count) * channels:channels]
+            if crossfade_first < count:
+                src = src.tolist()
+                wrap_origin = total_frames - crossfade_frames
+                for idx in range(crossfade_first, count):
+                    crossfade_idx = src_start + idx - wrap_origin
+                    progress = (crossfade_idx + 1) / (crossfade_frames + 1)
+                    wrap = min(crossfade_idx, total_frames - 1) * channels + ch
+                    src[idx] = (src[idx] * (1.0 - progress)) + (samples[wrap] * progress)
+            dst = slice(out_frame * channels + ch, (out_frame + count) * channels, channels)
+            if gains is None:
+                acc[dst] = [mixed + sample * base_gain for mixed, sample in zip(acc[dst], src)]
+            else:
+                acc[dst] = [mixed + sample * gain for mixed, sample, gain in zip(acc[dst], src, gains)]
+
+    def _add_segment_numpy(
+        self,
+        acc,
+        decoded: _DecodedCue,
+        out_frame: int,
+        src_start: int,
+        count: int,
+        base_gain: float,
+        fade_in_frames: int,
+        age_start: int,
+        fade_out_frames: int,
+        crossfade_frames: int,
+    ) -> None:
+        frames = decoded.frames
+        if frames is None:
+            frames = decoded.frames = _decoded_frames_view(decoded.samples, decoded.frame_count, self.channels)
+        total_frames = decoded.frame_count
+        block = frames[src_start:src_start + count].astype(_np.float64)
+        if crossfade_frames > 0:
+            wrap_origin = total_frames - crossfade_frames
+            first = max(0, wrap_origin - src_start)
+            if first < count:
+                crossfade_idx = _np.arange(src_start + first - wrap_origin, src_start + count - wrap_origin)
+                progress = ((crossfade_idx + 1) / (crossfade_frames + 1))[:, None]
+                wrap = _np.minimum(crossfade_idx, total_frames - 1)
+                block[first:] = (block[first:] * (1.0 - progress)) + (frames[wrap] * progress)
+        gains = _np.full(count, base_gain, dtype=_np.float64)
+        if fade_in_frames > 0 and age_start < fade_in_frames:
+            n = min(count, fade_in_frames - age_start)
+            gains[:n] *= _np.arange(age_start, age_start + n) / fade_in_frames
+        if fade_out_frames > 0:
+            first = max(0, max(0, total_frames - fade_out_frames) - src_start)
+            if first < count:
+                remaining = total_frames - _np.arange(src_start + first, src_start + count)
+                gains[first:] *= _np.maximum(0.0, remaining / fade_out_frames)
+        acc[out_frame:out_frame + count] += block * gains[:, None]
+
+
 class PcmMixerAudioBackend(_AudioBackend):
     _OUTPUT_SAMPLE_RATE = 44100
     _OUTPUT_CHANNELS = 2
@@ -274,6 +474,7 @@ class PcmMixerAudioBackend(_AudioBackend):
         self._channel_gains: dict[str, float] = {}
         self._ephemeral_seq = 0
         self._notice: str | None = None
+        self._mixer = _PcmBlockMixer(self._OUTPUT_SAMPLE_RATE, self._OUTPUT_CHANNELS, self._CHUNK_FRAMES)
         self._ensure_process()
 
     def play(self, cue: AudioCueConfig) -> None:
@@ -464,12 +665,15 @@ class PcmMixerAudioBackend(_AudioBackend):
             str(self._OUTPUT_SAMPLE_RATE),
             "pipe:1",
         ]
-        try:
-            raw = subprocess.check_output(command)
-        except subprocess.CalledProcessError as exc:
-            raise AudioPlaybackError(f"decode failed for {cue.path.name}: {exc}") from exc
-        samples = array.array("f")
-        samples.frombytes(raw)
+
+        def _decode() -> bytes:
+            try:
+                return subprocess.check_output(command)
+            except subprocess.CalledProcessError as exc:
+                raise AudioPlaybackError(f"decode failed for {cue.path.name}: {exc}") from exc
+
+        raw = memoryview(_cached_pcm(cue.path, self._OUTPUT_SAMPLE_RATE, self._OUTPUT_CHANNELS, "f32le", _decode))
+        samples = raw[: len(raw) - len(raw) % 4].cast("f")
         frame_count = len(samples) // self._OUTPUT_CHANNELS
         if frame_count <= 0:
             raise AudioPlaybackError(f"decode returned no audio frames for {cue.path.name}")
@@ -478,10 +682,10 @@ class PcmMixerAudioBackend(_AudioBackend):
             frame_count=frame_count,
             sample_rate=self._OUTPUT_SAMPLE_RATE,
             channels=self._OUTPUT_CHANNELS,
+            frames=_decoded_frames_view(samples, frame_count, self._OUTPUT_CHANNELS) if _np is not None else None,
         )
 
     def _mix_loop(self) -> None:
-        chunk_len = self._CHUNK_FRAMES * self._OUTPUT_CHANNELS
         while not self._stop.is_set():
             process = self._process
             if process is None or process.stdin is None:
@@ -496,80 +700,11 @@ class PcmMixerAudioBackend(_AudioBackend):
             with self._lock:
                 voices = list(self._voices.values())
                 channel_gains = dict(self._channel_gains)
-            mixed = [0.0] * chunk_len
-            finished_channels: list[str] = []
-            for voice in voices:
-                fade_in_frames = max(0, int(round(voice.cue.fade_in_s * self._OUTPUT_SAMPLE_RATE)))
-                fade_out_frames = max(0, int(round(voice.cue.fade_out_s * self._OUTPUT_SAMPLE_RATE)))
-                total_frames = voice.decoded.frame_count
-                loop_crossfade_frames = 0
-                if voice.loop:
-                    loop_crossfade_frames = max(
-                        0, int(round(voice.cue.loop_crossfade_s * self._OUTPUT_SAMPLE_RATE))
-                    )
-                    if total_frames > 1:
-                        loop_crossfade_frames = min(loop_crossfade_frames, max(0, total_frames // 2))
-                    else:
-                        loop_crossfade_frames = 0
-                rendered_frames = 0
-                for frame_idx in range(self._CHUNK_FRAMES):
-                    if voice.loop:
-                        src_frame = voice.position_frames
-                    else:
-                        src_frame = voice.position_frames + frame_idx
-                        if src_frame >= total_frames:
-                            finished_channels.append(voice.channel)
-                            break
-                    gain = 1.0
-                    gain *= float(voice.cue.volume)
-                    gain *= float(channel_gains.get(voice.channel.split("#", 1)[0], 1.0))
-                    if fade_in_frames > 0:
-                        if voice.loop:
-                            age_frame = voice.played_frames_total + frame_idx
-                            if age_frame < fade_in_frames:
-                                gain *= age_frame / fade_in_frames
-                        elif src_frame < fade_in_frames:
-                            gain *= src_frame / fade_in_frames
-                    if not voice.loop and fade_out_frames > 0 and src_frame >= max(0, total_frames - fade_out_frames):
-                        remaining = total_frames - src_frame
-                        gain *= max(0.0, remaining / fade_out_frames)
-                    base = src_frame * self._OUTPUT_CHANNELS
-                    out = frame_idx * self._OUTPUT_CHANNELS
-                    left = voice.decoded.samples[base]
-                    right = voice.decoded.samples[base + 1]
-                    if voice.loop and loop_crossfade_frames > 0 and src_frame >= (total_frames - loop_crossfade_frames):
-                        crossfade_idx = src_frame - (total_frames - loop_crossfade_frames)
-                        crossfade_progress = (crossfade_idx + 1) / (loop_crossfade_frames + 1)
-                        wrap_frame = min(crossfade_idx, total_frames - 1)
-                        wrap_base = wrap_frame * self._OUTPUT_CHANNELS
-                        left = (left * (1.0 - crossfade_progress)) + (
-                            voice.decoded.samples[wrap_base] * crossfade_progress
-                        )
-                        right = (right * (1.0 - crossfade_progress)) + (
-                            voice.decoded.samples[wrap_base + 1] * crossfade_progress
-                        )
-                    mixed[out] += left * gain
-                    mixed[out + 1] += right * gain
-                    rendered_frames += 1
-                    if voice.loop:
-                        voice.position_frames += 1
-                        if voice.position_frames >= total_frames:
-                            voice.position_frames = loop_crossfade_frames
-                if not voice.loop:
-                    voice.position_frames += rendered_frames
-                voice.played_frames_total += rendered_frames
-                if not voice.loop and voice.position_frames >= total_frames:
-                    finished_channels.append(voice.channel)
+            payload, finished_channels = self._mixer.mix(voices, channel_gains)
             if finished_channels:
                 with self._lock:
                     for channel in finished_channels:
                         self._voices.pop(channel, None)
-            for idx, sample in enumerate(mixed):
-                if sample > 1.0:
-                    mixed[idx] = 1.0
-                elif sample < -1.0:
-                    mixed[idx] = -1.0
-            payload = array.array("f", mixed).tobytes()
             try:
                 process.stdin.write(payload)
             except Exception as exc:
@@ -827,6 +962,7 @@ class AudioManager:
         self._event_last_played: dict[str, float] = {}
         self._music_lock = threading.Lock()
         self._music_tracks = {track.track_id: track for track in self.config.music.tracks}
+        self._music_probed: set[str] = set()
         self._music_volume = float(self.config.music.default_volume)
         self._music_track_id: str | None = None
         self._ambient_ducked = False
@@ -910,12 +1046,28 @@ class AudioManager:
         self._apply_music_channel_gain()
 
     def list_music_tracks(self) -> tuple[AudioMusicTrack, ...]:
-        return self.config.music.tracks
+        """Tracks with metadata; durations are probed on the first listing."""
+        probed = [self._probed_music_track(track_id) for track_id in list(self._music_tracks)]
+        flush_audio_probe_cache()
+        return tuple(track for track in probed if track is not None)
+
+    def music_track_ids(self) -> tuple[str, ...]:
+        return tuple(self._music_tracks)
+
+    def _probed_music_track(self, track_id: str) -> AudioMusicTrack | None:
+        track = self._music_tracks.get(track_id)
+        if track is None or track_id in self._music_probed:
+            return track
+        track = probe_music_track(track)
+        with self._music_lock:
+            self._music_tracks[track_id] = track
+            self._music_probed.add(track_id)
+        return track
 
     def play_music(self, audio_enabled: bool, track_id: str) -> AudioMusicTrack | None:
         if not audio_enabled:
             return None
-        track = self._music_tracks.get(track_id)
+        track = self._probed_music_track(track_id)
         if track is None:
             return None
         self._apply_music_channel_gain()
@@ -1091,3 +1243,208 @@ class AudioManager:
                 if not is_playing:
                     self._music_track_id = None
             self._refresh_ambient_ducking()
+
+
+class DeferredAudioManager:
+    """AudioManager stand-in that loads config, backend and preloads on a worker thread.
+
+    The UI constructs it without blocking; `ready` resolves to the built
+    AudioManager (or None when the config cannot be loaded). Calls made before
+    then follow one policy:
+
+    - preference calls (`prepare_session`, `start`, `apply_preferences`,
+      `apply_music_preferences`) are recorded, last call of each kind wins, and
+      replayed in call order on the worker once the manager exists;
+    - `play_startup` is replayed only if audio becomes ready within
+      `STARTUP_REPLAY_WINDOW_S` of the call;
+    - event cues are queued (at most `PENDING_EVENT_LIMIT`, oldest dropped) and
+      replayed only if younger than `PENDING_EVENT_MAX_AGE_S`;
+    - music commands and `backend` wait up to `READY_WAIT_S` for the manager.
+    """
+
+    STARTUP_REPLAY_WINDOW_S = 3.0
+    PENDING_EVENT_LIMIT = 8
+    PENDING_EVENT_MAX_AGE_S = 1.0
+    READY_WAIT_S = 2.0
+
+    def __init__(
+        self,
+        config_loader=load_audio_config,
+        backend_factory=None,
+    ) -> None:
+        self.ready: Future[AudioManager | None] = Future()
+        self._config_loader = config_loader
+        self._backend_factory = backend_factory
+        self._lock = threading.Lock()
+        self._manager: AudioManager | None = None
+        self._pending: list[tuple[str, float, tuple]] = []
+        self._notice: str | None = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._build, name="audio-init", daemon=True)
+        self._thread.start()
+
+    @property
+    def disabled(self) -> bool:
+        return self.ready.done() and self._manager is None
+
+    @property
+    def notice(self) -> str | None:
+        manager = self._manager
+        if manager is not None:
+            return manager.notice
+        return self._notice
+
+    @property
+    def backend(self) -> _AudioBackend:
+        manager = self.wait_ready(self.READY_WAIT_S)
+        if manager is not None:
+            return manager.backend
+        return NullAudioBackend("audio disabled" if self.ready.done() else "audio still initializing")
+
+    def wait_ready(self, timeout: float | None = None) -> AudioManager | None:
+        try:
+            self.ready.result(timeout=timeout)
+        except FutureTimeoutError:
+            return None
+        except Exception:
+            # The failure stays on `ready` for callers that want it; audio just stays off.
+            return None
+        return self._manager
+
+    def prepare_session(
+        self,
+        audio_enabled: bool,
+        ambient_enabled: bool,
+        startup_context: str | None = None,
+        music_volume: float | None = None,
+    ) -> None:
+        self._call_or_record("prepare_session", (audio_enabled, ambient_enabled, startup_context, music_volume))
+
+    def start(self, audio_enabled: bool, ambient_enabled: bool, music_volume: float | None = None) -> None:
+        self._call_or_record("start", (audio_enabled, ambient_enabled, music_volume))
+
+    def apply_preferences(self, audio_enabled: bool, ambient_enabled: bool) -> None:
+        self._call_or_record("apply_preferences", (audio_enabled, ambient_enabled))
+
+    def apply_music_preferences(self, music_volume: float | None) -> None:
+        self._call_or_record("apply_music_preferences", (music_volume,))
+
+    def play_startup(self, audio_enabled: bool, startup_context: str | None = None) -> None:
+        self._call_or_record("play_startup", (audio_enabled, startup_context))
+
+    def handle_event_batch(self, audio_enabled: bool, events: Iterable[Event | tuple[str, Event]]) -> None:
+        if not audio_enabled:
+            return
+        self._call_or_record("handle_event_batch", (audio_enabled, list(events)))
+
+    def play_event(
+        self,
+        audio_enabled: bool,
+        event_type: EventType | str,
+        severity: Severity | str | None = None,
+    ) -> None:
+        if not audio_enabled:
+            return
+        self._call_or_record("play_event", (audio_enabled, event_type, severity))
+
+    def list_music_tracks(self) -> tuple[AudioMusicTrack, ...]:
+        manager = self.wait_ready(self.READY_WAIT_S)
+        return manager.list_music_tracks() if manager is not None else ()
+
+    def music_track_ids(self) -> tuple[str, ...]:
+        # Completion must never block; before ready there is nothing to offer.
+        manager = self._manager
+        return manager.music_track_ids() if manager is not None else ()
+
+    def play_music(self, audio_enabled: bool, track_id: str) -> AudioMusicTrack | None:
+        manager = self.wait_ready(self.READY_WAIT_S)
+        return manager.play_music(audio_enabled, track_id) if manager is not None else None
+
+    def stop_music(self) -> None:
+        manager = self.wait_ready(self.READY_WAIT_S)
+        if manager is not None:
+            manager.stop_music()
+
+    def music_status(self) -> AudioMusicStatus:
+        manager = self.wait_ready(self.READY_WAIT_S)
+        if manager is not None:
+            return manager.music_status()
+        return AudioMusicStatus(track_id=None, title=None, is_playing=False, volume=0.0, ambient_ducked=False)
+
+    def consume_notice(self) -> str | None:
+        with self._lock:
+            notice = self._notice
+            self._notice = None
+            manager = self._manager
+        manager_notice = manager.consume_notice() if manager is not None else None
+        if notice and manager_notice:
+            return f"{notice}; {manager_notice}"
+        return notice or manager_notice
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._closed = True
+            self._pending.clear()
+            manager = self._manager
+        if manager is not None:
+            manager.shutdown()
+
+    def _call_or_record(self, name: str, args: tuple) -> None:
+        with self._lock:
+            manager = self._manager
+            if manager is None:
+                if self._closed or self.ready.done():
+                    return
+                self._record(name, args)
+                return
+        getattr(manager, name)(*args)
+
+    def _record(self, name: str, args: tuple) -> None:
+        now = time.monotonic()
+        if name in {"handle_event_batch", "play_event"}:
+            self._pending.append((name, now, args))
+            event_ops = [op for op in self._pending if op[0] in {"handle_event_batch", "play_event"}]
+            if len(event_ops) > self.PENDING_EVENT_LIMIT:
+                self._pending.remove(event_ops[0])
+            return
+        self._pending = [op for op in self._pending if op[0] != name]
+        self._pending.append((name, now, args))
+
+    def _replayable(self, name: str, recorded_at: float, now: float) -> bool:
+        if name == "play_startup":
+            return now - recorded_at <= self.STARTUP_REPLAY_WINDOW_S
+        if name in {"handle_event_batch", "play_event"}:
+            return now - recorded_at <= self.PENDING_EVENT_MAX_AGE_S
+        return True
+
+    def _build(self) -> None:
+        try:
+            config = self._config_loader()
+            backend = self._backend_factory(config) if self._backend_factory is not None else None
+            manager = AudioManager(config, backend=backend)
+        except (AudioConfigError, AudioPlaybackError, OSError) as exc:
+            with self._lock:
+                self._notice = f"[WARN] Audio disabled: {exc}"
+                self._pending.clear()
+            self.ready.set_result(None)
+            return
+        except Exception as exc:
+            self.ready.set_exception(exc)
+            return
+        while True:
+            with self._lock:
+                if self._closed:
+                    break
+                pending, self._pending = self._pending, []
+                if not pending:
+                    self._manager = manager
+                    break
+            now = time.monotonic()
+            for name, recorded_at, args in pending:
+                if self._replayable(name, recorded_at, now):
+                    getattr(manager, name)(*args)
+        if self._closed:
+            manager.shutdown()
+            self.ready.set_result(None)
+            return
+        self.ready.set_result(manager)
@@ -4,7 +4,7 @@ from retorno.core.gamestate import GameState
 from retorno.model.drones import DroneLocation, DroneState, DroneStatus
 from retorno.model.events import AlertState, Event, EventType, Severity, SourceRef
 from retorno.model.ship import PowerNetworkState
-from retorno.model.os import AccessLevel, FSNode, FSNodeType, Locale, normalize_path, register_mail, _normalize_access
+from retorno.model.os import LayeredFS, Locale, fs_base_id, normalize_path, register_mail
 from retorno.model.ship_layout import apply_retorno_canonical_layout, build_retorno_ship_sectors
 from retorno.model.systems import Dependency, ServiceState, ShipSystem, SystemState
 from retorno.model.world import SpaceNode, add_known_link, is_hop_within_cap, region_for_pos, sector_id_for_pos
@@ -13,7 +13,6 @@ from retorno.runtime.data_loader import load_modules, load_locations
 from retorno.config.balance import Balance
 import random
 import hashlib
-from pathlib import Path
 
 
 def create_initial_state_prologue() -> GameState:
@@ -291,9 +290,6 @@ def _bootstrap_locations(state: GameState, rng: random.Random, module_ids: list[
             return []
         return [rng.choice(candidates) for _ in range(count)]
 
-    def _access_level(value: str) -> AccessLevel:
-        return _normalize_access(value)
-
     def _roll_recoverable_drones(
         *,
         node_id: str,
@@ -369,8 +365,8 @@ def _bootstrap_locations(state: GameState, rng: random.Random, module_ids: list[
             state.world.known_contacts.add(node_id)
             state.world.known_nodes.add(node_id)
 
-        # Optional filesystem files (mails/logs) attached to location data.
-        # Only load files that belong to the player ship location at bootstrap.
+        # Mail/logs of the player ship location are served by the fs base layer
+        # (see `_bootstrap_os`); only their arrival is recorded here.
         if node_cfg.get("node_id") != state.ship.ship_id:
             continue
         fs_files = loc.get("fs_files", [])
@@ -378,11 +374,7 @@ def _bootstrap_locations(state: GameState, rng: random.Random, module_ids: list[
             path = file_cfg.get("path")
             if not path:
                 continue
-            content = file_cfg.get("content", "")
-            access = _access_level(file_cfg.get("access", "GUEST"))
-            norm = normalize_path(path)
-            state.os.fs[norm] = FSNode(path=norm, node_type=FSNodeType.FILE, content=content, access=access)
-            register_mail(state.os, norm, state.clock.t)
+            register_mail(state.os, normalize_path(path), state.clock.t)
 
 
 def _bootstrap_alerts(state: GameState) -> None:
@@ -421,58 +413,8 @@ def _bootstrap_alerts(state: GameState) -> None:
 
 
 def _bootstrap_os(state: GameState) -> None:
-    fs = state.os.fs
     state.os.auth_levels = {"GUEST"}
     state.os.locale = Locale.EN
-
-    manuals_root = Path(__file__).resolve().parents[2] / "data" / "manuals"
-
-    def add_dir(path: str, access: AccessLevel = AccessLevel.GUEST) -> None:
-        norm = normalize_path(path)
-        fs[norm] = FSNode(path=norm, node_type=FSNodeType.DIR, access=access)
-
-    def add_file(path: str, content: str, access: AccessLevel = AccessLevel.GUEST) -> None:
-        norm = normalize_path(path)
-        fs[norm] = FSNode(path=norm, node_type=FSNodeType.FILE, content=content, access=access)
-
-    def _load_manuals_from_disk() -> None:
-        if not manuals_root.exists():
-            return
-        for path in manuals_root.rglob("*.txt"):
-            if not path.is_file():
-                continue
-            rel = path.relative_to(manuals_root).as_posix()
-            vpath = normalize_path(f"/manuals/{rel}")
-            parent = normalize_path(str(Path(vpath).parent))
-            if parent not in fs:
-                add_dir(parent)
-            try:
-                content = path.read_text(encoding="utf-8")
-            except Exception:
-                content = ""
-            fs[vpath] = FSNode(
-                path=vpath,
-                node_type=FSNodeType.FILE,
-                content=content,
-                access=AccessLevel.GUEST,
-            )
-
-    add_dir("/")
-    add_dir("/manuals")
-    add_dir("/manuals/commands")
-    add_dir("/manuals/concepts")
-    add_dir("/manuals/systems")
-    add_dir("/manuals/alerts")
-    add_dir("/manuals/modules")
-    add_dir("/mail")
-    add_dir("/mail/inbox")
-    add_dir("/data")
-    add_dir("/data/nav")
-    add_dir("/data/nav/fragments")
-    add_dir("/logs", access=AccessLevel.ENG)
-    add_dir("/logs/nav", access=AccessLevel.ENG)
-    add_dir("/logs/medical", access=AccessLevel.MED)
-
-    _load_manuals_from_disk()
-
-    # Location-specific mails/logs are loaded from data/locations/*.json
+    # Standard dirs, manuals and the ship location's mail/logs come from data/
+    # on demand and stay out of the save.
+    state.os.fs = LayeredFS.from_entries(state.os.fs, fs_base_id(state.ship.ship_id))
@@ -60,7 +60,8 @@ _PARSE_ERROR_MESSAGES = {
         "debug_seed_int": "debug seed: <n> must be an integer",
         "debug_add_amount_int": "debug add: amount must be an integer",
         "debug_add_amount_gt0": "debug add: amount must be > 0",
-        "usage_debug": "Usage: debug on|off|status | debug scenario prologue|sandbox|dev | debug seed <n> | debug arcs | debug lore | debug deadnodes | debug modules | debug galaxy | debug galaxy map <sector|local|regional|global> | debug worldgen sector <sector_id> | debug graph all | debug add scrap <amount> | debug add module <module_id> [count] | debug add drone[s] [count]",
+        "debug_pregen_radius_int": "debug worldgen pregen: <radius> must be an integer >= 0",
+        "usage_debug": "Usage: debug on|off|status | debug scenario prologue|sandbox|dev | debug seed <n> | debug arcs | debug lore | debug deadnodes | debug modules | debug galaxy | debug galaxy map <sector|local|regional|global> | debug worldgen sector <sector_id> | debug worldgen pregen <radius> | debug graph all | debug add scrap <amount> | debug add module <module_id> [count] | debug add drone[s] [count]",
         "usage_dock": "Usage: dock <node_id>",
         "usage_undock": "Usage: undock",
         "usage_nav": "Usage: nav map sectors|graph [node_id]|path <node_id>|routes|contacts [sector]|galaxy [sector|local|regional|global] | nav <node_id> | nav --no-cruise <node_id> | nav abort",
@@ -83,7 +84,7 @@ _PARSE_ERROR_MESSAGES = {
         "usage_config": "Usage: config set lang <en|es> | config set verbose <on|off> | config set audio <on|off> | config set ambientsound <on|off> | config set theme <linux|amber|green|ice> | config show",
         "usage_mail": "Usage: mail inbox | mail read <id|latest>",
         "usage_mail_read": "Usage: mail read <id|latest>",
-        "usage_intel": "Usage: intel | intel <amount> | intel all | intel show <intel_id> | intel import <path> | intel export <path>",
+        "usage_intel": "Usage: intel | intel <amount> | intel all | intel to <node_id> | intel source <source_kind> | intel show <intel_id> | intel import <path> | intel export <path>",
         "usage_module": "Usage: module inspect <module_id> | modules",
         "usage_auth": "Usage: auth status | auth recover <level>",
         "intel_amount_gt0": "intel: amount must be > 0",
@@ -147,7 +148,8 @@ _PARSE_ERROR_MESSAGES = {
         "debug_seed_int": "debug seed: <n> debe ser entero",
         "debug_add_amount_int": "debug add: amount debe ser entero",
         "debug_add_amount_gt0": "debug add: amount debe ser > 0",
-        "usage_debug": "Uso: debug on|off|status | debug scenario prologue|sandbox|dev | debug seed <n> | debug arcs | debug lore | debug deadnodes | debug modules | debug galaxy | debug galaxy map <sector|local|regional|global> | debug worldgen sector <sector_id> | debug graph all | debug add scrap <amount> | debug add module <module_id> [count] | debug add drone[s] [count]",
+        "debug_pregen_radius_int": "debug worldgen pregen: <radius> debe ser entero >= 0",
+        "usage_debug": "Uso: debug on|off|status | debug scenario prologue|sandbox|dev | debug seed <n> | debug arcs | debug lore | debug deadnodes | debug modules | debug galaxy | debug galaxy map <sector|local|regional|global> | debug worldgen sector <sector_id> | debug worldgen pregen <radius> | debug graph all | debug add scrap <amount> | debug add module <module_id> [count] | debug add drone[s] [count]",
         "usage_dock": "Uso: dock <node_id>",
         "usage_undock": "Uso: undock",
         "usage_nav": "Uso: nav map sectors|graph [node_id]|path <node_id>|routes|contacts [sector]|galaxy [sector|local|regional|global] | nav <node_id> | nav --no-cruise <node_id> | nav abort",
@@ -170,7 +172,7 @@ _PARSE_ERROR_MESSAGES = {
         "usage_config": "Uso: config set lang <en|es> | config set verbose <on|off> | config set audio <on|off> | config set ambientsound <on|off> | config set theme <linux|amber|green|ice> | config show",
         "usage_mail": "Uso: mail inbox | mail read <id|latest>",
         "usage_mail_read": "Uso: mail read <id|latest>",
-        "usage_intel": "Uso: intel | intel <amount> | intel all | intel show <intel_id> | intel import <path> | intel export <path>",
+        "usage_intel": "Uso: intel | intel <amount> | intel all | intel to <node_id> | intel source <source_kind> | intel show <intel_id> | intel import <path> | intel export <path>",
         "usage_module": "Uso: module inspect <module_id> | modules",
         "usage_auth": "Uso: auth status | auth recover <level>",
         "intel_amount_gt0": "intel: amount debe ser > 0",
@@ -457,6 +459,14 @@ def parse_command(line: str):
             return ("DEBUG_GALAXY_MAP", args[2])
         if len(args) == 3 and args[0] == "worldgen" and args[1] == "sector":
             return ("DEBUG_WORLDGEN_SECTOR", args[2])
+        if len(args) == 3 and args[0] == "worldgen" and args[1] == "pregen":
+            try:
+                radius = int(args[2])
+            except ValueError as e:
+                raise ParseError("debug_pregen_radius_int") from e
+            if radius < 0:
+                raise ParseError("debug_pregen_radius_int")
+            return ("DEBUG_WORLDGEN_PREGEN", radius)
         if len(args) == 2 and args[0] == "graph" and args[1] == "all":
             return ("DEBUG_GRAPH_ALL", None)
         if len(args) != 1 or args[0] not in {"on", "off", "status"}:
@@ -587,6 +597,11 @@ def parse_command(line: str):
             if amount <= 0:
                 raise ParseError("intel_amount_gt0")
             return ("INTEL_LIST", amount)
+        if len(args) in {2, 4} and args[0] in {"to", "source"}:
+            filters = dict(zip(args[0::2], args[1::2]))
+            if len(filters) != len(args) // 2 or not set(filters) <= {"to", "source"}:
+                raise ParseError("usage_intel")
+            return ("INTEL_FILTER", filters.get("to"), filters.get("source"))
         if len(args) == 2 and args[0] == "import":
             return ("INTEL_IMPORT", args[1])
         if len(args) == 2 and args[0] == "show":
@@ -16,8 +16,7 @@ import time
 import tty
 from pathlib import Path
 from retorno.bootstrap import create_initial_state_prologue, create_initial_state_sandbox
-from retorno.audio.config import AudioConfigError, load_audio_config
-from retorno.audio.manager import AudioManager
+from retorno.audio.manager import AudioManager, DeferredAudioManager
 from retorno.core.engine import Engine
 from retorno.core.lore import (
     build_lore_context,
@@ -39,8 +38,9 @@ from retorno.runtime.operator_config import (
     resolve_help_verbose,
 )
 from retorno.core.power_policy import is_parsed_command_allowed_in_core_os_critical
+from retorno.core.versions import bump_versions, memoize_on_versions
 from retorno.model.events import Event, EventType, Severity, SourceRef
-from retorno.model.jobs import JobStatus, JobType, active_job_display_ids
+from retorno.model.jobs import JobStatus, JobType, active_job_display_ids, history_jobs
 from retorno.model.ship_layout import (
     canonical_ship_sector_id,
     drone_bay_sector_id_for_ship,
@@ -84,7 +84,14 @@ from retorno.model.world import (
     sector_id_for_pos,
 )
 from retorno.model.world import SpaceNode, region_for_pos
-from retorno.worldgen.generator import ensure_sector_generated, procedural_radiation_for_node, sync_sector_state_for_node
+from retorno.worldgen.generator import (
+    ensure_sector_generated,
+    pregen_sector_order,
+    pregenerate_sectors,
+    procedural_radiation_for_node,
+    sector_cluster_stats,
+    sync_sector_state_for_node,
+)
 from retorno.util.timefmt import format_elapsed_long, format_elapsed_short
 
 
@@ -330,6 +337,8 @@ def print_help(locale: str = "en", verbose: bool = False) -> None:
                 ("intel", "list latest intel", "lista intel reciente"),
                 ("intel <amount>", "list N latest intel entries", "lista N entradas de intel"),
                 ("intel all", "list all intel entries", "lista toda la intel"),
+                ("intel to <node_id>", "list intel pointing at a node", "lista la intel que apunta a un nodo"),
+                ("intel source <source_kind>", "list intel from one source kind", "lista la intel de un tipo de origen"),
                 ("intel show <intel_id>", "show one intel entry", "muestra una entrada de intel"),
                 ("intel import <path>", "import intel from file", "importa intel desde archivo"),
                 ("intel export <path>", "export intel to file", "exporta intel a archivo"),
@@ -471,6 +480,7 @@ def print_help(locale: str = "en", verbose: bool = False) -> None:
                 ("debug galaxy", "show worldgen and galaxy summary", "muestra resumen de galaxia y worldgen"),
                 ("debug galaxy map <sector|local|regional|global>", "show debug galaxy map", "muestra mapa galáctico debug"),
                 ("debug worldgen sector <sector_id>", "dump one materialized/generated sector", "vuelca un sector materializado/generado"),
+                ("debug worldgen pregen <radius>", "generate all sectors around the ship ahead of time", "genera por adelantado los sectores alrededor de la nave"),
                 ("debug graph all", "dump full materialized graph", "vuelca el grafo materializado completo"),
             ],
         ),
@@ -489,7 +499,22 @@ def print_help(locale: str = "en", verbose: bool = False) -> None:
     print("\n".join(lines).rstrip())
 
 
-def build_music_list_lines(audio_manager: AudioManager, locale: str = "en") -> list[str]:
+def music_unavailable_line(audio_manager: AudioManager | DeferredAudioManager, locale: str = "en") -> str | None:
+    """Why music commands cannot run right now, or None once audio is up.
+
+    Waits up to `READY_WAIT_S` for a deferred manager, like the music calls do.
+    """
+    if not isinstance(audio_manager, DeferredAudioManager):
+        return None
+    audio_manager.wait_ready(audio_manager.READY_WAIT_S)
+    if audio_manager.disabled:
+        return "music: unavailable" if locale != "es" else "music: no disponible"
+    if not audio_manager.ready.done():
+        return "music: audio still initializing" if locale != "es" else "music: el audio aún se está iniciando"
+    return None
+
+
+def build_music_list_lines(audio_manager: AudioManager | DeferredAudioManager, locale: str = "en") -> list[str]:
     tracks = audio_manager.list_music_tracks()
     if not tracks:
         return ["No music tracks available" if locale != "es" else "No hay pistas de música disponibles"]
@@ -503,7 +528,7 @@ def build_music_list_lines(audio_manager: AudioManager, locale: str = "en") -> l
     return lines
 
 
-def build_music_status_lines(audio_manager: AudioManager, locale: str = "en") -> list[str]:
+def build_music_status_lines(audio_manager: AudioManager | DeferredAudioManager, locale: str = "en") -> list[str]:
     status = audio_manager.music_status()
     lines = [
         f"music: {'playing' if status.is_playing else 'stopped'}"
@@ -521,7 +546,7 @@ def build_music_status_lines(audio_manager: AudioManager, locale: str = "en") ->
     return lines
 
 
-def apply_music_volume(os_state, audio_manager: AudioManager, volume: float, locale: str = "en") -> str:
+def apply_music_volume(os_state, audio_manager: AudioManager | DeferredAudioManager, volume: float, locale: str = "en") -> str:
     volume = max(0.0, min(float(volume), 1.0))
     os_state.audio.music_volume = volume
     audio_manager.apply_music_preferences(volume)
@@ -535,7 +560,7 @@ def apply_music_volume(os_state, audio_manager: AudioManager, volume: float, loc
 
 def play_music_track(
     os_state,
-    audio_manager: AudioManager,
+    audio_manager: AudioManager | DeferredAudioManager,
     track_id: str,
     locale: str = "en",
 ) -> list[str]:
@@ -560,11 +585,16 @@ def play_music_track(
     ]
 
 
-def stop_music_track(audio_manager: AudioManager, locale: str = "en") -> str:
+def stop_music_track(audio_manager: AudioManager | DeferredAudioManager, locale: str = "en") -> str:
     audio_manager.stop_music()
     return "music: stopped" if locale != "es" else "music: detenida"
 
 
+def _changed_content_note(content_refs: tuple[str, ...]) -> str:
+    refs = ", ".join(content_refs)
+    return f"[INFO] Authored texts updated since this save (loaded their current version): {refs}"
+
+
 def _format_track_duration(duration_s: float | None) -> str | None:
     if duration_s is None or duration_s <= 0.0:
         return None
@@ -2158,21 +2188,29 @@ def render_diag(state, system_id: str) -> None:
             print("notes: no drone charging available.")
 
 
+def _active_alerts_sorted(state) -> list:
+    active = [a for a in state.events.alerts.values() if a.is_active]
+    # Ordena por severidad y recencia
+    sev_rank = {"critical": 0, "warn": 1, "info": 2}
+    active.sort(key=lambda a: (sev_rank.get(a.severity.value, 9), -a.last_seen_t))
+    return active
+
+
+def _alerts_hint(locale: str) -> str:
+    return {
+        "en": "Hint: use 'alerts explain <alert_key>' for more details.",
+        "es": "Sugerencia: usa 'alerts explain <alert_key>' para más detalles.",
+    }.get(locale, "Hint: use 'alerts explain <alert_key>' for more details.")
+
+
 def render_alerts(state) -> None:
     print("\n=== ALERTS (active) ===")
-    active = [a for a in state.events.alerts.values() if a.is_active]
+    active = _active_alerts_sorted(state)
     if not active:
         print("(none)")
         return
     locale = state.os.locale.value
-    hint = {
-        "en": "Hint: use 'alerts explain <alert_key>' for more details.",
-        "es": "Sugerencia: usa 'alerts explain <alert_key>' para más detalles.",
-    }.get(locale, "Hint: use 'alerts explain <alert_key>' for more details.")
-    print(hint)
-    # Ordena por severidad y recencia
-    sev_rank = {"critical": 0, "warn": 1, "info": 2}
-    active.sort(key=lambda a: (sev_rank.get(a.severity.value, 9), -a.last_seen_t))
+    print(_alerts_hint(locale))
     for a in active:
         print(f"- {a.severity.value.upper():8s} {a.alert_key:24s} unacked={_format_eta_short(a.unacked_s, locale)}")
 
@@ -2186,14 +2224,17 @@ def render_logs(state, limit: int = 15) -> None:
         print(f"- [{t_label}] [{e.severity.value.upper()}] {e.type.value}: {e.message}")
 
 
-def render_jobs(state, limit: int | None = 5) -> None:
-    print("\n=== JOBS ===")
-    jobs_state = state.jobs
+def _active_jobs(jobs_state) -> list:
     active_jobs = []
     for job_id in jobs_state.active_job_ids:
         job = jobs_state.jobs.get(job_id)
         if job:
             active_jobs.append(job)
+    return active_jobs
+
+
+def _job_busy_context(active_jobs) -> tuple[set[str], bool]:
+    """Owners with a running job, and whether a route solve is running."""
     running_by_owner: set[str] = set()
     route_solve_running = False
     for job in active_jobs:
@@ -2201,12 +2242,12 @@ def render_jobs(state, limit: int | None = 5) -> None:
             running_by_owner.add(job.owner_id)
         if job.status == JobStatus.RUNNING and job.job_type == JobType.ROUTE_SOLVE:
             route_solve_running = True
+    return running_by_owner, route_solve_running
 
-    if not jobs_state.jobs:
-        print("(none)")
-        return
 
-    locale = state.os.locale.value
+def _job_display_fields(job, locale: str, busy: tuple[set[str], bool]) -> tuple[str, str, str, bool, str]:
+    """(target, eta, owner, emergency, wait_note) as shown in job listings."""
+    running_by_owner, route_solve_running = busy
     wait_note_templates = {
         "en": " (waiting: drone busy {drone_id})",
         "es": " (en espera: dron ocupado {drone_id})",
@@ -2215,19 +2256,35 @@ def render_jobs(state, limit: int | None = 5) -> None:
         "en": " (waiting: route solver busy)",
         "es": " (en espera: solver de rutas ocupado)",
     }
+    target = f"{job.target.kind}:{job.target.id}" if job.target else "-"
+    eta = _format_eta_short(job.eta_s, locale) if job.status in {JobStatus.QUEUED, JobStatus.RUNNING} else "-"
+    owner = job.owner_id or "-"
+    emergency = bool(job.params.get("emergency"))
+    wait_note = ""
+    if job.status == JobStatus.QUEUED and job.owner_id and job.owner_id in running_by_owner:
+        tmpl = wait_note_templates.get(locale, wait_note_templates["en"])
+        wait_note = tmpl.format(drone_id=job.owner_id)
+    if job.status == JobStatus.QUEUED and job.job_type == JobType.ROUTE_SOLVE and route_solve_running:
+        tmpl = route_wait_note_templates.get(locale, route_wait_note_templates["en"])
+        wait_note += tmpl
+    return target, eta, owner, emergency, wait_note
+
+
+def render_jobs(state, limit: int | None = 5) -> None:
+    print("\n=== JOBS ===")
+    jobs_state = state.jobs
+    active_jobs = _active_jobs(jobs_state)
+    busy = _job_busy_context(active_jobs)
+
+    if not jobs_state.jobs:
+        print("(none)")
+        return
+
+    locale = state.os.locale.value
 
     def _format_job(job):
-        target = f"{job.target.kind}:{job.target.id}" if job.target else "-"
-        eta = _format_eta_short(job.eta_s, locale) if job.status in {JobStatus.QUEUED, JobStatus.RUNNING} else "-"
-        owner = job.owner_id or "-"
-        emergency = " EMERGENCY" if job.params.get("emergency") else ""
-        wait_note = ""
-        if job.status == JobStatus.QUEUED and job.owner_id and job.owner_id in running_by_owner:
-            tmpl = wait_note_templates.get(locale, wait_note_templates["en"])
-            wait_note = tmpl.format(drone_id=job.owner_id)
-        if job.status == JobStatus.QUEUED and job.job_type == JobType.ROUTE_SOLVE and route_solve_running:
-            tmpl = route_wait_note_templates.get(locale, route_wait_note_templates["en"])
-            wait_note += tmpl
+        target, eta, owner, emergency, wait_note = _job_display_fields(job, locale, busy)
+        emergency = " EMERGENCY" if emergency else ""
         return f"- {job.job_id}: {job.status.value:8s} type={job.job_type.value} target={target} ETA={eta} owner={owner}{emergency}{wait_note}"
 
     print("Active (queued/running):")
@@ -2237,19 +2294,15 @@ def render_jobs(state, limit: int | None = 5) -> None:
     else:
         print("- (none)")
 
-    history = [
-        job
-        for job in jobs_state.jobs.values()
-        if (job.internal_id or job.job_id) not in jobs_state.active_job_ids
-        and job.status in {JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED}
-    ]
+    history = history_jobs(jobs_state)
     if history:
         print("Recent complete/failed/cancelled:")
-        history_sorted = sorted(history, key=lambda job: int(job.terminal_seq or 0), reverse=True)
         if limit is not None:
-            history_sorted = history_sorted[:limit]
-        for job in history_sorted:
+            history = history[:limit]
+        for job in history:
             print(_format_job(job))
+        if limit is None and jobs_state.archived_job_count:
+            print(f"- ({jobs_state.archived_job_count} older jobs archived)")
 
 
 def render_drone_status(state, drone_id: str | None = None) -> None:
@@ -3017,6 +3070,11 @@ def render_debug_galaxy(state) -> None:
             f"- sector_archetypes: materialized={len(sector_states)} mean_nodes={total_sector_nodes/len(sector_states):.2f} "
             f"dead_ends={dead_ends} single_exit={single_exit} multi_exit={multi_exit}"
         )
+        cluster_stats = sector_cluster_stats()
+        print(
+            f"- sector_clusters: settled={len(state.world.settled_sectors)} "
+            f"fast_path={cluster_stats['fast_path']} full_pass={cluster_stats['full_pass']}"
+        )
         for archetype in sorted(archetype_counts):
             count = archetype_counts[archetype]
             print(
@@ -3106,13 +3164,20 @@ def _counts_text(values: dict[str, int]) -> str:
 
 
 def _loaded_sector_node_ids(state, sector_id: str) -> list[str]:
-    sector_state = state.world.sector_states.get(sector_id)
-    if sector_state:
-        return sorted(sector_state.node_ids)
-    return sorted(
-        node.node_id
-        for node in state.world.space.nodes.values()
-        if sector_id_for_pos(node.x_ly, node.y_ly, node.z_ly) == sector_id
+    return state.world.sector_node_ids(sector_id)
+
+
+def render_debug_worldgen_pregen(state, radius: int) -> None:
+    print("\n=== DEBUG WORLDGEN PREGEN ===")
+    center = sector_id_for_pos(*state.world.current_pos_ly)
+    nodes_before = len(state.world.space.nodes)
+    started = time.perf_counter()
+    generated = pregenerate_sectors(state, center, radius)
+    elapsed = time.perf_counter() - started
+    print(f"- center: {center} radius={radius} sectors_in_radius={len(pregen_sector_order(center, radius))}")
+    print(
+        f"- generated_sectors: {len(generated)} nodes_added={len(state.world.space.nodes) - nodes_before} "
+        f"elapsed_s={elapsed:.2f}"
     )
 
 
@@ -3500,6 +3565,7 @@ def _contact_distance_text(state, node: SpaceNode, current_pos: tuple[float, flo
     return dist, f"{dist:.2f}ly"
 
 
+@memoize_on_versions("world", "links", extra=lambda state: state.os.locale.value)
 def _collect_known_contact_entries(state) -> list[dict[str, object]]:
     current_id = state.world.current_node_id
     known = _known_contact_cache_ids(state)
@@ -3796,6 +3862,7 @@ def _try_add_known_link_with_cap(
     if not is_hop_within_cap(state.world, from_id, to_id):
         return False, True, dist
     added = add_known_link(state.world, from_id, to_id, bidirectional=bidirectional)
+    bump_versions(state, "links")
     return added, False, dist
 
 def _core_os_limited_blocks(parsed) -> bool:
@@ -4538,6 +4605,8 @@ def _handle_intel_import(state, path: str) -> None:
 
 
 def _auto_import_intel_from_text(state, text: str, source_path: str) -> list[str]:
+    # Imports only write below; nothing here reads a memoized view.
+    bump_versions(state, "world", "links")
     source_kind, confidence, source_ref = _infer_intel_source(source_path)
     added_msgs: list[str] = []
     discarded_by_cap = 0
@@ -4840,7 +4909,11 @@ def _map_bfs_path(adj: dict[str, set[str]], start_id: str, target_id: str) -> tu
 def _route_solve_sources_for_target(state, target_id: str, source_ids: set[str]) -> list[tuple[float, str]]:
     sensors_range_ly = max(0.0, float(getattr(state.ship, "sensors_range_ly", Balance.SENSORS_RANGE_LY)))
     candidates: list[tuple[float, str]] = []
-    for src_id in sorted(source_ids):
+    target = state.world.space.nodes.get(target_id)
+    if target is None:
+        return candidates
+    nearby_ids = state.world.space.nodes_within((target.x_ly, target.y_ly, target.z_ly), sensors_range_ly)
+    for src_id in sorted(source_ids.intersection(nearby_ids)):
         if src_id == target_id:
             continue
         dist = _distance_ly_between_nodes(state, src_id, target_id)
@@ -5625,9 +5698,24 @@ def _handle_log_copy(state, amount: int | None) -> None:
         print(msg.get(locale, msg["en"]))
 
 
-def render_intel_list(state, limit: int | None = 20) -> None:
+def render_intel_list(
+    state,
+    limit: int | None = 20,
+    *,
+    to_id: str | None = None,
+    source_kind: str | None = None,
+) -> None:
     print("\n=== INTEL ===")
-    items = list(state.world.intel)
+    index = state.world.indexed_intel()
+    if to_id is not None:
+        to_id = _resolve_node_id_from_input(state, to_id) or to_id
+        items = list(index.by_to_id.get(to_id, []))
+        if source_kind is not None:
+            items = [item for item in items if item.source_kind == source_kind]
+    elif source_kind is not None:
+        items = list(index.by_source_kind.get(source_kind, []))
+    else:
+        items = list(state.world.intel)
     if not items:
         print("(no intel)")
         locale = state.os.locale.value
@@ -5674,11 +5762,7 @@ def render_intel_list(state, limit: int | None = 20) -> None:
 
 def render_intel_show(state, intel_id: str) -> None:
     print("\n=== INTEL DETAIL ===")
-    target = None
-    for item in state.world.intel:
-        if item.intel_id.lower() == intel_id.lower():
-            target = item
-            break
+    target = state.world.indexed_intel().by_id.get(intel_id.lower())
     if not target:
         print("(intel) not found")
         return
@@ -6185,6 +6269,11 @@ def _apply_salvage_loot(loop, state, events):
     return
 
 
+# Wake events whose trigger time Engine.next_event_horizon_s already predicts,
+# so hibernation does not need the hourly wake-check cap for them.
+_HIBERNATE_HORIZON_WAKE_EVENT_TYPES = {EventType.DRONE_LOW_BATTERY.value}
+
+
 def _hibernate_interrupt_reason(state, step_events: list[Event], wake_on_low_battery: bool) -> str | None:
     if state.os.terminal_lock:
         reason = state.os.terminal_reason or "terminal"
@@ -6302,10 +6391,11 @@ def _execute_hibernate(loop, years: float, wake_on_low_battery: bool = False) ->
         loop.set_auto_tick(False)
         while remaining > 0:
             step = Balance.HIBERNATE_CHUNK_S if remaining >= Balance.HIBERNATE_CHUNK_S else remaining
-            if wake_on_low_battery:
+            if wake_on_low_battery and not set(Balance.HIBERNATE_WAKE_EVENT_TYPES) <= _HIBERNATE_HORIZON_WAKE_EVENT_TYPES:
                 step = min(step, Balance.HIBERNATE_WAKE_CHECK_S)
             radiation_cross_dt = None
             with loop.with_lock() as locked_state:
+                step = loop.engine.next_event_horizon_s(locked_state, step)
                 radiation_cross_dt = _hibernate_transit_env_threshold_dt(locked_state, step)
             if radiation_cross_dt is not None:
                 step = min(step, max(1.0e-6, radiation_cross_dt))
@@ -6358,6 +6448,8 @@ def _execute_hibernate(loop, years: float, wake_on_low_battery: bool = False) ->
     recovery_events: list[Event] = []
     with loop.with_lock() as locked_state:
         recovery_events = ensure_exploration_recovery(locked_state, "hibernate_end")
+    # HIBERNATION_ENDED never passes through loop.step(), so ask for the save here.
+    loop.request_autosave()
     return HibernateRunResult(
         actual_years=actual_years,
         start_soc=start_soc,
@@ -6697,6 +6789,7 @@ def render_alert_explain(state, alert_key: str) -> None:
         print("- Decontamination does not require positive net power or scrap")
 
 
+@memoize_on_versions("world")
 def _known_contact_ids_for_completion(state) -> list[str]:
     known_ids = set(getattr(state.world, "known_nodes", set()) or set())
     known_ids.update(getattr(state.world, "known_contacts", set()) or set())
@@ -6713,6 +6806,7 @@ def _dock_targets_for_completion(state) -> list[str]:
     return [current_node_id]
 
 
+@memoize_on_versions("world", "links", extra=lambda state: float(state.ship.sensors_range_ly))
 def _route_solve_targets_for_completion(state) -> list[str]:
     current_node_id = getattr(state.world, "current_node_id", "")
     if not current_node_id:
@@ -6730,6 +6824,7 @@ def _route_solve_targets_for_completion(state) -> list[str]:
     ]
 
 
+@memoize_on_versions("world", "links")
 def _travel_targets_for_completion(state) -> list[str]:
     current_node_id = getattr(state.world, "current_node_id", "")
     if not current_node_id:
@@ -6835,6 +6930,7 @@ def main() -> None:
 
     play_startup_sequence = False
     startup_message = ""
+    startup_notes: list[str] = []
     startup_audio_context = "load_game"
     if scenario in {"sandbox", "dev"}:
         state = create_initial_state_sandbox()
@@ -6867,31 +6963,28 @@ def main() -> None:
                     startup_message = f"[WARN] Main save unreadable. Loaded backup: {loaded.path}"
                 else:
                     startup_message = f"[INFO] Loaded saved game: {loaded.path}"
+                if loaded.changed_content_refs:
+                    startup_notes.append(_changed_content_note(loaded.changed_content_refs))
     active_theme["preset"] = normalize_theme_preset(getattr(state.os, "theme_preset", "linux"))
 
-    audio_warning = ""
-    try:
-        audio_manager = AudioManager(load_audio_config())
-    except AudioConfigError as exc:
-        audio_manager = None
-        audio_warning = f"[WARN] Audio disabled: {exc}"
-    else:
-        audio_warning = audio_manager.notice or ""
+    # Audio loads on a worker thread; its warnings surface through consume_notice().
+    audio_manager = DeferredAudioManager()
 
     loop = GameLoop(engine, state, tick_s=1.0)
     loop.step(1.0)
     audio_enabled, ambient_enabled = audio_flags(state.os)
     music_volume = state.os.audio.music_volume
-    if audio_manager is not None:
-        audio_manager.prepare_session(audio_enabled, ambient_enabled, startup_audio_context, music_volume)
+    audio_manager.prepare_session(audio_enabled, ambient_enabled, startup_audio_context, music_volume)
     run_console_entry_gate(
-        [startup_message, audio_warning],
+        [startup_message, *startup_notes],
         state.os.locale.value,
         clear_after=True,
     )
-    if audio_manager is not None:
-        audio_manager.start(audio_enabled, ambient_enabled, music_volume)
-        audio_manager.play_startup(audio_enabled, startup_audio_context)
+    audio_manager.start(audio_enabled, ambient_enabled, music_volume)
+    audio_manager.play_startup(audio_enabled, startup_audio_context)
+    notice = audio_manager.consume_notice()
+    if notice:
+        print(notice)
     if play_startup_sequence:
         _maybe_run_startup_sequence(state.os.locale.value)
     if not state.os.debug_enabled:
@@ -6899,6 +6992,8 @@ def main() -> None:
         loop.start()
     else:
         loop.set_auto_tick(False)
+    if Balance.AUTOSAVE_ENABLED:
+        loop.start_autosave(args.save_path, user=profile_user)
 
     base_commands = [
         "help",
@@ -6967,7 +7062,7 @@ def main() -> None:
             else:
                 cmd = tokens[0]
                 candidates = []
-                with loop.with_lock() as locked_state:
+                with loop.with_lock(read_only=True) as locked_state:
                     systems = list(locked_state.ship.systems.keys())
                     drones = list(locked_state.ship.drones.keys())
                     contacts = _known_contact_ids_for_completion(locked_state)
@@ -6984,7 +7079,7 @@ def main() -> None:
                         if sys.service and sys.service.is_installed:
                             services.append(sys.service.service_name)
                     fs_paths = list(locked_state.os.fs.keys())
-                music_track_ids = [track.track_id for track in audio_manager.list_music_tracks()] if audio_manager is not None else []
+                music_track_ids = list(audio_manager.music_track_ids())
 
                 if len(tokens) == 1:
                     candidates = [c for c in base_commands if c.startswith(text)]
@@ -7113,7 +7208,7 @@ def main() -> None:
                     elif len(tokens) == 4 and tokens[1] == "galaxy" and tokens[2] == "map":
                         candidates = [c for c in ["sector", "local", "regional", "global"] if c.startswith(text)]
                     elif len(tokens) == 3 and tokens[1] == "worldgen":
-                        candidates = [c for c in ["sector"] if c.startswith(text)]
+                        candidates = [c for c in ["sector", "pregen"] if c.startswith(text)]
                     elif len(tokens) == 4 and tokens[1] == "worldgen" and tokens[2] == "sector":
                         sector_candidates = set(locked_state.world.generated_sectors)
                         sector_candidates.add(sector_id_for_pos(*locked_state.world.current_pos_ly))
@@ -7144,9 +7239,13 @@ def main() -> None:
                         candidates = [c for c in ["all", "5", "10", "20", "50"] if c.startswith(text)]
                 elif cmd == "intel":
                     if len(tokens) == 2:
-                        candidates = [c for c in ["show", "import", "export", "all"] if c.startswith(text)] + [t for t in ["10", "20", "50"] if t.startswith(text)]
+                        candidates = [c for c in ["show", "import", "export", "all", "to", "source"] if c.startswith(text)] + [t for t in ["10", "20", "50"] if t.startswith(text)]
                     elif len(tokens) == 3 and tokens[1] == "show":
                         candidates = [i.intel_id for i in locked_state.world.intel if i.intel_id.startswith(text.upper())]
+                    elif len(tokens) == 3 and tokens[1] in {"to", "source"}:
+                        index = locked_state.world.indexed_intel()
+                        keys = index.by_to_id if tokens[1] == "to" else index.by_source_kind
+                        candidates = [key for key in sorted(keys) if key.startswith(text)]
                     elif len(tokens) == 3 and tokens[1] in {"import", "export"}:
                         path_text = token or text
                         if "/" in path_text:
@@ -7348,11 +7447,10 @@ def main() -> None:
                 _apply_salvage_loot(loop, locked_state, followup_events)
                 render_events(locked_state, followup_events)
                 followup_audio_enabled = locked_state.os.audio.enabled
-            if audio_manager is not None:
-                audio_manager.handle_event_batch(followup_audio_enabled, followup_events)
-                notice = audio_manager.consume_notice()
-                if notice:
-                    print(notice)
+            audio_manager.handle_event_batch(followup_audio_enabled, followup_events)
+            notice = audio_manager.consume_notice()
+            if notice:
+                print(notice)
 
     def _drain_auto_events() -> None:
         auto_ev = loop.drain_events()
@@ -7362,11 +7460,10 @@ def main() -> None:
                 _apply_salvage_loot(loop, locked_state, auto_ev)
                 render_events(locked_state, auto_ev)
                 audio_enabled = locked_state.os.audio.enabled
-            if audio_manager is not None:
-                audio_manager.handle_event_batch(audio_enabled, auto_ev)
-                notice = audio_manager.consume_notice()
-                if notice:
-                    print(notice)
+            audio_manager.handle_event_batch(audio_enabled, auto_ev)
+            notice = audio_manager.consume_notice()
+            if notice:
+                print(notice)
             _handle_deferred_repair_auto_move_prompts(auto_ev)
 
     # print("RETORNO (prologue)")
@@ -7382,8 +7479,8 @@ def main() -> None:
         if did_persist_on_exit:
             return
         loop.stop()
-        if audio_manager is not None:
-            audio_manager.shutdown()
+        loop.stop_autosave()
+        audio_manager.shutdown()
         try:
             with loop.with_lock() as locked_state:
                 saved_path = save_single_slot(locked_state, args.save_path, user=profile_user)
@@ -7417,12 +7514,11 @@ def main() -> None:
             audio_enabled = locked_state.os.audio.enabled
         if block_msg:
             print(block_msg)
-            if audio_manager is not None:
-                severity = Severity.WARN if "Action blocked" in block_msg or "Acción bloqueada" in block_msg else Severity.INFO
-                audio_manager.play_event(audio_enabled, EventType.BOOT_BLOCKED, severity)
-                notice = audio_manager.consume_notice()
-                if notice:
-                    print(notice)
+            severity = Severity.WARN if "Action blocked" in block_msg or "Acción bloqueada" in block_msg else Severity.INFO
+            audio_manager.play_event(audio_enabled, EventType.BOOT_BLOCKED, severity)
+            notice = audio_manager.consume_notice()
+            if notice:
+                print(notice)
             continue
 
         _drain_auto_events()
@@ -7455,71 +7551,69 @@ def main() -> None:
         if parsed == "MUSIC_LIST":
             with loop.with_lock() as locked_state:
                 locale = locked_state.os.locale.value
-            if audio_manager is None:
-                print("music: unavailable" if locale != "es" else "music: no disponible")
+            unavailable = music_unavailable_line(audio_manager, locale)
+            if unavailable:
+                print(unavailable)
             else:
                 for line in build_music_list_lines(audio_manager, locale):
                     print(line)
-                notice = audio_manager.consume_notice()
-                if notice:
-                    print(notice)
+            notice = audio_manager.consume_notice()
+            if notice:
+                print(notice)
             continue
         if parsed == "MUSIC_STATUS":
             with loop.with_lock() as locked_state:
                 locale = locked_state.os.locale.value
-            if audio_manager is None:
-                print("music: unavailable" if locale != "es" else "music: no disponible")
+            unavailable = music_unavailable_line(audio_manager, locale)
+            if unavailable:
+                print(unavailable)
             else:
                 for line in build_music_status_lines(audio_manager, locale):
                     print(line)
-                notice = audio_manager.consume_notice()
-                if notice:
-                    print(notice)
+            notice = audio_manager.consume_notice()
+            if notice:
+                print(notice)
             continue
         if parsed == "MUSIC_STOP":
             with loop.with_lock() as locked_state:
                 locale = locked_state.os.locale.value
-            if audio_manager is None:
-                print("music: unavailable" if locale != "es" else "music: no disponible")
-            else:
-                print(stop_music_track(audio_manager, locale))
-                notice = audio_manager.consume_notice()
-                if notice:
-                    print(notice)
+            print(music_unavailable_line(audio_manager, locale) or stop_music_track(audio_manager, locale))
+            notice = audio_manager.consume_notice()
+            if notice:
+                print(notice)
             continue
         if isinstance(parsed, tuple) and parsed[0] == "MUSIC_PLAY":
             with loop.with_lock() as locked_state:
                 locale = locked_state.os.locale.value
-                lines = (
-                    ["music: unavailable" if locale != "es" else "music: no disponible"]
-                    if audio_manager is None
-                    else play_music_track(locked_state.os, audio_manager, str(parsed[1]), locale)
-                )
+            unavailable = music_unavailable_line(audio_manager, locale)
+            if unavailable:
+                lines = [unavailable]
+            else:
+                with loop.with_lock() as locked_state:
+                    lines = play_music_track(locked_state.os, audio_manager, str(parsed[1]), locale)
             for line in lines:
                 print(line)
-            if audio_manager is not None:
-                notice = audio_manager.consume_notice()
-                if notice:
-                    print(notice)
+            notice = audio_manager.consume_notice()
+            if notice:
+                print(notice)
             continue
         if isinstance(parsed, tuple) and parsed[0] == "MUSIC_VOLUME":
             with loop.with_lock() as locked_state:
                 locale = locked_state.os.locale.value
-                message = (
-                    "music: unavailable" if locale != "es" else "music: no disponible"
-                )
-                if audio_manager is not None:
+            # Before audio is ready the volume is recorded and applied on init.
+            message = "music: unavailable" if locale != "es" else "music: no disponible"
+            if not audio_manager.disabled:
+                with loop.with_lock() as locked_state:
                     message = apply_music_volume(locked_state.os, audio_manager, float(parsed[1]), locale)
             print(message)
-            if audio_manager is not None:
-                notice = audio_manager.consume_notice()
-                if notice:
-                    print(notice)
+            notice = audio_manager.consume_notice()
+            if notice:
+                print(notice)
             continue
         if parsed == "CONFIG_SHOW":
-            backend_name = audio_manager.backend.name if audio_manager is not None else None
+            backend_name = audio_manager.backend.name if not audio_manager.disabled else None
             runtime_status = None
-            if audio_manager is None:
+            if audio_manager.disabled:
                 runtime_status = "disabled"
             elif audio_manager.notice:
                 runtime_status = "degraded"
@@ -7542,7 +7636,7 @@ def main() -> None:
                 active_theme["preset"] = normalize_theme_preset(getattr(locked_state.os, "theme_preset", "linux"))
                 audio_enabled, ambient_enabled = audio_flags(locked_state.os)
                 print(message)
-            if audio_manager is not None and key in {"audio", "ambientsound"}:
+            if key in {"audio", "ambientsound"}:
                 audio_manager.apply_preferences(audio_enabled, ambient_enabled)
                 notice = audio_manager.consume_notice()
                 if notice:
@@ -7629,6 +7723,13 @@ def main() -> None:
                     continue
                 render_debug_worldgen_sector(locked_state, str(parsed[1]))
             continue
+        if isinstance(parsed, tuple) and parsed[0] == "DEBUG_WORLDGEN_PREGEN":
+            with loop.with_lock() as locked_state:
+                if not locked_state.os.debug_enabled:
+                    print("debug worldgen pregen: available only in DEBUG mode. Use: debug on")
+                    continue
+                render_debug_worldgen_pregen(locked_state, int(parsed[1]))
+            continue
         if isinstance(parsed, tuple) and parsed[0] == "DEBUG_GRAPH_ALL":
             with loop.with_lock() as locked_state:
                 if not locked_state.os.debug_enabled:
@@ -7770,11 +7871,10 @@ def main() -> None:
             with loop.with_lock() as locked_state:
                 render_events(locked_state, ev)
                 audio_enabled = locked_state.os.audio.enabled
-            if audio_manager is not None:
-                audio_manager.handle_event_batch(audio_enabled, ev)
-                notice = audio_manager.consume_notice()
-                if notice:
-                    print(notice)
+            audio_manager.handle_event_batch(audio_enabled, ev)
+            notice = audio_manager.consume_notice()
+            if notice:
+                print(notice)
             _drain_auto_events()
             continue
         if parsed == "INTEL_LIST":
@@ -7788,6 +7888,11 @@ def main() -> None:
                 limit = None if parsed[1] == "all" else int(parsed[1])
                 render_intel_list(locked_state, limit=limit)
             continue
+        if isinstance(parsed, tuple) and parsed[0] == "INTEL_FILTER":
+            _drain_auto_events()
+            with loop.with_lock() as locked_state:
+                render_intel_list(locked_state, None, to_id=parsed[1], source_kind=parsed[2])
+            continue
         if parsed.__class__.__name__ == "TravelAbort":
             _drain_auto_events()
             with loop.with_lock() as locked_state:
@@ -7860,7 +7965,7 @@ def main() -> None:
                 if not locked_state.os.debug_enabled:
                     print("wait is available only in DEBUG mode. Use: debug on")
                     continue
-            step_events = loop.step_many(seconds, dt=1.0)
+            step_events = loop.advance(seconds)
             cmd_events = [("step", e) for e in step_events]
             audio_enabled = False
             with loop.with_lock() as locked_state:
@@ -7869,11 +7974,10 @@ def main() -> None:
                 audio_enabled = locked_state.os.audio.enabled
                 if any(e.severity == Severity.CRITICAL for _, e in cmd_events):
                     render_alerts(locked_state)
-            if audio_manager is not None:
-                audio_manager.handle_event_batch(audio_enabled, step_events)
-                notice = audio_manager.consume_notice()
-                if notice:
-                    print(notice)
+            audio_manager.handle_event_batch(audio_enabled, step_events)
+            notice = audio_manager.consume_notice()
+            if notice:
+                print(notice)
             _handle_deferred_repair_auto_move_prompts(cmd_events)
             _drain_auto_events()
             continue
@@ -7955,11 +8059,10 @@ def main() -> None:
                         _apply_salvage_loot(loop, locked_state, ev)
                         render_events(locked_state, ev)
                         audio_enabled = locked_state.os.audio.enabled
-                    if audio_manager is not None:
-                        audio_manager.handle_event_batch(audio_enabled, ev)
-                        notice = audio_manager.consume_notice()
-                        if notice:
-                            print(notice)
+                    audio_manager.handle_event_batch(audio_enabled, ev)
+                    notice = audio_manager.consume_notice()
+                    if notice:
+                        print(notice)
                     continue
 
         ev = loop.apply_action(parsed)
@@ -7980,11 +8083,10 @@ def main() -> None:
                         }
                         print(msg.get(locale, msg["en"]))
                         break
-        if audio_manager is not None:
-            audio_manager.handle_event_batch(audio_enabled, ev)
-            notice = audio_manager.consume_notice()
-            if notice:
-                print(notice)
+        audio_manager.handle_event_batch(audio_enabled, ev)
+        notice = audio_manager.consume_notice()
+        if notice:
+            print(notice)
         _drain_auto_events()
 
     _stop_and_persist()
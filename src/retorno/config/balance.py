@@ -22,9 +22,13 @@ class Balance:
     GALAXY_OP_ORIGIN_PHYSICAL_X_LY = 250000.0
     GALAXY_OP_ORIGIN_PHYSICAL_Y_LY = 0.0
     GALAXY_OP_ORIGIN_PHYSICAL_Z_LY = 0.0
-    HIBERNATE_CHUNK_S = 7 * DAY_S
+    # Integration is closed-form, so chunk size only bounds the gap between wake checks.
+    HIBERNATE_CHUNK_S = 30 * DAY_S
     HIBERNATE_WAKE_CHECK_S = 1 * 60 * 60
     HIBERNATE_WAKE_EVENT_TYPES = {"drone_low_battery"}
+    # Engine.advance: shortest/longest jump between event horizons (seconds).
+    ADVANCE_MIN_STEP_S = 1.0
+    ADVANCE_MAX_STEP_S = YEAR_S
     # Startup sequence (new game only)
     STARTUP_SEQUENCE_ENABLED = True
     STARTUP_SEQUENCE_LINE_DELAY_S = 1.7
@@ -110,6 +114,21 @@ class Balance:
     REPAIR_JOB_FAIL_SCRAP_CONSUME_FRACTION = 0.25
     # Cargo audit time.
     CARGO_AUDIT_TIME_S = 11.0
+    # Finished jobs kept in the save for `jobs`/`jobs all`; older ones move to the archive.
+    JOB_HISTORY_MAX = 200
+    # Append evicted jobs to `<save>.jobs.jsonl` on save (False just drops them).
+    JOB_ARCHIVE_ON_SAVE = True
+    # Delta save log: fold into a new full save after this many records...
+    SAVE_DELTA_COMPACT_RECORDS = 64
+    # ...or once the log outgrows this fraction of the full save.
+    SAVE_DELTA_COMPACT_RATIO = 0.5
+    # Full-save codec: None keeps the plain RETORNO_SAVE_V2 pickle; "zlib" or "lzma" writes RETORNO_SAVE_V3.
+    SAVE_CODEC = None
+    # Save files at least this large are memory-mapped on load instead of read into memory.
+    SAVE_MMAP_MIN_BYTES = 4 * 1024 * 1024
+    # Background autosave while playing (real seconds between saves; arrival, dock and wake also trigger one).
+    AUTOSAVE_ENABLED = True
+    AUTOSAVE_INTERVAL_S = 120.0
     # Auth recover (MED) time and power draw.
     AUTH_RECOVER_MED_TIME_S = 245.0
     AUTH_RECOVER_MED_POWER_KW = 0.8
@@ -255,6 +274,14 @@ class Balance:
     # Toggle deterministic lore/intel behavior across processes for equal seed/state/action sequence.
     # False restores legacy process-dependent behavior for lore seed derivation and set iteration order.
     DETERMINISTIC_LORE_INTEL = True
+    # Debug: after each dirty-set completion pass, compare every node pool against a full recompute.
+    LORE_COMPLETION_DEBUG_ASSERT = False
+    # Debug: after each sector generation pass, check node/sector membership against the spatial index.
+    SECTOR_MEMBERSHIP_DEBUG_ASSERT = False
+    # Debug: after each load-shed step, compare the tick's cached power load against a full recompute.
+    POWER_NETWORK_DEBUG_ASSERT = False
+    # Debug: recompute every memoized state view on a cache hit and compare it against the cached value.
+    STATE_VERSIONS_DEBUG_ASSERT = False
     
     # Local (low scale) movement
     # Travel speed for local (km/mi) hops inside the same sector.
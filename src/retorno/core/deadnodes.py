@@ -53,11 +53,9 @@ def _is_within_route_range(state, reachable: set[str], node_id: str) -> bool:
     if not target:
         return False
     max_dist = Balance.SENSORS_RANGE_LY
-    for src_id in reachable:
-        src = state.world.space.nodes.get(src_id)
-        if not src:
-            continue
-        if _distance_ly(src, target) <= max_dist:
+    nodes = state.world.space.nodes
+    for src_id in state.world.space.nodes_within((target.x_ly, target.y_ly, target.z_ly), max_dist):
+        if src_id in reachable and _distance_ly(nodes[src_id], target) <= max_dist:
             return True
     return False
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import random
 import hashlib
-from typing import Iterable
+from typing import Callable, Iterable
 import difflib
 import math
 
@@ -46,6 +46,7 @@ from retorno.core.lore import (
     build_lore_context,
     close_window_on_orbit_entry,
     collect_node_salvage_data_files,
+    mark_node_completion_dirty,
     maybe_deliver_lore,
     mount_projection_breakdown,
     project_mountable_data_paths,
@@ -56,6 +57,16 @@ from retorno.core.lore import (
 )
 from retorno.core.deadnodes import evaluate_dead_nodes
 from retorno.core.exploration_recovery import ensure_exploration_recovery
+from retorno.core.integrators import (
+    SOC_QUALITY_WEIGHT,
+    ContinuousProfile,
+    battery_rate_kwh_per_s,
+    hull_ingress,
+    soc_quality,
+    time_to_reach,
+)
+from retorno.core.power_network import PowerNetwork
+from retorno.core.versions import bump_all_versions, bump_versions
 from retorno.core.power_policy import (
     is_action_allowed_in_critical_state,
     is_critical_power_state,
@@ -73,6 +84,7 @@ from retorno.model.jobs import (
     allocate_job_ids,
     find_job_key,
     finalize_job,
+    retire_job,
     job_id_numeric_suffix,
 )
 from retorno.model.ship_layout import canonical_ship_sector_id, drone_bay_sector_id_for_ship
@@ -84,6 +96,15 @@ from retorno.config.balance import Balance
 from retorno.worldgen.generator import ensure_sector_generated
 
 
+# SoC marks where load shedding, alerts or the power-quality ramp change behavior.
+_SOC_EVENT_MARKS = (0.0, 0.10, 0.25, 0.50, 1.0)
+_POWER_QUALITY_EVENT_MARKS = (
+    Balance.LOW_POWER_QUALITY_THRESHOLD,
+    Balance.POWER_QUALITY_CRITICAL_THRESHOLD,
+    Balance.POWER_QUALITY_COLLAPSE_THRESHOLD,
+)
+
+
 class Engine:
     _MAX_RECENT_EVENTS = 50
 
@@ -95,6 +116,7 @@ class Engine:
         state.clock.t += dt
 
         events: list[Event] = []
+        alerts_active = any(alert.is_active for alert in state.events.alerts.values())
 
         # Update effective generation based on power_core state.
         state.ship.power.p_gen_kw = self._compute_p_gen(state)
@@ -113,6 +135,7 @@ class Engine:
                     close_window_on_orbit_entry(state, node.node_id)
             self._clear_tmp_node(state)
             self._drop_initial_unknown_node(state)
+            bump_versions(state, "world", "links", "pools")
             events.append(
                 self._make_event(
                     state,
@@ -136,25 +159,26 @@ class Engine:
 
         events.extend(self._enforce_distribution_collapse(state))
 
-        p_load = self._compute_load_kw(state)
-        p_gen = state.ship.power.p_gen_kw
+        # Nothing outside the network touches systems or jobs until the load is settled.
+        network = PowerNetwork(state)
+        p_load = network.p_load
+        p_gen = network.p_gen
         p_discharge_max = state.ship.power.p_discharge_max_kw
-        soc = self._soc(state)
-        available_discharge_kw = p_discharge_max if soc > 0.0 else 0.0
-        p_capacity = p_gen + available_discharge_kw
+        soc = network.soc
+        p_capacity = network.p_capacity(soc)
 
         if p_load > p_capacity:
-            events.extend(self._auto_load_shed(state, p_capacity, p_load))
-            p_load = self._compute_load_kw(state)
+            events.extend(self._auto_load_shed(state, p_capacity, p_load, network))
+            p_load = network.p_load
 
         if 0.0 < soc < 0.10 and p_load > p_gen:
-            events.extend(self._auto_load_shed(state, p_gen, p_load))
-            p_load = self._compute_load_kw(state)
+            events.extend(self._auto_load_shed(state, p_gen, p_load, network))
+            p_load = network.p_load
 
         power_quality_pre = self._compute_power_quality(state, p_gen, p_load)
         if power_quality_pre < Balance.POWER_QUALITY_COLLAPSE_THRESHOLD:
-            events.extend(self._shed_all_noncritical(state))
-            p_load = self._compute_load_kw(state)
+            events.extend(self._shed_all_noncritical(state, network))
+            p_load = network.p_load
             power_quality_pre = self._compute_power_quality(state, p_gen, p_load)
         if power_quality_pre < Balance.POWER_QUALITY_CRITICAL_THRESHOLD:
             if p_load > p_gen or p_load > p_capacity:
@@ -162,15 +186,16 @@ class Engine:
             else:
                 state.ship.power.low_q_shed_timer_s = 0.0
             if state.ship.power.low_q_shed_timer_s >= Balance.POWER_QUALITY_SHED_INTERVAL_S:
-                events.extend(self._auto_shed_one_noncritical(state))
+                events.extend(self._auto_shed_one_noncritical(state, network))
                 state.ship.power.low_q_shed_timer_s = 0.0
-                p_load = self._compute_load_kw(state)
+                p_load = network.p_load
         else:
             state.ship.power.low_q_shed_timer_s = 0.0
 
         state.ship.power.p_load_kw = p_load
 
-        self._update_battery(state, dt, p_gen, p_load)
+        profile = self._continuous_profile(state, state.clock.t - dt, dt, p_gen, p_load)
+        self._update_battery(state, profile)
         power_quality = self._compute_power_quality(state, p_gen, p_load)
         state.ship.power.power_quality = power_quality
         soc = self._soc(state)
@@ -189,9 +214,9 @@ class Engine:
         state.ship.radiation_env_rad_per_s = env_rad
         internal_rad = self._compute_internal_radiation_rad_per_s(state, env_rad)
         events.extend(self._update_ship_radiation_level_alerts(state, env_rad, internal_rad))
-        self._apply_hull_degradation(state, dt, env_rad)
-        events.extend(self._apply_degradation(state, dt, power_quality, brownout_sustained, internal_rad))
-        self._apply_radiation(state, dt, env_rad)
+        self._apply_hull_degradation(state, profile)
+        events.extend(self._apply_degradation(state, profile, brownout_sustained))
+        self._apply_radiation(state, profile)
         self._update_drone_maintenance(state, dt)
         events.extend(self._update_drone_radiation_level_alerts(state))
         events.extend(self._update_drone_battery_alerts(state))
@@ -204,15 +229,206 @@ class Engine:
 
         self._update_alert_timers(state.events, dt)
 
+        # Health, wear and battery integrate every tick; alert timers age while any is active.
+        bump_versions(state, "systems", "power")
+        if alerts_active or any(alert.is_active for alert in state.events.alerts.values()):
+            bump_versions(state, "alerts")
+
         return events
 
-    def apply_action(self, state: GameState, action: Action) -> list[Event]:
-        if isinstance(action, Status):
+    def advance(
+        self,
+        state: GameState,
+        total_s: float,
+        *,
+        max_step_s: float | None = None,
+        stop: Callable[[GameState, list[Event]], bool] | None = None,
+    ) -> list[Event]:
+        """Fast-forward `total_s` seconds, ticking once per event horizon.
+
+        Each tick ends at the next time something discrete can happen (see
+        `next_event_horizon_s`); in between, `tick` integrates battery, wear,
+        hull and dose in closed form. Tolerance against 1-second stepping:
+        SoC, hull and health within 1e-3 absolute; threshold transitions within
+        `Balance.ADVANCE_MIN_STEP_S`, except timer-driven load shedding, which
+        may shift by a few tens of seconds.
+        `stop(state, events)` is checked after every tick and ends the run early.
+        """
+        cap = Balance.ADVANCE_MAX_STEP_S if max_step_s is None else max(0.0, float(max_step_s))
+        events: list[Event] = []
+        remaining = float(total_s)
+        while remaining > 1e-9:
+            step = self.next_event_horizon_s(state, min(remaining, cap) if cap > 0.0 else remaining)
+            step_events = self.tick(state, step)
+            events.extend(step_events)
+            remaining -= step
+            if stop is not None and stop(state, step_events):
+                break
+        return events
+
+    def next_event_horizon_s(self, state: GameState, max_dt_s: float) -> float:
+        """Seconds until the next job/arrival/threshold event, clamped to [min step, max_dt_s]."""
+        max_dt_s = max(0.0, float(max_dt_s))
+        horizon = max_dt_s
+        for candidate in self._event_horizon_candidates(state, max_dt_s):
+            if candidate < horizon:
+                horizon = candidate
+        return max(horizon, min(Balance.ADVANCE_MIN_STEP_S, max_dt_s))
+
+    def _event_horizon_candidates(self, state: GameState, window_s: float) -> list[float]:
+        t = state.clock.t
+        ship = state.ship
+        power = ship.power
+        out: list[float] = []
+
+        for job_id in state.jobs.active_job_ids:
+            job = state.jobs.jobs.get(job_id)
+            if not job or job.status not in (JobStatus.QUEUED, JobStatus.RUNNING):
+                continue
+            if bool(job.params.get("awaiting_auto_move_confirmation")):
+                continue
+            if job.params.get("emergency"):
+                # Emergency jobs roll for failure every second.
+                out.append(0.0)
+            out.append(job.eta_s)
+
+        if ship.in_transit:
+            out.append(ship.arrival_t - t)
+        placements = state.world.lore_placements
+        if getattr(Balance, "LORE_SCHEDULER_ENABLED", True) and placements.next_non_forced_eval_t > 0.0:
+            out.append(placements.next_non_forced_eval_t - t)
+        if t < Balance.BUS_INSTABILITY_AFTER_S:
+            out.append(Balance.BUS_INSTABILITY_AFTER_S - t)
+
+        if power.brownout and power.brownout_sustained_s < Balance.BROWNOUT_SUSTAINED_AFTER_S:
+            out.append(Balance.BROWNOUT_SUSTAINED_AFTER_S - power.brownout_sustained_s)
+        if power.power_quality < Balance.POWER_QUALITY_CRITICAL_THRESHOLD:
+            out.append(Balance.POWER_QUALITY_SHED_INTERVAL_S - power.low_q_shed_timer_s)
+        life_support = ship.systems.get("life_support")
+        if life_support and life_support.state == SystemState.OFFLINE:
+            out.append(Balance.LIFE_SUPPORT_CRITICAL_GRACE_S - ship.life_support_offline_s)
+
+        profile = self._continuous_profile(
+            state, t, window_s, self._compute_p_gen(state), self._compute_load_kw(state)
+        )
+        out.extend(self._battery_event_horizons(state, profile))
+        out.extend(self._radiation_event_horizons(profile))
+        out.extend(self._health_event_horizons(state, profile))
+        out.extend(self._drone_event_horizons(state, profile))
+        return out
+
+    def _battery_event_horizons(self, state: GameState, profile: ContinuousProfile) -> list[float]:
+        power = state.ship.power
+        e_max = power.e_batt_max_kwh
+        rate = profile.e_rate_kwh_s
+        if e_max <= 0.0 or rate == 0.0:
             return []
+        soc = power.e_batt_kwh / e_max
+        out: list[float] = []
+        for mark in _SOC_EVENT_MARKS:
+            if rate < 0.0 and 0.0 < mark == soc:
+                # Shedding and alerts test `soc < mark`, so landing exactly on
+                # a mark still needs one more (minimum) step to cross it.
+                out.append(0.0)
+                continue
+            tau = time_to_reach(power.e_batt_kwh, rate, mark * e_max)
+            if tau > 0.0:
+                out.append(tau)
+        for threshold in _POWER_QUALITY_EVENT_MARKS:
+            out.append(profile.first_crossing(profile.power_quality_at, threshold))
+        return out
+
+    def _radiation_event_horizons(self, profile: ContinuousProfile) -> list[float]:
+        out: list[float] = []
+        for level in (Balance.RAD_LEVEL_ENV_ELEVATED, Balance.RAD_LEVEL_ENV_HIGH, Balance.RAD_LEVEL_ENV_EXTREME):
+            out.append(profile.first_crossing(profile.env_at, level))
+        for level in (
+            Balance.RAD_LEVEL_INTERNAL_ELEVATED,
+            Balance.RAD_LEVEL_INTERNAL_HIGH,
+            Balance.RAD_LEVEL_INTERNAL_EXTREME,
+        ):
+            out.append(profile.first_crossing(profile.internal_rad_at, level))
+        return out
+
+    def _health_event_horizons(self, state: GameState, profile: ContinuousProfile) -> list[float]:
+        power = state.ship.power
+        wear_mult = self._transit_wear_mult(state)
+        brownout_sustained = power.brownout and power.brownout_sustained_s >= Balance.BROWNOUT_SUSTAINED_AFTER_S
+        thresholds = (
+            Balance.SYSTEM_HEALTH_LIMITED,
+            Balance.SYSTEM_HEALTH_DAMAGED,
+            Balance.SYSTEM_HEALTH_CRITICAL,
+        )
+        out: list[float] = []
+        for system in state.ship.systems.values():
+            if system.health <= Balance.SYSTEM_HEALTH_OFFLINE:
+                continue
+            rate = system.base_decay_per_s * wear_mult * self._brownout_degrade_mult(system, brownout_sustained)
+            if rate <= 0.0:
+                continue
+            target = Balance.SYSTEM_HEALTH_OFFLINE
+            for threshold in thresholds:
+                if system.health >= threshold:
+                    target = threshold
+                    break
+            out.append(
+                profile.time_to_integral(
+                    lambda tau, s=system: profile.wear_factor_at(tau, s.k_power, s.k_rad),
+                    (system.health - target) / rate,
+                )
+            )
+        return out
+
+    def _drone_event_horizons(self, state: GameState, profile: ContinuousProfile) -> list[float]:
+        out: list[float] = []
+        dose_levels = (
+            Balance.DRONE_RAD_DOSE_WARN,
+            Balance.DRONE_RAD_DOSE_HIGH,
+            Balance.DRONE_RAD_DOSE_CRITICAL,
+        )
+        support: dict | None = None
+        for drone in state.ship.drones.values():
+            if drone.status == DroneStatus.DEPLOYED:
+                drain = Balance.DRONE_BATTERY_IDLE_DRAIN_DEPLOYED_PER_S
+                battery_max = max(0.000001, float(self._drone_profile(state, drone).battery_max_effective))
+                ratios = [Balance.DRONE_LOW_BATTERY_THRESHOLD, 0.0]
+                if drone.autorecall_enabled:
+                    ratios.append(max(0.0, min(1.0, drone.autorecall_threshold)))
+                for ratio in ratios:
+                    target = ratio * battery_max
+                    if drain > 0.0 and drone.battery > target:
+                        out.append((drone.battery - target) / drain)
+            if drone.status != DroneStatus.DOCKED:
+                for level in dose_levels:
+                    if drone.shield_factor > 0.0 and drone.dose_rad < level:
+                        out.append(profile.time_to_integral(profile.env_at, (level - drone.dose_rad) / drone.shield_factor))
+                continue
+            if support is None:
+                support = self._drone_bay_support_snapshot(state)
+            decon_rate = float(support["decon_rate"])
+            for level in dose_levels:
+                if decon_rate > 0.0 and drone.dose_rad >= level:
+                    out.append((drone.dose_rad - level) / decon_rate)
+            profile = self._drone_profile(state, drone)
+            if (
+                drone.integrity < profile.integrity_max_effective
+                and float(support["repair_rate_mult"]) > 0.0
+                and state.ship.cargo_scrap >= int(support["repair_scrap_cost"])
+            ):
+                # Bay repair spends scrap once per tick, not per second.
+                out.append(0.0)
+        return out
 
-        if isinstance(action, Diag):
+    def apply_action(self, state: GameState, action: Action) -> list[Event]:
+        if isinstance(action, (Status, Diag)):
             return []
+        try:
+            return self._dispatch_action(state, action)
+        finally:
+            # Actions can touch any sub-state.
+            bump_all_versions(state)
 
+    def _dispatch_action(self, state: GameState, action: Action) -> list[Event]:
         blocked = self._check_power_action_block(state, action)
         if blocked:
             return [blocked]
@@ -3332,12 +3548,15 @@ class Engine:
                 job.status = JobStatus.COMPLETED
                 completed.append(job_id)
                 events.extend(self._apply_job_effect(state, job))
+                # Job effects reach into the world, the fs, node pools and systems.
+                bump_all_versions(state)
                 if job.status == JobStatus.COMPLETED and job.terminal_seq is None:
                     self._finalize_job(state.jobs, job, JobStatus.COMPLETED)
 
         for job_id in completed:
-            if job_id in jobs_state.active_job_ids:
-                jobs_state.active_job_ids.remove(job_id)
+            retire_job(jobs_state, job_id)
+        if jobs_state.active_job_ids or completed:
+            bump_versions(state, "jobs")
 
         return events
 
@@ -3812,7 +4031,9 @@ class Engine:
         recovery_entry_id = getattr(state.world.exploration_recovery, "entry_node_id", None)
         state.meta.rng_counter += 1
 
-        for node_id, target in state.world.space.nodes.items():
+        nodes = state.world.space.nodes
+        for node_id in state.world.space.nodes_within((x, y, z), radius_ly):
+            target = nodes[node_id]
             dx = target.x_ly - x
             dy = target.y_ly - y
             dz = target.z_ly - z
@@ -3882,6 +4103,7 @@ class Engine:
             return
         state.world.space.nodes.pop(tmp_id, None)
         state.world.known_links.pop(tmp_id, None)
+        mark_node_completion_dirty(state, tmp_id)
         state.world.active_tmp_node_id = None
         state.world.active_tmp_from = None
         state.world.active_tmp_to = None
@@ -3891,7 +4113,11 @@ class Engine:
         unknown_id = "UNKNOWN"
         if state.world.current_node_id == unknown_id:
             return
+        sector_id = state.world.node_sector_id(unknown_id)
         state.world.space.nodes.pop(unknown_id, None)
+        if sector_id is not None:
+            state.world.sync_sector_membership(sector_id)
+        mark_node_completion_dirty(state, unknown_id)
         state.world.known_contacts.discard(unknown_id)
         if hasattr(state.world, "known_nodes"):
             state.world.known_nodes.discard(unknown_id)
@@ -4480,6 +4706,7 @@ class Engine:
             if node and node.recoverable_drones_count > 0:
                 recovered_count = int(node.recoverable_drones_count)
                 node.recoverable_drones_count = 0
+                mark_node_completion_dirty(state, node_id)
                 for _ in range(recovered_count):
                     drone_id = self._next_fleet_drone_id(state)
                     integrity, battery, dose = self._roll_salvaged_drone_stats(state)
@@ -4824,25 +5051,7 @@ class Engine:
         return events
 
     def _compute_load_kw(self, state: GameState) -> float:
-        systems = state.ship.systems.values()
-        job_load_kw = 0.0
-        for job in state.jobs.jobs.values():
-            if job.status == JobStatus.RUNNING and job.power_draw_kw > 0.0:
-                job_load_kw += job.power_draw_kw
-        if state.ship.op_mode == "CRUISE":
-            cruise_shed_targets = {"sensors", "security", "data_core", "drone_bay"}
-            def _factor(sys: ShipSystem) -> float:
-                if sys.state == SystemState.OFFLINE:
-                    return 0.0
-                if sys.system_id in cruise_shed_targets and sys.forced_offline:
-                    return 0.0
-                if "critical" in sys.tags or sys.system_id in {"energy_distribution"}:
-                    return 1.0
-                if sys.system_id in cruise_shed_targets:
-                    return 1.0
-                return 0.1
-            return sum(sys.p_effective_kw() * _factor(sys) for sys in systems) + job_load_kw
-        return sum(system.p_effective_kw() for system in systems if system.state != SystemState.OFFLINE) + job_load_kw
+        return PowerNetwork(state).p_load
 
     def _distance_between_nodes(self, state: GameState, from_id: str, to_id: str) -> float:
         nodes = state.world.space.nodes
@@ -4855,23 +5064,18 @@ class Engine:
         dz = float(a.z_ly) - float(b.z_ly)
         return math.sqrt(dx * dx + dy * dy + dz * dz)
 
-    def _auto_load_shed(self, state: GameState, p_capacity: float, p_load: float) -> list[Event]:
+    def _auto_load_shed(
+        self, state: GameState, p_capacity: float, p_load: float, network: PowerNetwork | None = None
+    ) -> list[Event]:
         events: list[Event] = []
-        systems_sorted = sorted(
-            state.ship.systems.values(),
-            key=lambda s: s.priority,
-            reverse=True,
-        )
-        for system in systems_sorted:
+        network = network or PowerNetwork(state)
+        for system in network.shed_order():
             if p_load <= p_capacity:
                 break
             if system.state == SystemState.OFFLINE or system.priority == 1:
                 continue
             prev_load = system.p_effective_kw()
-            old_state = system.state
-            system.state = SystemState.OFFLINE
-            system.forced_offline = True
-            system.auto_offline_reason = "load_shed"
+            old_state = network.take_offline(system)
             p_load -= prev_load
             events.append(
                 self._make_event(
@@ -4910,35 +5114,45 @@ class Engine:
     def _apply_degradation(
         self,
         state: GameState,
-        dt: float,
-        power_quality: float,
+        profile: ContinuousProfile,
         brownout_sustained: bool,
-        internal_rad: float,
     ) -> list[Event]:
-        internal_rad_norm = self._clamp(internal_rad / Balance.R_REF)
         events: list[Event] = []
-        wear_mult = 1.0
-        if state.ship.in_transit and state.ship.op_mode != "CRUISE":
-            wear_mult = Balance.TRANSIT_WEAR_MULT_NORMAL
+        wear_mult = self._transit_wear_mult(state)
+        # s_factor is linear in (1 - quality) and internal radiation, so its
+        # integral over the tick only needs these two shared integrals.
+        quality_loss = profile.integral(lambda tau: 1.0 - profile.power_quality_at(tau))
+        rad_exposure = profile.integral(profile.internal_rad_norm_at)
         for system in state.ship.systems.values():
-            s_factor = 1.0 + system.k_power * (1.0 - power_quality) + system.k_rad * internal_rad_norm
-            if brownout_sustained:
-                if system.system_id == "energy_distribution":
-                    s_factor *= Balance.BROWNOUT_DEGRADE_MULT_DISTRIBUTION
-                elif system.system_id == "power_core":
-                    s_factor *= Balance.BROWNOUT_DEGRADE_MULT_POWER_CORE
+            s_integral = profile.span_s + system.k_power * quality_loss + system.k_rad * rad_exposure
+            s_integral *= self._brownout_degrade_mult(system, brownout_sustained)
             system.health = max(
                 0.0,
-                system.health - system.base_decay_per_s * s_factor * wear_mult * dt,
+                system.health - system.base_decay_per_s * s_integral * wear_mult,
             )
             self._apply_health_state(system, state, events, cause="degradation")
         return events
 
-    def _apply_radiation(self, state: GameState, dt: float, env_rad: float) -> None:
+    def _transit_wear_mult(self, state: GameState) -> float:
+        if state.ship.in_transit and state.ship.op_mode != "CRUISE":
+            return Balance.TRANSIT_WEAR_MULT_NORMAL
+        return 1.0
+
+    def _brownout_degrade_mult(self, system: ShipSystem, brownout_sustained: bool) -> float:
+        if not brownout_sustained:
+            return 1.0
+        if system.system_id == "energy_distribution":
+            return Balance.BROWNOUT_DEGRADE_MULT_DISTRIBUTION
+        if system.system_id == "power_core":
+            return Balance.BROWNOUT_DEGRADE_MULT_POWER_CORE
+        return 1.0
+
+    def _apply_radiation(self, state: GameState, profile: ContinuousProfile) -> None:
+        env_dose = profile.integral(profile.env_at)
         for drone in state.ship.drones.values():
             if drone.status == DroneStatus.DOCKED:
                 continue
-            drone.dose_rad += env_rad * drone.shield_factor * dt
+            drone.dose_rad += env_dose * drone.shield_factor
 
     def _update_drone_maintenance(self, state: GameState, dt: float) -> None:
         for drone in state.ship.drones.values():
@@ -6063,53 +6277,79 @@ class Engine:
         }
         return order[state]
 
-    def _compute_env_radiation_rad_per_s(self, state: GameState) -> float:
+    def _env_radiation_ramp(self, state: GameState) -> tuple[float, float, float, float]:
+        """Ambient radiation as (from_rad, to_rad, ramp_start_t, ramp_end_t); constant when from == to."""
         fallback = max(0.0, float(state.ship.radiation_env_rad_per_s))
         nodes = state.world.space.nodes
         if state.ship.in_transit:
             from_node = nodes.get(state.ship.transit_from)
             to_node = nodes.get(state.ship.transit_to)
             if from_node and to_node:
-                from_rad = max(0.0, float(from_node.radiation_rad_per_s))
-                to_rad = max(0.0, float(to_node.radiation_rad_per_s))
-                start_t = float(state.ship.transit_start_t)
-                end_t = float(state.ship.arrival_t)
-                if end_t > start_t:
-                    progress = self._clamp((state.clock.t - start_t) / (end_t - start_t))
-                else:
-                    progress = 1.0
-                return max(0.0, from_rad + (to_rad - from_rad) * progress)
+                return (
+                    max(0.0, float(from_node.radiation_rad_per_s)),
+                    max(0.0, float(to_node.radiation_rad_per_s)),
+                    float(state.ship.transit_start_t),
+                    float(state.ship.arrival_t),
+                )
             if from_node:
-                return max(0.0, float(from_node.radiation_rad_per_s))
-            if to_node:
-                return max(0.0, float(to_node.radiation_rad_per_s))
-            return fallback
+                value = max(0.0, float(from_node.radiation_rad_per_s))
+            elif to_node:
+                value = max(0.0, float(to_node.radiation_rad_per_s))
+            else:
+                value = fallback
+            return (value, value, 0.0, 0.0)
         current_id = state.world.current_node_id or state.ship.current_node_id
         node = nodes.get(current_id) if current_id else None
-        if node:
-            return max(0.0, float(node.radiation_rad_per_s))
-        return fallback
+        value = max(0.0, float(node.radiation_rad_per_s)) if node else fallback
+        return (value, value, 0.0, 0.0)
+
+    def _compute_env_radiation_rad_per_s(self, state: GameState) -> float:
+        from_rad, to_rad, start_t, end_t = self._env_radiation_ramp(state)
+        if end_t > start_t:
+            progress = self._clamp((state.clock.t - start_t) / (end_t - start_t))
+        else:
+            progress = 1.0
+        return max(0.0, from_rad + (to_rad - from_rad) * progress)
 
     def _compute_internal_radiation_rad_per_s(self, state: GameState, env_rad: float) -> float:
-        hull = self._clamp(state.ship.hull_integrity)
-        ingress = (
-            Balance.HULL_INTERNAL_RAD_MIN_INGRESS
-            + (1.0 - hull) * (Balance.HULL_INTERNAL_RAD_MAX_INGRESS - Balance.HULL_INTERNAL_RAD_MIN_INGRESS)
-        )
-        ingress = self._clamp(
-            ingress,
-            Balance.HULL_INTERNAL_RAD_MIN_INGRESS,
-            Balance.HULL_INTERNAL_RAD_MAX_INGRESS,
-        )
-        return max(0.0, env_rad) * ingress
+        return max(0.0, env_rad) * hull_ingress(state.ship.hull_integrity)
 
-    def _apply_hull_degradation(self, state: GameState, dt: float, env_rad: float) -> None:
-        env_norm = self._clamp(env_rad / Balance.HULL_RAD_REF) if Balance.HULL_RAD_REF > 0 else 0.0
-        env_mult = 1.0 + env_norm * (Balance.HULL_RAD_DECAY_MULT_MAX - 1.0)
+    def _continuous_profile(
+        self,
+        state: GameState,
+        start_t: float,
+        span_s: float,
+        p_gen: float,
+        p_load: float,
+    ) -> ContinuousProfile:
+        """Battery, radiation and hull model for [start_t, start_t + span_s] at fixed loads."""
+        power = state.ship.power
+        env_from, env_to, ramp_start_t, ramp_end_t = self._env_radiation_ramp(state)
+        hull_mult = 1.0
         if state.ship.in_transit or state.ship.is_hibernating:
-            env_mult *= Balance.HULL_TRANSIT_DECAY_MULT
-        amount = Balance.HULL_BASE_DECAY_PER_S * env_mult * dt
-        self._damage_hull(state, amount)
+            hull_mult = Balance.HULL_TRANSIT_DECAY_MULT
+        return ContinuousProfile(
+            span_s=span_s,
+            e0_kwh=power.e_batt_kwh,
+            e_max_kwh=power.e_batt_max_kwh,
+            e_rate_kwh_s=battery_rate_kwh_per_s(
+                p_gen - p_load,
+                power.p_charge_max_kw,
+                power.p_discharge_max_kw,
+                power.eta_charge,
+                power.eta_discharge,
+            ),
+            quality_const=self._power_quality_const(state, self._deficit_ratio(state, p_gen, p_load)),
+            env_from=env_from,
+            env_to=env_to,
+            env_ramp_start_s=ramp_start_t - start_t,
+            env_ramp_end_s=ramp_end_t - start_t,
+            hull0=state.ship.hull_integrity,
+            hull_decay_per_s=Balance.HULL_BASE_DECAY_PER_S * hull_mult,
+        )
+
+    def _apply_hull_degradation(self, state: GameState, profile: ContinuousProfile) -> None:
+        self._damage_hull(state, state.ship.hull_integrity - profile.hull_at(profile.span_s))
 
     def _damage_hull(self, state: GameState, amount: float) -> None:
         if amount <= 0.0:
@@ -6273,23 +6513,16 @@ class Engine:
             return False
         return True
 
-    def _auto_shed_one_noncritical(self, state: GameState) -> list[Event]:
+    def _auto_shed_one_noncritical(self, state: GameState, network: PowerNetwork | None = None) -> list[Event]:
         events: list[Event] = []
-        systems_sorted = sorted(
-            state.ship.systems.values(),
-            key=lambda s: s.priority,
-            reverse=True,
-        )
-        for system in systems_sorted:
+        network = network or PowerNetwork(state)
+        for system in network.shed_order():
             if system.state == SystemState.OFFLINE:
                 continue
             if not self._is_noncritical_system(system):
                 continue
             prev_load = system.p_effective_kw()
-            old_state = system.state
-            system.state = SystemState.OFFLINE
-            system.forced_offline = True
-            system.auto_offline_reason = "load_shed"
+            old_state = network.take_offline(system)
             events.append(
                 self._make_event(
                     state,
@@ -6309,22 +6542,15 @@ class Engine:
             break
         return events
 
-    def _shed_all_noncritical(self, state: GameState) -> list[Event]:
+    def _shed_all_noncritical(self, state: GameState, network: PowerNetwork | None = None) -> list[Event]:
         events: list[Event] = []
-        systems_sorted = sorted(
-            state.ship.systems.values(),
-            key=lambda s: s.priority,
-            reverse=True,
-        )
-        for system in systems_sorted:
+        network = network or PowerNetwork(state)
+        for system in network.shed_order():
             if system.state == SystemState.OFFLINE:
                 continue
             if not self._is_noncritical_system(system):
                 continue
-            old_state = system.state
-            system.state = SystemState.OFFLINE
-            system.forced_offline = True
-            system.auto_offline_reason = "load_shed"
+            old_state = network.take_offline(system)
             if system.service:
                 system.service.is_running = False
             events.append(
@@ -6532,50 +6758,32 @@ class Engine:
 
         return None
 
-    def _update_battery(self, state: GameState, dt: float, p_gen: float, p_load: float) -> None:
-        p_charge_max = state.ship.power.p_charge_max_kw
-        p_discharge_max = state.ship.power.p_discharge_max_kw
-        net = p_gen - p_load
-        if net >= 0:
-            charge_kw = min(net, p_charge_max)
-            delta_e = (charge_kw * dt / 3600.0) * state.ship.power.eta_charge
-            state.ship.power.e_batt_kwh = min(
-                state.ship.power.e_batt_max_kwh,
-                state.ship.power.e_batt_kwh + delta_e,
-            )
-        else:
-            discharge_kw = min(-net, p_discharge_max)
-            delta_e = (discharge_kw * dt / 3600.0) / max(state.ship.power.eta_discharge, 1e-6)
-            state.ship.power.e_batt_kwh = max(
-                0.0,
-                state.ship.power.e_batt_kwh - delta_e,
-            )
+    def _update_battery(self, state: GameState, profile: ContinuousProfile) -> None:
+        state.ship.power.e_batt_kwh = profile.energy_at(profile.span_s)
 
-    def _compute_power_quality(self, state: GameState, p_gen: float, p_load: float) -> float:
-        if state.ship.power.e_batt_max_kwh > 0:
-            soc = state.ship.power.e_batt_kwh / state.ship.power.e_batt_max_kwh
-        else:
-            soc = 0.0
-        q_soc = self._clamp((soc - 0.10) / (0.50 - 0.10))
+    def _deficit_ratio(self, state: GameState, p_gen: float, p_load: float) -> float:
         p_deficit = max(0.0, p_load - p_gen)
-        p_deficit_ratio = (
-            self._clamp(p_deficit / state.ship.power.p_discharge_max_kw)
-            if state.ship.power.p_discharge_max_kw > 0
-            else 1.0
-        )
-        state.ship.power.deficit_ratio = p_deficit_ratio
-        q_def = 1.0 - 0.7 * p_deficit_ratio
-        power_quality = 0.6 * q_soc + 0.4 * q_def
+        if state.ship.power.p_discharge_max_kw > 0:
+            return self._clamp(p_deficit / state.ship.power.p_discharge_max_kw)
+        return 1.0
 
+    def _power_quality_const(self, state: GameState, deficit_ratio: float) -> float:
+        """Power-quality terms that do not depend on SoC."""
+        q_def = 1.0 - 0.7 * deficit_ratio
+        power_quality = 0.4 * q_def
         distribution = state.ship.systems.get("energy_distribution")
         if distribution:
             if distribution.state == SystemState.CRITICAL:
                 power_quality -= 0.20
             elif distribution.state in (SystemState.DAMAGED, SystemState.LIMITED):
                 power_quality -= 0.10
+        return power_quality + state.ship.power.quality_offset
 
-        power_quality += state.ship.power.quality_offset
-        return self._clamp(power_quality)
+    def _compute_power_quality(self, state: GameState, p_gen: float, p_load: float) -> float:
+        p_deficit_ratio = self._deficit_ratio(state, p_gen, p_load)
+        state.ship.power.deficit_ratio = p_deficit_ratio
+        power_quality = SOC_QUALITY_WEIGHT * soc_quality(self._soc(state))
+        return self._clamp(power_quality + self._power_quality_const(state, p_deficit_ratio))
 
     def _compute_p_gen(self, state: GameState) -> float:
         base = state.ship.power.p_gen_base_kw + state.ship.power.p_gen_bonus_kw
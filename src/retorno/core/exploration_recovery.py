@@ -4,6 +4,7 @@ import math
 import random
 
 from retorno.config.balance import Balance
+from retorno.core.versions import bump_versions, memoize_on_versions
 from retorno.core.lore import (
     _location_node_ids,
     _pending_node_files_count,
@@ -138,19 +139,18 @@ def _has_route_solve_frontier(state, reachable: set[str]) -> bool:
     if sensors_range <= 0.0:
         return False
 
+    max_dist = min(sensors_range, float(Balance.MAX_ROUTE_HOP_LY))
     for from_id in reachable:
         origin = nodes.get(from_id)
         if not origin:
             continue
-        for dest_id in known:
-            if dest_id == from_id or dest_id in visited:
+        linked = state.world.known_links.get(from_id, set())
+        for dest_id in state.world.space.nodes_within((origin.x_ly, origin.y_ly, origin.z_ly), max_dist):
+            if dest_id == from_id or dest_id in visited or dest_id not in known:
                 continue
-            if dest_id in state.world.known_links.get(from_id, set()):
+            if dest_id in linked:
                 continue
-            dest = nodes.get(dest_id)
-            if not dest:
-                continue
-            dist = _distance_ly(origin, dest)
+            dist = _distance_ly(origin, nodes[dest_id])
             if dist <= sensors_range and dist <= float(Balance.MAX_ROUTE_HOP_LY):
                 return True
     return False
@@ -187,9 +187,7 @@ def _node_has_pending_uplink_payload(state, node_id: str) -> bool:
     return False
 
 
-def _has_uplink_frontier(state, reachable: set[str]) -> bool:
-    if _uplink_system_blocked_reason(state):
-        return False
+def _has_uplink_payload(state, reachable: set[str]) -> bool:
     nodes = state.world.space.nodes
     for node_id in reachable:
         node = nodes.get(node_id)
@@ -217,20 +215,27 @@ def _has_passive_recovery_frontier(state) -> bool:
     return False
 
 
-def has_exploration_frontier(state) -> bool:
+@memoize_on_versions("world", "links", "pools", "fs", extra=lambda state: float(state.ship.sensors_range_ly))
+def _frontier_summary(state) -> tuple[bool, bool]:
+    """(frontier that needs no uplink, uplink payload reachable); the uplink gate is checked by the caller."""
     current_id = state.world.current_node_id
     reachable = _reachable_component(state.world.known_links, current_id)
     if _has_known_route_frontier(state, reachable):
-        return True
+        return True, False
     if _has_route_solve_frontier(state, reachable):
-        return True
-    if _has_uplink_frontier(state, reachable):
-        return True
+        return True, False
     if _has_non_uplink_data_frontier(state, reachable):
-        return True
+        return True, False
     if _has_passive_recovery_frontier(state):
+        return True, False
+    return False, _has_uplink_payload(state, reachable)
+
+
+def has_exploration_frontier(state) -> bool:
+    frontier, uplink_payload = _frontier_summary(state)
+    if frontier:
         return True
-    return False
+    return uplink_payload and not _uplink_system_blocked_reason(state)
 
 
 def _sample_anchor_offset(
@@ -269,7 +274,11 @@ def _pick_existing_gateway_candidate(state, entry_node_id: str) -> str | None:
     authored = _location_node_ids()
     known = _known_node_ids(state)
     candidates: list[tuple[float, str]] = []
-    for node in state.world.space.nodes.values():
+    nodes = state.world.space.nodes
+    nearby_ids = state.world.space.nodes_within(
+        (entry.x_ly, entry.y_ly, entry.z_ly), float(Balance.MAX_ROUTE_HOP_LY)
+    )
+    for node in (nodes[node_id] for node_id in nearby_ids):
         if node.node_id in {entry_node_id, state.world.current_node_id}:
             continue
         if not node.is_hub or node.node_id in known or node.node_id in authored:
@@ -292,15 +301,17 @@ def _drop_hidden_node(state, node_id: str) -> None:
         return
     for other in state.world.space.nodes.values():
         other.links.discard(node_id)
+    state.world.space.links_changed()
     state.world.forced_hidden_nodes.discard(node_id)
     state.world.node_pools.pop(node_id, None)
     state.world.dead_nodes.pop(node_id, None)
     state.world.known_links.pop(node_id, None)
     for links in state.world.known_links.values():
         links.discard(node_id)
-    for sector_state in state.world.sector_states.values():
-        if node_id in sector_state.node_ids:
-            sector_state.node_ids = [existing for existing in sector_state.node_ids if existing != node_id]
+    sector_id = sector_id_for_pos(node.x_ly, node.y_ly, node.z_ly)
+    sector_state = state.world.sector_states.get(sector_id)
+    if sector_state is not None:
+        state.world.sync_sector_membership(sector_id)
         if sector_state.playable_hub_node_id == node_id:
             sector_state.playable_hub_node_id = None
         if sector_state.topology_hub_node_id == node_id:
@@ -501,8 +512,13 @@ def _deliver_gateway_broadcast_if_needed(state) -> list[Event]:
 def ensure_exploration_recovery(state, trigger: str) -> list[Event]:
     sync_node_pools_for_known_nodes(state)
     events = _deliver_gateway_broadcast_if_needed(state)
+    if events:
+        bump_versions(state, "world")
     if not is_exploration_capable(state):
         return events
     if has_exploration_frontier(state):
         return events
-    return events + _activate_recovery(state, trigger)
+    activated = _activate_recovery(state, trigger)
+    # Recovery adds (or drops) hidden nodes, pools and hint files even when it gives up.
+    bump_versions(state, "world", "links", "pools", "fs")
+    return events + activated
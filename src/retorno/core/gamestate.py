@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import MISSING, dataclass, field, fields
 
 from retorno.config.balance import Balance
+from retorno.core.versions import StateVersions
 
 from retorno.model.events import EventManagerState
 from retorno.model.jobs import JobManagerState
@@ -34,3 +35,27 @@ class GameState:
     os: OSState = field(default_factory=OSState)
     jobs: JobManagerState = field(default_factory=JobManagerState)
     events: EventManagerState = field(default_factory=EventManagerState)
+    versions: StateVersions = field(default_factory=StateVersions, repr=False, compare=False)
+
+    def __setstate__(self, state) -> None:
+        """Backward-compatible unpickle for slot additions."""
+        slot_state = state
+        if isinstance(state, tuple):
+            if len(state) == 2 and isinstance(state[1], dict):
+                slot_state = state[1]
+            elif len(state) == 2 and isinstance(state[0], dict):
+                slot_state = state[0]
+        if not isinstance(slot_state, dict):
+            raise TypeError(f"Unsupported GameState pickle payload: {type(state)!r}")
+
+        data = dict(slot_state)
+        for f in fields(self):
+            if f.name in data:
+                value = data[f.name]
+            elif f.default is not MISSING:
+                value = f.default
+            elif f.default_factory is not MISSING:
+                value = f.default_factory()
+            else:
+                continue
+            object.__setattr__(self, f.name, value)
@@ -0,0 +1,240 @@
+"""Closed-form integrators for the ship's continuous processes.
+
+Between discrete events the battery, hull, ambient radiation and system wear
+follow linear or clamp-limited laws. `ContinuousProfile` splits an interval at
+every clamp/kink so each quantity is a polynomial of degree <= 3 inside a
+piece; Simpson's rule is exact there, so results do not depend on `dt`.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Callable
+
+from retorno.config.balance import Balance
+
+# Power quality ramps linearly with SoC between these marks.
+SOC_QUALITY_LOW = 0.10
+SOC_QUALITY_HIGH = 0.50
+SOC_QUALITY_WEIGHT = 0.6
+
+_BISECT_ITERS = 64
+
+
+def clamp(value: float, lo: float = 0.0, hi: float = 1.0) -> float:
+    if value < lo:
+        return lo
+    if value > hi:
+        return hi
+    return value
+
+
+def linear_clamped(value: float, rate: float, dt: float, lo: float = -math.inf, hi: float = math.inf) -> float:
+    return clamp(value + rate * dt, lo, hi)
+
+
+def time_to_reach(value: float, rate: float, target: float) -> float:
+    """Seconds until `value + rate * t` reaches `target` (0 if already there, inf if never)."""
+    delta = target - value
+    if delta == 0.0:
+        return 0.0
+    if rate == 0.0 or (delta > 0.0) != (rate > 0.0):
+        return math.inf
+    return delta / rate
+
+
+def battery_rate_kwh_per_s(
+    net_kw: float,
+    p_charge_max_kw: float,
+    p_discharge_max_kw: float,
+    eta_charge: float,
+    eta_discharge: float,
+) -> float:
+    if net_kw >= 0.0:
+        return min(net_kw, p_charge_max_kw) / 3600.0 * eta_charge
+    return -min(-net_kw, p_discharge_max_kw) / 3600.0 / max(eta_discharge, 1e-6)
+
+
+def soc_quality(soc: float) -> float:
+    return clamp((soc - SOC_QUALITY_LOW) / (SOC_QUALITY_HIGH - SOC_QUALITY_LOW))
+
+
+def hull_ingress(hull_integrity: float) -> float:
+    lo = Balance.HULL_INTERNAL_RAD_MIN_INGRESS
+    hi = Balance.HULL_INTERNAL_RAD_MAX_INGRESS
+    return clamp(lo + (1.0 - clamp(hull_integrity)) * (hi - lo), lo, hi)
+
+
+def hull_decay_mult(env_rad: float) -> float:
+    env_norm = clamp(env_rad / Balance.HULL_RAD_REF) if Balance.HULL_RAD_REF > 0 else 0.0
+    return 1.0 + env_norm * (Balance.HULL_RAD_DECAY_MULT_MAX - 1.0)
+
+
+def _simpson(fn: Callable[[float], float], a: float, b: float) -> float:
+    if b <= a:
+        return 0.0
+    return (b - a) / 6.0 * (fn(a) + 4.0 * fn(0.5 * (a + b)) + fn(b))
+
+
+def _bisect_past(fn: Callable[[float], float], lo: float, hi: float) -> float:
+    """Return a point just past the sign change of `fn` in [lo, hi]."""
+    lo_sign = fn(lo) > 0.0
+    for _ in range(_BISECT_ITERS):
+        mid = 0.5 * (lo + hi)
+        if mid <= lo or mid >= hi:
+            break
+        if (fn(mid) > 0.0) == lo_sign:
+            lo = mid
+        else:
+            hi = mid
+    return hi
+
+
+@dataclass(slots=True)
+class ContinuousProfile:
+    """Battery, ambient radiation and hull over [0, span_s] with fixed power flows.
+
+    Times are seconds from the start of the interval. `quality_const` holds the
+    power-quality terms that do not depend on SoC (deficit, distribution state,
+    offsets); `env_*` describe the transit ramp (equal from/to when docked).
+    """
+
+    span_s: float
+    e0_kwh: float
+    e_max_kwh: float
+    e_rate_kwh_s: float
+    quality_const: float
+    env_from: float
+    env_to: float
+    env_ramp_start_s: float
+    env_ramp_end_s: float
+    hull0: float
+    hull_decay_per_s: float
+    breakpoints: list[float] = field(init=False, default_factory=list)
+    _hull_at_breaks: list[float] = field(init=False, default_factory=list)
+
+    def __post_init__(self) -> None:
+        span = max(0.0, self.span_s)
+        points = {0.0, span}
+        for energy in self._energy_kinks():
+            points.add(time_to_reach(self.e0_kwh, self.e_rate_kwh_s, energy))
+        for tau in self._env_kinks():
+            points.add(tau)
+        self._set_breakpoints(points)
+
+        if self.hull_decay_per_s > 0.0 and self.hull_at(span) <= 0.0 < self.hull0:
+            points.add(self.first_crossing(self._hull_raw, 0.0))
+            self._set_breakpoints(points)
+        for a, b in zip(self.breakpoints, self.breakpoints[1:]):
+            over = lambda tau: self.internal_rad_at(tau) - Balance.R_REF
+            if (over(a) > 0.0) != (over(b) > 0.0):
+                points.add(_bisect_past(over, a, b))
+        self._set_breakpoints(points)
+
+    def _energy_kinks(self) -> list[float]:
+        if self.e_max_kwh <= 0.0:
+            return []
+        socs = [0.0, 1.0, SOC_QUALITY_LOW, SOC_QUALITY_HIGH]
+        for quality in (0.0, 1.0):
+            q_soc = (quality - self.quality_const) / SOC_QUALITY_WEIGHT
+            if 0.0 < q_soc < 1.0:
+                socs.append(SOC_QUALITY_LOW + q_soc * (SOC_QUALITY_HIGH - SOC_QUALITY_LOW))
+        return [soc * self.e_max_kwh for soc in socs]
+
+    def _env_kinks(self) -> list[float]:
+        out = [self.env_ramp_start_s, self.env_ramp_end_s]
+        ramp = self.env_ramp_end_s - self.env_ramp_start_s
+        if ramp > 0.0 and self.env_to != self.env_from:
+            progress = (Balance.HULL_RAD_REF - self.env_from) / (self.env_to - self.env_from)
+            if 0.0 < progress < 1.0:
+                out.append(self.env_ramp_start_s + progress * ramp)
+        return out
+
+    def _set_breakpoints(self, points: set[float]) -> None:
+        span = max(0.0, self.span_s)
+        self.breakpoints = sorted(p for p in points if 0.0 <= p <= span)
+        hull = [self.hull0]
+        for a, b in zip(self.breakpoints, self.breakpoints[1:]):
+            hull.append(hull[-1] - self.hull_decay_per_s * _simpson(self.hull_mult_at, a, b))
+        self._hull_at_breaks = hull
+
+    def _piece_index(self, tau: float) -> int:
+        idx = 0
+        for i, point in enumerate(self.breakpoints[:-1]):
+            if point <= tau:
+                idx = i
+        return idx
+
+    def energy_at(self, tau: float) -> float:
+        return linear_clamped(self.e0_kwh, self.e_rate_kwh_s, tau, 0.0, self.e_max_kwh)
+
+    def soc_at(self, tau: float) -> float:
+        return self.energy_at(tau) / self.e_max_kwh if self.e_max_kwh > 0.0 else 0.0
+
+    def power_quality_at(self, tau: float) -> float:
+        return clamp(SOC_QUALITY_WEIGHT * soc_quality(self.soc_at(tau)) + self.quality_const)
+
+    def env_at(self, tau: float) -> float:
+        ramp = self.env_ramp_end_s - self.env_ramp_start_s
+        progress = clamp((tau - self.env_ramp_start_s) / ramp) if ramp > 0.0 else 1.0
+        return max(0.0, self.env_from + (self.env_to - self.env_from) * progress)
+
+    def hull_mult_at(self, tau: float) -> float:
+        return hull_decay_mult(self.env_at(tau))
+
+    def _hull_raw(self, tau: float) -> float:
+        idx = self._piece_index(tau)
+        start = self.breakpoints[idx] if self.breakpoints else 0.0
+        base = self._hull_at_breaks[idx] if self._hull_at_breaks else self.hull0
+        return base - self.hull_decay_per_s * _simpson(self.hull_mult_at, start, tau)
+
+    def hull_at(self, tau: float) -> float:
+        return clamp(self._hull_raw(tau))
+
+    def internal_rad_at(self, tau: float) -> float:
+        return self.env_at(tau) * hull_ingress(self.hull_at(tau))
+
+    def internal_rad_norm_at(self, tau: float) -> float:
+        return clamp(self.internal_rad_at(tau) / Balance.R_REF)
+
+    def wear_factor_at(self, tau: float, k_power: float, k_rad: float) -> float:
+        """`s_factor` of `Engine._apply_degradation` at time `tau`."""
+        return 1.0 + k_power * (1.0 - self.power_quality_at(tau)) + k_rad * self.internal_rad_norm_at(tau)
+
+    def integral(self, fn: Callable[[float], float], end: float | None = None) -> float:
+        end = self.span_s if end is None else min(end, self.span_s)
+        total = 0.0
+        for a, b in zip(self.breakpoints, self.breakpoints[1:]):
+            if a >= end:
+                break
+            total += _simpson(fn, a, min(b, end))
+        return total
+
+    def time_to_integral(self, fn: Callable[[float], float], amount: float) -> float:
+        """First time the integral of a non-negative `fn` reaches `amount` (inf if not in span)."""
+        if amount <= 0.0:
+            return 0.0
+        total = 0.0
+        for a, b in zip(self.breakpoints, self.breakpoints[1:]):
+            piece = _simpson(fn, a, b)
+            if total + piece >= amount:
+                need = amount - total
+                return _bisect_past(lambda tau: _simpson(fn, a, tau) - need, a, b)
+            total += piece
+        return math.inf
+
+    def first_crossing(self, fn: Callable[[float], float], level: float) -> float:
+        """First time `fn` moves across `level` (landing just past it), or inf."""
+        for a, b in zip(self.breakpoints, self.breakpoints[1:]):
+            fa = fn(a) - level
+            fb = fn(b) - level
+            if fa == 0.0:
+                # Sitting exactly on the level: one more step settles which side it is on.
+                if fb != 0.0:
+                    return a
+                continue
+            if (fa > 0.0) == (fb > 0.0):
+                continue
+            return _bisect_past(lambda tau: fn(tau) - level, a, b)
+        return math.inf
@@ -1,17 +1,22 @@
 from __future__ import annotations
 
+import bisect
+from collections import deque
 from dataclasses import dataclass
 import hashlib
+import itertools
 import math
+import operator
 import random
 import re
-from pathlib import Path
 
 from retorno.config.balance import Balance
+from retorno.core.versions import bump_versions, versions_stamp
 from retorno.model.events import Event, EventType, Severity, SourceRef
-from retorno.model.os import AccessLevel, FSNode, FSNodeType, normalize_path, register_mail
+from retorno.model.os import AccessLevel, FSNode, FSNodeType, mount_dest_path, normalize_path, register_mail
 from retorno.model.world import (
     SECTOR_SIZE_LY,
+    LorePlacementState,
     NodePoolState,
     SpaceNode,
     add_known_link,
@@ -20,7 +25,7 @@ from retorno.model.world import (
     region_for_pos,
     sector_id_for_pos,
 )
-from retorno.runtime.data_loader import load_arcs, load_locations, load_singles
+from retorno.runtime.data_loader import load_arcs, load_data_text, load_locations, load_singles
 from retorno.worldgen.generator import (
     _generate_node_id,
     _name_from_node_id,
@@ -59,13 +64,7 @@ def _lore_seed(*parts: object) -> int:
 
 
 def _content_from_ref(content_ref: str | None) -> str:
-    if not content_ref:
-        return ""
-    path = Path(__file__).resolve().parents[3] / "data" / content_ref
-    try:
-        return path.read_text(encoding="utf-8")
-    except Exception:
-        return ""
+    return load_data_text(content_ref)
 
 
 def _sanitize_piece_path_id(value: str) -> str:
@@ -110,6 +109,7 @@ def deliver_ship_mail(
     mail_from: str | None = None,
     mail_subject: str | None = None,
 ) -> str:
+    bump_versions(state, "fs")
     _ensure_dir(state.os.fs, "/mail")
     _ensure_dir(state.os.fs, "/mail/inbox")
     seq = state.events.next_event_seq
@@ -126,6 +126,7 @@ def deliver_ship_mail(
 
 
 def deliver_captured_signal(state, content_ref: str, lang: str) -> str:
+    bump_versions(state, "fs")
     _ensure_dir(state.os.fs, "/logs")
     _ensure_dir(state.os.fs, "/logs/signals")
     seq = state.events.next_event_seq
@@ -136,6 +137,7 @@ def deliver_captured_signal(state, content_ref: str, lang: str) -> str:
 
 
 def deliver_station_broadcast(state, node_id: str, content_ref: str, lang: str) -> str:
+    bump_versions(state, "fs")
     _ensure_dir(state.os.fs, "/logs")
     _ensure_dir(state.os.fs, "/logs/broadcasts")
     seq = state.events.next_event_seq
@@ -158,6 +160,7 @@ def write_local_intel(
     seq = state.events.next_event_seq
     locale = state.os.locale.value
     source = source or SourceRef(kind="world", id=node_id or state.world.current_node_id)
+    bump_versions(state, "fs")
 
     if channel == "captured_signal":
         _ensure_dir(state.os.fs, "/logs")
@@ -272,26 +275,34 @@ def _is_hidden_origin_placeholder(node_id: str) -> bool:
     return node_id == "UNKNOWN" or node_id.startswith("UNKNOWN_")
 
 
-def _location_node_ids() -> set[str]:
-    out: set[str] = set()
-    for loc in load_locations():
+_LOCATION_INDEX: tuple[list[dict], frozenset[str], dict[str, dict | None]] | None = None
+
+
+def _location_index() -> tuple[frozenset[str], dict[str, dict | None]]:
+    # Rebuilt only when the content catalog hands back a different locations list.
+    global _LOCATION_INDEX
+    locations = load_locations()
+    cached = _LOCATION_INDEX
+    if cached is not None and cached[0] is locations:
+        return cached[1], cached[2]
+    uplink_tables: dict[str, dict | None] = {}
+    for loc in locations:
         node_cfg = loc.get("node", {})
         nid = str(node_cfg.get("node_id", "")).strip()
-        if nid:
-            out.add(nid)
-    return out
+        if nid and nid not in uplink_tables:
+            uplink_table = loc.get("uplink_table")
+            uplink_tables[nid] = uplink_table if isinstance(uplink_table, dict) else None
+    ids = frozenset(uplink_tables)
+    _LOCATION_INDEX = (locations, ids, uplink_tables)
+    return ids, uplink_tables
+
+
+def _location_node_ids() -> frozenset[str]:
+    return _location_index()[0]
 
 
 def _location_uplink_table(node_id: str) -> dict | None:
-    for loc in load_locations():
-        node_cfg = loc.get("node", {})
-        if str(node_cfg.get("node_id", "")).strip() != node_id:
-            continue
-        uplink_table = loc.get("uplink_table")
-        if isinstance(uplink_table, dict):
-            return uplink_table
-        return None
-    return None
+    return _location_index()[1].get(node_id)
 
 
 def _location_fs_files(node_id: str) -> list[dict]:
@@ -365,7 +376,47 @@ def _parse_sector_id(sector_id: str) -> tuple[int, int, int]:
         return 0, 0, 0
 
 
-def _precompute_uplink_route_pool_for_node(state, node_id: str, max_new: int = 3) -> list[str]:
+_UPLINK_CANDIDATE_BASE_MEMO_SLOT = "lore.uplink_candidate_base"
+
+
+def _uplink_candidate_base(state) -> list[tuple[str, int]]:
+    """Sorted (node_id, weight) uplink candidates that do not depend on the uplink node.
+
+    Known hubs weigh 10, known ships/derelicts 2, other known ids 1, and any
+    derelict in space at least 1. Cached in the state memo until `known_nodes`
+    or the node map (worldgen) is written; both count their writes.
+    """
+    world = state.world
+    nodes = world.space.nodes
+    known = world.known_node_ids()
+    revision = getattr(nodes, "revision", None)
+    memo = state.versions.memo
+    entry = memo.get(_UPLINK_CANDIDATE_BASE_MEMO_SLOT)
+    key = (revision, known.revision)
+    if entry is not None and revision is not None and entry[0] is nodes and entry[1] is known and entry[2] == key:
+        return entry[3]
+    weights: dict[str, int] = {}
+    for nid in known:
+        if _is_hidden_origin_placeholder(nid):
+            continue
+        n = nodes.get(nid)
+        if n and n.is_hub:
+            weights[nid] = 10
+        elif n and n.kind in {"ship", "derelict"}:
+            weights[nid] = 2
+        else:
+            weights[nid] = 1
+    for nid in world.space.node_ids_of_kind("derelict"):
+        if nid not in weights and not _is_hidden_origin_placeholder(nid):
+            weights[nid] = 1
+    base = sorted(weights.items())
+    memo[_UPLINK_CANDIDATE_BASE_MEMO_SLOT] = (nodes, known, key, base)
+    return base
+
+
+def _precompute_uplink_route_pool_for_node(
+    state, node_id: str, max_new: int = 3, locked_primary_targets: set[str] | None = None
+) -> list[str]:
     node = state.world.space.nodes.get(node_id)
     if not node or node.kind not in {"relay", "station", "waystation"}:
         return []
@@ -377,13 +428,13 @@ def _precompute_uplink_route_pool_for_node(state, node_id: str, max_new: int = 3
     ensure_sector_generated(state, current_sector)
 
     routes = set(state.world.known_links.get(node_id, set()))
-    locked_primary_targets = _locked_primary_targets(state)
-    authored_ids = _location_node_ids()
+    if locked_primary_targets is None:
+        locked_primary_targets = _locked_primary_targets(state)
+    authored_ids, uplink_tables = _location_index()
     hub_kinds = {"relay", "station", "waystation"}
     deterministic = Balance.DETERMINISTIC_LORE_INTEL
-    candidates: dict[str, int] = {}
     selected: list[str] = []
-    uplink_cfg = _location_uplink_table(node_id) or {}
+    uplink_cfg = uplink_tables.get(node_id) or {}
     authored_pool = uplink_cfg.get("authored_candidates") or []
     try:
         min_authored = int(uplink_cfg.get("min_authored", 0) or 0)
@@ -394,44 +445,25 @@ def _precompute_uplink_route_pool_for_node(state, node_id: str, max_new: int = 3
     except Exception:
         max_authored = 0
 
-    def _add_candidate(nid: str, weight: int) -> None:
-        if _is_hidden_origin_placeholder(nid):
-            return
-        if nid == node_id or nid in routes or nid in locked_primary_targets:
-            return
-        prev = candidates.get(nid, 0)
-        if weight > prev:
-            candidates[nid] = weight
-
-    known_nodes_iter = sorted(state.world.known_nodes) if deterministic else state.world.known_nodes
-    for nid in known_nodes_iter:
-        if nid == node_id or nid in routes:
-            continue
-        n = state.world.space.nodes.get(nid)
-        if n and n.is_hub:
-            _add_candidate(nid, 10)
-        elif n and n.kind in {"ship", "derelict"}:
-            _add_candidate(nid, 2)
-        else:
-            _add_candidate(nid, 1)
-
-    neighbor_sectors: list[str] = []
+    # Hubs and unauthored hub-kind nodes in the 3x3 sector neighbourhood, from the spatial index.
+    nodes = state.world.space.nodes
+    local_weights: dict[str, int] = {}
     for dx in (-1, 0, 1):
         for dy in (-1, 0, 1):
-            neighbor_sectors.append(f"S{sx+dx:+04d}_{sy+dy:+04d}_{sz:+04d}")
-
-    space_nodes_iter = sorted(state.world.space.nodes) if deterministic else state.world.space.nodes
-    for nid in space_nodes_iter:
-        n = state.world.space.nodes[nid]
-        sid = sector_id_for_pos(n.x_ly, n.y_ly, n.z_ly)
-        if n.is_hub and sid == current_sector:
-            _add_candidate(nid, 6)
-        if n.is_hub and sid in neighbor_sectors:
-            _add_candidate(nid, 5)
-        if n.kind == "derelict":
-            _add_candidate(nid, 1)
-        if nid not in authored_ids and n.kind in hub_kinds and sid in neighbor_sectors:
-            _add_candidate(nid, 4)
+            sid = f"S{sx+dx:+04d}_{sy+dy:+04d}_{sz:+04d}"
+            for nid in state.world.space.sector_node_ids(sid):
+                n = nodes[nid]
+                weight = 0
+                if n.is_hub:
+                    weight = 6 if sid == current_sector else 5
+                elif nid not in authored_ids and n.kind in hub_kinds:
+                    weight = 4
+                if weight > local_weights.get(nid, 0) and not _is_hidden_origin_placeholder(nid):
+                    local_weights[nid] = weight
+
+    excluded = routes | locked_primary_targets
+    excluded.add(node_id)
+    candidates = _merge_uplink_candidates(_uplink_candidate_base(state), local_weights, excluded)
 
     max_authored = max(0, min(max_new, max_authored))
     min_authored = max(0, min(max_new, min_authored))
@@ -475,18 +507,10 @@ def _precompute_uplink_route_pool_for_node(state, node_id: str, max_new: int = 3
     authored_pick_count = min(max_authored, len(authored_weights))
     authored_pool_weighted = sorted(authored_weights) if deterministic else list(authored_weights)
     while authored_pool_weighted and len(selected) < authored_pick_count:
-        total = sum(weight for _, weight in authored_pool_weighted)
-        if total <= 0:
+        picked = _pop_weighted(rng, authored_pool_weighted)
+        if picked is None:
             break
-        roll = rng.uniform(0, total)
-        upto = 0.0
-        picked_index = 0
-        for i, (_, weight) in enumerate(authored_pool_weighted):
-            upto += weight
-            if roll <= upto:
-                picked_index = i
-                break
-        dest, _weight = authored_pool_weighted.pop(picked_index)
+        dest = picked[0]
         if dest in selected or dest == node_id:
             continue
         selected.append(dest)
@@ -499,23 +523,12 @@ def _precompute_uplink_route_pool_for_node(state, node_id: str, max_new: int = 3
             if len(selected) >= min_authored:
                 break
 
-    for dest in selected:
-        candidates.pop(dest, None)
-
-    pool = sorted(candidates.items()) if deterministic else list(candidates.items())
+    pool = [item for item in candidates if item[0] not in selected] if selected else list(candidates)
     while pool and len(selected) < max_new:
-        total = sum(weight for _, weight in pool)
-        if total <= 0:
+        picked = _pop_weighted(rng, pool)
+        if picked is None:
             break
-        roll = rng.uniform(0, total)
-        upto = 0.0
-        picked_index = 0
-        for i, (_, weight) in enumerate(pool):
-            upto += weight
-            if roll <= upto:
-                picked_index = i
-                break
-        dest, _weight = pool.pop(picked_index)
+        dest = picked[0]
         if dest in selected or dest == node_id:
             continue
         selected.append(dest)
@@ -523,6 +536,35 @@ def _precompute_uplink_route_pool_for_node(state, node_id: str, max_new: int = 3
     return selected
 
 
+def _merge_uplink_candidates(
+    base: list[tuple[str, int]], local_weights: dict[str, int], excluded: set[str]
+) -> list[tuple[str, int]]:
+    """Sorted union of `base` and `local_weights` keeping the larger weight, minus `excluded`."""
+    merged = dict(base)
+    resort = False
+    for nid, weight in local_weights.items():
+        prev = merged.get(nid)
+        if prev is None:
+            resort = True
+        if prev is None or weight > prev:
+            merged[nid] = weight
+    for nid in excluded:
+        merged.pop(nid, None)
+    return sorted(merged.items()) if resort else list(merged.items())
+
+
+def _pop_weighted(rng: random.Random, pool: list[tuple[str, int]]) -> tuple[str, int] | None:
+    """Remove and return one (id, weight) entry picked with probability proportional to weight."""
+    cumulative = list(itertools.accumulate(map(operator.itemgetter(1), pool)))
+    total = cumulative[-1]
+    if total <= 0:
+        return None
+    picked_index = bisect.bisect_left(cumulative, rng.uniform(0, total))
+    if picked_index >= len(pool):
+        picked_index = 0
+    return pool.pop(picked_index)
+
+
 def _procedural_fs_files(state, node: SpaceNode) -> list[dict]:
     seed = _stable_seed64(state.meta.rng_seed, node.node_id)
     rng = random.Random(seed)
@@ -779,7 +821,7 @@ def build_lore_context(state, node_id: str) -> LoreContext:
 def _collect_base_files_for_node(state, node_id: str, node: SpaceNode | None) -> list[dict]:
     base = _location_fs_files(node_id)
     if base:
-        return list(base)
+        return [dict(entry) for entry in base]
     if node is None:
         return []
     return _procedural_fs_files(state, node)
@@ -810,12 +852,9 @@ def _project_mount_paths(
     projected: set[str] = set()
     mount_root = normalize_path(mount_root)
     for entry in files:
-        src_path = normalize_path(str(entry.get("path", "")))
-        if not src_path:
-            continue
-        if not (src_path.startswith("/mail") or src_path.startswith("/logs") or src_path.startswith("/data")):
+        dest_path = mount_dest_path(mount_root, str(entry.get("path", "")))
+        if dest_path is None:
             continue
-        dest_path = normalize_path(mount_root + src_path)
         if not include_existing and dest_path in fs:
             continue
         projected.add(dest_path)
@@ -828,12 +867,9 @@ def mount_projection_breakdown(fs: dict[str, FSNode], mount_root: str, files: li
     new_paths: list[str] = []
     existing_paths: list[str] = []
     for entry in files:
-        src_path = normalize_path(str(entry.get("path", "")))
-        if not src_path:
-            continue
-        if not (src_path.startswith("/mail") or src_path.startswith("/logs") or src_path.startswith("/data")):
+        dest_path = mount_dest_path(mount_root, str(entry.get("path", "")))
+        if dest_path is None:
             continue
-        dest_path = normalize_path(mount_root + src_path)
         if dest_path in seen:
             continue
         seen.add(dest_path)
@@ -864,13 +900,19 @@ def survey_reports_data_signatures(state, node_id: str, job_id: str, data_availa
 
 
 def sync_node_pools_for_known_nodes(state) -> None:
+    locked_primary_targets: set[str] | None = None
     for node_id in _pool_seed_node_ids(state):
         if node_id in state.world.node_pools:
             continue
         node = state.world.space.nodes.get(node_id)
         pool = NodePoolState(initialized_t=float(state.clock.t), window_open=True)
         pool.base_files = _collect_base_files_for_node(state, node_id, node)
-        pool.uplink_route_pool = _precompute_uplink_route_pool_for_node(state, node_id, max_new=3)
+        if locked_primary_targets is None:
+            # Arc unlocks do not happen while pools are being created.
+            locked_primary_targets = _locked_primary_targets(state)
+        pool.uplink_route_pool = _precompute_uplink_route_pool_for_node(
+            state, node_id, max_new=3, locked_primary_targets=locked_primary_targets
+        )
         state.world.node_pools[node_id] = pool
         recompute_node_completion(state, node_id)
         if node_id in state.world.visited_nodes:
@@ -884,6 +926,7 @@ def close_window_on_orbit_entry(state, node_id: str, *, reason: str = "orbit_ent
     pool.window_open = False
     pool.window_closed_t = float(state.clock.t)
     pool.window_closed_reason = reason
+    bump_versions(state, "pools")
 
 
 def close_windows_for_visited_nodes(state) -> None:
@@ -897,12 +940,8 @@ def _pending_node_files_count(state, node_id: str, pool: NodePoolState) -> int:
     return len(_project_mount_paths(state.os.fs, mount_root, files, include_existing=False))
 
 
-def recompute_node_completion(state, node_id: str) -> None:
+def _node_completion_flags(state, node_id: str, pool: NodePoolState) -> tuple[bool, bool, bool, bool]:
     node = state.world.space.nodes.get(node_id)
-    pool = state.world.node_pools.get(node_id)
-    if not pool:
-        return
-
     scrap_complete = True
     extras_complete = True
     if node:
@@ -920,16 +959,67 @@ def recompute_node_completion(state, node_id: str) -> None:
     uplink_needed = bool(node and node.kind in {"relay", "station", "waystation"})
     uplink_complete = (not uplink_needed) or bool(pool.uplink_data_consumed)
     data_complete = pending_files == 0 and len(pending_push) == 0 and uplink_complete
+    node_cleaned = scrap_complete and extras_complete and data_complete
+    return scrap_complete, extras_complete, data_complete, node_cleaned
+
 
+def recompute_node_completion(state, node_id: str) -> None:
+    state.world.completion_dirty_nodes.discard(node_id)
+    pool = state.world.node_pools.get(node_id)
+    if not pool:
+        return
+    # Every pool mutation ends with a recompute, so this also covers the pool contents.
+    bump_versions(state, "pools")
+
+    scrap_complete, extras_complete, data_complete, node_cleaned = _node_completion_flags(state, node_id, pool)
     pool.scrap_complete = scrap_complete
     pool.extras_complete = extras_complete
     pool.data_complete = data_complete
-    pool.node_cleaned = scrap_complete and extras_complete and data_complete
+    pool.node_cleaned = node_cleaned
+
+
+# Completion flags read node salvage (world), pool contents and mounted files.
+_COMPLETION_VERSION_PARTS = ("world", "pools", "fs")
+_FULL_COMPLETION_MEMO_SLOT = "lore.recompute_all_node_completion"
 
 
 def recompute_all_node_completion(state) -> None:
+    memo = state.versions.memo
+    if memo.get(_FULL_COMPLETION_MEMO_SLOT) == versions_stamp(state, _COMPLETION_VERSION_PARTS):
+        if Balance.STATE_VERSIONS_DEBUG_ASSERT:
+            _assert_node_completion_consistent(state)
+        return
     for node_id in sorted(state.world.node_pools.keys()):
         recompute_node_completion(state, node_id)
+    memo[_FULL_COMPLETION_MEMO_SLOT] = versions_stamp(state, _COMPLETION_VERSION_PARTS)
+
+
+def mark_node_completion_dirty(state, node_id: str | None) -> None:
+    """Flag a node whose salvage, mounted data or uplink state changed outside a recompute."""
+    if node_id:
+        state.world.completion_dirty_nodes.add(node_id)
+
+
+def recompute_dirty_node_completion(state) -> None:
+    dirty = state.world.completion_dirty_nodes
+    if dirty:
+        for node_id in sorted(dirty):
+            recompute_node_completion(state, node_id)
+        dirty.clear()
+        bump_versions(state, "world")
+    if getattr(Balance, "LORE_COMPLETION_DEBUG_ASSERT", False):
+        _assert_node_completion_consistent(state)
+
+
+def _assert_node_completion_consistent(state) -> None:
+    mismatched: list[str] = []
+    for node_id, pool in sorted(state.world.node_pools.items()):
+        expected = _node_completion_flags(state, node_id, pool)
+        stored = (pool.scrap_complete, pool.extras_complete, pool.data_complete, pool.node_cleaned)
+        if stored != expected:
+            mismatched.append(f"{node_id}: stored={stored} expected={expected}")
+    if mismatched:
+        raise AssertionError("Stale node completion (missing dirty mark?): " + "; ".join(mismatched))
 
 
 def piece_constraints_ok(piece: dict, ctx: LoreContext) -> bool:
@@ -1046,9 +1136,9 @@ def _default_channels_for_piece(piece: dict, *, single: bool) -> list[str]:
     return list(allowed)
 
 
-def _iter_all_pieces() -> list[dict]:
+def _build_piece_entries(arcs: list[dict], singles: list[dict]) -> list[dict]:
     pieces: list[dict] = []
-    for arc in load_arcs():
+    for arc in arcs:
         arc_id = str(arc.get("arc_id", "")).strip()
         if not arc_id:
             continue
@@ -1082,7 +1172,7 @@ def _iter_all_pieces() -> list[dict]:
                 }
             )
 
-    for single in load_singles() or []:
+    for single in singles or []:
         sid = str(single.get("single_id", "")).strip()
         if not sid:
             continue
@@ -1102,16 +1192,125 @@ def _iter_all_pieces() -> list[dict]:
     return pieces
 
 
+class LorePieceRegistry:
+    """Normalized lore pieces indexed by key, role, force policy and channel.
+
+    Built once from the loaded arcs/singles and reused until the loaders
+    return different objects (the content catalog keeps them stable while
+    the data files are unchanged).
+    """
+
+    __slots__ = (
+        "arcs_src",
+        "singles_src",
+        "entries",
+        "by_key",
+        "by_role",
+        "by_force_policy",
+        "by_channel",
+        "forced_entries",
+        "non_forced_entries",
+        "max_hops_from_start",
+    )
+
+    def __init__(self, arcs: list[dict], singles: list[dict]) -> None:
+        self.arcs_src = arcs
+        self.singles_src = singles
+        self.entries: list[dict] = _build_piece_entries(arcs, singles)
+        self.by_key: dict[str, dict] = {}
+        self.by_role: dict[str, list[str]] = {}
+        self.by_force_policy: dict[str, list[str]] = {}
+        self.by_channel: dict[str, list[str]] = {}
+        self.forced_entries: list[dict] = []
+        self.non_forced_entries: list[dict] = []
+        self.max_hops_from_start = 0
+        for entry in self.entries:
+            key = entry["piece_key"]
+            rules = entry.get("placement_rules") or {}
+            self.max_hops_from_start = max(self.max_hops_from_start, int(rules.get("max_hops_from_start", 0) or 0))
+            self.by_key[key] = entry
+            self.by_role.setdefault(str(entry.get("role", "")), []).append(key)
+            for channel in entry.get("channels", []):
+                self.by_channel.setdefault(str(channel), []).append(key)
+            if entry.get("force", False):
+                policy = str((entry.get("piece") or {}).get("force_policy", "none") or "none")
+                self.by_force_policy.setdefault(policy, []).append(key)
+                self.forced_entries.append(entry)
+            else:
+                self.non_forced_entries.append(entry)
+
+    def matches(self, arcs: list[dict], singles: list[dict]) -> bool:
+        return self.arcs_src is arcs and self.singles_src is singles
+
+    def pending(self, state) -> _PendingPieces:
+        """Pieces `state` has not placed yet; kept in the state memo across ticks."""
+        placements = state.world.lore_placements
+        memo = state.versions.memo
+        pending = memo.get(_PENDING_PIECES_MEMO_SLOT)
+        if pending is None or not pending.matches(self, placements):
+            pending = _PendingPieces(self, placements)
+            memo[_PENDING_PIECES_MEMO_SLOT] = pending
+        return pending
+
+
+_PENDING_PIECES_MEMO_SLOT = "lore.pending_pieces"
+
+
+class _PendingPieces:
+    """Unplaced registry entries of one state, in registry order.
+
+    `_assign_piece_to_node` drops each piece it places, so a tick costs
+    O(pending). Rebuilt when the registry changes or the placement revision
+    moves past the one this set last followed (`piece_to_node` written
+    anywhere else, see `LorePlacementState.placements_changed`).
+    """
+
+    __slots__ = ("registry", "placements", "revision", "forced_by_key", "non_forced_by_key")
+
+    def __init__(self, registry: LorePieceRegistry, placements: LorePlacementState) -> None:
+        placed = placements.piece_to_node
+        self.registry = registry
+        self.placements = placements
+        self.revision = placements.revision
+        self.forced_by_key = {e["piece_key"]: e for e in registry.forced_entries if e["piece_key"] not in placed}
+        self.non_forced_by_key = {e["piece_key"]: e for e in registry.non_forced_entries if e["piece_key"] not in placed}
+
+    def matches(self, registry: LorePieceRegistry, placements: LorePlacementState) -> bool:
+        return self.registry is registry and self.placements is placements and self.revision == placements.revision
+
+    def forced(self) -> list[dict]:
+        return list(self.forced_by_key.values())
+
+    def non_forced(self) -> list[dict]:
+        return list(self.non_forced_by_key.values())
+
+    def mark_placed(self, piece_key: str) -> None:
+        """Follow one placement; call right after the `placements_changed()` that recorded it."""
+        self.revision = self.placements.revision
+        self.forced_by_key.pop(piece_key, None)
+        self.non_forced_by_key.pop(piece_key, None)
+
+
+_LORE_PIECE_REGISTRY: LorePieceRegistry | None = None
+
+
+def get_lore_piece_registry() -> LorePieceRegistry:
+    global _LORE_PIECE_REGISTRY
+    arcs = load_arcs()
+    singles = load_singles()
+    registry = _LORE_PIECE_REGISTRY
+    if registry is None or not registry.matches(arcs, singles):
+        registry = LorePieceRegistry(arcs, singles)
+        _LORE_PIECE_REGISTRY = registry
+    return registry
+
+
 def list_lore_piece_entries() -> list[dict]:
     """Public helper for debug/inspection views.
 
     Returns normalized piece entries with canonical `piece_key` values.
     """
-    return _iter_all_pieces()
-
-
-def _piece_index() -> dict[str, dict]:
-    return {entry["piece_key"]: entry for entry in _iter_all_pieces()}
+    return list(get_lore_piece_registry().entries)
 
 
 def _start_node_for_hops(state) -> str:
@@ -1135,29 +1334,57 @@ def _distance_from_start_ly(state, x_ly: float, y_ly: float, z_ly: float) -> flo
     return math.sqrt(dx * dx + dy * dy + dz * dz)
 
 
+_HOP_DISTANCES_MEMO_SLOT = "lore.hop_distances_from_start"
+
+
 def _hop_distance_from_start(state, target_id: str, max_hops: int) -> int | None:
-    start_id = _start_node_for_hops(state)
-    if start_id not in state.world.space.nodes or target_id not in state.world.space.nodes:
+    hop = _hop_distances_from_start(state, max_hops).get(target_id)
+    if hop is None or hop > max_hops:
         return None
-    visited = {start_id}
-    queue = [(start_id, 0)]
+    return hop
+
+
+def _hop_distances_from_start(state, max_hops: int) -> dict[str, int]:
+    """BFS hop counts from the start node, up to at least `max_hops`.
+
+    Cached in the state memo per (node map, `links_revision`, start node).
+    A recompute keeps the deepest bound asked for so far, so callers with
+    different `max_hops` share one map.
+    """
+    space = state.world.space
+    start_id = _start_node_for_hops(state)
+    key = (space.nodes, space.links_revision, start_id)
+    memo = state.versions.memo
+    entry = memo.get(_HOP_DISTANCES_MEMO_SLOT)
+    if entry is not None and entry[0] is key[0] and entry[1:3] == key[1:] and entry[3] >= max_hops:
+        if Balance.STATE_VERSIONS_DEBUG_ASSERT:
+            fresh = _bfs_hop_distances(space.nodes, start_id, entry[3])
+            if fresh != entry[4]:
+                raise AssertionError("Stale hop distances (missing SpaceGraph.links_changed()?)")
+        return entry[4]
+    if entry is not None:
+        max_hops = max(max_hops, entry[3])
+    distances = _bfs_hop_distances(space.nodes, start_id, max_hops)
+    memo[_HOP_DISTANCES_MEMO_SLOT] = (*key, max_hops, distances)
+    return distances
+
+
+def _bfs_hop_distances(nodes: dict[str, SpaceNode], start_id: str, max_hops: int) -> dict[str, int]:
+    if start_id not in nodes:
+        return {}
+    distances = {start_id: 0}
+    queue = deque([start_id])
     while queue:
-        nid, dist = queue.pop(0)
-        if nid == target_id:
-            return dist
+        nid = queue.popleft()
+        dist = distances[nid]
         if dist >= max_hops:
             continue
-        node = state.world.space.nodes.get(nid)
-        if not node:
-            continue
-        for nxt in sorted(node.links):
-            if nxt in visited:
-                continue
-            if nxt not in state.world.space.nodes:
+        for nxt in nodes[nid].links:
+            if nxt in distances or nxt not in nodes:
                 continue
-            visited.add(nxt)
-            queue.append((nxt, dist + 1))
-    return None
+            distances[nxt] = dist + 1
+            queue.append(nxt)
+    return distances
 
 
 def _node_matches_candidates(node_id: str, node: SpaceNode, candidates: set[str], authored: set[str]) -> bool:
@@ -1201,7 +1428,53 @@ def _trigger_matches_channel(trigger: str, channel: str) -> bool:
     return False
 
 
-def _candidate_nodes_for_piece(state, piece_entry: dict) -> list[str]:
+class _LoreEvaluation:
+    """Per-scheduler-pass caches shared by every piece evaluated in that pass.
+
+    Lore contexts depend on node position, the start node and the clock,
+    none of which move within a pass. The open-pool buckets are dropped
+    (`pools_changed`) after a placement or an ad-hoc node spawn.
+    """
+
+    __slots__ = ("contexts", "open_nodes", "open_nodes_by_kind")
+
+    def __init__(self) -> None:
+        self.contexts: dict[str, LoreContext] = {}
+        self.open_nodes: list[str] | None = None
+        self.open_nodes_by_kind: dict[str, list[str]] = {}
+
+    def context(self, state, node_id: str) -> LoreContext:
+        ctx = self.contexts.get(node_id)
+        if ctx is None:
+            ctx = build_lore_context(state, node_id)
+            self.contexts[node_id] = ctx
+        return ctx
+
+    def open_pool_nodes(self, state, kinds: set[str]) -> list[str]:
+        """Sorted ids of existing nodes with an open, uncleaned pool, limited to `kinds` if given."""
+        if self.open_nodes is None:
+            nodes = state.world.space.nodes
+            self.open_nodes = []
+            self.open_nodes_by_kind = {}
+            for node_id, pool in sorted(state.world.node_pools.items()):
+                node = nodes.get(node_id)
+                if node is None or not pool.window_open or pool.node_cleaned:
+                    continue
+                self.open_nodes.append(node_id)
+                self.open_nodes_by_kind.setdefault(node.kind, []).append(node_id)
+        if not kinds:
+            return self.open_nodes
+        if len(kinds) == 1:
+            return self.open_nodes_by_kind.get(next(iter(kinds)), [])
+        return sorted(node_id for kind in kinds for node_id in self.open_nodes_by_kind.get(kind, ()))
+
+    def pools_changed(self) -> None:
+        self.open_nodes = None
+
+
+def _candidate_nodes_for_piece(state, piece_entry: dict, evaluation: _LoreEvaluation | None = None) -> list[str]:
+    if evaluation is None:
+        evaluation = _LoreEvaluation()
     authored = _location_node_ids()
     piece = piece_entry["piece"]
     rules = piece_entry.get("placement_rules") or {}
@@ -1210,24 +1483,19 @@ def _candidate_nodes_for_piece(state, piece_entry: dict) -> list[str]:
     candidates_cfg = set(str(x) for x in (rules.get("candidates") or []))
     max_hops = int(rules.get("max_hops_from_start", 0) or 0)
 
+    nodes = state.world.space.nodes
     out: list[str] = []
-    for node_id, pool in sorted(state.world.node_pools.items()):
-        if not pool.window_open or pool.node_cleaned:
-            continue
-        node = state.world.space.nodes.get(node_id)
+    for node_id in evaluation.open_pool_nodes(state, require_kinds):
         if node_id in avoid_ids:
             continue
-        if node is None:
-            continue
-        if require_kinds and node.kind not in require_kinds:
-            continue
+        node = nodes[node_id]
         if not _node_matches_candidates(node_id, node, candidates_cfg, authored):
             continue
         if max_hops > 0:
             hop = _hop_distance_from_start(state, node_id, max_hops)
             if hop is None or hop > max_hops:
                 continue
-        ctx = build_lore_context(state, node_id)
+        ctx = evaluation.context(state, node_id)
         if not piece_constraints_ok(piece, ctx):
             continue
         if not any(_channel_feasible_for_node(ch, node) for ch in piece_entry.get("channels", [])):
@@ -1484,6 +1752,7 @@ def register_hidden_anchored_node(
     node.links.add(anchor.node_id)
     anchor.links.add(node.node_id)
     state.world.space.nodes[node_id] = node
+    state.world.space.links_changed()
     sync_sector_state_for_node(state, node_id)
     sync_sector_state_for_node(state, anchor.node_id)
     state.world.forced_hidden_nodes.add(node_id)
@@ -1625,8 +1894,16 @@ def _assign_piece_to_node(state, piece_entry: dict, node_id: str) -> bool:
     if not channel:
         return False
 
-    state.world.lore_placements.piece_to_node[piece_key] = node_id
-    state.world.lore_placements.piece_channel_bindings[piece_key] = channel
+    placements = state.world.lore_placements
+    pending = state.versions.memo.get(_PENDING_PIECES_MEMO_SLOT)
+    # Only a set that followed every earlier placement can follow this one.
+    in_sync = pending is not None and pending.placements is placements and pending.revision == placements.revision
+    placements.piece_to_node[piece_key] = node_id
+    placements.placements_changed()
+    bump_versions(state, "world")
+    if in_sync:
+        pending.mark_placed(piece_key)
+    placements.piece_channel_bindings[piece_key] = channel
 
     file_path: str | None = None
     if channel == "salvage_data":
@@ -1678,6 +1955,7 @@ def _deliver_piece(
                 left = right = ""
             if left and right:
                 if is_hop_within_cap(state.world, left, right, float(Balance.MAX_ROUTE_HOP_LY)):
+                    bump_versions(state, "world", "links")
                     add_known_link(state.world, left, right, bidirectional=True)
                     state.world.known_nodes.add(left)
                     state.world.known_nodes.add(right)
@@ -1785,7 +2063,7 @@ def _deliver_assigned_for_trigger(state, trigger: str, ctx: LoreContext) -> Lore
     delivered_files: list[dict] = []
     events: list[Event] = []
     node_id = ctx.node_id
-    piece_by_key = _piece_index()
+    piece_by_key = get_lore_piece_registry().by_key
     pool = state.world.node_pools.get(node_id)
 
     for piece_key, placed_node in sorted(state.world.lore_placements.piece_to_node.items()):
@@ -1829,10 +2107,8 @@ def _deliver_assigned_for_trigger(state, trigger: str, ctx: LoreContext) -> Lore
     return LoreDelivery(delivered_files, events)
 
 
-def _evaluate_forced_pieces(state, piece_entries: list[dict]) -> None:
+def _evaluate_forced_pieces(state, piece_entries: list[dict], evaluation: _LoreEvaluation) -> None:
     for piece_entry in piece_entries:
-        if not piece_entry.get("force", False):
-            continue
         piece_key = piece_entry["piece_key"]
         if piece_key in state.world.lore_placements.piece_to_node:
             continue
@@ -1850,11 +2126,12 @@ def _evaluate_forced_pieces(state, piece_entries: list[dict]) -> None:
         if not should_place:
             continue
 
-        candidates = _candidate_nodes_for_piece(state, piece_entry)
+        candidates = _candidate_nodes_for_piece(state, piece_entry, evaluation)
         if not candidates:
             generated_id = _spawn_ad_hoc_candidate_for_forced_piece(state, piece_entry)
             if generated_id:
                 candidates = [generated_id]
+                evaluation.pools_changed()
 
         if not candidates:
             continue
@@ -1869,6 +2146,7 @@ def _evaluate_forced_pieces(state, piece_entries: list[dict]) -> None:
         )
         selected = random.Random(seed).choice(candidates)
         _assign_piece_to_node(state, piece_entry, selected)
+        evaluation.pools_changed()
 
 
 def _non_forced_piece_probability(piece_entry: dict) -> float:
@@ -1884,10 +2162,8 @@ def _non_forced_piece_probability(piece_entry: dict) -> float:
     return max(0.0, min(1.0, base * weight))
 
 
-def _evaluate_non_forced_pieces(state, piece_entries: list[dict]) -> None:
+def _evaluate_non_forced_pieces(state, piece_entries: list[dict], evaluation: _LoreEvaluation) -> None:
     for piece_entry in piece_entries:
-        if piece_entry.get("force", False):
-            continue
         piece_key = piece_entry["piece_key"]
         if piece_key in state.world.lore_placements.piece_to_node:
             continue
@@ -1905,7 +2181,7 @@ def _evaluate_non_forced_pieces(state, piece_entries: list[dict]) -> None:
         if random.Random(roll_seed).random() >= inject_p:
             continue
 
-        candidates = _candidate_nodes_for_piece(state, piece_entry)
+        candidates = _candidate_nodes_for_piece(state, piece_entry, evaluation)
         if not candidates:
             continue
         candidates = sorted(candidates)
@@ -1918,15 +2194,21 @@ def _evaluate_non_forced_pieces(state, piece_entries: list[dict]) -> None:
         )
         selected = random.Random(pick_seed).choice(candidates)
         _assign_piece_to_node(state, piece_entry, selected)
+        evaluation.pools_changed()
 
 
 def run_lore_scheduler_tick(state) -> None:
     sync_node_pools_for_known_nodes(state)
     close_windows_for_visited_nodes(state)
-    recompute_all_node_completion(state)
+    recompute_dirty_node_completion(state)
 
-    pieces = _iter_all_pieces()
-    _evaluate_forced_pieces(state, pieces)
+    registry = get_lore_piece_registry()
+    placements = state.world.lore_placements
+    if registry.max_hops_from_start > 0:
+        _hop_distances_from_start(state, registry.max_hops_from_start)
+    evaluation = _LoreEvaluation()
+    pending = registry.pending(state)
+    _evaluate_forced_pieces(state, pending.forced(), evaluation)
 
     if not getattr(Balance, "LORE_SCHEDULER_ENABLED", True):
         return
@@ -1934,23 +2216,25 @@ def run_lore_scheduler_tick(state) -> None:
     interval_years = max(0.0, float(getattr(Balance, "LORE_NON_FORCED_INTERVAL_YEARS", 1.0)))
     interval_s = interval_years * Balance.YEAR_S
 
-    placements = state.world.lore_placements
     if placements.next_non_forced_eval_t <= 0.0:
         placements.next_non_forced_eval_t = state.clock.t
+        bump_versions(state, "world")
 
     if interval_s <= 0.0:
         placements.eval_seq += 1
-        _evaluate_non_forced_pieces(state, pieces)
+        bump_versions(state, "world")
+        _evaluate_non_forced_pieces(state, registry.pending(state).non_forced(), evaluation)
         placements.next_non_forced_eval_t = state.clock.t
-        recompute_all_node_completion(state)
+        recompute_dirty_node_completion(state)
         return
 
     while state.clock.t >= placements.next_non_forced_eval_t:
         placements.eval_seq += 1
-        _evaluate_non_forced_pieces(state, pieces)
+        bump_versions(state, "world")
+        _evaluate_non_forced_pieces(state, registry.pending(state).non_forced(), evaluation)
         placements.next_non_forced_eval_t += interval_s
 
-    recompute_all_node_completion(state)
+    recompute_dirty_node_completion(state)
 
 
 def maybe_deliver_lore(state, trigger: str, ctx: LoreContext, *, count_trigger: bool = True) -> LoreDelivery:
@@ -1964,5 +2248,5 @@ def maybe_deliver_lore(state, trigger: str, ctx: LoreContext, *, count_trigger:
 
     sync_node_pools_for_known_nodes(state)
     result = _deliver_assigned_for_trigger(state, trigger, ctx)
-    recompute_all_node_completion(state)
+    recompute_dirty_node_completion(state)
     return result
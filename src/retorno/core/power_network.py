@@ -0,0 +1,109 @@
+"""Per-tick view of the ship's power bus.
+
+`PowerNetwork` caches each system's effective load and the running-job draw
+so the tick's load-shed/quality sequence reads `p_load` without re-summing
+the ship. Mutations made through the view (`take_offline`) update the cache;
+anything else that touches a system's `state`/`forced_offline`, the ship's
+`op_mode` or a job's status must call `refresh()`; `is_stale()` tells.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+from retorno.config.balance import Balance
+from retorno.model.jobs import running_jobs_power_kw
+from retorno.model.systems import ShipSystem, SystemState
+
+# Systems that keep full draw in CRUISE unless explicitly forced offline.
+CRUISE_SHED_TARGETS = frozenset({"sensors", "security", "data_core", "drone_bay"})
+
+
+@lru_cache(maxsize=64)
+def _shed_order(priorities: tuple[tuple[str, int], ...]) -> tuple[str, ...]:
+    # Highest priority number sheds first; ties keep ship order (stable sort).
+    return tuple(system_id for system_id, _ in sorted(priorities, key=lambda item: item[1], reverse=True))
+
+
+def system_load_kw(system: ShipSystem, op_mode: str) -> float:
+    if op_mode == "CRUISE":
+        if system.state == SystemState.OFFLINE:
+            factor = 0.0
+        elif system.system_id in CRUISE_SHED_TARGETS and system.forced_offline:
+            factor = 0.0
+        elif "critical" in system.tags or system.system_id == "energy_distribution":
+            factor = 1.0
+        elif system.system_id in CRUISE_SHED_TARGETS:
+            factor = 1.0
+        else:
+            factor = 0.1
+        return system.p_effective_kw() * factor
+    if system.state == SystemState.OFFLINE:
+        return 0.0
+    return system.p_effective_kw()
+
+
+class PowerNetwork:
+    __slots__ = ("state", "_loads", "_job_kw", "_p_load")
+
+    def __init__(self, state) -> None:
+        self.state = state
+        self.refresh()
+
+    def refresh(self) -> None:
+        ship = self.state.ship
+        self._loads = {system_id: system_load_kw(system, ship.op_mode) for system_id, system in ship.systems.items()}
+        self._job_kw = running_jobs_power_kw(self.state.jobs)
+        self._p_load = None
+
+    def is_stale(self) -> bool:
+        fresh = PowerNetwork(self.state)
+        return fresh._loads != self._loads or fresh._job_kw != self._job_kw
+
+    @property
+    def p_load(self) -> float:
+        if self._p_load is None:
+            # Same summation order as a full recompute, so results match bit for bit.
+            self._p_load = sum(self._loads.values()) + self._job_kw
+        return self._p_load
+
+    @property
+    def p_gen(self) -> float:
+        return self.state.ship.power.p_gen_kw
+
+    @property
+    def soc(self) -> float:
+        power = self.state.ship.power
+        if power.e_batt_max_kwh > 0:
+            return power.e_batt_kwh / power.e_batt_max_kwh
+        return 0.0
+
+    def p_capacity(self, soc: float | None = None) -> float:
+        soc = self.soc if soc is None else soc
+        available_discharge_kw = self.state.ship.power.p_discharge_max_kw if soc > 0.0 else 0.0
+        return self.p_gen + available_discharge_kw
+
+    def system_load_kw(self, system_id: str) -> float:
+        return self._loads.get(system_id, 0.0)
+
+    def shed_order(self) -> list[ShipSystem]:
+        systems = self.state.ship.systems
+        key = tuple((system_id, system.priority) for system_id, system in systems.items())
+        return [systems[system_id] for system_id in _shed_order(key)]
+
+    def take_offline(self, system: ShipSystem, reason: str = "load_shed") -> SystemState:
+        """Force `system` OFFLINE and drop its draw from the cached load; returns the old state."""
+        old_state = system.state
+        system.state = SystemState.OFFLINE
+        system.forced_offline = True
+        system.auto_offline_reason = reason
+        self._loads[system.system_id] = system_load_kw(system, self.state.ship.op_mode)
+        self._p_load = None
+        if Balance.POWER_NETWORK_DEBUG_ASSERT:
+            self.assert_consistent()
+        return old_state
+
+    def assert_consistent(self) -> None:
+        if self.is_stale():
+            fresh = PowerNetwork(self.state)
+            raise AssertionError(f"Power network out of sync: cached={self.p_load!r} fresh={fresh.p_load!r}")
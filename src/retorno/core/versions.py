@@ -0,0 +1,98 @@
+"""Per-sub-state change counters and the memo helper keyed on them.
+
+Each counter in `StateVersions` only ever grows. Code that mutates a
+sub-state bumps its counter (`bump_versions`). Derived views cache their
+result with `memoize_on_versions`, keyed on the counters they read. Entry
+points that can touch anything (`Engine.apply_action`, job effects,
+`GameLoop.with_lock()` in write mode) bump every counter.
+"""
+
+from __future__ import annotations
+
+import functools
+from dataclasses import dataclass, field
+from typing import Any, Callable, Hashable
+
+from retorno.config.balance import Balance
+
+VERSION_PARTS = ("systems", "power", "jobs", "world", "links", "pools", "fs", "alerts")
+
+# Distinct argument tuples kept per memoized view before its table is reset.
+_MEMO_ARGS_LIMIT = 64
+
+
+class VersionMemo(dict):
+    """Memoized views; saved and copied empty, refilled on the next read."""
+
+    __slots__ = ()
+
+    def __reduce__(self):
+        return (VersionMemo, ())
+
+
+@dataclass(slots=True)
+class StateVersions:
+    systems: int = 0   # ship systems: state, health, forced_offline, services
+    power: int = 0     # power bus and battery
+    jobs: int = 0      # job queue, statuses and ETAs
+    world: int = 0     # space graph, current node, known/visited nodes, drones' world position
+    links: int = 0     # known_links
+    pools: int = 0     # node pools (files, pieces, uplink payloads, completion flags)
+    fs: int = 0        # os.fs
+    alerts: int = 0    # alert table and unacked timers
+    memo: VersionMemo = field(default_factory=VersionMemo, repr=False, compare=False)
+
+
+def bump_versions(state, *parts: str) -> None:
+    versions = state.versions
+    for part in parts:
+        setattr(versions, part, getattr(versions, part) + 1)
+
+
+def bump_all_versions(state) -> None:
+    bump_versions(state, *VERSION_PARTS)
+
+
+def versions_stamp(state, parts: tuple[str, ...]) -> tuple[int, ...]:
+    versions = state.versions
+    return tuple(getattr(versions, part) for part in parts)
+
+
+def memoize_on_versions(*parts: str, extra: Callable[[Any], Hashable] | None = None):
+    """Cache `fn(state, *args)` until one of `parts` is bumped or `extra(state)` changes.
+
+    Cached values are shared between callers and must not be mutated.
+    """
+    for part in parts:
+        if part not in VERSION_PARTS:
+            raise ValueError(f"Unknown state version part: {part}")
+
+    def decorate(fn):
+        slot = f"{fn.__module__}.{fn.__qualname__}"
+
+        @functools.wraps(fn)
+        def wrapper(state, *args):
+            stamp = (versions_stamp(state, parts), extra(state) if extra is not None else None)
+            memo = state.versions.memo
+            entry = memo.get(slot)
+            if entry is None or entry[0] != stamp:
+                entry = (stamp, {})
+                memo[slot] = entry
+            values = entry[1]
+            if args in values:
+                value = values[args]
+                if Balance.STATE_VERSIONS_DEBUG_ASSERT:
+                    fresh = fn(state, *args)
+                    if fresh != value:
+                        raise AssertionError(f"Stale {slot}{args!r} (missing bump of {parts}?): {value!r} != {fresh!r}")
+                return value
+            value = fn(state, *args)
+            if len(values) >= _MEMO_ARGS_LIMIT:
+                values.clear()
+            values[args] = value
+            return value
+
+        wrapper.uncached = fn
+        return wrapper
+
+    return decorate
@@ -1,20 +1,56 @@
 from __future__ import annotations
 
 import hashlib
+import io
+import json
+import lzma
+import mmap
 import os
 import pickle
 import re
-from dataclasses import dataclass
+import threading
+import zlib
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
 from pathlib import Path
 
+from retorno.config.balance import Balance
 from retorno.core.gamestate import GameState
+from retorno.core.versions import versions_stamp
+from retorno.model.jobs import Job, take_pending_archive
+from retorno.model.os import LayeredFS
 from retorno.model.ship_layout import apply_retorno_canonical_layout
+from retorno.runtime.data_loader import load_authored_texts, load_data_text
 
 _SAVE_MAGIC = b"RETORNO_SAVE_V2"
+# V3: compressed payload (codec named in the header), authored texts stored by reference.
+_SAVE_MAGIC_V3 = b"RETORNO_SAVE_V3"
+_SAVE_CODECS = {
+    "zlib": (lambda data: zlib.compress(data, 6), zlib.decompress),
+    "lzma": (lzma.compress, lzma.decompress),
+}
+# Shorter authored texts are cheaper inline than as a reference.
+_CONTENT_REF_MIN_CHARS = 64
 _LEGACY_SAVE_MAGICS = {b"RETORNO_SAVE_V1"}
 _DEFAULT_SLOT_FILENAME = "savegame.dat"
 _BACKUP_SUFFIX = ".bak"
+_JOB_ARCHIVE_SUFFIX = ".jobs.jsonl"
+_DELTA_MAGIC = b"RETORNO_DELTA_V1"
+_DELTA_SUFFIX = ".delta"
+_JOURNAL_MEMO_KEY = "retorno.io.save_load.journal"
+# Delta log sections. Whole sections are replaced as one object; world and os
+# are stored without their per-key tables (node pools, the fs overlay), which
+# are diffed by key.
+_WHOLE_SECTIONS = ("meta", "clock", "ship", "jobs", "events")
+_SPLIT_SECTIONS = {"world": "node_pools", "os": "fs"}
+_KEYED_SECTIONS = {"pools": ("world", "node_pools"), "fs": ("os", "fs")}
+# State version parts covering the large sections; a delta skips pickling a
+# section whose stamp matches the last save. The others are always pickled.
+_SECTION_VERSION_PARTS = {"jobs": ("jobs",), "world": ("world", "links"), "pools": ("pools",), "fs": ("fs",)}
 _USER_RE = re.compile(r"^[a-z0-9](?:[a-z0-9._-]{0,30}[a-z0-9])?$")
+# Archive lines whose save failed, per slot path; the next successful save appends them.
+_UNARCHIVED_JOB_LINES: dict[Path, list[str]] = {}
+_JOB_ARCHIVE_LOCK = threading.Lock()
 
 
 class SaveLoadError(RuntimeError):
@@ -26,6 +62,49 @@ class LoadGameResult:
     state: GameState
     source: str  # "primary" | "backup"
     path: Path
+    deltas_replayed: int = 0
+    # Authored data/ files edited since the save; loaded with their current text.
+    changed_content_refs: tuple[str, ...] = ()
+
+
+@dataclass(slots=True)
+class _SaveJournal:
+    """What the slot on disk holds for one in-memory state: base file plus delta records."""
+
+    path: Path
+    base_checksum: bytes
+    base_size: int
+    digests: dict[str, bytes]
+    keyed_digests: dict[str, dict[str, bytes]]
+    stamps: dict[str, tuple[int, ...]]
+    records: int = 0
+    log_size: int = 0
+    stale: bool = False
+
+
+@dataclass(slots=True)
+class SaveSnapshot:
+    """A state pickled by `capture_save`, waiting for `write_save`."""
+
+    path: Path
+    memo: dict
+    journal: _SaveJournal | None  # None for a full save
+    codec: str | None  # None: RETORNO_SAVE_V2, else a `_SAVE_CODECS` key
+    state_blob: bytes | None
+    # Sections whose stamp moved since the journal's last save; for a full save,
+    # every section when STATE_VERSIONS_DEBUG_ASSERT is set, else none.
+    blobs: dict[str, bytes]
+    keyed_blobs: dict[str, dict[str, bytes]]
+    stamps: dict[str, tuple[int, ...]]
+    # Archive lines for jobs evicted from the pickled state; appended once it is durable.
+    job_archive: list[str]
+
+
+def save_base_dir() -> Path:
+    env_save_dir = os.environ.get("RETORNO_SAVE_DIR", "").strip()
+    if env_save_dir:
+        return Path(env_save_dir).expanduser()
+    return Path.home() / ".retorno"
 
 
 def resolve_save_path(save_path: str | Path | None = None, user: str | None = None) -> Path:
@@ -36,10 +115,7 @@ def resolve_save_path(save_path: str | Path | None = None, user: str | None = No
     if env_save_path:
         return Path(env_save_path).expanduser().resolve()
 
-    base_dir = Path.home() / ".retorno"
-    env_save_dir = os.environ.get("RETORNO_SAVE_DIR", "").strip()
-    if env_save_dir:
-        base_dir = Path(env_save_dir).expanduser()
+    base_dir = save_base_dir()
 
     normalized_user = normalize_user_id(user)
     if normalized_user:
@@ -57,8 +133,100 @@ def save_exists(save_path: str | Path | None = None, user: str | None = None) ->
 
 
 def save_single_slot(state: GameState, save_path: str | Path | None = None, user: str | None = None) -> Path:
+    return write_save(capture_save(state, save_path, user=user, full=True))
+
+
+def append_save_delta(state: GameState, save_path: str | Path | None = None, user: str | None = None) -> Path:
+    """Append what changed since the last save of `state` to the slot's delta log.
+
+    Writes a full save instead (folding the log into a new base) when `state`
+    was not saved to or loaded from this slot yet, or when the log has grown
+    past `Balance.SAVE_DELTA_COMPACT_RECORDS` / `SAVE_DELTA_COMPACT_RATIO`.
+    """
+    return write_save(capture_save(state, save_path, user=user))
+
+
+def capture_save(
+    state: GameState, save_path: str | Path | None = None, user: str | None = None, *, full: bool = False
+) -> SaveSnapshot:
+    """Pickle `state` for a later `write_save`; the only step that needs the state lock.
+
+    The snapshot is a delta on top of the slot's last save when possible (see
+    `append_save_delta`), or a full save when `full` is set.
+    """
     path = resolve_save_path(save_path, user=user)
-    payload = _pack_state(state)
+    pending = take_pending_archive(state.jobs)
+    job_archive = [_job_archive_line(job) for job in pending] if Balance.JOB_ARCHIVE_ON_SAVE else []
+    memo = state.versions.memo
+    journal = memo.get(_JOURNAL_MEMO_KEY)
+    if full or not _journal_accepts_delta(journal, path):
+        journal = None
+    codec = _save_codec()
+    stamps = _section_stamps(state)
+    state_blob = None
+    blobs: dict[str, bytes] = {}
+    keyed_blobs: dict[str, dict[str, bytes]] = {}
+    if journal is None:
+        # write_save derives the journal's section digests from this blob.
+        state_blob = _dumps_with_content_refs(state) if codec else _dumps(state)
+        if Balance.STATE_VERSIONS_DEBUG_ASSERT:
+            # Unpickled sets can iterate in another order; the check needs the live state's bytes.
+            blobs, keyed_blobs = _section_blobs(state)
+    else:
+        unchanged = {name for name, stamp in stamps.items() if journal.stamps.get(name) == stamp}
+        if Balance.STATE_VERSIONS_DEBUG_ASSERT:
+            _assert_sections_unchanged(state, unchanged, journal)
+        blobs, keyed_blobs = _section_blobs(state, skip=unchanged)
+    return SaveSnapshot(
+        path=path,
+        memo=memo,
+        journal=journal,
+        codec=codec,
+        state_blob=state_blob,
+        blobs=blobs,
+        keyed_blobs=keyed_blobs,
+        stamps=stamps,
+        job_archive=job_archive,
+    )
+
+
+def write_save(snapshot: SaveSnapshot) -> Path:
+    """Checksum, write and fsync a captured snapshot; safe to run without the state lock.
+
+    Jobs evicted since the last save reach the job archive only after the save
+    that drops them is on disk.
+    """
+    try:
+        if snapshot.journal is None:
+            path = _write_full_save(snapshot)
+        else:
+            path = _write_delta_record(snapshot)
+    except SaveLoadError:
+        # The slot on disk still holds these jobs; archive them with the next save.
+        with _JOB_ARCHIVE_LOCK:
+            _UNARCHIVED_JOB_LINES.setdefault(snapshot.path, []).extend(snapshot.job_archive)
+        raise
+    _append_job_archive(snapshot.path, snapshot.job_archive)
+    return path
+
+
+def _journal_accepts_delta(journal: _SaveJournal | None, path: Path) -> bool:
+    return (
+        isinstance(journal, _SaveJournal)
+        and journal.path == path
+        and not journal.stale
+        and journal.records < Balance.SAVE_DELTA_COMPACT_RECORDS
+        and journal.log_size <= journal.base_size * Balance.SAVE_DELTA_COMPACT_RATIO
+    )
+
+
+def _write_full_save(snapshot: SaveSnapshot) -> Path:
+    path = snapshot.path
+    if snapshot.blobs:
+        digests, keyed_digests = _blob_digests(snapshot.blobs, snapshot.keyed_blobs)
+    else:
+        digests, keyed_digests = _section_digests(_loads_state_blob(snapshot.state_blob, snapshot.codec))
+    payload, checksum = _pack_state_blob(snapshot.state_blob, snapshot.codec)
     tmp_path = path.with_suffix(path.suffix + ".tmp")
     backup_path = _backup_path(path)
 
@@ -71,6 +239,8 @@ def save_single_slot(state: GameState, save_path: str | Path | None = None, user
 
         if path.exists():
             os.replace(path, backup_path)
+            # The backup keeps the delta records written on top of it.
+            _move_delta_log(path, backup_path)
         os.replace(tmp_path, path)
         _fsync_dir(path.parent)
     except OSError as exc:
@@ -82,12 +252,57 @@ def save_single_slot(state: GameState, save_path: str | Path | None = None, user
             except OSError:
                 pass
 
+    snapshot.memo[_JOURNAL_MEMO_KEY] = _SaveJournal(
+        path=path,
+        base_checksum=checksum,
+        base_size=len(snapshot.state_blob),
+        digests=digests,
+        keyed_digests=keyed_digests,
+        stamps=snapshot.stamps,
+    )
+    return path
+
+
+def _write_delta_record(snapshot: SaveSnapshot) -> Path:
+    path = snapshot.path
+    journal = snapshot.journal
+    sections, keyed, digests, keyed_digests = _collect_delta(snapshot.blobs, snapshot.keyed_blobs, journal)
+    if not sections and not keyed:
+        journal.stamps = snapshot.stamps
+        return path
+    record = pickle.dumps({"sections": sections, "keyed": keyed}, protocol=pickle.HIGHEST_PROTOCOL)
+    checksum = hashlib.sha256(record).hexdigest().encode("ascii")
+    framed = str(len(record)).encode("ascii") + b" " + checksum + b"\n" + record
+    log_path = _delta_path(path)
+
+    try:
+        with log_path.open("ab" if journal.records else "wb") as fh:
+            if not journal.records:
+                header = _DELTA_MAGIC + b"\n" + journal.base_checksum + b"\n"
+                fh.write(header)
+                journal.log_size = len(header)
+            fh.write(framed)
+            fh.flush()
+            os.fsync(fh.fileno())
+    except OSError as exc:
+        # The log may end in a torn record now; the next save starts a new base.
+        journal.stale = True
+        raise SaveLoadError(f"Could not append save delta to {log_path}: {exc}") from exc
+
+    journal.digests = digests
+    journal.keyed_digests = keyed_digests
+    journal.stamps = snapshot.stamps
+    journal.records += 1
+    journal.log_size += len(framed)
     return path
 
 
 def load_single_slot(save_path: str | Path | None = None, user: str | None = None) -> LoadGameResult | None:
     path = resolve_save_path(save_path, user=user)
     backup_path = _backup_path(path)
+    # A loaded state evicts (and archives) its own jobs again.
+    with _JOB_ARCHIVE_LOCK:
+        _UNARCHIVED_JOB_LINES.pop(path, None)
 
     if not path.exists() and not backup_path.exists():
         return None
@@ -95,17 +310,21 @@ def load_single_slot(save_path: str | Path | None = None, user: str | None = Non
     primary_error: Exception | None = None
     if path.exists():
         try:
-            state = _load_from_file(path)
+            state, replayed, changed = _load_from_file(path)
             apply_retorno_canonical_layout(state)
-            return LoadGameResult(state=state, source="primary", path=path)
+            return LoadGameResult(
+                state=state, source="primary", path=path, deltas_replayed=replayed, changed_content_refs=changed
+            )
         except Exception as exc:  # noqa: BLE001
             primary_error = exc
 
     if backup_path.exists():
         try:
-            state = _load_from_file(backup_path)
+            state, replayed, changed = _load_from_file(backup_path)
             apply_retorno_canonical_layout(state)
-            return LoadGameResult(state=state, source="backup", path=backup_path)
+            return LoadGameResult(
+                state=state, source="backup", path=backup_path, deltas_replayed=replayed, changed_content_refs=changed
+            )
         except Exception as backup_error:  # noqa: BLE001
             msg = (
                 f"Save slot is unreadable. primary={path} ({primary_error}); "
@@ -119,40 +338,193 @@ def load_single_slot(save_path: str | Path | None = None, user: str | None = Non
     return None
 
 
-def _pack_state(state: GameState) -> bytes:
-    state_blob = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
-    checksum = hashlib.sha256(state_blob).hexdigest().encode("ascii")
-    return _SAVE_MAGIC + b"\n" + checksum + b"\n" + state_blob
+def job_archive_path(save_path: str | Path | None = None, user: str | None = None) -> Path:
+    path = resolve_save_path(save_path, user=user)
+    return Path(str(path) + _JOB_ARCHIVE_SUFFIX)
+
+
+def load_job_archive(save_path: str | Path | None = None, user: str | None = None) -> list[dict]:
+    path = job_archive_path(save_path, user=user)
+    if not path.exists():
+        return []
+    records: list[dict] = []
+    with path.open("r", encoding="utf-8") as fh:
+        for line in fh:
+            line = line.strip()
+            if line:
+                records.append(json.loads(line))
+    return records
+
+
+def _job_archive_line(job: Job) -> str:
+    record = {
+        "job_key": job.internal_id or job.job_id,
+        "job_id": job.job_id,
+        "job_type": job.job_type.value,
+        "status": job.status.value,
+        "owner_id": job.owner_id,
+        "target": f"{job.target.kind}:{job.target.id}" if job.target else None,
+        "terminal_seq": job.terminal_seq,
+        "params": job.params,
+    }
+    return json.dumps(record, default=str, sort_keys=True)
+
+
+def _append_job_archive(path: Path, lines: list[str]) -> None:
+    archive_path = Path(str(path) + _JOB_ARCHIVE_SUFFIX)
+    with _JOB_ARCHIVE_LOCK:
+        lines = _UNARCHIVED_JOB_LINES.pop(path, []) + lines
+        if not lines:
+            return
+        try:
+            archive_path.parent.mkdir(parents=True, exist_ok=True)
+            with archive_path.open("a", encoding="utf-8") as fh:
+                fh.write("".join(line + "\n" for line in lines))
+        except OSError:
+            _UNARCHIVED_JOB_LINES[path] = lines
 
 
-def _load_from_file(path: Path) -> GameState:
-    try:
-        raw = path.read_bytes()
-    except OSError as exc:
-        raise SaveLoadError(f"Could not read save file {path}: {exc}") from exc
+def _save_codec() -> str | None:
+    codec = Balance.SAVE_CODEC
+    if codec is not None and codec not in _SAVE_CODECS:
+        raise SaveLoadError(f"Unknown save codec: {codec}")
+    return codec
+
+
+def _pack_state_blob(state_blob: bytes, codec: str | None) -> tuple[bytes, bytes]:
+    if codec is None:
+        checksum = hashlib.sha256(state_blob).hexdigest().encode("ascii")
+        return _SAVE_MAGIC + b"\n" + checksum + b"\n" + state_blob, checksum
+    compressed = _SAVE_CODECS[codec][0](state_blob)
+    checksum = hashlib.sha256(compressed).hexdigest().encode("ascii")
+    return _SAVE_MAGIC_V3 + b"\n" + codec.encode("ascii") + b"\n" + checksum + b"\n" + compressed, checksum
+
+
+class _ContentRefPickler(pickle.Pickler):
+    """Stores authored data/ texts as (content_ref, sha256) instead of inline."""
 
+    def __init__(self, fh, texts: dict[str, tuple[str, str]]) -> None:
+        super().__init__(fh, protocol=pickle.HIGHEST_PROTOCOL)
+        self._texts = texts
+
+    def persistent_id(self, obj):
+        if type(obj) is str and len(obj) >= _CONTENT_REF_MIN_CHARS:
+            return self._texts.get(obj)
+        return None
+
+
+class _ContentRefUnpickler(pickle.Unpickler):
+    """Resolves content refs against the current data/ files.
+
+    An authored file edited since the save (digest mismatch) loads its
+    current text, the same text the fs base layer already serves, and is
+    listed in `changed_refs`. A file that is gone fails the load.
+    """
+
+    def __init__(self, fh) -> None:
+        super().__init__(fh)
+        self.changed_refs: set[str] = set()
+
+    def persistent_load(self, pid):
+        content_ref, digest = pid
+        text = load_data_text(content_ref)
+        if not text:
+            # Authored texts are never empty (see load_authored_texts); the file was removed or renamed.
+            raise SaveLoadError(f"Authored file {content_ref} referenced by this save is missing")
+        if hashlib.sha256(text.encode("utf-8")).hexdigest() != digest:
+            self.changed_refs.add(content_ref)
+        return text
+
+
+def _dumps_with_content_refs(state: GameState) -> bytes:
+    buffer = io.BytesIO()
+    _ContentRefPickler(buffer, load_authored_texts()).dump(state)
+    return buffer.getvalue()
+
+
+def _loads_state_blob(state_blob: bytes, codec: str | None) -> GameState:
+    """Unpickle a captured blob, resolving content refs from the texts they were made from."""
+    if codec is None:
+        return pickle.loads(state_blob)
+    texts = {ref: text for text, ref in load_authored_texts().items()}
+    unpickler = pickle.Unpickler(io.BytesIO(state_blob))
+    unpickler.persistent_load = texts.__getitem__
+    return unpickler.load()
+
+
+def _load_from_file(path: Path) -> tuple[GameState, int, tuple[str, ...]]:
+    """Base save at `path` with its delta log replayed, the number of records replayed
+    and the authored files that changed since the base was written."""
+    state, checksum, base_size, changed = _load_base_file(path)
+    log_path = _delta_path(path)
+    records, log_size = _read_delta_log(log_path, checksum)
+    for record in records:
+        try:
+            _apply_delta(state, pickle.loads(record))
+        except Exception as exc:  # noqa: BLE001
+            raise SaveLoadError(f"Could not replay save delta from {log_path}: {exc}") from exc
+    digests, keyed_digests = _section_digests(state)
+    state.versions.memo[_JOURNAL_MEMO_KEY] = _SaveJournal(
+        path=path,
+        base_checksum=checksum,
+        base_size=base_size,
+        digests=digests,
+        keyed_digests=keyed_digests,
+        stamps=_section_stamps(state),
+        records=len(records),
+        log_size=log_size,
+        # A torn tail would hide anything appended after it.
+        stale=log_size != _file_size(log_path),
+    )
+    return state, len(records), changed
+
+
+def _load_base_file(path: Path) -> tuple[GameState, bytes, int, tuple[str, ...]]:
+    with _read_save_file(path) as raw:
+        return _decode_base_file(path, raw)
+
+
+def _decode_base_file(path: Path, raw) -> tuple[GameState, bytes, int, tuple[str, ...]]:
     first_nl = raw.find(b"\n")
-    second_nl = raw.find(b"\n", first_nl + 1) if first_nl != -1 else -1
+    magic = bytes(raw[:first_nl]) if first_nl != -1 else b""
+    codec = None
+    header_end = first_nl
+    if magic == _SAVE_MAGIC_V3:
+        codec_nl = raw.find(b"\n", first_nl + 1)
+        codec = bytes(raw[first_nl + 1 : codec_nl]).decode("ascii", "replace") if codec_nl != -1 else ""
+        header_end = codec_nl
+    second_nl = raw.find(b"\n", header_end + 1) if header_end != -1 else -1
     if first_nl == -1 or second_nl == -1:
         raise SaveLoadError(f"Malformed save file header: {path}")
 
-    magic = raw[:first_nl]
-    checksum = raw[first_nl + 1 : second_nl]
-    payload = raw[second_nl + 1 :]
+    checksum = bytes(raw[header_end + 1 : second_nl])
+    payload = memoryview(raw)[second_nl + 1 :]
 
-    if magic != _SAVE_MAGIC:
+    if magic not in {_SAVE_MAGIC, _SAVE_MAGIC_V3}:
         if magic in _LEGACY_SAVE_MAGICS:
             raise SaveLoadError(
                 "Save incompatible with data-pool refactor; start a new game."
             )
         raise SaveLoadError(f"Unknown save format in {path}")
+    if codec is not None and codec not in _SAVE_CODECS:
+        raise SaveLoadError(f"Unknown save codec {codec!r} in {path}")
 
     payload_hash = hashlib.sha256(payload).hexdigest().encode("ascii")
     if payload_hash != checksum:
         raise SaveLoadError(f"Checksum mismatch in {path}")
 
+    changed: tuple[str, ...] = ()
     try:
-        loaded = pickle.loads(payload)
+        if codec is None:
+            state_blob = payload
+            loaded = pickle.loads(state_blob)
+        else:
+            state_blob = _SAVE_CODECS[codec][1](payload)
+            unpickler = _ContentRefUnpickler(io.BytesIO(state_blob))
+            loaded = unpickler.load()
+            changed = tuple(sorted(unpickler.changed_refs))
+    except SaveLoadError:
+        raise
     except Exception as exc:  # noqa: BLE001
         raise SaveLoadError(f"Could not decode save file {path}: {exc}") from exc
 
@@ -163,7 +535,196 @@ def _load_from_file(path: Path) -> GameState:
             "Save incompatible with data-pool refactor; start a new game."
         )
 
-    return loaded
+    return loaded, checksum, len(state_blob), changed
+
+
+@contextmanager
+def _read_save_file(path: Path):
+    """Save file contents; memory-mapped once the file reaches `Balance.SAVE_MMAP_MIN_BYTES`."""
+    try:
+        size = path.stat().st_size
+        if size < max(1, Balance.SAVE_MMAP_MIN_BYTES):
+            mapped = None
+            raw = path.read_bytes()
+        else:
+            with path.open("rb") as fh:
+                mapped = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            raw = mapped
+    except (OSError, ValueError) as exc:
+        raise SaveLoadError(f"Could not read save file {path}: {exc}") from exc
+    try:
+        yield raw
+    finally:
+        if mapped is not None:
+            try:
+                mapped.close()
+            except BufferError:
+                # A view is still referenced (e.g. by a traceback); let GC unmap it.
+                pass
+
+
+def _read_delta_log(log_path: Path, base_checksum: bytes) -> tuple[list[bytes], int]:
+    """Intact records of the delta log bound to `base_checksum`, and the bytes they span.
+
+    A log written on top of another base is ignored. Reading stops at the first
+    truncated or corrupt record: that is where a crash interrupted an append.
+    """
+    try:
+        raw = log_path.read_bytes()
+    except FileNotFoundError:
+        return [], 0
+    except OSError as exc:
+        raise SaveLoadError(f"Could not read save delta log {log_path}: {exc}") from exc
+
+    header = _DELTA_MAGIC + b"\n" + base_checksum + b"\n"
+    if not raw.startswith(header):
+        return [], 0
+    records: list[bytes] = []
+    pos = len(header)
+    while pos < len(raw):
+        nl = raw.find(b"\n", pos)
+        if nl == -1:
+            break
+        size_text, _, checksum = raw[pos:nl].partition(b" ")
+        if not size_text.isdigit():
+            break
+        end = nl + 1 + int(size_text)
+        record = raw[nl + 1 : end]
+        if end > len(raw) or hashlib.sha256(record).hexdigest().encode("ascii") != checksum:
+            break
+        records.append(record)
+        pos = end
+    return records, pos
+
+
+def _section_stamps(state: GameState) -> dict[str, tuple[int, ...]]:
+    stamps = {name: versions_stamp(state, parts) for name, parts in _SECTION_VERSION_PARTS.items()}
+    world = state.world
+    stamps["world"] += (world.space.nodes.revision, world.space.links_revision, world.known_node_ids().revision)
+    return stamps
+
+
+def _section_blobs(
+    state: GameState, skip: set[str] | frozenset[str] = frozenset()
+) -> tuple[dict[str, bytes], dict[str, dict[str, bytes]]]:
+    """Pickled sections and keyed entries of `state`, leaving out the sections named in `skip`."""
+    blobs = {name: _dumps(getattr(state, name)) for name in _WHOLE_SECTIONS if name not in skip}
+    for name, table in _SPLIT_SECTIONS.items():
+        if name in skip:
+            continue
+        owner = getattr(state, name)
+        data = {f.name: getattr(owner, f.name) for f in fields(owner) if f.name != table}
+        table_value = getattr(owner, table)
+        if isinstance(table_value, LayeredFS):
+            # Layer ids and whiteouts travel with the section; overlay entries are keyed.
+            data[table] = table_value.shell()
+        blobs[name] = _dumps(data)
+    keyed: dict[str, dict[str, bytes]] = {}
+    for name, (owner_name, table) in _KEYED_SECTIONS.items():
+        if name in skip:
+            continue
+        entries = _keyed_entries(getattr(getattr(state, owner_name), table))
+        keyed[name] = {key: _dumps(value) for key, value in entries.items()}
+    return blobs, keyed
+
+
+def _section_digests(state: GameState) -> tuple[dict[str, bytes], dict[str, dict[str, bytes]]]:
+    return _blob_digests(*_section_blobs(state))
+
+
+def _assert_sections_unchanged(state: GameState, names: set[str], journal: _SaveJournal) -> None:
+    digests, keyed_digests = _section_digests(state)
+    for name in names:
+        if name in digests and digests[name] != journal.digests.get(name):
+            raise AssertionError(f"Save section {name!r} changed without a state version bump")
+        if name in keyed_digests and keyed_digests[name] != journal.keyed_digests.get(name):
+            raise AssertionError(f"Save section {name!r} changed without a state version bump")
+
+
+def _blob_digests(
+    blobs: dict[str, bytes], keyed_blobs: dict[str, dict[str, bytes]]
+) -> tuple[dict[str, bytes], dict[str, dict[str, bytes]]]:
+    return (
+        {name: _digest(blob) for name, blob in blobs.items()},
+        {name: {key: _digest(blob) for key, blob in entries.items()} for name, entries in keyed_blobs.items()},
+    )
+
+
+def _collect_delta(blobs: dict[str, bytes], keyed_blobs: dict[str, dict[str, bytes]], journal: _SaveJournal):
+    """Changed sections and keyed entries since `journal`, plus the new digests.
+
+    Sections missing from `blobs`/`keyed_blobs` were skipped as unchanged and keep their digests.
+    """
+    new_digests, new_keyed_digests = _blob_digests(blobs, keyed_blobs)
+    sections = {name: blobs[name] for name, digest in new_digests.items() if journal.digests.get(name) != digest}
+    digests = {**journal.digests, **new_digests}
+    keyed_digests = {**journal.keyed_digests, **new_keyed_digests}
+    keyed: dict[str, dict] = {}
+    for name, new in new_keyed_digests.items():
+        old = journal.keyed_digests.get(name, {})
+        changed = {key: keyed_blobs[name][key] for key, digest in new.items() if old.get(key) != digest}
+        removed = [key for key in old if key not in new]
+        if changed or removed:
+            keyed[name] = {"set": changed, "del": removed}
+    return sections, keyed, digests, keyed_digests
+
+
+def _apply_delta(state: GameState, record: dict) -> None:
+    for name, blob in record["sections"].items():
+        value = pickle.loads(blob)
+        if name in _SPLIT_SECTIONS:
+            table = _SPLIT_SECTIONS[name]
+            current = getattr(state, name)
+            shell = value.get(table)
+            if isinstance(shell, LayeredFS):
+                shell.overlay = _keyed_entries(getattr(current, table))
+            else:
+                value[table] = getattr(current, table)
+            rebuilt = type(current).__new__(type(current))
+            rebuilt.__setstate__((None, value))
+            value = rebuilt
+        setattr(state, name, value)
+    for name, change in record["keyed"].items():
+        owner_name, table = _KEYED_SECTIONS[name]
+        entries = _keyed_entries(getattr(getattr(state, owner_name), table))
+        for key in change["del"]:
+            entries.pop(key, None)
+        for key, blob in change["set"].items():
+            entries[key] = pickle.loads(blob)
+        if name == "pools":
+            # Same as a full load: completion flags are recomputed for every pool.
+            state.world.completion_dirty_nodes.update(change["set"])
+
+
+def _keyed_entries(table) -> dict:
+    return table.overlay if isinstance(table, LayeredFS) else table
+
+
+def _dumps(value) -> bytes:
+    return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _digest(blob: bytes) -> bytes:
+    return hashlib.sha256(blob).digest()
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def _delta_path(path: Path) -> Path:
+    return Path(str(path) + _DELTA_SUFFIX)
+
+
+def _move_delta_log(path: Path, backup_path: Path) -> None:
+    delta_path = _delta_path(path)
+    if delta_path.exists():
+        os.replace(delta_path, _delta_path(backup_path))
+    else:
+        _delta_path(backup_path).unlink(missing_ok=True)
 
 
 def _backup_path(path: Path) -> Path:
@@ -3,7 +3,9 @@ from __future__ import annotations
 import re
 from dataclasses import MISSING, dataclass, field, fields
 from enum import Enum
-from typing import Any
+from typing import Any, Iterable, Iterator
+
+from retorno.config.balance import Balance
 
 
 class JobType(str, Enum):
@@ -124,13 +126,114 @@ class Job:
             object.__setattr__(self, f.name, value)
 
 
+class JobIdSet:
+    """Insertion-ordered set of job keys with O(1) membership, append and remove.
+
+    Reads like the list it replaced (iteration, indexing, `index`, `insert`)
+    and pickles as a plain list.
+    """
+
+    __slots__ = ("_ids",)
+
+    def __init__(self, ids: Iterable[str] = ()) -> None:
+        self._ids: dict[str, None] = dict.fromkeys(ids)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._ids
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ids)
+
+    def __reversed__(self) -> Iterator[str]:
+        return reversed(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __getitem__(self, index):
+        if index == 0 and self._ids:
+            return next(iter(self._ids))
+        if index == -1 and self._ids:
+            return next(reversed(self._ids))
+        return list(self._ids)[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, JobIdSet):
+            return list(self._ids) == list(other._ids)
+        if isinstance(other, list):
+            return list(self._ids) == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{list(self._ids)!r}"
+
+    def __reduce__(self):
+        return (JobIdSet, (list(self._ids),))
+
+    def append(self, key: str) -> None:
+        self._ids[key] = None
+
+    def remove(self, key: str) -> None:
+        try:
+            del self._ids[key]
+        except KeyError:
+            raise ValueError(f"{key!r} not in job id set") from None
+
+    def discard(self, key: str) -> None:
+        self._ids.pop(key, None)
+
+    def pop_oldest(self) -> str:
+        key = next(iter(self._ids))
+        del self._ids[key]
+        return key
+
+    def index(self, key: str) -> int:
+        return list(self._ids).index(key)
+
+    def insert(self, index: int, key: str) -> None:
+        ids = [item for item in self._ids if item != key]
+        ids.insert(index, key)
+        self._ids = dict.fromkeys(ids)
+
+
+class JobDisplayIndex(dict):
+    """Display id -> job key cache; saved and copied empty.
+
+    `stale` is set while some display id may be missing (a new index, or an
+    id handed out by `allocate_job_ids`); only then does a lookup miss rebuild it.
+    """
+
+    __slots__ = ("stale",)
+
+    def __init__(self, *args) -> None:
+        super().__init__(*args)
+        self.stale = not self
+
+    def __reduce__(self):
+        return (JobDisplayIndex, ())
+
+
 @dataclass(slots=True)
 class JobManagerState:
+    """Active jobs plus a bounded, ring-buffered history of finished ones.
+
+    `jobs` holds every active job and the newest `Balance.JOB_HISTORY_MAX`
+    finished ones (`history_job_ids`, oldest first). Evicted jobs wait in
+    `pending_archive` until the next save appends them to the on-disk archive.
+    """
+
     jobs: dict[str, Job] = field(default_factory=dict)
-    active_job_ids: list[str] = field(default_factory=list)
+    active_job_ids: JobIdSet = field(default_factory=JobIdSet)
     next_job_seq: int = 1
     next_active_job_seq: int = 1
     next_terminal_job_seq: int = 1
+    history_job_ids: JobIdSet = field(default_factory=JobIdSet)
+    pending_archive: list[Job] = field(default_factory=list)
+    archived_job_count: int = 0
+    # Display id -> job key; rebuilt when stale, entries are checked before use.
+    display_index: JobDisplayIndex = field(default_factory=JobDisplayIndex, repr=False, compare=False)
 
     def __setstate__(self, state) -> None:
         slot_state = state
@@ -179,7 +282,8 @@ def normalize_job_manager_state(jobs_state: JobManagerState, *, migrate_legacy_i
             active_ids.append(mapped)
             seen.add(mapped)
     object.__setattr__(jobs_state, "jobs", jobs)
-    object.__setattr__(jobs_state, "active_job_ids", active_ids)
+    object.__setattr__(jobs_state, "active_job_ids", JobIdSet(active_ids))
+    object.__setattr__(jobs_state, "display_index", JobDisplayIndex())
 
     active_set = set(active_ids)
     terminal_jobs = [
@@ -203,6 +307,7 @@ def normalize_job_manager_state(jobs_state: JobManagerState, *, migrate_legacy_i
             next_terminal += 1
         object.__setattr__(jobs_state, "next_active_job_seq", len(active_ids) + 1 if active_ids else 1)
         object.__setattr__(jobs_state, "next_terminal_job_seq", next_terminal)
+        _rebuild_history(jobs_state, terminal_jobs)
         return
 
     max_active = 0
@@ -238,6 +343,15 @@ def normalize_job_manager_state(jobs_state: JobManagerState, *, migrate_legacy_i
         "next_terminal_job_seq",
         max(int(jobs_state.next_terminal_job_seq or 1), max_terminal + 1),
     )
+    _rebuild_history(jobs_state, terminal_jobs)
+
+
+def _rebuild_history(jobs_state: JobManagerState, terminal_jobs: list[tuple[int, str, Job]]) -> None:
+    ordered = sorted(terminal_jobs, key=lambda item: (int(item[2].terminal_seq or 0), item[1]))
+    object.__setattr__(jobs_state, "history_job_ids", JobIdSet(key for _, key, _ in ordered))
+    object.__setattr__(jobs_state, "pending_archive", list(jobs_state.pending_archive or []))
+    object.__setattr__(jobs_state, "archived_job_count", int(jobs_state.archived_job_count or 0))
+    prune_job_history(jobs_state)
 
 
 def allocate_job_ids(jobs_state: JobManagerState) -> tuple[str, str]:
@@ -253,6 +367,8 @@ def allocate_job_ids(jobs_state: JobManagerState) -> tuple[str, str]:
 
     display_seq = max(1, int(jobs_state.next_active_job_seq or 1))
     jobs_state.next_active_job_seq = display_seq + 1
+    # The caller registers the job under this id after we return.
+    jobs_state.display_index.stale = True
     return internal_id, format_active_job_id(display_seq)
 
 
@@ -265,27 +381,95 @@ def finalize_job(jobs_state: JobManagerState, job_key: str, status: JobStatus) -
     jobs_state.next_terminal_job_seq = seq + 1
     object.__setattr__(job, "terminal_seq", seq)
     object.__setattr__(job, "job_id", format_terminal_job_id(status, seq))
-    if job_key in jobs_state.active_job_ids:
-        jobs_state.active_job_ids.remove(job_key)
+    jobs_state.active_job_ids.discard(job_key)
     if not jobs_state.active_job_ids:
         jobs_state.next_active_job_seq = 1
+    jobs_state.history_job_ids.discard(job_key)
+    jobs_state.history_job_ids.append(job_key)
+    jobs_state.display_index[job.job_id] = job_key
+    prune_job_history(jobs_state)
     return job
 
 
+def retire_job(jobs_state: JobManagerState, job_key: str) -> None:
+    """Take a job out of the active set; finished jobs join the history ring."""
+    jobs_state.active_job_ids.discard(job_key)
+    job = jobs_state.jobs.get(job_key)
+    if job is not None and is_terminal_job_status(job.status) and job_key not in jobs_state.history_job_ids:
+        jobs_state.history_job_ids.append(job_key)
+        prune_job_history(jobs_state)
+
+
+def prune_job_history(jobs_state: JobManagerState, limit: int | None = None) -> list[Job]:
+    """Drop the oldest finished jobs beyond `limit`; they are queued for the archive."""
+    limit = int(Balance.JOB_HISTORY_MAX if limit is None else limit)
+    evicted: list[Job] = []
+    history = jobs_state.history_job_ids
+    while len(history) > max(0, limit):
+        key = history.pop_oldest()
+        if key in jobs_state.active_job_ids:
+            continue
+        job = jobs_state.jobs.pop(key, None)
+        if job is not None:
+            evicted.append(job)
+    if evicted:
+        jobs_state.archived_job_count += len(evicted)
+        if Balance.JOB_ARCHIVE_ON_SAVE:
+            jobs_state.pending_archive.extend(evicted)
+    return evicted
+
+
+def take_pending_archive(jobs_state: JobManagerState) -> list[Job]:
+    pending = list(jobs_state.pending_archive)
+    jobs_state.pending_archive.clear()
+    return pending
+
+
 def find_job_key(jobs_state: JobManagerState, job_ref: str) -> str | None:
     ref = str(job_ref or "").strip()
     if not ref:
         return None
     if ref in jobs_state.jobs:
         return ref
+    key = _indexed_job_key(jobs_state, ref)
+    if key is None and jobs_state.display_index.stale:
+        index = JobDisplayIndex((job.job_id, key) for key, job in jobs_state.jobs.items())
+        for active_key in jobs_state.active_job_ids:
+            job = jobs_state.jobs.get(active_key)
+            if job:
+                index[job.job_id] = active_key
+        index.stale = False
+        jobs_state.display_index = index
+        key = _indexed_job_key(jobs_state, ref)
+    return key
+
+
+def _indexed_job_key(jobs_state: JobManagerState, ref: str) -> str | None:
+    key = jobs_state.display_index.get(ref)
+    job = jobs_state.jobs.get(key) if key is not None else None
+    if job is not None and job.job_id == ref:
+        return key
+    return None
+
+
+def running_jobs_power_kw(jobs_state: JobManagerState) -> float:
+    """Power drawn by RUNNING jobs; only active jobs can run, so history is never walked."""
+    total = 0.0
     for key in jobs_state.active_job_ids:
         job = jobs_state.jobs.get(key)
-        if job and job.job_id == ref:
-            return key
-    for key, job in jobs_state.jobs.items():
-        if job.job_id == ref:
-            return key
-    return None
+        if job is not None and job.status == JobStatus.RUNNING and job.power_draw_kw > 0.0:
+            total += job.power_draw_kw
+    return total
+
+
+def history_jobs(jobs_state: JobManagerState) -> list[Job]:
+    """Finished jobs kept in the save, newest first."""
+    out: list[Job] = []
+    for key in reversed(jobs_state.history_job_ids):
+        job = jobs_state.jobs.get(key)
+        if job is not None and key not in jobs_state.active_job_ids and is_terminal_job_status(job.status):
+            out.append(job)
+    return out
 
 
 def active_job_display_ids(jobs_state: JobManagerState) -> list[str]:
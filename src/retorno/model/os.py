@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import functools
+import sys
+from collections.abc import Iterator, Mapping, MutableMapping
 from dataclasses import MISSING, dataclass, field, fields
 from enum import Enum
 
@@ -32,6 +35,161 @@ class FSNode:
     is_corrupted: bool = False
 
 
+def fs_base_id(ship_id: str) -> str:
+    return f"system:{ship_id}"
+
+
+# Older saves kept the whole fs inline; they only ever had the RETORNO ship.
+LEGACY_FS_BASE_ID = fs_base_id("RETORNO_SHIP")
+
+
+class LayeredFS(MutableMapping):
+    """`OSState.fs`: a writable per-save overlay on a read-only base layer.
+
+    The base layer (standard directories, manuals, the ship's authored mail
+    and logs) is built from data/ through the content catalog and is not
+    saved: a save holds `base_id`, the overlay and the whiteouts (base paths
+    deleted in this game), so edits to authored files show up on the next
+    load. Base nodes are shared between games; replace entries, never mutate
+    them in place.
+
+    Keys are interned in normalized form on insertion. A directory index
+    (dir path -> child name -> number of paths under that child) backs
+    `list_dir`; it is built on first use, kept current by set/delete, and
+    rebuilt after a load or when `overlay` is replaced wholesale.
+    """
+
+    __slots__ = ("base_id", "overlay", "whiteouts", "_base", "_children", "_indexed_overlay")
+
+    def __init__(
+        self,
+        base_id: str | None = None,
+        overlay: dict[str, FSNode] | None = None,
+        whiteouts: set[str] | None = None,
+    ) -> None:
+        self.base_id = base_id
+        self.overlay: dict[str, FSNode] = overlay if overlay is not None else {}
+        self.whiteouts: set[str] = whiteouts if whiteouts is not None else set()
+        self._base: Mapping[str, FSNode] | None = None
+        self._children: dict[str, dict[str, int]] | None = None
+        self._indexed_overlay: dict[str, FSNode] | None = None
+
+    @classmethod
+    def from_entries(cls, entries: Mapping[str, FSNode], base_id: str | None) -> LayeredFS:
+        """Layer a flat fs dict over `base_id`; paths the base provides come from the base."""
+        layered = cls(base_id)
+        base = layered.base
+        layered.overlay = {path: node for path, node in entries.items() if path not in base}
+        return layered
+
+    @property
+    def base(self) -> Mapping[str, FSNode]:
+        if self._base is None:
+            if self.base_id is None:
+                self._base = {}
+            else:
+                from retorno.runtime.data_loader import load_fs_base_layer
+
+                self._base = load_fs_base_layer(self.base_id)
+        return self._base
+
+    def shell(self) -> LayeredFS:
+        """Same layers and whiteouts, no overlay entries."""
+        return LayeredFS(self.base_id, {}, set(self.whiteouts))
+
+    def __getitem__(self, path: str) -> FSNode:
+        node = self.overlay.get(path)
+        if node is not None:
+            return node
+        if path in self.whiteouts:
+            raise KeyError(path)
+        return self.base[path]
+
+    def __setitem__(self, path: str, node: FSNode) -> None:
+        path = sys.intern(normalize_path(path))
+        children = self._live_index()
+        if children is not None and path not in self:
+            _index_add(children, path)
+        self.overlay[path] = node
+        self.whiteouts.discard(path)
+
+    def __delitem__(self, path: str) -> None:
+        in_overlay = self.overlay.pop(path, None) is not None
+        if path in self.base and path not in self.whiteouts:
+            self.whiteouts.add(path)
+        elif not in_overlay:
+            raise KeyError(path)
+        children = self._live_index()
+        if children is not None:
+            _index_remove(children, path)
+
+    def __contains__(self, path: object) -> bool:
+        if path in self.overlay:
+            return True
+        return path not in self.whiteouts and path in self.base
+
+    def __iter__(self) -> Iterator[str]:
+        overlay = self.overlay
+        whiteouts = self.whiteouts
+        for path in self.base:
+            if path not in overlay and path not in whiteouts:
+                yield path
+        yield from overlay
+
+    def __len__(self) -> int:
+        overlay = self.overlay
+        return len(overlay) + sum(1 for path in self.base if path not in overlay and path not in self.whiteouts)
+
+    def __reduce__(self):
+        return (LayeredFS, (self.base_id, self.overlay, self.whiteouts))
+
+    def list_dir(self, dir_path: str) -> list[str]:
+        """Sorted child names of the normalized `dir_path`."""
+        children = self._live_index()
+        if children is None:
+            children = {}
+            for path in self:
+                _index_add(children, path)
+            self._children = children
+            self._indexed_overlay = self.overlay
+        return sorted(children.get(dir_path, ()))
+
+    def _live_index(self) -> dict[str, dict[str, int]] | None:
+        if self._indexed_overlay is not self.overlay:
+            self._children = None
+        return self._children
+
+    def __repr__(self) -> str:
+        return f"LayeredFS(base_id={self.base_id!r}, overlay={len(self.overlay)}, whiteouts={len(self.whiteouts)})"
+
+
+def _index_add(children: dict[str, dict[str, int]], path: str) -> None:
+    parent = "/"
+    for name in path.split("/")[1:]:
+        if not name:
+            return
+        counts = children.setdefault(parent, {})
+        counts[name] = counts.get(name, 0) + 1
+        parent = f"/{name}" if parent == "/" else f"{parent}/{name}"
+
+
+def _index_remove(children: dict[str, dict[str, int]], path: str) -> None:
+    parent = "/"
+    for name in path.split("/")[1:]:
+        if not name:
+            return
+        counts = children.get(parent)
+        if counts is None or name not in counts:
+            return
+        if counts[name] > 1:
+            counts[name] -= 1
+        else:
+            del counts[name]
+            if not counts:
+                del children[parent]
+        parent = f"/{name}" if parent == "/" else f"{parent}/{name}"
+
+
 @dataclass(slots=True)
 class AudioSettings:
     enabled: bool = True
@@ -61,7 +219,7 @@ class OSState:
     help_verbose: bool = True
     theme_preset: str = "linux"
     debug_enabled: bool = False
-    fs: dict[str, FSNode] = field(default_factory=dict)
+    fs: LayeredFS = field(default_factory=LayeredFS)
     mail_received_t: dict[str, float] = field(default_factory=dict)
     mail_received_seq: int = 0
     mail_received_seq_map: dict[str, int] = field(default_factory=dict)
@@ -83,6 +241,8 @@ class OSState:
         data = dict(slot_state)
         if "audio" not in data:
             data["audio"] = AudioSettings()
+        if isinstance(data.get("fs"), dict):
+            data["fs"] = LayeredFS.from_entries(data["fs"], LEGACY_FS_BASE_ID)
 
         for f in fields(self):
             if f.name in data:
@@ -159,6 +319,8 @@ def _has_access(node: FSNode, auth_levels: set[str]) -> bool:
 
 def list_dir(fs: dict[str, FSNode], dir_path: str) -> list[str]:
     dir_path = normalize_path(dir_path)
+    if isinstance(fs, LayeredFS):
+        return fs.list_dir(dir_path)
     if dir_path != "/":
         prefix = dir_path + "/"
     else:
@@ -194,16 +356,29 @@ def _ensure_dir(fs: dict[str, FSNode], dir_path: str, access: AccessLevel) -> No
     fs[dir_path] = FSNode(path=dir_path, node_type=FSNodeType.DIR, access=access)
 
 
+@functools.lru_cache(maxsize=4096)
+def _mount_src_path(raw_path: str) -> str | None:
+    src_path = normalize_path(raw_path)
+    if not src_path.startswith(("/mail", "/logs", "/data")):
+        return None
+    return sys.intern(src_path)
+
+
+def mount_dest_path(mount_root: str, raw_path: str) -> str | None:
+    """Where a node file lands under the normalized `mount_root`, or None if it is not mountable."""
+    src_path = _mount_src_path(raw_path)
+    if src_path is None:
+        return None
+    return src_path if mount_root == "/" else mount_root + src_path
+
+
 def mount_files(fs: dict[str, FSNode], prefix: str, files: list[dict]) -> int:
     prefix = normalize_path(prefix)
     added = 0
     for entry in files:
-        src_path = normalize_path(entry.get("path", ""))
-        if not src_path:
-            continue
-        if not (src_path.startswith("/mail") or src_path.startswith("/logs") or src_path.startswith("/data")):
+        dest_path = mount_dest_path(prefix, str(entry.get("path", "")))
+        if dest_path is None:
             continue
-        dest_path = normalize_path(prefix + src_path)
         if dest_path in fs:
             continue
         access = _normalize_access(entry.get("access", AccessLevel.GUEST))
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 from dataclasses import MISSING, dataclass, field, fields
 from typing import Optional, Tuple
 from retorno.config.balance import Balance
@@ -54,10 +55,404 @@ class SpaceNode:
             object.__setattr__(self, f.name, value)
 
 
+Cell = Tuple[int, int, int]
+
+
+class SpatialIndex:
+    """Bucket grid over node positions; cells coincide with the SECTOR_SIZE_LY sector grid.
+
+    Queries return node ids in insertion order, matching iteration over the
+    node dict, so callers that switch from a full scan keep deterministic output.
+    """
+
+    __slots__ = ("_cells", "_entries", "_next_seq")
+
+    def __init__(self) -> None:
+        self._cells: dict[Cell, set[str]] = {}
+        self._entries: dict[str, tuple[int, float, float, float, Cell]] = {}
+        self._next_seq = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def cell_for_pos(x_ly: float, y_ly: float, z_ly: float) -> Cell:
+        return (
+            math.floor(x_ly / SECTOR_SIZE_LY),
+            math.floor(y_ly / SECTOR_SIZE_LY),
+            math.floor(z_ly / SECTOR_SIZE_LY),
+        )
+
+    def add(self, node_id: str, x_ly: float, y_ly: float, z_ly: float) -> None:
+        previous = self._entries.get(node_id)
+        if previous is not None:
+            # Re-assigning a key keeps its dict position, so keep its sequence too.
+            seq = previous[0]
+            self._discard_from_cell(node_id, previous[4])
+        else:
+            seq = self._next_seq
+            self._next_seq += 1
+        cell = self.cell_for_pos(x_ly, y_ly, z_ly)
+        self._entries[node_id] = (seq, x_ly, y_ly, z_ly, cell)
+        self._cells.setdefault(cell, set()).add(node_id)
+
+    def remove(self, node_id: str) -> None:
+        entry = self._entries.pop(node_id, None)
+        if entry is not None:
+            self._discard_from_cell(node_id, entry[4])
+
+    def _discard_from_cell(self, node_id: str, cell: Cell) -> None:
+        bucket = self._cells.get(cell)
+        if bucket is None:
+            return
+        bucket.discard(node_id)
+        if not bucket:
+            del self._cells[cell]
+
+    def _ordered(self, node_ids) -> list[str]:
+        return sorted(node_ids, key=lambda node_id: self._entries[node_id][0])
+
+    def cell_of(self, node_id: str) -> Cell | None:
+        entry = self._entries.get(node_id)
+        return entry[4] if entry is not None else None
+
+    def indexed_positions(self) -> dict[str, tuple[float, float, float]]:
+        return {node_id: (entry[1], entry[2], entry[3]) for node_id, entry in self._entries.items()}
+
+    def cell_node_ids(self, cell: Cell) -> list[str]:
+        return self._ordered(self._cells.get(cell, ()))
+
+    def within(self, x_ly: float, y_ly: float, z_ly: float, radius_ly: float) -> list[str]:
+        """Ids of nodes at distance <= radius_ly, in insertion order."""
+        if radius_ly < 0.0:
+            return []
+        lo = self.cell_for_pos(x_ly - radius_ly, y_ly - radius_ly, z_ly - radius_ly)
+        hi = self.cell_for_pos(x_ly + radius_ly, y_ly + radius_ly, z_ly + radius_ly)
+        box_cells = (hi[0] - lo[0] + 1) * (hi[1] - lo[1] + 1) * (hi[2] - lo[2] + 1)
+        if box_cells <= len(self._cells):
+            cells = (
+                (cx, cy, cz)
+                for cx in range(lo[0], hi[0] + 1)
+                for cy in range(lo[1], hi[1] + 1)
+                for cz in range(lo[2], hi[2] + 1)
+            )
+        else:
+            cells = (
+                cell
+                for cell in self._cells
+                if lo[0] <= cell[0] <= hi[0] and lo[1] <= cell[1] <= hi[1] and lo[2] <= cell[2] <= hi[2]
+            )
+        r2 = radius_ly * radius_ly
+        hits: list[str] = []
+        for cell in cells:
+            for node_id in self._cells.get(cell, ()):
+                _, nx, ny, nz, _ = self._entries[node_id]
+                dx = nx - x_ly
+                dy = ny - y_ly
+                dz = nz - z_ly
+                dist2 = dx * dx + dy * dy + dz * dz
+                # Accept both squared and sqrt comparisons so boundary nodes match
+                # whichever form the caller used before switching to the index.
+                if dist2 <= r2 or math.sqrt(dist2) <= radius_ly:
+                    hits.append(node_id)
+        return self._ordered(hits)
+
+    def _rings(self, center: Cell, max_ring: int | None):
+        """(ring, cells) for the rings of cells at Chebyshev distance 0, 1, ... from `center`.
+
+        Each shell is enumerated by offset while it has fewer cells than the
+        grid holds; past that, the remaining occupied cells are bucketed by
+        ring in one pass.
+        """
+        cx, cy, cz = center
+        ring = 0
+        while max_ring is None or ring <= max_ring:
+            if 24 * ring * ring + 2 > len(self._cells):
+                break
+            yield ring, self._shell_cells(center, ring)
+            ring += 1
+        else:
+            return
+        rest: dict[int, list[Cell]] = {}
+        for cell in self._cells:
+            cell_ring = max(abs(cell[0] - cx), abs(cell[1] - cy), abs(cell[2] - cz))
+            if cell_ring >= ring and (max_ring is None or cell_ring <= max_ring):
+                rest.setdefault(cell_ring, []).append(cell)
+        for cell_ring in sorted(rest):
+            yield cell_ring, rest[cell_ring]
+
+    @staticmethod
+    def _shell_cells(center: Cell, ring: int) -> list[Cell]:
+        cx, cy, cz = center
+        if ring == 0:
+            return [center]
+        cells: list[Cell] = []
+        for dx in range(-ring, ring + 1):
+            for dy in range(-ring, ring + 1):
+                if abs(dx) == ring or abs(dy) == ring:
+                    dzs = range(-ring, ring + 1)
+                else:
+                    dzs = (-ring, ring)
+                cells.extend((cx + dx, cy + dy, cz + dz) for dz in dzs)
+        return cells
+
+    def nearest(
+        self,
+        x_ly: float,
+        y_ly: float,
+        z_ly: float,
+        k: int,
+        max_radius_ly: float | None = None,
+    ) -> list[tuple[float, str]]:
+        """Up to k (distance, node_id) pairs sorted by distance, then id."""
+        if k <= 0 or not self._entries:
+            return []
+        center = self.cell_for_pos(x_ly, y_ly, z_ly)
+        # A cell `ring` steps away is at least (ring - 1) cells from the query point.
+        max_ring = None if max_radius_ly is None else max(0, math.floor(max_radius_ly / SECTOR_SIZE_LY) + 1)
+        found: list[tuple[float, str]] = []
+        for ring, cells in self._rings(center, max_ring):
+            for cell in cells:
+                for node_id in self._cells.get(cell, ()):
+                    _, nx, ny, nz, _ = self._entries[node_id]
+                    dx = nx - x_ly
+                    dy = ny - y_ly
+                    dz = nz - z_ly
+                    found.append((dx * dx + dy * dy + dz * dz, node_id))
+            found.sort()
+            # Anything in an unvisited ring is at least `ring` cells away.
+            reach = ring * SECTOR_SIZE_LY
+            if len(found) >= k and found[k - 1][0] <= reach * reach:
+                break
+            if len(found) == len(self._entries):
+                break
+        out = [(math.sqrt(dist2), node_id) for dist2, node_id in found[:k]]
+        if max_radius_ly is not None:
+            out = [item for item in out if item[0] <= max_radius_ly]
+        return out
+
+
+class NodeMap(dict):
+    """`SpaceGraph.nodes` mapping that keeps a `SpatialIndex` and a by-kind index in sync on every write.
+
+    `revision` counts writes; caches derived from the node set compare it.
+    """
+
+    __slots__ = ("index", "by_kind", "revision")
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__()
+        self.index = SpatialIndex()
+        self.by_kind: dict[str, set[str]] = {}
+        self.revision = 0
+        self.update(*args, **kwargs)
+
+    def __setitem__(self, node_id: str, node: SpaceNode) -> None:
+        old = self.get(node_id)
+        if old is not None:
+            self._unindex_kind(node_id, old)
+        super().__setitem__(node_id, node)
+        self.index.add(
+            node_id,
+            float(getattr(node, "x_ly", 0.0)),
+            float(getattr(node, "y_ly", 0.0)),
+            float(getattr(node, "z_ly", 0.0)),
+        )
+        self.by_kind.setdefault(str(getattr(node, "kind", "")), set()).add(node_id)
+        self.revision += 1
+
+    def __delitem__(self, node_id: str) -> None:
+        node = self[node_id]
+        super().__delitem__(node_id)
+        self.index.remove(node_id)
+        self._unindex_kind(node_id, node)
+        self.revision += 1
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __reduce__(self):
+        return (NodeMap, (dict(self),))
+
+    def copy(self) -> NodeMap:
+        return NodeMap(self)
+
+    def pop(self, node_id: str, *default):
+        if node_id in self:
+            node = self[node_id]
+            del self[node_id]
+            return node
+        return super().pop(node_id, *default)
+
+    def popitem(self):
+        node_id, node = super().popitem()
+        self.index.remove(node_id)
+        self._unindex_kind(node_id, node)
+        self.revision += 1
+        return node_id, node
+
+    def clear(self) -> None:
+        super().clear()
+        self.index = SpatialIndex()
+        self.by_kind = {}
+        self.revision += 1
+
+    def setdefault(self, node_id: str, default=None):
+        if node_id not in self:
+            self[node_id] = default
+        return self[node_id]
+
+    def update(self, *args, **kwargs) -> None:
+        for node_id, node in dict(*args, **kwargs).items():
+            self[node_id] = node
+
+    def _unindex_kind(self, node_id: str, node: SpaceNode) -> None:
+        kind = str(getattr(node, "kind", ""))
+        ids = self.by_kind.get(kind)
+        if ids is not None:
+            ids.discard(node_id)
+            if not ids:
+                del self.by_kind[kind]
+
+
+class RevisionSet(set):
+    """Set that counts its writes in `revision`, like `NodeMap`; used for `WorldState.known_nodes`."""
+
+    __slots__ = ("revision",)
+
+    def __init__(self, *args) -> None:
+        super().__init__(*args)
+        self.revision = 0
+
+    def __reduce__(self):
+        return (RevisionSet, (set(self),))
+
+    def add(self, item) -> None:
+        if item not in self:
+            super().add(item)
+            self.revision += 1
+
+    def discard(self, item) -> None:
+        if item in self:
+            super().discard(item)
+            self.revision += 1
+
+    def remove(self, item) -> None:
+        super().remove(item)
+        self.revision += 1
+
+    def pop(self):
+        item = super().pop()
+        self.revision += 1
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self.revision += 1
+
+    def update(self, *others) -> None:
+        super().update(*others)
+        self.revision += 1
+
+    def difference_update(self, *others) -> None:
+        super().difference_update(*others)
+        self.revision += 1
+
+    def intersection_update(self, *others) -> None:
+        super().intersection_update(*others)
+        self.revision += 1
+
+    def symmetric_difference_update(self, other) -> None:
+        super().symmetric_difference_update(other)
+        self.revision += 1
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __isub__(self, other):
+        self.difference_update(other)
+        return self
+
+    def __iand__(self, other):
+        self.intersection_update(other)
+        return self
+
+    def __ixor__(self, other):
+        self.symmetric_difference_update(other)
+        return self
+
+
 @dataclass(slots=True)
 class SpaceGraph:
-    nodes: dict[str, SpaceNode] = field(default_factory=dict)
+    nodes: dict[str, SpaceNode] = field(default_factory=NodeMap)
     edges: dict[str, list[str]] = field(default_factory=dict)  # adjacency
+    links_revision: int = 0  # bumped by links_changed(); keys cached hop distances
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.nodes, NodeMap):
+            self.nodes = NodeMap(self.nodes)
+
+    def links_changed(self) -> None:
+        """Call after adding or removing `SpaceNode.links` entries."""
+        self.links_revision += 1
+
+    def __setstate__(self, state) -> None:
+        """Backward-compatible unpickle; rebuilds the spatial index from plain-dict saves."""
+        slot_state = state
+        if isinstance(state, tuple):
+            if len(state) == 2 and isinstance(state[1], dict):
+                slot_state = state[1]
+            elif len(state) == 2 and isinstance(state[0], dict):
+                slot_state = state[0]
+        if not isinstance(slot_state, dict):
+            raise TypeError(f"Unsupported SpaceGraph pickle payload: {type(state)!r}")
+
+        data = dict(slot_state)
+        for f in fields(self):
+            if f.name in data:
+                value = data[f.name]
+            elif f.default is not MISSING:
+                value = f.default
+            elif f.default_factory is not MISSING:
+                value = f.default_factory()
+            else:
+                continue
+            object.__setattr__(self, f.name, value)
+        self.__post_init__()
+
+    def spatial_index(self) -> SpatialIndex:
+        # Callers may assign a plain dict to `nodes`; re-wrap it on first use.
+        if not isinstance(self.nodes, NodeMap):
+            self.nodes = NodeMap(self.nodes)
+        return self.nodes.index
+
+    def nodes_within(self, pos: Tuple[float, float, float], radius_ly: float) -> list[str]:
+        return self.spatial_index().within(pos[0], pos[1], pos[2], radius_ly)
+
+    def nearest_nodes(
+        self,
+        pos: Tuple[float, float, float],
+        k: int,
+        max_radius_ly: float | None = None,
+    ) -> list[tuple[float, str]]:
+        return self.spatial_index().nearest(pos[0], pos[1], pos[2], k, max_radius_ly)
+
+    def sector_node_ids(self, sector_id: str) -> list[str]:
+        cell = sector_cell(sector_id)
+        if cell is None:
+            return []
+        return self.spatial_index().cell_node_ids(cell)
+
+    def node_sector_id(self, node_id: str) -> str | None:
+        cell = self.spatial_index().cell_of(node_id)
+        return sector_id_for_cell(cell) if cell is not None else None
+
+    def node_ids_of_kind(self, kind: str) -> set[str]:
+        """Ids of nodes whose `kind` was `kind` when inserted; do not mutate."""
+        self.spatial_index()
+        return self.nodes.by_kind.get(kind, set())
 
 
 @dataclass(slots=True)
@@ -75,6 +470,48 @@ class IntelItem:
     note: Optional[str] = None
 
 
+IntelKey = Tuple[str, Optional[str], Optional[str], Optional[str], Optional[Tuple[float, float, float]]]
+
+
+class IntelIndex:
+    """Lookup tables over `WorldState.intel`; never saved, rebuilt lazily after load.
+
+    Intel is append-only, so items appended outside `record_intel` are picked
+    up incrementally from the tail on the next `sync`.
+    """
+
+    __slots__ = ("keys", "by_id", "by_to_id", "by_source_kind", "_source", "_count")
+
+    def __init__(self) -> None:
+        self.keys: set[IntelKey] = set()
+        self.by_id: dict[str, IntelItem] = {}
+        self.by_to_id: dict[str, list[IntelItem]] = {}
+        self.by_source_kind: dict[str, list[IntelItem]] = {}
+        self._source: list[IntelItem] | None = None
+        self._count = 0
+
+    def __reduce__(self):
+        return (IntelIndex, ())
+
+    def __deepcopy__(self, memo) -> IntelIndex:
+        return IntelIndex()
+
+    def sync(self, items: list[IntelItem]) -> None:
+        if items is not self._source or len(items) < self._count:
+            self.__init__()
+            self._source = items
+        for item in items[self._count :]:
+            self.add(item)
+
+    def add(self, item: IntelItem) -> None:
+        self.keys.add(_intel_key(item.kind, item.from_id, item.to_id, item.sector_id, item.coord))
+        self.by_id[item.intel_id.lower()] = item
+        if item.to_id:
+            self.by_to_id.setdefault(item.to_id, []).append(item)
+        self.by_source_kind.setdefault(item.source_kind, []).append(item)
+        self._count += 1
+
+
 @dataclass(slots=True)
 class SectorGenState:
     sector_id: str = ""
@@ -92,7 +529,7 @@ class SectorGenState:
 class WorldState:
     space: SpaceGraph = field(default_factory=SpaceGraph)
     known_contacts: set[str] = field(default_factory=set)
-    known_nodes: set[str] = field(default_factory=set)
+    known_nodes: set[str] = field(default_factory=RevisionSet)
     known_intel: dict[str, dict] = field(default_factory=dict)
     forced_hidden_nodes: set[str] = field(default_factory=set)
     intel: list[IntelItem] = field(default_factory=list)
@@ -123,6 +560,11 @@ class WorldState:
     sector_states: dict[str, SectorGenState] = field(default_factory=dict)
     intersector_link_pairs: set[str] = field(default_factory=set)
     sparse_guardrail_done: bool = False
+    # Sectors whose whole 3x3 cluster is generated and internally linked.
+    settled_sectors: set[str] = field(default_factory=set)
+    intel_index: IntelIndex = field(default_factory=IntelIndex, repr=False, compare=False)
+    # Node pools whose completion flags must be recomputed before the next read.
+    completion_dirty_nodes: set[str] = field(default_factory=set)
 
     def __setstate__(self, state) -> None:
         """Backward-compatible unpickle for slot additions."""
@@ -144,6 +586,11 @@ class WorldState:
             data["sparse_guardrail_done"] = False
         if "exploration_recovery" not in data:
             data["exploration_recovery"] = ExplorationRecoveryState()
+        data["known_nodes"] = RevisionSet(data.get("known_nodes") or ())
+        # Completion flags are recomputed once after load; this also migrates older saves.
+        data["completion_dirty_nodes"] = set(data.get("completion_dirty_nodes") or set()) | set(
+            data.get("node_pools") or {}
+        )
 
         for f in fields(self):
             if f.name in data:
@@ -155,6 +602,56 @@ class WorldState:
             else:
                 continue
             object.__setattr__(self, f.name, value)
+        # Older saves kept partial sector node lists; rebuild them from node positions.
+        self.sync_sector_membership()
+
+    def known_node_ids(self) -> RevisionSet:
+        # Callers may assign a plain set to `known_nodes`; re-wrap it on first use.
+        if not isinstance(self.known_nodes, RevisionSet):
+            self.known_nodes = RevisionSet(self.known_nodes)
+        return self.known_nodes
+
+    def indexed_intel(self) -> IntelIndex:
+        self.intel_index.sync(self.intel)
+        return self.intel_index
+
+    def sector_node_ids(self, sector_id: str) -> list[str]:
+        """Sorted ids of the nodes inside `sector_id` (the transient nav point excluded).
+
+        Membership comes from the spatial index on `space.nodes`, which is
+        updated on every node insertion and removal, so this is O(sector size).
+        """
+        tmp_id = self.active_tmp_node_id
+        return sorted(node_id for node_id in self.space.sector_node_ids(sector_id) if node_id != tmp_id)
+
+    def node_sector_id(self, node_id: str) -> str | None:
+        return self.space.node_sector_id(node_id)
+
+    def sync_sector_membership(self, sector_id: str | None = None) -> None:
+        """Rewrite `SectorGenState.node_ids` from the index for one sector, or all of them."""
+        targets = list(self.sector_states) if sector_id is None else [sector_id]
+        for target in targets:
+            sector_state = self.sector_states.get(target)
+            if sector_state is not None:
+                sector_state.node_ids = self.sector_node_ids(target)
+
+    def sector_membership_issues(self) -> list[str]:
+        """Differences between nodes, the spatial index and stored sector node lists."""
+        issues: list[str] = []
+        index = self.space.spatial_index()
+        indexed = index.indexed_positions()
+        for node_id in sorted(set(self.space.nodes) - set(indexed)):
+            issues.append(f"{node_id}: missing from index")
+        for node_id in sorted(set(indexed) - set(self.space.nodes)):
+            issues.append(f"{node_id}: indexed but not in nodes")
+        for node_id, node in sorted(self.space.nodes.items()):
+            if node_id in indexed and indexed[node_id] != (node.x_ly, node.y_ly, node.z_ly):
+                issues.append(f"{node_id}: moved without re-indexing")
+        for sector_id, sector_state in sorted(self.sector_states.items()):
+            expected = self.sector_node_ids(sector_id)
+            if sector_state.node_ids != expected:
+                issues.append(f"{sector_id}: node_ids={sector_state.node_ids} expected={expected}")
+        return issues
 
 
 @dataclass(slots=True)
@@ -181,6 +678,34 @@ class LorePlacementState:
     piece_channel_bindings: dict[str, str] = field(default_factory=dict)
     next_non_forced_eval_t: float = 0.0
     eval_seq: int = 0
+    revision: int = 0  # bumped by placements_changed(); keys the pending-piece cache
+
+    def placements_changed(self) -> None:
+        """Call after adding or removing `piece_to_node` entries."""
+        self.revision += 1
+
+    def __setstate__(self, state) -> None:
+        """Backward-compatible unpickle for slot additions."""
+        slot_state = state
+        if isinstance(state, tuple):
+            if len(state) == 2 and isinstance(state[1], dict):
+                slot_state = state[1]
+            elif len(state) == 2 and isinstance(state[0], dict):
+                slot_state = state[0]
+        if not isinstance(slot_state, dict):
+            raise TypeError(f"Unsupported LorePlacementState pickle payload: {type(state)!r}")
+
+        data = dict(slot_state)
+        for f in fields(self):
+            if f.name in data:
+                value = data[f.name]
+            elif f.default is not MISSING:
+                value = f.default
+            elif f.default_factory is not MISSING:
+                value = f.default_factory()
+            else:
+                continue
+            object.__setattr__(self, f.name, value)
 
 
 @dataclass(slots=True)
@@ -229,13 +754,27 @@ SECTOR_SIZE_LY = 10.0
 
 
 def sector_id_for_pos(x_ly: float, y_ly: float, z_ly: float) -> str:
-    import math
-    sx = math.floor(x_ly / SECTOR_SIZE_LY)
-    sy = math.floor(y_ly / SECTOR_SIZE_LY)
-    sz = math.floor(z_ly / SECTOR_SIZE_LY)
+    return sector_id_for_cell(SpatialIndex.cell_for_pos(x_ly, y_ly, z_ly))
+
+
+def sector_id_for_cell(cell: Tuple[int, int, int]) -> str:
+    sx, sy, sz = cell
     return f"S{sx:+04d}_{sy:+04d}_{sz:+04d}"
 
 
+def sector_cell(sector_id: str) -> Tuple[int, int, int] | None:
+    """Inverse of `sector_id_for_pos` grid coordinates; None for malformed ids."""
+    if not sector_id.startswith("S"):
+        return None
+    parts = sector_id[1:].split("_")
+    if len(parts) != 3:
+        return None
+    try:
+        return (int(parts[0]), int(parts[1]), int(parts[2]))
+    except ValueError:
+        return None
+
+
 def region_for_pos(x_ly: float, y_ly: float, z_ly: float) -> str:
     # Phase 2 semantics: gameplay/worldgen/lore regions follow the physical model.
     return galactic_region_for_op_pos(x_ly, y_ly, z_ly)
@@ -297,10 +836,9 @@ def record_intel(
     coord: Optional[Tuple[float, float, float]] = None,
     note: Optional[str] = None,
 ) -> Optional[IntelItem]:
-    key = _intel_key(kind, from_id, to_id, sector_id, coord)
-    for item in state.intel:
-        if _intel_key(item.kind, item.from_id, item.to_id, item.sector_id, item.coord) == key:
-            return None
+    index = state.indexed_intel()
+    if _intel_key(kind, from_id, to_id, sector_id, coord) in index.keys:
+        return None
     intel_id = f"I{state.next_intel_seq}"
     state.next_intel_seq += 1
     item = IntelItem(
@@ -317,6 +855,7 @@ def record_intel(
         note=note,
     )
     state.intel.append(item)
+    index.add(item)
     return item
 
 
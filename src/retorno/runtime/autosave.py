@@ -0,0 +1,117 @@
+"""Background autosave for a running `GameLoop`.
+
+The worker saves every `interval_s` real seconds, and sooner when `request()`
+is called; the loop requests a save when a tick reports one of the trigger
+events (arrival, docking), and `hibernate` requests one through
+`GameLoop.request_autosave()` when it wakes. Only the pickling in
+`capture_save` runs under the loop lock. Checksums, writes and fsync happen on
+the worker thread. Requests that arrive while a save is running collapse into
+one follow-up save.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from typing import Iterable
+
+from retorno.config.balance import Balance
+from retorno.io.save_load import SaveLoadError, capture_save, write_save
+from retorno.model.events import Event, EventType
+
+DEFAULT_AUTOSAVE_TRIGGERS = frozenset({EventType.ARRIVED, EventType.DOCKED, EventType.HIBERNATION_ENDED})
+
+
+class AutosaveService:
+    def __init__(
+        self,
+        loop,
+        save_path: str | Path | None = None,
+        user: str | None = None,
+        interval_s: float | None = None,
+        triggers: Iterable[EventType] = DEFAULT_AUTOSAVE_TRIGGERS,
+    ) -> None:
+        self.loop = loop
+        self.save_path = save_path
+        self.user = user
+        self.interval_s = float(Balance.AUTOSAVE_INTERVAL_S if interval_s is None else interval_s)
+        self.triggers = frozenset(triggers)
+        self.saves_written = 0
+        self.last_path: Path | None = None
+        self.last_error: SaveLoadError | None = None
+        self._cond = threading.Condition()
+        self._requested = False
+        self._saving = False
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        with self._cond:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="retorno-autosave", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Stop the worker, letting a save in progress finish; pending requests are dropped."""
+        with self._cond:
+            self._stopping = True
+            self._requested = False
+            self._cond.notify_all()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=timeout)
+
+    def request(self) -> None:
+        with self._cond:
+            self._requested = True
+            self._cond.notify_all()
+
+    def notice_events(self, events: Iterable[Event]) -> None:
+        if any(event.type in self.triggers for event in events):
+            self.request()
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """Wait until no save is pending or running; False on timeout."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._requested or self._saving:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not (self._thread and self._thread.is_alive()):
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def _run(self) -> None:
+        next_due = time.monotonic() + self.interval_s
+        while True:
+            with self._cond:
+                while not self._stopping and not self._requested:
+                    remaining = next_due - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                if self._stopping:
+                    return
+                self._requested = False
+                self._saving = True
+            try:
+                self._save_once()
+            finally:
+                next_due = time.monotonic() + self.interval_s
+                with self._cond:
+                    self._saving = False
+                    self._cond.notify_all()
+
+    def _save_once(self) -> None:
+        try:
+            with self.loop.with_lock(read_only=True) as state:
+                snapshot = capture_save(state, self.save_path, user=self.user)
+            path = write_save(snapshot)
+        except SaveLoadError as exc:
+            self.last_error = exc
+            return
+        self.last_error = None
+        self.last_path = path
+        self.saves_written += 1
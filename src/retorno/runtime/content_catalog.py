@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import json
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+
+class FrozenDict(dict):
+    """Read-only dict returned by the content catalog.
+
+    It still passes `isinstance(x, dict)` checks and pickles/deep-copies as a
+    plain dict, so callers that copy entries into game state keep working.
+    """
+
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("catalog content is read-only; copy it with dict(...) first")
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __ior__ = _readonly
+    clear = _readonly
+    pop = _readonly
+    popitem = _readonly
+    setdefault = _readonly
+    update = _readonly
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+    def __copy__(self) -> dict:
+        return dict(self)
+
+
+class FrozenList(list):
+    """Read-only list returned by the content catalog."""
+
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("catalog content is read-only; copy it with list(...) first")
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __iadd__ = _readonly
+    __imul__ = _readonly
+    append = _readonly
+    clear = _readonly
+    extend = _readonly
+    insert = _readonly
+    pop = _readonly
+    remove = _readonly
+    reverse = _readonly
+    sort = _readonly
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+    def __copy__(self) -> list:
+        return list(self)
+
+
+def freeze(value: Any) -> Any:
+    if isinstance(value, FrozenDict | FrozenList):
+        return value
+    if isinstance(value, dict):
+        frozen = FrozenDict()
+        for key, item in value.items():
+            dict.__setitem__(frozen, key, freeze(item))
+        return frozen
+    if isinstance(value, list):
+        frozen_list = FrozenList()
+        list.extend(frozen_list, (freeze(item) for item in value))
+        return frozen_list
+    return value
+
+
+FileSignature = tuple[int, int] | None
+
+
+def _signature(path: Path) -> FileSignature:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+@dataclass(slots=True)
+class _CatalogEntry:
+    value: Any
+    deps: dict[Path, FileSignature] = field(default_factory=dict)
+
+
+class ContentCatalog:
+    """Process-wide cache of parsed data files.
+
+    Each entry remembers the (mtime, size) signature of every file it was
+    built from and is rebuilt only when one of those signatures changes.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, _CatalogEntry] = {}
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def _is_fresh(self, entry: _CatalogEntry) -> bool:
+        for path, sig in entry.deps.items():
+            if _signature(path) != sig:
+                return False
+        return True
+
+    def derived(self, key: str, build: Callable[[], tuple[Any, Iterable[Path]]]) -> Any:
+        """Return a frozen value built from files; `build` returns (value, deps)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._is_fresh(entry):
+                self.hits += 1
+                return entry.value
+            self.misses += 1
+            value, deps = build()
+            frozen = freeze(value)
+            self._entries[key] = _CatalogEntry(
+                value=frozen,
+                deps={Path(dep): _signature(Path(dep)) for dep in deps},
+            )
+            return frozen
+
+    def json_file(self, path: Path) -> Any:
+        def _build() -> tuple[Any, list[Path]]:
+            with path.open("r", encoding="utf-8") as fh:
+                return json.load(fh), [path]
+
+        return self.derived(f"json:{path}", _build)
+
+    def text_file(self, path: Path, default: str = "") -> str:
+        def _build() -> tuple[str, list[Path]]:
+            try:
+                return path.read_text(encoding="utf-8"), [path]
+            except Exception:
+                return default, [path]
+
+        return self.derived(f"text:{path}", _build)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_CATALOG = ContentCatalog()
+
+
+def get_content_catalog() -> ContentCatalog:
+    return _CATALOG
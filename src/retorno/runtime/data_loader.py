@@ -1,112 +1,237 @@
 from __future__ import annotations
 
+import hashlib
 import json
 from pathlib import Path
 
+from retorno.model.os import AccessLevel, FSNode, FSNodeType, _normalize_access, normalize_path
+from retorno.runtime.content_catalog import get_content_catalog
+
 _DATA_ROOT = Path(__file__).resolve().parents[3] / "data"
 
+# Directories every ship OS starts with.
+_FS_BASE_DIRS = (
+    ("/", AccessLevel.GUEST),
+    ("/manuals", AccessLevel.GUEST),
+    ("/manuals/commands", AccessLevel.GUEST),
+    ("/manuals/concepts", AccessLevel.GUEST),
+    ("/manuals/systems", AccessLevel.GUEST),
+    ("/manuals/alerts", AccessLevel.GUEST),
+    ("/manuals/modules", AccessLevel.GUEST),
+    ("/mail", AccessLevel.GUEST),
+    ("/mail/inbox", AccessLevel.GUEST),
+    ("/data", AccessLevel.GUEST),
+    ("/data/nav", AccessLevel.GUEST),
+    ("/data/nav/fragments", AccessLevel.GUEST),
+    ("/logs", AccessLevel.ENG),
+    ("/logs/nav", AccessLevel.ENG),
+    ("/logs/medical", AccessLevel.MED),
+)
+
 
 def _node_to_filename(node_id: str) -> str:
     return node_id.lower().replace("-", "_") + ".json"
 
 
-def load_loot(node_id: str) -> dict:
-    path = _DATA_ROOT / "loot" / _node_to_filename(node_id)
+def _read_json(path: Path):
     with path.open("r", encoding="utf-8") as fh:
         return json.load(fh)
 
 
+def load_loot(node_id: str) -> dict:
+    path = _DATA_ROOT / "loot" / _node_to_filename(node_id)
+    return get_content_catalog().json_file(path)
+
+
 def load_modules() -> dict:
     path = _DATA_ROOT / "modules.json"
-    with path.open("r", encoding="utf-8") as fh:
-        raw = json.load(fh)
-    if not isinstance(raw, dict):
-        return {}
-    normalized: dict[str, dict] = {}
-    for module_id, info in raw.items():
-        if not isinstance(info, dict):
-            continue
-        item = dict(info)
-        scope = str(item.get("scope", "ship")).strip().lower() or "ship"
-        if scope not in {"ship", "drone"}:
-            scope = "ship"
-        item["scope"] = scope
-        if scope == "drone":
-            slot_cost = int(item.get("slot_cost", 1) or 1)
-            item["slot_cost"] = max(1, slot_cost)
-            if "drone_effects" not in item and isinstance(item.get("effects"), dict):
-                item["drone_effects"] = dict(item.get("effects", {}))
-        normalized[module_id] = item
-    return normalized
+
+    def _build() -> tuple[dict, list[Path]]:
+        raw = _read_json(path)
+        if not isinstance(raw, dict):
+            return {}, [path]
+        normalized: dict[str, dict] = {}
+        for module_id, info in raw.items():
+            if not isinstance(info, dict):
+                continue
+            item = dict(info)
+            scope = str(item.get("scope", "ship")).strip().lower() or "ship"
+            if scope not in {"ship", "drone"}:
+                scope = "ship"
+            item["scope"] = scope
+            if scope == "drone":
+                slot_cost = int(item.get("slot_cost", 1) or 1)
+                item["slot_cost"] = max(1, slot_cost)
+                if "drone_effects" not in item and isinstance(item.get("effects"), dict):
+                    item["drone_effects"] = dict(item.get("effects", {}))
+            normalized[module_id] = item
+        return normalized, [path]
+
+    return get_content_catalog().derived("modules", _build)
 
 
 def load_locations() -> list[dict]:
     path = _DATA_ROOT / "locations"
-    if not path.exists():
-        return []
-    locations: list[dict] = []
-    for file in sorted(path.glob("*.json")):
-        with file.open("r", encoding="utf-8") as fh:
-            locations.append(json.load(fh))
-    for loc in locations:
-        files = loc.get("fs_files") or []
-        for entry in files:
-            content_ref = entry.get("content_ref")
-            if content_ref and "content" not in entry:
-                ref_path = _DATA_ROOT / content_ref
-                try:
-                    entry["content"] = ref_path.read_text(encoding="utf-8")
-                except Exception:
-                    entry["content"] = ""
-    return locations
+
+    def _build() -> tuple[list[dict], list[Path]]:
+        deps: list[Path] = [path]
+        if not path.exists():
+            return [], deps
+        locations: list[dict] = []
+        for file in sorted(path.glob("*.json")):
+            locations.append(_read_json(file))
+            deps.append(file)
+        for loc in locations:
+            files = loc.get("fs_files") or []
+            for entry in files:
+                content_ref = entry.get("content_ref")
+                if content_ref and "content" not in entry:
+                    ref_path = _DATA_ROOT / content_ref
+                    deps.append(ref_path)
+                    try:
+                        entry["content"] = ref_path.read_text(encoding="utf-8")
+                    except Exception:
+                        entry["content"] = ""
+        return locations, deps
+
+    return get_content_catalog().derived("locations", _build)
+
+
+def _load_json_dir_by_key(catalog_key: str, path: Path, field: str) -> dict[str, dict]:
+    def _build() -> tuple[dict[str, dict], list[Path]]:
+        deps: list[Path] = [path]
+        if not path.exists():
+            return {}, deps
+        out: dict[str, dict] = {}
+        for file in sorted(path.glob("*.json")):
+            data = _read_json(file)
+            deps.append(file)
+            key = str(data.get(field, "") or "").strip()
+            if key:
+                out[key] = data
+        return out, deps
+
+    return get_content_catalog().derived(catalog_key, _build)
 
 
 def load_worldgen_templates() -> dict[str, dict]:
-    path = _DATA_ROOT / "worldgen" / "templates"
-    if not path.exists():
-        return {}
-    templates: dict[str, dict] = {}
-    for file in sorted(path.glob("*.json")):
-        with file.open("r", encoding="utf-8") as fh:
-            data = json.load(fh)
-        region = data.get("region")
-        if region:
-            templates[region] = data
-    return templates
+    return _load_json_dir_by_key("worldgen_templates", _DATA_ROOT / "worldgen" / "templates", "region")
 
 
 def load_worldgen_archetypes() -> dict[str, dict]:
-    path = _DATA_ROOT / "worldgen" / "archetypes"
-    if not path.exists():
-        return {}
-    archetypes: dict[str, dict] = {}
-    for file in sorted(path.glob("*.json")):
-        with file.open("r", encoding="utf-8") as fh:
-            data = json.load(fh)
-        archetype = str(data.get("archetype", "") or "").strip()
-        if archetype:
-            archetypes[archetype] = data
-    return archetypes
-
+    return _load_json_dir_by_key("worldgen_archetypes", _DATA_ROOT / "worldgen" / "archetypes", "archetype")
 
 
 def load_arcs() -> list[dict]:
     path = _DATA_ROOT / "arcs"
-    if not path.exists():
-        return []
-    arcs: list[dict] = []
-    for file in sorted(path.glob("*.json")):
-        with file.open("r", encoding="utf-8") as fh:
-            arcs.append(json.load(fh))
-    return arcs
+
+    def _build() -> tuple[list[dict], list[Path]]:
+        deps: list[Path] = [path]
+        if not path.exists():
+            return [], deps
+        arcs: list[dict] = []
+        for file in sorted(path.glob("*.json")):
+            arcs.append(_read_json(file))
+            deps.append(file)
+        return arcs, deps
+
+    return get_content_catalog().derived("arcs", _build)
 
 
 def load_singles() -> list[dict]:
     path = _DATA_ROOT / "lore" / "singles" / "index.json"
-    if not path.exists():
-        return []
-    with path.open("r", encoding="utf-8") as fh:
-        data = json.load(fh)
-    if isinstance(data, list):
-        return data
-    return []
+
+    def _build() -> tuple[list[dict], list[Path]]:
+        if not path.exists():
+            return [], [path]
+        data = _read_json(path)
+        if isinstance(data, list):
+            return data, [path]
+        return [], [path]
+
+    return get_content_catalog().derived("singles", _build)
+
+
+def load_data_text(content_ref: str | None) -> str:
+    """Read an authored text file under data/ through the content catalog."""
+    if not content_ref:
+        return ""
+    return get_content_catalog().text_file(_DATA_ROOT / content_ref)
+
+
+def load_fs_base_layer(base_id: str) -> dict[str, FSNode]:
+    """Read-only base of `os.fs` for `base_id` ("system:<ship id>").
+
+    Holds the standard directories, every manual under data/manuals and the
+    authored mail and logs of the ship's own location.
+    """
+    kind, _, ship_id = base_id.partition(":")
+    if kind != "system":
+        raise ValueError(f"Unknown fs base layer: {base_id}")
+    manuals_root = _DATA_ROOT / "manuals"
+    locations_root = _DATA_ROOT / "locations"
+
+    def _build() -> tuple[dict[str, FSNode], list[Path]]:
+        deps: list[Path] = [manuals_root, locations_root]
+        nodes: dict[str, FSNode] = {}
+        for path, access in _FS_BASE_DIRS:
+            nodes[path] = FSNode(path=path, node_type=FSNodeType.DIR, access=access)
+        for file in sorted(manuals_root.rglob("*.txt")) if manuals_root.exists() else []:
+            deps.append(file)
+            vpath = normalize_path(f"/manuals/{file.relative_to(manuals_root).as_posix()}")
+            parent = vpath.rsplit("/", 1)[0] or "/"
+            if parent not in nodes:
+                nodes[parent] = FSNode(path=parent, node_type=FSNodeType.DIR, access=AccessLevel.GUEST)
+            try:
+                content = file.read_text(encoding="utf-8")
+            except Exception:
+                content = ""
+            nodes[vpath] = FSNode(path=vpath, node_type=FSNodeType.FILE, content=content)
+        for file in sorted(locations_root.glob("*.json")) if locations_root.exists() else []:
+            deps.append(file)
+            loc = _read_json(file)
+            if (loc.get("node") or {}).get("node_id") != ship_id:
+                continue
+            for entry in loc.get("fs_files") or []:
+                path = entry.get("path")
+                if not path:
+                    continue
+                content = entry.get("content")
+                if content is None:
+                    ref_path = _DATA_ROOT / str(entry.get("content_ref") or "")
+                    deps.append(ref_path)
+                    try:
+                        content = ref_path.read_text(encoding="utf-8")
+                    except Exception:
+                        content = ""
+                norm = normalize_path(path)
+                nodes[norm] = FSNode(
+                    path=norm,
+                    node_type=FSNodeType.FILE,
+                    content=content,
+                    access=_normalize_access(entry.get("access", "GUEST")),
+                )
+        return nodes, deps
+
+    return get_content_catalog().derived(f"fs_base:{base_id}", _build)
+
+
+def load_authored_texts() -> dict[str, tuple[str, str]]:
+    """Every authored text file under data/, keyed by its content: text -> (content_ref, sha256)."""
+
+    def _build() -> tuple[dict[str, tuple[str, str]], list[Path]]:
+        deps: list[Path] = [_DATA_ROOT]
+        out: dict[str, tuple[str, str]] = {}
+        for file in sorted(_DATA_ROOT.rglob("*.txt")):
+            deps.append(file)
+            content_ref = file.relative_to(_DATA_ROOT).as_posix()
+            text = load_data_text(content_ref)
+            if text:
+                out.setdefault(text, (content_ref, hashlib.sha256(text.encode("utf-8")).hexdigest()))
+        return out, deps
+
+    return get_content_catalog().derived("authored_texts", _build)
+
+
+def content_catalog_stats() -> dict[str, int]:
+    return get_content_catalog().stats()
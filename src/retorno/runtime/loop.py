@@ -8,7 +8,9 @@ from contextlib import contextmanager
 from retorno.core.actions import Action
 from retorno.core.engine import Engine
 from retorno.core.gamestate import GameState
+from retorno.core.versions import bump_all_versions
 from retorno.model.events import Event
+from retorno.runtime.autosave import AutosaveService
 
 
 class GameLoop:
@@ -23,6 +25,7 @@ class GameLoop:
         self._stop = threading.Event()
         self._thread: threading.Thread | None = None
         self._auto_tick_enabled = True
+        self.autosave: AutosaveService | None = None
 
     def start(self) -> None:
         if not self._auto_tick_enabled:
@@ -47,14 +50,35 @@ class GameLoop:
         else:
             self.start()
 
+    def start_autosave(self, save_path=None, user: str | None = None, interval_s: float | None = None) -> AutosaveService:
+        """Save in the background until `stop_autosave()`; independent of auto-tick."""
+        self.stop_autosave()
+        self.autosave = AutosaveService(self, save_path, user=user, interval_s=interval_s)
+        self.autosave.start()
+        return self.autosave
+
+    def stop_autosave(self) -> None:
+        if self.autosave is not None:
+            self.autosave.stop()
+            self.autosave = None
+
+    def request_autosave(self) -> None:
+        """Ask the autosave worker for a save soon; no-op when autosave is off."""
+        autosave = self.autosave
+        if autosave is not None:
+            autosave.request()
+
     def apply_action(self, action: Action) -> list[Event]:
         with self._lock:
-            return self.engine.apply_action(self.state, action)
+            events = self.engine.apply_action(self.state, action)
+        self._notice_events(events)
+        return events
 
     def step(self, dt: float) -> list[Event]:
         with self._lock:
             events = self.engine.tick(self.state, dt)
-            return events
+        self._notice_events(events)
+        return events
 
     def step_many(self, total_s: float, dt: float = 1.0) -> list[Event]:
         events: list[Event] = []
@@ -65,6 +89,12 @@ class GameLoop:
             remaining -= step_dt
         return events
 
+    def advance(self, total_s: float) -> list[Event]:
+        with self._lock:
+            events = self.engine.advance(self.state, total_s)
+        self._notice_events(events)
+        return events
+
     def drain_events(self) -> list[tuple[str, Event]]:
         with self._lock:
             events = [("auto", e) for e in self._events_auto]
@@ -78,11 +108,16 @@ class GameLoop:
         return self._rng
 
     @contextmanager
-    def with_lock(self):
+    def with_lock(self, read_only: bool = False):
+        """Hold the loop lock; pass read_only=True when the caller does not mutate state."""
         self._lock.acquire()
+        state = self.state
         try:
-            yield self.state
+            yield state
         finally:
+            if not read_only:
+                # The caller may have changed anything; invalidate every memoized view.
+                bump_all_versions(state)
             self._lock.release()
 
     def _run(self) -> None:
@@ -91,3 +126,9 @@ class GameLoop:
             with self._lock:
                 events = self.engine.tick(self.state, self.tick_s)
                 self._events_auto.extend(events)
+            self._notice_events(events)
+
+    def _notice_events(self, events: list[Event]) -> None:
+        autosave = self.autosave
+        if autosave is not None and events:
+            autosave.notice_events(events)
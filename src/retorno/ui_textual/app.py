@@ -6,6 +6,7 @@ import os
 import random
 import sys
 import time
+from dataclasses import dataclass
 
 from textual.app import App, ComposeResult
 from textual import events
@@ -13,8 +14,7 @@ from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
 from textual.widgets import Static, Input, RichLog
 
-from retorno.audio.config import AudioConfigError, load_audio_config
-from retorno.audio.manager import AudioManager
+from retorno.audio.manager import DeferredAudioManager
 from retorno.bootstrap import create_initial_state_prologue, create_initial_state_sandbox
 from retorno.cli.parser import ParseError, parse_command, format_parse_error
 from retorno.cli import repl
@@ -54,6 +54,33 @@ from retorno.io.save_load import (
 )
 
 
+@dataclass(slots=True)
+class _PanelRender:
+    """What was last written to a side panel, per row."""
+
+    rows: tuple
+    lines: tuple[str, ...]
+    # RichLog strips each row wrapped to; None when the widget deferred the writes.
+    strip_counts: list[int] | None
+    width: int
+    theme: str
+
+
+def _truncate_rich_log(widget: RichLog, keep_strips: int) -> bool:
+    """Drop the strips of `widget` after `keep_strips`.
+
+    Relies on RichLog internals (the `lines` list and its `_line_cache`);
+    returns False when they are missing so callers fall back to a full rewrite.
+    """
+    line_cache = getattr(widget, "_line_cache", None)
+    if not isinstance(getattr(widget, "lines", None), list) or not callable(getattr(line_cache, "clear", None)):
+        return False
+    del widget.lines[keep_strips:]
+    # RichLog caches cropped lines by index; the rewritten tail must not hit it.
+    line_cache.clear()
+    return True
+
+
 class CommandInput(Input):
     def key_tab(self) -> None:
         # Reserve TAB for completion.
@@ -240,6 +267,8 @@ class RetornoTextualApp(App):
                         self._console_messages.append(f"[WARN] Main save unreadable. Loaded backup: {loaded.path}")
                     else:
                         self._console_messages.append(f"[INFO] Loaded saved game: {loaded.path}")
+                    if loaded.changed_content_refs:
+                        self._console_messages.append(repl._changed_content_note(loaded.changed_content_refs))
         engine = Engine()
         self.loop = GameLoop(engine, state, tick_s=1.0)
         self._theme_preset = normalize_theme_preset(getattr(state.os, "theme_preset", "linux"))
@@ -262,26 +291,21 @@ class RetornoTextualApp(App):
         self._startup_panel_blackout = bool(self._play_startup_sequence and Balance.STARTUP_SEQUENCE_ENABLED)
         self._hibernate_sequence_running = False
         self._hibernate_panel_blackout = False
-        try:
-            self._audio_manager = AudioManager(load_audio_config())
-        except AudioConfigError as exc:
-            self._audio_manager = None
-            self._console_messages.append(f"[WARN] Audio disabled: {exc}")
-        else:
-            if self._audio_manager.notice:
-                self._console_messages.append(self._audio_manager.notice)
-            audio_enabled, ambient_enabled = audio_flags(self.loop.state.os)
-            self._audio_manager.prepare_session(
-                audio_enabled,
-                ambient_enabled,
-                self._startup_audio_context,
-                self.loop.state.os.audio.music_volume,
-            )
+        # Audio loads on a worker thread; its warnings surface through consume_notice().
+        self._audio_manager = DeferredAudioManager()
+        audio_enabled, ambient_enabled = audio_flags(self.loop.state.os)
+        self._audio_manager.prepare_session(
+            audio_enabled,
+            ambient_enabled,
+            self._startup_audio_context,
+            self.loop.state.os.audio.music_volume,
+        )
         self._panel_visible = {
             "status": True,
             "alerts": True,
             "jobs": True,
         }
+        self._panel_rendered: dict[str, _PanelRender] = {}
         super().__init__()
 
     def compose(self) -> ComposeResult:
@@ -298,11 +322,12 @@ class RetornoTextualApp(App):
 
     def on_mount(self) -> None:
         self._apply_theme(normalize_theme_preset(getattr(self.loop.state.os, "theme_preset", self._theme_preset)))
-        if self._audio_manager is not None:
-            audio_enabled, ambient_enabled = audio_flags(self.loop.state.os)
-            self._audio_manager.start(audio_enabled, ambient_enabled, self.loop.state.os.audio.music_volume)
-            self._audio_manager.play_startup(audio_enabled, self._startup_audio_context)
-            self._audio_manager.consume_notice()
+        audio_enabled, ambient_enabled = audio_flags(self.loop.state.os)
+        self._audio_manager.start(audio_enabled, ambient_enabled, self.loop.state.os.audio.music_volume)
+        self._audio_manager.play_startup(audio_enabled, self._startup_audio_context)
+        notice = self._audio_manager.consume_notice()
+        if notice:
+            self._log_line(notice)
         self.loop.step(1.0)
         if not self.loop.state.os.debug_enabled:
             self.loop.set_auto_tick(True)
@@ -432,6 +457,7 @@ class RetornoTextualApp(App):
         widget_ids = ("status", "alerts", "jobs", "log") if clear_log else ("status", "alerts", "jobs")
         for widget_id in widget_ids:
             self.query_one(f"#{widget_id}", RichLog).clear()
+        self._panel_rendered.clear()
 
     async def _run_hibernate_start_sequence(self, years: float, wake_on_low_battery: bool) -> None:
         if self._hibernate_sequence_running:
@@ -583,9 +609,9 @@ class RetornoTextualApp(App):
     def _persist_game_on_exit(self) -> None:
         if self._exit_persist_done:
             return
-        if self._audio_manager is not None:
-            self._audio_manager.shutdown()
+        self._audio_manager.shutdown()
         self.loop.stop()
+        self.loop.stop_autosave()
         try:
             with self.loop.with_lock() as state:
                 saved_path = save_single_slot(state, self._save_path, user=self._user)
@@ -696,7 +722,7 @@ class RetornoTextualApp(App):
             token = tokens[-1] if tokens else ""
             base = buf[:-len(token)] if token else buf
 
-        with self.loop.with_lock() as state:
+        with self.loop.with_lock(read_only=True) as state:
             candidates = self._get_completion_candidates(state, buf, token)
 
         if not candidates:
@@ -807,7 +833,7 @@ class RetornoTextualApp(App):
             if sys.service and sys.service.is_installed:
                 services.append(sys.service.service_name)
         fs_paths = list(state.os.fs.keys())
-        music_track_ids = [track.track_id for track in self._audio_manager.list_music_tracks()] if self._audio_manager is not None else []
+        music_track_ids = list(self._audio_manager.music_track_ids())
 
         if not tokens:
             return [c for c in base_commands if c.startswith(text)]
@@ -1100,9 +1126,13 @@ class RetornoTextualApp(App):
                 return [c for c in ["latest"] + mail_ids if c.startswith(text)]
         if cmd == "intel":
             if len(tokens) == 2:
-                return [c for c in ["show", "import", "export", "all"] if c.startswith(text)] + [t for t in ["10", "20", "50"] if t.startswith(text)]
+                return [c for c in ["show", "import", "export", "all", "to", "source"] if c.startswith(text)] + [t for t in ["10", "20", "50"] if t.startswith(text)]
             if len(tokens) == 3 and tokens[1] == "show":
                 return [i.intel_id for i in state.world.intel if i.intel_id.startswith(text.upper())]
+            if len(tokens) == 3 and tokens[1] in {"to", "source"}:
+                index = state.world.indexed_intel()
+                keys = index.by_to_id if tokens[1] == "to" else index.by_source_kind
+                return [key for key in sorted(keys) if key.startswith(text)]
             if len(tokens) == 3 and tokens[1] in {"import", "export"}:
                 path_text = token or text
                 if "/" in path_text:
@@ -1327,14 +1357,55 @@ class RetornoTextualApp(App):
         self._pending_hibernate_requires_non_cruise = False
         self._pending_wake_on_low_battery = False
 
-    def _set_log_content(self, widget: RichLog, lines: list[str], preserve_scroll: bool = False, follow_end: bool = False) -> None:
+    def _set_panel_rows(
+        self,
+        widget: RichLog,
+        panel: str,
+        rows: tuple[presenter.PanelRow, ...],
+        preserve_scroll: bool = False,
+        follow_end: bool = False,
+    ) -> None:
+        """Push panel rows to `widget`, rewriting only from the first changed row on."""
+        width = widget.scrollable_content_region.width
+        rendered = self._panel_rendered.get(panel)
+        reusable = rendered is not None and rendered.width == width and rendered.theme == self._theme_preset
+        lines = rendered.lines if reusable and rendered.rows is rows else presenter.panel_texts(rows)
+        if reusable and rendered.lines == lines:
+            rendered.rows = rows
+            if follow_end:
+                widget.scroll_end(animate=False)
+            return
+        keep = 0
+        if reusable and rendered.strip_counts is not None and len(widget.lines) == sum(rendered.strip_counts):
+            for old_line, new_line in zip(rendered.lines, lines):
+                if old_line != new_line:
+                    break
+                keep += 1
+            if keep >= len(lines):
+                # Rows were only dropped from the end; a full rewrite keeps the widths right.
+                keep = 0
         scroll_y = widget.scroll_y if preserve_scroll else None
         prev_auto = widget.auto_scroll
         if preserve_scroll:
             widget.auto_scroll = False
-        widget.clear()
-        for line in lines:
+        if keep and not _truncate_rich_log(widget, sum(rendered.strip_counts[:keep])):
+            keep = 0
+        if keep:
+            strip_counts: list[int] | None = rendered.strip_counts[:keep]
+        else:
+            widget.clear()
+            strip_counts = []
+        for line in lines[keep:]:
+            before = len(widget.lines)
             self._write_rich_line(widget, line)
+            added = len(widget.lines) - before
+            if added <= 0:
+                strip_counts = None
+            elif strip_counts is not None:
+                strip_counts.append(added)
+        if keep:
+            widget.refresh()
+        self._panel_rendered[panel] = _PanelRender(rows, lines, strip_counts, width, self._theme_preset)
         if follow_end:
             widget.scroll_end(animate=False)
         elif preserve_scroll and scroll_y is not None:
@@ -1383,7 +1454,7 @@ class RetornoTextualApp(App):
         input_widget.styles.color = palette.foreground
 
     def refresh_panels(self) -> None:
-        with self.loop.with_lock() as state:
+        with self.loop.with_lock(read_only=True) as state:
             theme_preset = normalize_theme_preset(getattr(state.os, "theme_preset", "linux"))
         if theme_preset != self._theme_preset:
             self._apply_theme(theme_preset)
@@ -1393,34 +1464,36 @@ class RetornoTextualApp(App):
         if self._hibernate_panel_blackout:
             self._render_panel_blackout()
             return
-        with self.loop.with_lock() as state:
+        with self.loop.with_lock(read_only=True) as state:
             header = presenter.build_header(state)
-            status_lines = presenter.build_status_lines(state)
-            alerts_lines = presenter.build_alerts_lines(state)
-            jobs_lines = presenter.build_jobs_lines(state)
             power_lines = presenter.build_power_lines(state)
+            # Rows are memoized on the systems/alerts/jobs versions; unchanged panels come back as-is.
+            model = presenter.build_panel_model(state)
         self.query_one("#header", Static).update(render_rich_line(header, self._theme_preset))
         status_widget = self.query_one("#status", RichLog)
         if status_widget.display:
-            self._set_log_content(
+            self._set_panel_rows(
                 status_widget,
-                status_lines,
+                "status",
+                model.status,
                 preserve_scroll=True,
                 follow_end=False,
             )
         alerts_widget = self.query_one("#alerts", RichLog)
         jobs_widget = self.query_one("#jobs", RichLog)
         if alerts_widget.display:
-            self._set_log_content(
+            self._set_panel_rows(
                 alerts_widget,
-                alerts_lines,
+                "alerts",
+                model.alerts,
                 preserve_scroll=(self.focused is alerts_widget),
                 follow_end=(self.focused is not alerts_widget),
             )
         if jobs_widget.display:
-            self._set_log_content(
+            self._set_panel_rows(
                 jobs_widget,
-                jobs_lines,
+                "jobs",
+                model.jobs,
                 preserve_scroll=(self.focused is jobs_widget),
                 follow_end=(self.focused is not jobs_widget),
             )
@@ -1430,15 +1503,14 @@ class RetornoTextualApp(App):
         auto_events = self.loop.drain_events()
         if auto_events:
             audio_enabled = False
-            with self.loop.with_lock() as state:
+            with self.loop.with_lock(read_only=True) as state:
                 lines = presenter.format_event_lines(state, auto_events)
                 audio_enabled = state.os.audio.enabled
             self._log_lines(lines)
-            if self._audio_manager is not None:
-                self._audio_manager.handle_event_batch(audio_enabled, auto_events)
-                notice = self._audio_manager.consume_notice()
-                if notice:
-                    self._log_line(notice)
+            self._audio_manager.handle_event_batch(audio_enabled, auto_events)
+            notice = self._audio_manager.consume_notice()
+            if notice:
+                self._log_line(notice)
             self._queue_deferred_repair_auto_move_prompt(auto_events)
 
     def _queue_deferred_repair_auto_move_prompt(self, auto_events) -> None:
@@ -1494,11 +1566,10 @@ class RetornoTextualApp(App):
             lines = presenter.format_event_lines(state, auto_events)
             audio_enabled = state.os.audio.enabled
         self._log_lines(lines)
-        if self._audio_manager is not None:
-            self._audio_manager.handle_event_batch(audio_enabled, auto_events)
-            notice = self._audio_manager.consume_notice()
-            if notice:
-                self._log_line(notice)
+        self._audio_manager.handle_event_batch(audio_enabled, auto_events)
+        notice = self._audio_manager.consume_notice()
+        if notice:
+            self._log_line(notice)
         self._queue_deferred_repair_auto_move_prompt(auto_events)
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
@@ -1555,11 +1626,10 @@ class RetornoTextualApp(App):
                             lines = presenter.format_event_lines(state, [("cmd", e) for e in ev])
                             audio_enabled = state.os.audio.enabled
                         self._log_lines(lines)
-                        if self._audio_manager is not None:
-                            self._audio_manager.handle_event_batch(audio_enabled, ev)
-                            notice = self._audio_manager.consume_notice()
-                            if notice:
-                                self._log_line(notice)
+                        self._audio_manager.handle_event_batch(audio_enabled, ev)
+                        notice = self._audio_manager.consume_notice()
+                        if notice:
+                            self._log_line(notice)
                 elif action == "HIBERNATE_DRONES":
                     with self.loop.with_lock() as state:
                         self._confirm_hibernate_wake_needed(state)
@@ -1603,11 +1673,10 @@ class RetornoTextualApp(App):
                                         lines.append(msg.get(state.os.locale.value, msg["en"]))
                                         break
                         self._log_lines(lines)
-                        if self._audio_manager is not None:
-                                self._audio_manager.handle_event_batch(audio_enabled, ev)
-                                notice = self._audio_manager.consume_notice()
-                                if notice:
-                                    self._log_line(notice)
+                        self._audio_manager.handle_event_batch(audio_enabled, ev)
+                        notice = self._audio_manager.consume_notice()
+                        if notice:
+                            self._log_line(notice)
             else:
                 if confirm_kind == "REPAIR_AUTO_MOVE_DEFERRED":
                     ev = self.loop.apply_action(RepairAutoMoveDecision(job_id=confirm_payload.job_id, auto_move=False))
@@ -1617,11 +1686,10 @@ class RetornoTextualApp(App):
                             lines = presenter.format_event_lines(state, [("cmd", e) for e in ev])
                             audio_enabled = state.os.audio.enabled
                         self._log_lines(lines)
-                        if self._audio_manager is not None:
-                            self._audio_manager.handle_event_batch(audio_enabled, ev)
-                            notice = self._audio_manager.consume_notice()
-                            if notice:
-                                self._log_line(notice)
+                        self._audio_manager.handle_event_batch(audio_enabled, ev)
+                        notice = self._audio_manager.consume_notice()
+                        if notice:
+                            self._log_line(notice)
                     return
                 if confirm_kind == "REPAIR_AUTO_MOVE":
                     ev = self.loop.apply_action(confirm_payload)
@@ -1631,11 +1699,10 @@ class RetornoTextualApp(App):
                             lines = presenter.format_event_lines(state, [("cmd", e) for e in ev])
                             audio_enabled = state.os.audio.enabled
                         self._log_lines(lines)
-                        if self._audio_manager is not None:
-                            self._audio_manager.handle_event_batch(audio_enabled, ev)
-                            notice = self._audio_manager.consume_notice()
-                            if notice:
-                                self._log_line(notice)
+                        self._audio_manager.handle_event_batch(audio_enabled, ev)
+                        notice = self._audio_manager.consume_notice()
+                        if notice:
+                            self._log_line(notice)
                     return
                 if isinstance(action, str) and action in {"HIBERNATE_DRONES", "HIBERNATE_WAKE", "HIBERNATE_NON_CRUISE"}:
                     self._pending_hibernate_parsed = None
@@ -1679,12 +1746,11 @@ class RetornoTextualApp(App):
             audio_enabled = state.os.audio.enabled
         if block_msg:
             self._log_line(block_msg)
-            if self._audio_manager is not None:
-                severity = Severity.WARN if "Action blocked" in block_msg or "Acción bloqueada" in block_msg else Severity.INFO
-                self._audio_manager.play_event(audio_enabled, EventType.BOOT_BLOCKED, severity)
-                notice = self._audio_manager.consume_notice()
-                if notice:
-                    self._log_line(notice)
+            severity = Severity.WARN if "Action blocked" in block_msg or "Acción bloqueada" in block_msg else Severity.INFO
+            self._audio_manager.play_event(audio_enabled, EventType.BOOT_BLOCKED, severity)
+            notice = self._audio_manager.consume_notice()
+            if notice:
+                self._log_line(notice)
             return
 
         # Informational commands (drain AUTO first to avoid mixing)
@@ -1732,63 +1798,64 @@ class RetornoTextualApp(App):
         if parsed == "MUSIC_LIST":
             with self.loop.with_lock() as state:
                 locale = state.os.locale.value
-            if self._audio_manager is None:
-                self._log_line("music: unavailable" if locale != "es" else "music: no disponible")
+            unavailable = repl.music_unavailable_line(self._audio_manager, locale)
+            if unavailable:
+                self._log_line(unavailable)
             else:
                 self._log_lines(repl.build_music_list_lines(self._audio_manager, locale))
-                notice = self._audio_manager.consume_notice()
-                if notice:
-                    self._log_line(notice)
+            notice = self._audio_manager.consume_notice()
+            if notice:
+                self._log_line(notice)
             return
         if parsed == "MUSIC_STATUS":
             with self.loop.with_lock() as state:
                 locale = state.os.locale.value
-            if self._audio_manager is None:
-                self._log_line("music: unavailable" if locale != "es" else "music: no disponible")
+            unavailable = repl.music_unavailable_line(self._audio_manager, locale)
+            if unavailable:
+                self._log_line(unavailable)
             else:
                 self._log_lines(repl.build_music_status_lines(self._audio_manager, locale))
-                notice = self._audio_manager.consume_notice()
-                if notice:
-                    self._log_line(notice)
+            notice = self._audio_manager.consume_notice()
+            if notice:
+                self._log_line(notice)
             return
         if parsed == "MUSIC_STOP":
             with self.loop.with_lock() as state:
                 locale = state.os.locale.value
-            if self._audio_manager is None:
-                self._log_line("music: unavailable" if locale != "es" else "music: no disponible")
-            else:
-                self._log_line(repl.stop_music_track(self._audio_manager, locale))
-                notice = self._audio_manager.consume_notice()
-                if notice:
-                    self._log_line(notice)
+            self._log_line(
+                repl.music_unavailable_line(self._audio_manager, locale)
+                or repl.stop_music_track(self._audio_manager, locale)
+            )
+            notice = self._audio_manager.consume_notice()
+            if notice:
+                self._log_line(notice)
             return
         if isinstance(parsed, tuple) and parsed[0] == "MUSIC_PLAY":
             with self.loop.with_lock() as state:
                 locale = state.os.locale.value
-                lines = (
-                    ["music: unavailable" if locale != "es" else "music: no disponible"]
-                    if self._audio_manager is None
-                    else repl.play_music_track(state.os, self._audio_manager, str(parsed[1]), locale)
-                )
+            unavailable = repl.music_unavailable_line(self._audio_manager, locale)
+            if unavailable:
+                lines = [unavailable]
+            else:
+                with self.loop.with_lock() as state:
+                    lines = repl.play_music_track(state.os, self._audio_manager, str(parsed[1]), locale)
             self._log_lines(lines)
-            if self._audio_manager is not None:
-                notice = self._audio_manager.consume_notice()
-                if notice:
-                    self._log_line(notice)
+            notice = self._audio_manager.consume_notice()
+            if notice:
+                self._log_line(notice)
             return
         if isinstance(parsed, tuple) and parsed[0] == "MUSIC_VOLUME":
             with self.loop.with_lock() as state:
                 locale = state.os.locale.value
-                message = (
-                    "music: unavailable" if locale != "es" else "music: no disponible"
-                )
-                if self._audio_manager is not None:
+            # Before audio is ready the volume is recorded and applied on init.
+            message = "music: unavailable" if locale != "es" else "music: no disponible"
+            if not self._audio_manager.disabled:
+                with self.loop.with_lock() as state:
                     message = repl.apply_music_volume(state.os, self._audio_manager, float(parsed[1]), locale)
             self._log_line(message)
-            if self._audio_manager is not None:
-                notice = self._audio_manager.consume_notice()
-                if notice:
-                    self._log_line(notice)
+            notice = self._audio_manager.consume_notice()
+            if notice:
+                self._log_line(notice)
             return
         if parsed == "JOBS":
             with self.loop.with_lock() as state:
@@ -1819,11 +1886,10 @@ class RetornoTextualApp(App):
                     lines = presenter.format_event_lines(state, [("cmd", e) for e in ev])
                     audio_enabled = state.os.audio.enabled
                 self._log_lines(lines)
-                if self._audio_manager is not None:
-                    self._audio_manager.handle_event_batch(audio_enabled, ev)
-                    notice = self._audio_manager.consume_notice()
-                    if notice:
-                        self._log_line(notice)
+                self._audio_manager.handle_event_batch(audio_enabled, ev)
+                notice = self._audio_manager.consume_notice()
+                if notice:
+                    self._log_line(notice)
             auto_ev = self.loop.drain_events()
             if auto_ev:
                 audio_enabled = False
@@ -1831,11 +1897,10 @@ class RetornoTextualApp(App):
                     lines = presenter.format_event_lines(state, auto_ev)
                     audio_enabled = state.os.audio.enabled
                 self._log_lines(lines)
-                if self._audio_manager is not None:
-                    self._audio_manager.handle_event_batch(audio_enabled, auto_ev)
-                    notice = self._audio_manager.consume_notice()
-                    if notice:
-                        self._log_line(notice)
+                self._audio_manager.handle_event_batch(audio_enabled, auto_ev)
+                notice = self._audio_manager.consume_notice()
+                if notice:
+                    self._log_line(notice)
                 self._queue_deferred_repair_auto_move_prompt(auto_ev)
             return
         if parsed == "UPLINK":
@@ -1913,9 +1978,10 @@ class RetornoTextualApp(App):
                 self._log_lines(presenter.build_command_output(repl.render_power_status, state))
             return
         if parsed == "CONFIG_SHOW":
-            backend_name = self._audio_manager.backend.name if self._audio_manager is not None else None
+            audio_disabled = self._audio_manager.disabled
+            backend_name = None if audio_disabled else self._audio_manager.backend.name
             runtime_status = None
-            if self._audio_manager is None:
+            if audio_disabled:
                 runtime_status = "disabled"
             elif self._audio_manager.notice:
                 runtime_status = "degraded"
@@ -1938,7 +2004,7 @@ class RetornoTextualApp(App):
             if key == "theme":
                 self._apply_theme(next_theme)
                 self.refresh_panels()
-            if self._audio_manager is not None and key in {"audio", "ambientsound"}:
+            if key in {"audio", "ambientsound"}:
                 self._audio_manager.apply_preferences(audio_enabled, ambient_enabled)
                 notice = self._audio_manager.consume_notice()
                 if notice:
@@ -1961,6 +2027,14 @@ class RetornoTextualApp(App):
                 limit = None if parsed[1] == "all" else int(parsed[1])
                 self._log_lines(presenter.build_command_output(repl.render_intel_list, state, limit=limit))
             return
+        if isinstance(parsed, tuple) and parsed[0] == "INTEL_FILTER":
+            with self.loop.with_lock() as state:
+                self._log_lines(
+                    presenter.build_command_output(
+                        repl.render_intel_list, state, None, to_id=parsed[1], source_kind=parsed[2]
+                    )
+                )
+            return
         if isinstance(parsed, tuple) and parsed[0] == "INTEL_IMPORT":
             with self.loop.with_lock() as state:
                 self._log_lines(presenter.build_command_output(repl._handle_intel_import, state, parsed[1]))
@@ -2086,6 +2160,15 @@ class RetornoTextualApp(App):
                     presenter.build_command_output(repl.render_debug_worldgen_sector, state, str(parsed[1]))
                 )
             return
+        if isinstance(parsed, tuple) and parsed[0] == "DEBUG_WORLDGEN_PREGEN":
+            with self.loop.with_lock() as state:
+                if not state.os.debug_enabled:
+                    self._log_line("debug worldgen pregen: available only in DEBUG mode. Use: debug on")
+                    return
+                self._log_lines(
+                    presenter.build_command_output(repl.render_debug_worldgen_pregen, state, int(parsed[1]))
+                )
+            return
         if isinstance(parsed, tuple) and parsed[0] == "DEBUG_GRAPH_ALL":
             with self.loop.with_lock() as state:
                 if not state.os.debug_enabled:
@@ -2166,18 +2249,17 @@ class RetornoTextualApp(App):
                 if not state.os.debug_enabled:
                     self._log_line("wait is available only in DEBUG mode. Use: debug on")
                     return
-            step_events = self.loop.step_many(seconds, dt=1.0)
+            step_events = self.loop.advance(seconds)
             step_pairs = [("step", e) for e in step_events]
             audio_enabled = False
             with self.loop.with_lock() as state:
                 lines = presenter.format_event_lines(state, step_pairs)
                 audio_enabled = state.os.audio.enabled
             self._log_lines(lines)
-            if self._audio_manager is not None:
-                self._audio_manager.handle_event_batch(audio_enabled, step_events)
-                notice = self._audio_manager.consume_notice()
-                if notice:
-                    self._log_line(notice)
+            self._audio_manager.handle_event_batch(audio_enabled, step_events)
+            notice = self._audio_manager.consume_notice()
+            if notice:
+                self._log_line(notice)
             self._queue_deferred_repair_auto_move_prompt(step_pairs)
             return
 
@@ -2220,11 +2302,10 @@ class RetornoTextualApp(App):
                             lines.append(msg.get(state.os.locale.value, msg["en"]))
                             break
             self._log_lines(lines)
-            if self._audio_manager is not None:
-                self._audio_manager.handle_event_batch(audio_enabled, ev)
-                notice = self._audio_manager.consume_notice()
-                if notice:
-                    self._log_line(notice)
+            self._audio_manager.handle_event_batch(audio_enabled, ev)
+            notice = self._audio_manager.consume_notice()
+            if notice:
+                self._log_line(notice)
         else:
             # No immediate events; still ok.
             pass
@@ -2272,6 +2353,8 @@ def main() -> None:
         app.loop.state.os.locale.value,
         clear_after=False,
     )
+    if Balance.AUTOSAVE_ENABLED:
+        app.loop.start_autosave(args.save_path, user=profile_user)
     app.run()
     exit_message = app.exit_console_message()
     if exit_message:
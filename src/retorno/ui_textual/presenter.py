@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import io
 from contextlib import redirect_stdout
+from dataclasses import dataclass
 
 from retorno.cli import repl
 from retorno.util.timefmt import format_elapsed_short
 from retorno.config.balance import Balance
+from retorno.core.versions import memoize_on_versions
 from retorno.runtime.operator_config import resolve_help_verbose
 
 
@@ -59,48 +61,151 @@ def build_power_lines(state) -> list[str]:
     ]
 
 
+@dataclass(slots=True, frozen=True)
+class TextRow:
+    """A fixed line in a panel (section header, hint, placeholder)."""
+
+    text: str
+
+    @property
+    def key(self) -> str:
+        return self.text
+
+
+@dataclass(slots=True, frozen=True)
+class SystemRow:
+    system_id: str
+    state: str
+    health: float
+    forced_offline: bool
+
+    @property
+    def key(self) -> str:
+        return self.system_id
+
+    @property
+    def text(self) -> str:
+        fo = " forced_offline" if self.forced_offline else ""
+        return f"{self.system_id} {self.state} {self.health:.2f}{fo}"
+
+
+@dataclass(slots=True, frozen=True)
+class AlertRow:
+    alert_key: str
+    severity: str
+    unacked: str
+
+    @property
+    def key(self) -> str:
+        return self.alert_key
+
+    @property
+    def text(self) -> str:
+        return f"- {self.severity.upper():8s} {self.alert_key:24s} unacked={self.unacked}"
+
+
+@dataclass(slots=True, frozen=True)
+class JobRow:
+    job_id: str
+    status: str
+    job_type: str
+    target: str
+    eta: str
+    owner: str
+    emergency: bool
+    wait_note: str
+
+    @property
+    def key(self) -> str:
+        return self.job_id
+
+    @property
+    def text(self) -> str:
+        emergency = " EMERGENCY" if self.emergency else ""
+        return (
+            f"- {self.job_id}: {self.status:8s} type={self.job_type} target={self.target}"
+            f" ETA={self.eta} owner={self.owner}{emergency}{self.wait_note}"
+        )
+
+
+PanelRow = TextRow | SystemRow | AlertRow | JobRow
+
+
+@dataclass(slots=True, frozen=True)
+class PanelModel:
+    """Rows for the status/alerts/jobs panels, built straight from state."""
+
+    status: tuple[PanelRow, ...]
+    alerts: tuple[PanelRow, ...]
+    jobs: tuple[PanelRow, ...]
+
+
+def panel_texts(rows: tuple[PanelRow, ...]) -> tuple[str, ...]:
+    return tuple(row.text for row in rows)
+
+
+@memoize_on_versions("systems")
+def build_status_rows(state) -> tuple[PanelRow, ...]:
+    systems = state.ship.systems
+    if not systems:
+        # Nothing to compact; show the full status block instead.
+        return tuple(TextRow(line) for line in _capture_output(repl.render_status, state))
+    return tuple(
+        SystemRow(sid, system.state.value, system.health, system.forced_offline)
+        for sid, system in systems.items()
+    )
+
+
+@memoize_on_versions("alerts", extra=lambda state: state.os.locale.value)
+def build_alerts_rows(state) -> tuple[PanelRow, ...]:
+    active = repl._active_alerts_sorted(state)
+    if not active:
+        return (TextRow("(none)"),)
+    locale = state.os.locale.value
+    rows: list[PanelRow] = [TextRow(repl._alerts_hint(locale))]
+    for alert in active:
+        rows.append(AlertRow(alert.alert_key, alert.severity.value, repl._format_eta_short(alert.unacked_s, locale)))
+    return tuple(rows)
+
+
+@memoize_on_versions("jobs", extra=lambda state: state.os.locale.value)
+def build_jobs_rows(state) -> tuple[PanelRow, ...]:
+    header = TextRow("Active jobs (queued/running):")
+    jobs_state = state.jobs
+    if not jobs_state.jobs:
+        return (header, TextRow("(none)"))
+    active_jobs = repl._active_jobs(jobs_state)
+    if not active_jobs:
+        return (header, TextRow("- (none)"))
+    locale = state.os.locale.value
+    busy = repl._job_busy_context(active_jobs)
+    rows: list[PanelRow] = [header]
+    for job in active_jobs:
+        target, eta, owner, emergency, wait_note = repl._job_display_fields(job, locale, busy)
+        rows.append(
+            JobRow(job.job_id, job.status.value, job.job_type.value, target, eta, owner, emergency, wait_note)
+        )
+    return tuple(rows)
+
+
+def build_panel_model(state) -> PanelModel:
+    return PanelModel(
+        status=build_status_rows(state),
+        alerts=build_alerts_rows(state),
+        jobs=build_jobs_rows(state),
+    )
+
+
 def build_status_lines(state) -> list[str]:
-    lines = _capture_output(repl.render_status, state)
-    sys_lines = []
-    in_systems = False
-    for line in lines:
-        if line.strip().lower() == "systems:":
-            in_systems = True
-            continue
-        if in_systems and line.strip().startswith("-"):
-            compact = line.strip()
-            if compact.startswith("- "):
-                compact = compact[2:]
-            compact = compact.replace("state=", "").replace("health=", "")
-            parts = [p for p in compact.split() if not (p.startswith("svc=") or p.startswith("running="))]
-            compact = " ".join(parts)
-            sys_lines.append(compact)
-    return sys_lines if sys_lines else lines
+    return list(panel_texts(build_status_rows(state)))
 
 
 def build_alerts_lines(state) -> list[str]:
-    lines = _capture_output(repl.render_alerts, state)
-    if lines and lines[0].strip().upper().startswith("=== ALERTS"):
-        lines = lines[1:]
-    return lines
+    return list(panel_texts(build_alerts_rows(state)))
 
 
 def build_jobs_lines(state) -> list[str]:
-    lines = _capture_output(repl.render_jobs, state)
-    if lines and lines[0].strip().upper() == "=== JOBS ===":
-        lines = lines[1:]
-    if not lines:
-        return ["Active jobs (queued/running):", "- (none)"]
-    if lines[0].strip().lower().startswith("active"):
-        lines[0] = "Active jobs (queued/running):"
-    else:
-        lines.insert(0, "Active jobs (queued/running):")
-    filtered = []
-    for line in lines:
-        if line.strip().lower().startswith("recent complete/failed"):
-            break
-        filtered.append(line)
-    return filtered
+    return list(panel_texts(build_jobs_rows(state)))
 
 
 def build_help_lines(state, verbose: bool | None = None) -> list[str]:
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 import hashlib
+import multiprocessing
+import os
 import random
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+from dataclasses import dataclass
 
 from retorno.config.balance import Balance
 from retorno.core.gamestate import GameState
@@ -120,11 +124,13 @@ def _radiation_for_region(region: str) -> float:
 
 
 def _sector_nodes(state: GameState, sector_id: str) -> list[SpaceNode]:
-    return [
-        node
-        for node in state.world.space.nodes.values()
-        if sector_id_for_pos(node.x_ly, node.y_ly, node.z_ly) == sector_id
-    ]
+    """Nodes inside `sector_id` by id, including the active nav point.
+
+    Worldgen has always seen the nav point (signature, kind planning, links);
+    only the stored `SectorGenState.node_ids` leave it out.
+    """
+    nodes = state.world.space.nodes
+    return [nodes[node_id] for node_id in sorted(state.world.space.sector_node_ids(sector_id))]
 
 
 def _pair_key(left: str, right: str) -> str:
@@ -156,13 +162,13 @@ def sync_sector_state_for_node(state: GameState, node_id: str) -> None:
     node = state.world.space.nodes.get(node_id)
     if not node:
         return
-    sector_id = sector_id_for_pos(node.x_ly, node.y_ly, node.z_ly)
+    sector_id = state.world.node_sector_id(node_id)
+    if sector_id is None:
+        return
     if sector_id not in state.world.generated_sectors and sector_id not in state.world.sector_states:
         return
     sector_state = _sector_state(state, sector_id)
-    if node_id not in sector_state.node_ids:
-        sector_state.node_ids.append(node_id)
-        sector_state.node_ids.sort()
+    state.world.sync_sector_membership(sector_id)
     if node.is_hub and sector_state.playable_hub_node_id is None:
         sector_state.playable_hub_node_id = node_id
     if node.is_topology_hub and sector_state.topology_hub_node_id is None:
@@ -192,7 +198,7 @@ def _select_archetype(
 
 
 def _choose_playable_hub_kind(
-    state: GameState,
+    seed: int,
     sector_id: str,
     archetype: str,
     archetype_cfg: dict,
@@ -204,7 +210,7 @@ def _choose_playable_hub_kind(
         return None
     if not force_playable_hub:
         prob = max(0.0, min(1.0, float(archetype_cfg.get("playable_hub_prob", 0.0) or 0.0)))
-        rng = random.Random(_hash64(state.meta.rng_seed, f"sector_hub_roll:{sector_id}:{archetype}"))
+        rng = random.Random(_hash64(seed, f"sector_hub_roll:{sector_id}:{archetype}"))
         if rng.random() > prob:
             return None
     caps = archetype_cfg.get("kind_caps", {}) or {}
@@ -221,41 +227,40 @@ def _choose_playable_hub_kind(
         filtered[kind] = float(weight)
     if not filtered:
         return None
-    rng = random.Random(_hash64(state.meta.rng_seed, f"sector_hub_kind:{sector_id}:{archetype}"))
+    rng = random.Random(_hash64(seed, f"sector_hub_kind:{sector_id}:{archetype}"))
     return _weighted_choice(rng, filtered)
 
 
 def _plan_sector_kinds(
-    state: GameState,
+    seed: int,
     sector_id: str,
     archetype: str,
     sector_region: str,
-    region_template: dict,
     archetype_cfg: dict,
+    existing: tuple[tuple[str, bool], ...],
     *,
     force_playable_hub: bool = False,
 ) -> tuple[list[str], str | None]:
-    existing_nodes = _sector_nodes(state, sector_id)
+    """Kinds to add to a sector given the (kind, is_hub) pairs of nodes already in it."""
     counts: dict[str, int] = {}
-    existing_playable_hub = None
-    for node in existing_nodes:
-        counts[node.kind] = counts.get(node.kind, 0) + 1
-        if node.is_hub and existing_playable_hub is None:
-            existing_playable_hub = node.node_id
+    has_playable_hub = False
+    for kind, is_hub in existing:
+        counts[kind] = counts.get(kind, 0) + 1
+        has_playable_hub = has_playable_hub or is_hub
 
-    count_rng = random.Random(_hash64(state.meta.rng_seed, f"sector_node_count:{sector_id}:{archetype}:{sector_region}"))
+    count_rng = random.Random(_hash64(seed, f"sector_node_count:{sector_id}:{archetype}:{sector_region}"))
     min_count = int(archetype_cfg.get("node_count_min", 0) or 0)
     max_count = int(archetype_cfg.get("node_count_max", 0) or 0)
     if max_count < min_count:
         max_count = min_count
     target_total = count_rng.randint(max(0, min_count), max(0, max_count))
-    remaining_slots = max(0, target_total - len(existing_nodes))
+    remaining_slots = max(0, target_total - len(existing))
 
     planned: list[str] = []
     playable_hub_kind = None
-    if existing_playable_hub is None and remaining_slots > 0:
+    if not has_playable_hub and remaining_slots > 0:
         playable_hub_kind = _choose_playable_hub_kind(
-            state,
+            seed,
             sector_id,
             archetype,
             archetype_cfg,
@@ -279,7 +284,7 @@ def _plan_sector_kinds(
             if cap is not None and int(cap) <= counts.get(kind, 0):
                 continue
             candidates[kind] = float(weight)
-        rng = random.Random(_hash64(state.meta.rng_seed, f"sector_kind_pick:{sector_id}:{archetype}:{len(planned)}"))
+        rng = random.Random(_hash64(seed, f"sector_kind_pick:{sector_id}:{archetype}:{len(planned)}"))
         choice = _weighted_choice(rng, candidates)
         if not choice:
             break
@@ -315,15 +320,14 @@ def _pick_modules(
 
 
 def _apply_salvage_profile(
-    state: GameState,
+    seed: int,
     node: SpaceNode,
     salvage_cfg: dict,
     module_ids: list[str],
 ) -> None:
     if node.kind not in {"station", "derelict", "ship", "relay", "waystation"}:
         return
-    seed = _hash64(state.meta.rng_seed, f"sector_salvage:{node.node_id}")
-    rng = random.Random(seed)
+    rng = random.Random(_hash64(seed, f"sector_salvage:{node.node_id}"))
     scrap_min = int(salvage_cfg.get("scrap_min", 0) or 0)
     scrap_max = int(salvage_cfg.get("scrap_max", 0) or 0)
     if scrap_max > 0:
@@ -336,7 +340,7 @@ def _apply_salvage_profile(
         salvage_cfg.get("modules_pool"),
     )
     node.recoverable_drones_count = _roll_recoverable_drones_for_node(
-        state.meta.rng_seed,
+        seed,
         node.node_id,
         node.kind,
     )
@@ -374,8 +378,8 @@ def _pick_topology_hub(nodes: list[SpaceNode]) -> SpaceNode | None:
 
 def _refresh_sector_metadata(state: GameState, sector_id: str) -> None:
     sector_state = _sector_state(state, sector_id)
-    nodes = sorted(_sector_nodes(state, sector_id), key=lambda node: node.node_id)
-    sector_state.node_ids = [node.node_id for node in nodes]
+    nodes = _sector_nodes(state, sector_id)
+    sector_state.node_ids = state.world.sector_node_ids(sector_id)
     if not sector_state.region and nodes:
         sector_state.region = nodes[0].region or region_for_pos(nodes[0].x_ly, nodes[0].y_ly, nodes[0].z_ly)
     sector_state.playable_hub_node_id = next((node.node_id for node in nodes if node.is_hub), None)
@@ -386,7 +390,7 @@ def _build_internal_links_for_sector(state: GameState, sector_id: str, archetype
     sector_state = _sector_state(state, sector_id)
     if sector_state.internal_links_built:
         return
-    nodes = sorted(_sector_nodes(state, sector_id), key=lambda node: node.node_id)
+    nodes = _sector_nodes(state, sector_id)
     if not nodes:
         sector_state.internal_links_built = True
         sector_state.internal_link_count = 0
@@ -426,6 +430,8 @@ def _build_internal_links_for_sector(state: GameState, sector_id: str, archetype
 
     sector_state.internal_links_built = True
     sector_state.internal_link_count = internal_added
+    if internal_added:
+        state.world.space.links_changed()
     _refresh_sector_metadata(state, sector_id)
 
 
@@ -476,6 +482,7 @@ def _evaluate_intersector_pair(
     if _link_with_cap(left_hub, right_hub):
         left_state.intersector_link_count += 1
         right_state.intersector_link_count += 1
+        state.world.space.links_changed()
 
 
 def _ensure_intersector_links_for_new_sectors(
@@ -551,6 +558,91 @@ def _maybe_apply_sparse_guardrail(
     return overrides, force_playable_hub
 
 
+@dataclass(slots=True, frozen=True)
+class _SectorPlanInputs:
+    """Everything the node plan of one sector depends on."""
+
+    seed: int
+    sector_id: str
+    archetype: str
+    sector_region: str
+    existing: tuple[tuple[str, bool], ...]
+    force_playable_hub: bool
+
+
+_SectorPlans = dict[str, tuple[_SectorPlanInputs, list[SpaceNode]]]
+
+
+def _existing_sector_signature(state: GameState, sector_id: str) -> tuple[tuple[str, bool], ...]:
+    return tuple((node.kind, node.is_hub) for node in _sector_nodes(state, sector_id))
+
+
+def _build_sector_node(
+    inputs: _SectorPlanInputs,
+    index: int,
+    kind: str,
+    playable_hub_kind: str | None,
+    region_template: dict,
+    module_ids: list[str],
+    taken_ids,
+) -> SpaceNode:
+    seed = inputs.seed
+    sector_id = inputs.sector_id
+    x0, y0, z0 = _sector_bounds(sector_id)
+    z_center = z0 + SECTOR_SIZE_LY / 2.0
+    z_sigma = float(region_template.get("z_sigma", 0.3) or 0.3)
+    rng = random.Random(_hash64(seed, f"sector_node:{sector_id}:{inputs.archetype}:{index}:{kind}"))
+    x = x0 + rng.random() * SECTOR_SIZE_LY
+    y = y0 + rng.random() * SECTOR_SIZE_LY
+    z = rng.gauss(z_center, z_sigma)
+    node_region = region_for_pos(x, y, z)
+    node_id = _generate_node_id_avoiding(taken_ids, kind, rng)
+    node = SpaceNode(
+        node_id=node_id,
+        name=_name_from_node_id(node_id, kind),
+        kind=kind,
+        radiation_rad_per_s=procedural_radiation_for_node(seed, node_id, kind, node_region),
+        radiation_base=_radiation_for_region(node_region),
+        region=node_region,
+        x_ly=x,
+        y_ly=y,
+        z_ly=z,
+        is_hub=kind == playable_hub_kind and kind in _PLAYABLE_HUB_KINDS,
+        is_topology_hub=False,
+    )
+    _apply_salvage_profile(seed, node, dict(region_template.get("salvage", {}) or {}), module_ids)
+    return node
+
+
+def _plan_sector_nodes(inputs: _SectorPlanInputs) -> list[SpaceNode]:
+    """Nodes a sector would receive, computed without game state (process-pool worker).
+
+    Node ids only avoid collisions inside the sector; the serial merge re-checks
+    them against the live node map.
+    """
+    templates = load_worldgen_templates()
+    archetypes = load_worldgen_archetypes()
+    region_template = templates.get(inputs.sector_region) or templates.get("disk") or {}
+    archetype_cfg = archetypes.get(inputs.archetype) or archetypes.get("empty") or {}
+    module_ids = list(load_modules().keys())
+    planned_kinds, playable_hub_kind = _plan_sector_kinds(
+        inputs.seed,
+        inputs.sector_id,
+        inputs.archetype,
+        inputs.sector_region,
+        archetype_cfg,
+        inputs.existing,
+        force_playable_hub=inputs.force_playable_hub,
+    )
+    taken: set[str] = set()
+    nodes: list[SpaceNode] = []
+    for index, kind in enumerate(planned_kinds):
+        node = _build_sector_node(inputs, index, kind, playable_hub_kind, region_template, module_ids, taken)
+        taken.add(node.node_id)
+        nodes.append(node)
+    return nodes
+
+
 def _ensure_sector_generated_core(
     state: GameState,
     sector_id: str,
@@ -558,6 +650,7 @@ def _ensure_sector_generated_core(
     archetypes: dict[str, dict],
     overrides: dict[str, str] | None = None,
     force_playable_hub: set[str] | None = None,
+    plans: _SectorPlans | None = None,
 ) -> bool:
     if sector_id in state.world.generated_sectors:
         return False
@@ -574,51 +667,74 @@ def _ensure_sector_generated_core(
     sector_state.internal_link_count = 0
     sector_state.intersector_link_count = 0
 
-    modules = load_modules()
-    module_ids = list(modules.keys())
+    module_ids = list(load_modules().keys())
+    inputs = _SectorPlanInputs(
+        seed=state.meta.rng_seed,
+        sector_id=sector_id,
+        archetype=archetype,
+        sector_region=sector_region,
+        existing=_existing_sector_signature(state, sector_id),
+        force_playable_hub=sector_id in force_playable_hub,
+    )
     planned_kinds, playable_hub_kind = _plan_sector_kinds(
-        state,
+        inputs.seed,
         sector_id,
         archetype,
         sector_region,
-        region_template,
         archetype_cfg,
-        force_playable_hub=sector_id in force_playable_hub,
+        inputs.existing,
+        force_playable_hub=inputs.force_playable_hub,
     )
-    x0, y0, z0 = _sector_bounds(sector_id)
-    z_center = z0 + SECTOR_SIZE_LY / 2.0
-    z_sigma = float(region_template.get("z_sigma", 0.3) or 0.3)
-    salvage_cfg = dict(region_template.get("salvage", {}) or {})
+    precomputed: list[SpaceNode] = []
+    plan = plans.get(sector_id) if plans else None
+    if plan is not None and plan[0] == inputs and len(plan[1]) == len(planned_kinds):
+        precomputed = plan[1]
 
+    nodes = state.world.space.nodes
     for index, kind in enumerate(planned_kinds):
-        rng = random.Random(_hash64(state.meta.rng_seed, f"sector_node:{sector_id}:{archetype}:{index}:{kind}"))
-        x = x0 + rng.random() * SECTOR_SIZE_LY
-        y = y0 + rng.random() * SECTOR_SIZE_LY
-        z = rng.gauss(z_center, z_sigma)
-        node_region = region_for_pos(x, y, z)
-        node_id = _generate_node_id(state, kind, rng)
-        node = SpaceNode(
-            node_id=node_id,
-            name=_name_from_node_id(node_id, kind),
-            kind=kind,
-            radiation_rad_per_s=procedural_radiation_for_node(state.meta.rng_seed, node_id, kind, node_region),
-            radiation_base=_radiation_for_region(node_region),
-            region=node_region,
-            x_ly=x,
-            y_ly=y,
-            z_ly=z,
-            is_hub=kind == playable_hub_kind and kind in _PLAYABLE_HUB_KINDS,
-            is_topology_hub=False,
-        )
-        _apply_salvage_profile(state, node, salvage_cfg, module_ids)
-        state.world.space.nodes[node_id] = node
+        node = precomputed[index] if precomputed else None
+        if node is None or node.node_id in nodes:
+            # A pregenerated id that collides with the live map is rebuilt exactly
+            # as lazy generation would pick it.
+            node = _build_sector_node(inputs, index, kind, playable_hub_kind, region_template, module_ids, nodes)
+        nodes[node.node_id] = node
 
     _refresh_sector_metadata(state, sector_id)
     state.world.generated_sectors.add(sector_id)
     return True
 
 
-def _ensure_sector_cluster_generated(state: GameState, sector_ids: list[str]) -> None:
+_CLUSTER_STATS = {"fast_path": 0, "full_pass": 0}
+
+
+def sector_cluster_stats() -> dict[str, int]:
+    """How often `ensure_sector_generated` skipped an already settled cluster."""
+    return dict(_CLUSTER_STATS)
+
+
+def reset_sector_cluster_stats() -> None:
+    for key in _CLUSTER_STATS:
+        _CLUSTER_STATS[key] = 0
+
+
+def _is_sector_settled(state: GameState, sector_id: str) -> bool:
+    if sector_id in state.world.settled_sectors:
+        return sector_id in state.world.generated_sectors
+    for neighbor_id in _neighbor_sector_ids_2d(sector_id, radius=1, include_self=True):
+        if neighbor_id not in state.world.generated_sectors:
+            return False
+        sector_state = state.world.sector_states.get(neighbor_id)
+        if sector_state is None or not sector_state.internal_links_built:
+            return False
+    state.world.settled_sectors.add(sector_id)
+    return True
+
+
+def _ensure_sector_cluster_generated(
+    state: GameState,
+    sector_ids: list[str],
+    plans: _SectorPlans | None = None,
+) -> None:
     templates = load_worldgen_templates()
     archetypes = load_worldgen_archetypes()
     cluster_ids: set[str] = set()
@@ -636,6 +752,7 @@ def _ensure_sector_cluster_generated(state: GameState, sector_ids: list[str]) ->
             archetypes,
             overrides,
             force_playable_hub,
+            plans,
         ):
             newly_generated.append(sector_id)
 
@@ -647,10 +764,95 @@ def _ensure_sector_cluster_generated(state: GameState, sector_ids: list[str]) ->
         _build_internal_links_for_sector(state, sector_id, archetype_cfg)
 
     _ensure_intersector_links_for_new_sectors(state, newly_generated, archetypes)
+    if getattr(Balance, "SECTOR_MEMBERSHIP_DEBUG_ASSERT", False):
+        issues = state.world.sector_membership_issues()
+        if issues:
+            raise AssertionError("Sector membership out of sync: " + "; ".join(issues))
 
 
 def ensure_sector_generated(state: GameState, sector_id: str) -> None:
-    _ensure_sector_cluster_generated(state, [sector_id])
+    _ensure_sector(state, sector_id)
+
+
+def _ensure_sector(state: GameState, sector_id: str, plans: _SectorPlans | None = None) -> None:
+    # Generation and linking never undo themselves, so a settled cluster needs
+    # no template loads, guardrail or link passes.
+    if _is_sector_settled(state, sector_id):
+        _CLUSTER_STATS["fast_path"] += 1
+        return
+    _CLUSTER_STATS["full_pass"] += 1
+    _ensure_sector_cluster_generated(state, [sector_id], plans)
+
+
+def pregen_sector_order(center_sector_id: str, radius: int) -> list[str]:
+    """Sectors within `radius` rings of the centre, ring by ring, then by id."""
+    cx, cy, _ = _parse_sector_id(center_sector_id)
+
+    def _ring(sector_id: str) -> int:
+        sx, sy, _ = _parse_sector_id(sector_id)
+        return max(abs(sx - cx), abs(sy - cy))
+
+    return sorted(_neighbor_sector_ids_2d(center_sector_id, radius=max(0, radius)), key=lambda sid: (_ring(sid), sid))
+
+
+def _plan_sectors(requests: list[_SectorPlanInputs], workers: int) -> list[list[SpaceNode]]:
+    if workers > 1 and len(requests) > 1:
+        try:
+            # Spawned workers: forking would copy the caller's threads and held locks
+            # (game loop, audio, Textual) into the children.
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+                chunk = max(1, len(requests) // (workers * 4))
+                return list(pool.map(_plan_sector_nodes, requests, chunksize=chunk))
+        except (OSError, BrokenExecutor):
+            # No usable process pool here (sandbox, frozen build); plan inline instead.
+            pass
+    return [_plan_sector_nodes(request) for request in requests]
+
+
+def pregenerate_sectors(
+    state: GameState,
+    center_sector_id: str,
+    radius: int,
+    *,
+    workers: int | None = None,
+) -> list[str]:
+    """Generate every sector within `radius` rings of `center_sector_id`.
+
+    Node plans for the not-yet-generated sectors are computed in a process
+    pool, then merged serially through the same path as `ensure_sector_generated`
+    in `pregen_sector_order`, so the world is identical to generating each
+    sector lazily in that order. Returns the newly generated sector ids.
+    """
+    order = pregen_sector_order(center_sector_id, radius)
+    before = set(state.world.generated_sectors)
+    targets: set[str] = set()
+    for sector_id in order:
+        targets.update(_neighbor_sector_ids_2d(sector_id, radius=1, include_self=True))
+    targets -= before
+
+    templates = load_worldgen_templates()
+    requests: list[_SectorPlanInputs] = []
+    for sector_id in sorted(targets):
+        sector_region = region_for_pos(*_sector_center(sector_id))
+        requests.append(
+            _SectorPlanInputs(
+                seed=state.meta.rng_seed,
+                sector_id=sector_id,
+                archetype=_select_archetype(state, sector_id, sector_region, templates),
+                sector_region=sector_region,
+                existing=_existing_sector_signature(state, sector_id),
+                force_playable_hub=False,
+            )
+        )
+    if workers is None:
+        workers = os.cpu_count() or 1
+    planned = _plan_sectors(requests, workers)
+    plans: _SectorPlans = {request.sector_id: (request, nodes) for request, nodes in zip(requests, planned)}
+
+    for sector_id in order:
+        _ensure_sector(state, sector_id, plans)
+    return sorted(state.world.generated_sectors - before)
 
 
 _GREEK_SUFFIXES = [
@@ -682,14 +884,18 @@ _GREEK_SUFFIXES = [
 
 
 def _generate_node_id(state: GameState, kind: str, rng: random.Random) -> str:
+    return _generate_node_id_avoiding(state.world.space.nodes, kind, rng)
+
+
+def _generate_node_id_avoiding(taken_ids, kind: str, rng: random.Random) -> str:
     prefix = "WRECK" if kind == "ship" else (kind or "node").upper()
     while True:
         base = f"{prefix}_{rng.getrandbits(24):06X}"
-        if base not in state.world.space.nodes:
+        if base not in taken_ids:
             return base
         for suffix in _GREEK_SUFFIXES:
             candidate = f"{base}_{suffix}"
-            if candidate not in state.world.space.nodes:
+            if candidate not in taken_ids:
                 return candidate
 
 
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import array
+import os
+import tempfile
+from pathlib import Path
+
+import retorno.audio.cache as audio_cache
+import retorno.audio.config as audio_config
+from retorno.audio.cache import AudioCache
+from retorno.audio.config import AudioCueConfig
+from retorno.audio.manager import PcmMixerAudioBackend, _PcmBlockMixer, _Voice
+
+
+def _assert_pcm_round_trip(root: Path, source: Path) -> None:
+    calls: list[int] = []
+
+    def _decode() -> bytes:
+        calls.append(1)
+        return array.array("f", [0.25, -0.25] * 64).tobytes()
+
+    raw = AudioCache(root).decoded_pcm(source, 44100, 2, "f32le", _decode)
+    # A fresh cache (next launch) maps the stored file instead of decoding.
+    cached = AudioCache(root).decoded_pcm(source, 44100, 2, "f32le", _decode)
+    assert calls == [1]
+    assert isinstance(cached, memoryview) and bytes(cached) == bytes(raw)
+    assert AudioCache(root).load_pcm(source, 48000, 2, "f32le") is None
+
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert AudioCache(root).load_pcm(source, 44100, 2, "f32le") is None
+
+
+def _assert_probe_index(root: Path, source: Path) -> None:
+    cache = AudioCache(root)
+    assert cache.probe(source) is None
+    cache.store_probe(source, (1.5, 44100, 66150))
+    cache.flush()
+    assert AudioCache(root).probe(source) == (1.5, 44100, 66150)
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert AudioCache(root).probe(source) is None
+
+
+def _assert_config_and_decode_use_cache(root: Path) -> None:
+    probes: list[Path] = []
+    original_probe = audio_config._run_ffprobe
+    original_cache = audio_cache._DEFAULT_CACHE
+
+    def _fake_probe(path: Path):
+        probes.append(path)
+        return 2.0, 44100, 88200
+
+    audio_config._run_ffprobe = _fake_probe
+    try:
+        audio_cache._DEFAULT_CACHE = AudioCache(root)
+        first = audio_config.load_audio_config()
+        assert probes, "first launch probes every asset"
+        probes.clear()
+        audio_cache._DEFAULT_CACHE = AudioCache(root)
+        second = audio_config.load_audio_config()
+        assert probes == [], probes
+        assert second.cues["alert_ping"].sample_count == first.cues["alert_ping"].sample_count == 88200
+
+        cue = second.cues["alert_ping"]
+        backend = object.__new__(PcmMixerAudioBackend)
+        backend._binary = "/nonexistent/ffmpeg"
+        audio_cache._DEFAULT_CACHE.store_pcm(
+            cue.path, 44100, 2, "f32le", array.array("f", [0.5, -0.5] * 4096).tobytes()
+        )
+        decoded = backend._decode_cue(cue)
+        assert decoded.frame_count == 4096 and isinstance(decoded.samples, memoryview)
+        mixer = _PcmBlockMixer(44100, 2, 2048, use_numpy=False)
+        payload, _ = mixer.mix([_Voice("ambient", cue, decoded, loop=True)], {})
+        assert len(payload) == 2048 * 2 * 4
+    finally:
+        audio_config._run_ffprobe = original_probe
+        audio_cache._DEFAULT_CACHE = original_cache
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        root = Path(tmp_dir) / "cache"
+        source = Path(tmp_dir) / "cue.wav"
+        source.write_bytes(b"RIFF-not-really")
+        _assert_pcm_round_trip(root, source)
+        _assert_probe_index(root, source)
+        _assert_config_and_decode_use_cache(Path(tmp_dir) / "launch")
+    print("AUDIO CACHE SMOKE PASSED")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from textual.widgets import Input
+
+import retorno.audio.cache as audio_cache
+import retorno.audio.config as audio_config
+from retorno.audio.cache import AudioCache
+from retorno.audio.config import AudioConfigError, load_audio_config
+from retorno.audio.manager import AudioManager, DeferredAudioManager, _AudioBackend
+from retorno.cli import repl
+from retorno.model.events import EventType, Severity
+from retorno.ui_textual import app as textual_app
+
+
+class _SlowRecordingBackend(_AudioBackend):
+    def __init__(self, delay_s: float) -> None:
+        time.sleep(delay_s)
+        self.prepared: list[str] = []
+        self.played: list[str] = []
+
+    def prepare(self, cue) -> None:
+        self.prepared.append(cue.cue_id)
+
+    def play(self, cue) -> None:
+        self.played.append(cue.cue_id)
+
+    def stop_channel(self, channel: str) -> None:
+        return
+
+    def stop_all(self) -> None:
+        return
+
+    def is_available(self) -> bool:
+        return True
+
+    @property
+    def name(self) -> str:
+        return "slow-recording"
+
+
+def _assert_startup_does_not_wait() -> None:
+    config = load_audio_config()
+    manager = DeferredAudioManager(lambda: config, lambda _: _SlowRecordingBackend(0.3))
+    started = time.monotonic()
+    manager.prepare_session(True, False, "new_game", 0.5)
+    manager.start(True, False, 0.5)
+    manager.play_startup(True, "new_game")
+    for _ in range(3 * DeferredAudioManager.PENDING_EVENT_LIMIT):
+        manager.play_event(True, EventType.JOB_COMPLETED, Severity.INFO)
+    assert time.monotonic() - started < 0.2, "pre-ready calls must not block"
+    assert manager.music_track_ids() == ()
+
+    ready = manager.ready.result(timeout=5.0)
+    assert isinstance(ready, AudioManager)
+    backend = ready.backend
+    startup_cue = config.startup_new_game_cue_id or config.startup_cue_id
+    assert startup_cue in backend.prepared and backend.played[0] == startup_cue, backend.played
+    # Event cues beyond the queue limit were dropped; the rest replayed once.
+    assert len(backend.played) <= 1 + DeferredAudioManager.PENDING_EVENT_LIMIT, backend.played
+    manager.shutdown()
+
+
+def _assert_stale_events_are_dropped() -> None:
+    config = load_audio_config()
+    manager = DeferredAudioManager(lambda: config, lambda _: _SlowRecordingBackend(0.2))
+    manager.PENDING_EVENT_MAX_AGE_S = 0.0
+    manager.play_event(True, EventType.JOB_COMPLETED, Severity.INFO)
+    ready = manager.ready.result(timeout=5.0)
+    assert ready.backend.played == []
+    manager.play_event(True, EventType.JOB_COMPLETED, Severity.INFO)
+    assert len(ready.backend.played) == 1
+    manager.shutdown()
+
+
+def _assert_config_failure_disables_audio() -> None:
+    def _broken():
+        raise AudioConfigError("no config")
+
+    manager = DeferredAudioManager(_broken)
+    assert manager.ready.result(timeout=5.0) is None
+    assert manager.disabled
+    assert "Audio disabled: no config" in (manager.consume_notice() or "")
+    manager.play_event(True, EventType.JOB_COMPLETED)
+    assert manager.list_music_tracks() == ()
+    assert repl.music_unavailable_line(manager) == "music: unavailable"
+    assert repl.music_unavailable_line(manager, "es") == "music: no disponible"
+
+    # A manager still loading past READY_WAIT_S says so instead of "unknown track".
+    release = threading.Event()
+
+    def _slow():
+        release.wait(5.0)
+        return load_audio_config()
+
+    loading = DeferredAudioManager(_slow, lambda _: _SlowRecordingBackend(0.0))
+    loading.READY_WAIT_S = 0.0
+    assert repl.music_unavailable_line(loading) == "music: audio still initializing"
+    release.set()
+    assert loading.ready.result(timeout=5.0) is not None
+    assert repl.music_unavailable_line(loading) is None
+    loading.shutdown()
+
+
+async def _assert_textual_mount_logs_notice() -> None:
+    def _broken():
+        raise AudioConfigError("no config")
+
+    def _ready_broken_manager():
+        manager = DeferredAudioManager(_broken)
+        manager.ready.result(timeout=5.0)
+        return manager
+
+    original = textual_app.DeferredAudioManager
+    old_scenario = os.environ.get("RETORNO_SCENARIO")
+    textual_app.DeferredAudioManager = _ready_broken_manager
+    os.environ["RETORNO_SCENARIO"] = "sandbox"
+    try:
+        app = textual_app.RetornoTextualApp(force_new_game=True)
+        app._play_startup_sequence = False
+        app._startup_panel_blackout = False
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            assert any("Audio disabled: no config" in line for line in app._log_buffer), app._log_buffer
+            input_widget = app.query_one("#input", Input)
+            for command in ("music play ambient_1", "music status", "music list", "music stop"):
+                app._log_buffer.clear()
+                input_widget.value = command
+                await pilot.press("enter")
+                await pilot.pause()
+                assert "music: unavailable" in app._log_buffer, (command, app._log_buffer)
+    finally:
+        textual_app.DeferredAudioManager = original
+        if old_scenario is None:
+            os.environ.pop("RETORNO_SCENARIO", None)
+        else:
+            os.environ["RETORNO_SCENARIO"] = old_scenario
+
+
+def _assert_music_metadata_is_lazy(tmp_dir: Path) -> None:
+    probes: list[str] = []
+    original = (audio_config._run_ffprobe, audio_config._MUSIC_ROOT, audio_cache._DEFAULT_CACHE)
+
+    def _fake_probe(path):
+        probes.append(path.name)
+        return 61.0, 44100, 61 * 44100
+
+    music_root = tmp_dir / "music"
+    music_root.mkdir()
+    for name in ("b_side.ogg", "a_side.mp3"):
+        (music_root / name).write_bytes(b"not audio")
+    audio_config._run_ffprobe = _fake_probe
+    audio_config._MUSIC_ROOT = music_root
+    audio_cache._DEFAULT_CACHE = AudioCache(tmp_dir / "cache")
+    try:
+        config = load_audio_config()
+        probes.clear()
+        manager = AudioManager(config, backend=_SlowRecordingBackend(0.0))
+        assert manager.music_track_ids() == ("a_side", "b_side") and probes == []
+        tracks = manager.list_music_tracks()
+        assert sorted(probes) == ["a_side.mp3", "b_side.ogg"]
+        assert all(track.duration_s == 61.0 for track in tracks)
+        manager.list_music_tracks()
+        assert len(probes) == len(tracks)
+        manager.shutdown()
+    finally:
+        audio_config._run_ffprobe, audio_config._MUSIC_ROOT, audio_cache._DEFAULT_CACHE = original
+
+
+def main() -> None:
+    _assert_startup_does_not_wait()
+    _assert_stale_events_are_dropped()
+    _assert_config_failure_disables_audio()
+    asyncio.run(_assert_textual_mount_logs_notice())
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        _assert_music_metadata_is_lazy(Path(tmp_dir))
+    print("AUDIO DEFERRED INIT SMOKE PASSED")
+
+
+if __name__ == "__main__":
+    main()
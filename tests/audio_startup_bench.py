@@ -0,0 +1,60 @@
+"""Time from audio setup to the first interactive prompt: eager vs deferred vs disabled.
+
+Run with `PYTHONPATH=src python tests/audio_startup_bench.py [repeats]`. "eager"
+is the old startup path (config + backend + cue preload before the prompt),
+"deferred" hands the same work to DeferredAudioManager, and "disabled" skips
+audio entirely. Each mode reports the median wall time until the prompt
+would be shown; deferred also reports when audio itself became ready.
+"""
+
+from __future__ import annotations
+
+import statistics
+import sys
+import time
+
+from retorno.audio.config import load_audio_config
+from retorno.audio.manager import AudioManager, DeferredAudioManager
+
+
+def _eager() -> tuple[float, float]:
+    started = time.perf_counter()
+    manager = AudioManager(load_audio_config())
+    manager.prepare_session(True, True, "new_game", None)
+    manager.start(True, True, None)
+    manager.play_startup(True, "new_game")
+    prompt = time.perf_counter() - started
+    manager.shutdown()
+    return prompt, prompt
+
+
+def _deferred() -> tuple[float, float]:
+    started = time.perf_counter()
+    manager = DeferredAudioManager()
+    manager.prepare_session(True, True, "new_game", None)
+    manager.start(True, True, None)
+    manager.play_startup(True, "new_game")
+    prompt = time.perf_counter() - started
+    manager.ready.result(timeout=30.0)
+    ready = time.perf_counter() - started
+    manager.shutdown()
+    return prompt, ready
+
+
+def _disabled() -> tuple[float, float]:
+    started = time.perf_counter()
+    prompt = time.perf_counter() - started
+    return prompt, prompt
+
+
+def main() -> None:
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    for label, run in (("disabled", _disabled), ("eager", _eager), ("deferred", _deferred)):
+        samples = [run() for _ in range(repeats)]
+        prompt_ms = statistics.median(sample[0] for sample in samples) * 1000.0
+        ready_ms = statistics.median(sample[1] for sample in samples) * 1000.0
+        print(f"{label:>8}: prompt after {prompt_ms:8.2f} ms, audio ready after {ready_ms:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
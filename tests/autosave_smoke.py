@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from retorno.bootstrap import create_initial_state_sandbox
+from retorno.cli import repl
+from retorno.core.actions import Dock
+from retorno.core.engine import Engine
+from retorno.io.save_load import load_single_slot
+from retorno.runtime import autosave as autosave_module
+from retorno.runtime.loop import GameLoop
+
+
+def _wait_for(predicate, timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "Timed out waiting for autosave"
+        time.sleep(0.01)
+
+
+def main() -> None:
+    original_write = autosave_module.write_save
+    with TemporaryDirectory() as tmp_dir:
+        slot_path = Path(tmp_dir) / "slot.dat"
+        loop = GameLoop(Engine(), create_initial_state_sandbox())
+        lock_free_during_write: list[bool] = []
+
+        def _checked_write(snapshot):
+            lock_free_during_write.append(not loop._lock.locked())
+            return original_write(snapshot)
+
+        autosave_module.write_save = _checked_write
+        try:
+            service = loop.start_autosave(slot_path, interval_s=3600.0)
+
+            # Docking is a trigger event; ordinary ticks are not.
+            loop.step(1.0)
+            assert service.flush() and service.saves_written == 0
+            loop.apply_action(Dock(node_id=loop.state.world.current_node_id))
+            for _ in range(120):
+                loop.step(1.0)
+                if loop.state.ship.docked_node_id:
+                    break
+            assert loop.state.ship.docked_node_id
+            _wait_for(lambda: service.saves_written == 1)
+            assert service.last_error is None and service.last_path == slot_path.resolve()
+
+            # Requests made while the loop lock is busy coalesce into one save.
+            loop.step(1.0)
+            with loop.with_lock():
+                for _ in range(5):
+                    service.request()
+                time.sleep(0.05)
+            assert service.flush()
+            assert service.saves_written == 2, service.saves_written
+            assert lock_free_during_write and all(lock_free_during_write)
+
+            loaded = load_single_slot(slot_path)
+            assert loaded is not None and loaded.deltas_replayed == 1
+            assert loaded.state.clock.t == loop.state.clock.t
+            assert loaded.state.ship.docked_node_id == loop.state.ship.docked_node_id
+
+            # Waking from hibernation saves (shared by the REPL and Textual commands).
+            saves = service.saves_written
+            repl._execute_hibernate(loop, 0.001)
+            _wait_for(lambda: service.saves_written > saves)
+            assert service.flush()
+            loaded = load_single_slot(slot_path)
+            assert loaded is not None and loaded.state.clock.t == loop.state.clock.t
+
+            # The interval alone also saves.
+            saves = service.saves_written
+            loop.step(1.0)
+            service.interval_s = 0.05
+            service.request()
+            _wait_for(lambda: service.saves_written >= saves + 2)
+            loop.stop_autosave()
+            assert loop.autosave is None and not service._thread.is_alive()
+        finally:
+            autosave_module.write_save = original_write
+            loop.stop_autosave()
+    print("AUTOSAVE SMOKE PASSED")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import copy
+import json
+import os
+import pickle
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from retorno.runtime.content_catalog import ContentCatalog
+from retorno.runtime.data_loader import content_catalog_stats, load_locations, load_modules
+
+
+def _assert_readonly(value, label: str) -> None:
+    try:
+        value["smoke"] = 1
+    except TypeError:
+        return
+    raise AssertionError(f"Expected {label} to be read-only")
+
+
+def main() -> None:
+    first = load_modules()
+    before = content_catalog_stats()
+    second = load_modules()
+    after = content_catalog_stats()
+    assert first is second, "Expected cached modules view to be reused"
+    assert after["hits"] == before["hits"] + 1, (before, after)
+    assert after["misses"] == before["misses"], (before, after)
+    _assert_readonly(first, "modules catalog")
+
+    locations = load_locations()
+    assert locations is load_locations(), "Expected cached locations view to be reused"
+    copied = [dict(loc) for loc in locations]
+    copied[0]["smoke"] = True
+    restored = pickle.loads(pickle.dumps(locations[0]))
+    assert type(restored) is dict, type(restored)
+    assert type(copy.deepcopy(locations[0])) is dict
+
+    with TemporaryDirectory() as tmp_dir:
+        catalog = ContentCatalog()
+        path = Path(tmp_dir) / "entry.json"
+        path.write_text(json.dumps({"value": 1}), encoding="utf-8")
+        v1 = catalog.json_file(path)
+        assert catalog.json_file(path) is v1
+        assert catalog.stats()["hits"] == 1 and catalog.stats()["misses"] == 1, catalog.stats()
+
+        path.write_text(json.dumps({"value": 22}), encoding="utf-8")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        v2 = catalog.json_file(path)
+        assert v2 is not v1 and v2["value"] == 22, v2
+        assert catalog.stats()["misses"] == 2, catalog.stats()
+
+    print("CONTENT CATALOG SMOKE PASSED")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import copy
+import io
+from contextlib import redirect_stdout
+
+from retorno.bootstrap import create_initial_state_sandbox
+from retorno.cli import repl
+from retorno.config.balance import Balance
+from retorno.core.engine import Engine
+from retorno.model.drones import DroneStatus, compute_drone_effective_profile
+from retorno.runtime.data_loader import load_modules
+from retorno.runtime.loop import GameLoop
+
+# Documented Engine.advance tolerance against 1-second stepping.
+_VALUE_TOL = 1e-3
+
+
+class _CountingEngine(Engine):
+    def __init__(self) -> None:
+        self.ticks = 0
+
+    def tick(self, state, dt):
+        self.ticks += 1
+        return super().tick(state, dt)
+
+
+def _assert_matches_stepping() -> None:
+    engine = Engine()
+    base = create_initial_state_sandbox()
+    engine.tick(base, 1.0)
+    stepped = copy.deepcopy(base)
+    advanced = copy.deepcopy(base)
+
+    total_s = 2 * 60 * 60
+    for _ in range(total_s):
+        engine.tick(stepped, 1.0)
+    counting = _CountingEngine()
+    counting.advance(advanced, float(total_s))
+
+    assert abs(advanced.clock.t - stepped.clock.t) < 1e-6, (advanced.clock.t, stepped.clock.t)
+    assert counting.ticks < total_s // 100, counting.ticks
+    soc_a = advanced.ship.power.e_batt_kwh / advanced.ship.power.e_batt_max_kwh
+    soc_s = stepped.ship.power.e_batt_kwh / stepped.ship.power.e_batt_max_kwh
+    assert abs(soc_a - soc_s) < _VALUE_TOL, (soc_a, soc_s)
+    assert abs(advanced.ship.hull_integrity - stepped.ship.hull_integrity) < _VALUE_TOL
+    for system_id, system in stepped.ship.systems.items():
+        other = advanced.ship.systems[system_id]
+        assert abs(other.health - system.health) < _VALUE_TOL, (system_id, other.health, system.health)
+        assert other.state == system.state, (system_id, other.state, system.state)
+
+
+def _assert_hibernate_wakes_on_drone_battery() -> None:
+    state = create_initial_state_sandbox()
+    engine = _CountingEngine()
+    loop = GameLoop(engine, state)
+    loop.step(1.0)
+
+    # Slow drain so the wake lands a few weeks out.
+    Balance.DRONE_BATTERY_IDLE_DRAIN_DEPLOYED_PER_S = 1.0e-7
+    drone = next(iter(state.ship.drones.values()))
+    drone.status = DroneStatus.DEPLOYED
+    drone.autorecall_enabled = False
+    battery_max = compute_drone_effective_profile(drone, load_modules()).battery_max_effective
+    drone.battery = battery_max * (Balance.DRONE_LOW_BATTERY_THRESHOLD + 0.25)
+    drone.low_battery_warned = False
+    expected_wake_t = state.clock.t + (
+        drone.battery - Balance.DRONE_LOW_BATTERY_THRESHOLD * battery_max
+    ) / Balance.DRONE_BATTERY_IDLE_DRAIN_DEPLOYED_PER_S
+
+    engine.ticks = 0
+    with redirect_stdout(io.StringIO()):
+        result = repl._execute_hibernate(loop, years=1.0, wake_on_low_battery=True)
+
+    assert result.woke_early and result.wake_reason == "event:drone_low_battery", result.wake_reason
+    assert abs(state.clock.t - expected_wake_t) <= Balance.ADVANCE_MIN_STEP_S, (state.clock.t, expected_wake_t)
+    hourly_ticks = (expected_wake_t - 1.0) / Balance.HIBERNATE_WAKE_CHECK_S
+    assert engine.ticks < hourly_ticks, (engine.ticks, hourly_ticks)
+
+
+def main() -> None:
+    _assert_matches_stepping()
+    original_drain = Balance.DRONE_BATTERY_IDLE_DRAIN_DEPLOYED_PER_S
+    try:
+        _assert_hibernate_wakes_on_drone_battery()
+    finally:
+        Balance.DRONE_BATTERY_IDLE_DRAIN_DEPLOYED_PER_S = original_drain
+    print("ENGINE ADVANCE SMOKE PASSED")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import pickle
+import random
+
+from retorno.bootstrap import create_initial_state_prologue
+from retorno.core.lore import mount_projection_breakdown, project_mountable_data_paths
+from retorno.model.os import FSNode, FSNodeType, list_dir, mount_files, normalize_path
+
+
+def _scan(fs, dir_path: str) -> list[str]:
+    # Flat-dict path of list_dir: scans every entry.
+    return list_dir(dict(fs.items()), dir_path)
+
+
+def _all_dirs(fs) -> set[str]:
+    dirs = {"/"}
+    for path in fs:
+        parts = path.strip("/").split("/")
+        for depth in range(1, len(parts)):
+            dirs.add("/" + "/".join(parts[:depth]))
+        dirs.add(path)
+    return dirs
+
+
+def _assert_matches_scan(fs) -> None:
+    for dir_path in sorted(_all_dirs(fs)) + ["/missing", "/mail/inbox/"]:
+        assert list_dir(fs, dir_path) == _scan(fs, dir_path), dir_path
+
+
+def _assert_index_tracks_edits() -> None:
+    state = create_initial_state_prologue()
+    fs = state.os.fs
+    _assert_matches_scan(fs)
+    rng = random.Random(7)
+    pool = ["/remote/N1/logs/a.txt", "/remote/N1/mail/inbox/b.en.txt", "/logs/nav/x.txt", "/data/deep/er/file.txt"]
+    pool += rng.sample(sorted(fs), 20)
+    for _ in range(300):
+        path = rng.choice(pool)
+        if path in fs and rng.random() < 0.5:
+            del fs[path]
+        else:
+            fs[path] = FSNode(path=path, node_type=FSNodeType.FILE, content="x")
+        _assert_matches_scan(fs)
+
+    # The index is not saved; a loaded fs and a wholesale overlay swap rebuild it.
+    clone = pickle.loads(pickle.dumps(fs))
+    assert clone._children is None
+    _assert_matches_scan(clone)
+    clone.overlay = {"/tmp/only.txt": FSNode(path="/tmp/only.txt", node_type=FSNodeType.FILE)}
+    assert list_dir(clone, "/tmp") == ["only.txt"]
+    _assert_matches_scan(clone)
+
+    fs["//logs//odd/"] = FSNode(path="/logs/odd", node_type=FSNodeType.DIR)
+    assert "/logs/odd" in fs.overlay and "odd" in list_dir(fs, "/logs")
+
+
+def _assert_mount_paths() -> None:
+    state = create_initial_state_prologue()
+    files = [
+        {"path": "logs/a.txt", "content": "a"},
+        {"path": "/mail//inbox/b.en.txt/", "content": "b"},
+        {"path": "/etc/passwd", "content": "skip"},
+        {"path": "", "content": "skip"},
+    ]
+    root = normalize_path("/remote/N9")
+    assert project_mountable_data_paths(state.os.fs, root, files) == ["/remote/N9/logs/a.txt", "/remote/N9/mail/inbox/b.en.txt"]
+    assert mount_files(state.os.fs, root, files) == 2
+    assert list_dir(state.os.fs, "/remote/N9/mail/inbox") == ["b.en.txt"]
+    new, existing, total = mount_projection_breakdown(state.os.fs, root, files)
+    assert not new and existing == total and len(total) == 2
+
+
+def main() -> None:
+    _assert_index_tracks_edits()
+    _assert_mount_paths()
+    print("FS DIR INDEX SMOKE PASSED")
+
+
+if __name__ == "__main__":
+    main()
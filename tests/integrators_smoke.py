@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import copy
+import math
+
+from retorno.bootstrap import create_initial_state_sandbox
+from retorno.config.balance import Balance
+from retorno.core.engine import Engine
+from retorno.core.integrators import ContinuousProfile, time_to_reach
+from retorno.model.drones import DroneStatus
+from retorno.model.systems import SystemState
+
+
+def _transit_state():
+    state = create_initial_state_sandbox()
+    for system_id in ("power_core", "energy_distribution"):
+        state.ship.systems[system_id].state = SystemState.NOMINAL
+        state.ship.systems[system_id].health = 1.0
+    state.ship.power.p_gen_base_kw = 20.0
+    state.ship.power.e_batt_kwh = state.ship.power.e_batt_max_kwh
+    from_id = state.world.current_node_id
+    to_id = next(node_id for node_id in state.world.space.nodes if node_id != from_id)
+    state.world.space.nodes[from_id].radiation_rad_per_s = 0.0005
+    state.world.space.nodes[to_id].radiation_rad_per_s = 0.0025
+    state.ship.in_transit = True
+    state.ship.transit_from = from_id
+    state.ship.transit_to = to_id
+    state.ship.transit_start_t = state.clock.t
+    state.ship.arrival_t = state.clock.t + 60 * Balance.DAY_S
+    drone = next(iter(state.ship.drones.values()))
+    drone.status = DroneStatus.DEPLOYED
+    drone.battery = 1.0e6
+    return state
+
+
+def _assert_tick_independent_of_dt() -> None:
+    engine = Engine()
+    one_shot = _transit_state()
+    chunked = copy.deepcopy(one_shot)
+    span_s = 30 * Balance.DAY_S
+
+    engine.tick(one_shot, span_s)
+    for _ in range(30):
+        engine.tick(chunked, Balance.DAY_S)
+
+    assert abs(one_shot.ship.hull_integrity - chunked.ship.hull_integrity) < 1e-12
+    assert abs(one_shot.ship.power.e_batt_kwh - chunked.ship.power.e_batt_kwh) < 1e-9
+    for system_id, system in one_shot.ship.systems.items():
+        other = chunked.ship.systems[system_id]
+        assert abs(system.health - other.health) < 1e-9, (system_id, system.health, other.health)
+    dose_a = next(iter(one_shot.ship.drones.values())).dose_rad
+    dose_b = next(iter(chunked.ship.drones.values())).dose_rad
+    # Dose is the integral of the linear transit ramp: exact regardless of dt.
+    assert abs(dose_a - dose_b) < 1e-9 * max(1.0, dose_a), (dose_a, dose_b)
+
+
+def _assert_crossing_times() -> None:
+    assert time_to_reach(1.0, -0.25, 0.0) == 4.0
+    assert math.isinf(time_to_reach(1.0, 0.25, 0.0))
+
+    profile = ContinuousProfile(
+        span_s=1000.0,
+        e0_kwh=5.0,
+        e_max_kwh=10.0,
+        e_rate_kwh_s=-0.01,
+        quality_const=0.4,
+        env_from=0.001,
+        env_to=0.003,
+        env_ramp_start_s=0.0,
+        env_ramp_end_s=1000.0,
+        hull0=1.0,
+        hull_decay_per_s=0.0,
+    )
+    # SoC reaches zero at 500 s and the battery stays empty afterwards.
+    assert abs(profile.energy_at(500.0)) < 1e-12
+    assert profile.energy_at(900.0) == 0.0
+    # Power quality drops from 1.0 to 0.4 between SoC 0.5 and 0.1 (t = 0..400 s).
+    crossing = profile.first_crossing(profile.power_quality_at, 0.7)
+    assert abs(crossing - 200.0) < 1e-6, crossing
+    # Ambient radiation ramps linearly, so its integral is the trapezoid area.
+    assert abs(profile.integral(profile.env_at) - 2.0) < 1e-12
+    dose_t = profile.time_to_integral(profile.env_at, 1.0)
+    expected = (-0.001 + math.sqrt(0.001**2 + 4 * 1e-6 * 1.0)) / (2 * 1e-6)
+    assert abs(dose_t - expected) < 1e-6, (dose_t, expected)
+
+
+def main() -> None:
+    _assert_tick_independent_of_dt()
+    _assert_crossing_times()
+    print("INTEGRATORS SMOKE PASSED")
+
+
+if __name__ == "__main__":
+    main()
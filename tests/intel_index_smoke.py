@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import copy
+import io
+import pickle
+from contextlib import redirect_stdout
+
+from retorno.bootstrap import create_initial_state_sandbox
+from retorno.cli import repl
+from retorno.cli.parser import ParseError, parse_command
+from retorno.model.world import IntelItem, record_intel
+
+
+def _import_many(state, count: int) -> None:
+    for idx in range(count):
+        record_intel(
+            state.world,
+            t=float(idx),
+            kind="link",
+            confidence=0.8,
+            source_kind="nav_fragment" if idx % 2 else "mail",
+            from_id=f"SRC_{idx % 50}",
+            to_id=f"DST_{idx}",
+        )
+
+
+def main() -> None:
+    state = create_initial_state_sandbox()
+    state.world.intel.clear()
+    _import_many(state, 5000)
+    assert len(state.world.intel) == 5000
+    # Same keys again are all rejected, whatever the source.
+    _import_many(state, 5000)
+    assert len(state.world.intel) == 5000
+    assert record_intel(state.world, t=0.0, kind="node", confidence=1.0, source_kind="scan", to_id="DST_7")
+    assert record_intel(state.world, t=0.0, kind="node", confidence=1.0, source_kind="scan", to_id="DST_7") is None
+
+    index = state.world.indexed_intel()
+    assert [item.kind for item in index.by_to_id["DST_7"]] == ["link", "node"]
+    assert len(index.by_source_kind["mail"]) == 2500
+
+    # The index is not saved; a loaded or copied state rebuilds it on first use.
+    for loaded in (pickle.loads(pickle.dumps(state)), copy.deepcopy(state)):
+        assert not loaded.world.intel_index.keys
+        assert record_intel(loaded.world, t=1.0, kind="link", confidence=0.5, source_kind="mail", from_id="SRC_1", to_id="DST_1") is None
+        assert len(loaded.world.indexed_intel().keys) == len(loaded.world.intel)
+
+    # Items appended directly are indexed on the next lookup.
+    state.world.intel.append(
+        IntelItem(intel_id="I9999", t=2.0, kind="sector", sector_id="S+001_+001_+000", source_kind="manual")
+    )
+    assert record_intel(state.world, t=3.0, kind="sector", confidence=1.0, source_kind="scan", sector_id="S+001_+001_+000") is None
+
+    out = io.StringIO()
+    with redirect_stdout(out):
+        repl.render_intel_show(state, "i9999")
+        _, to_id, source_kind = parse_command("intel to DST_7 source scan")
+        repl.render_intel_list(state, None, to_id=to_id, source_kind=source_kind)
+    text = out.getvalue()
+    assert "kind: sector" in text, text
+    assert "DST_7" in text and "DST_70" not in text, text
+    assert parse_command("intel source mail") == ("INTEL_FILTER", None, "mail")
+    for bad in ("intel to", "intel to A to B", "intel source mail show I1"):
+        try:
+            parse_command(bad)
+        except ParseError:
+            pass
+        else:
+            raise AssertionError(bad)
+    print("INTEL INDEX SMOKE PASSED")
+
+
+if __name__ == "__main__":
+    main()
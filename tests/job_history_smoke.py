@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import io
+import pickle
+from contextlib import redirect_stdout
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from retorno.bootstrap import create_initial_state_prologue
+from retorno.cli import repl
+from retorno.config.balance import Balance
+from retorno.core.engine import Engine
+from retorno.io.save_load import SaveLoadError, load_job_archive, load_single_slot, save_single_slot
+from retorno.model.jobs import (
+    Job,
+    JobManagerState,
+    JobStatus,
+    JobType,
+    allocate_job_ids,
+    finalize_job,
+    find_job_key,
+    running_jobs_power_kw,
+)
+
+
+def _enqueue(jobs_state: JobManagerState, *, power_kw: float = 0.0) -> Job:
+    job_key, job_id = allocate_job_ids(jobs_state)
+    job = Job(
+        job_id=job_id,
+        job_type=JobType.CARGO_AUDIT,
+        status=JobStatus.QUEUED,
+        eta_s=10.0,
+        power_draw_kw=power_kw,
+        internal_id=job_key,
+    )
+    jobs_state.jobs[job_key] = job
+    jobs_state.active_job_ids.append(job_key)
+    return job
+
+
+def _finish_jobs(jobs_state: JobManagerState, count: int) -> None:
+    for idx in range(count):
+        job = _enqueue(jobs_state, power_kw=0.25)
+        finalize_job(jobs_state, job.internal_id, JobStatus.COMPLETED if idx % 3 else JobStatus.FAILED)
+
+
+def _assert_history_is_bounded() -> None:
+    jobs_state = JobManagerState()
+    running = _enqueue(jobs_state, power_kw=1.5)
+    running.status = JobStatus.RUNNING
+    _finish_jobs(jobs_state, 500)
+    jobs_state.pending_archive.clear()
+    size_early = len(pickle.dumps(jobs_state))
+    _finish_jobs(jobs_state, 2500)
+    jobs_state.pending_archive.clear()
+    # Saved history stays flat however long the campaign runs.
+    assert len(pickle.dumps(jobs_state)) < size_early * 1.1
+
+    limit = Balance.JOB_HISTORY_MAX
+    assert len(jobs_state.history_job_ids) == limit
+    assert len(jobs_state.jobs) == limit + 1
+    assert jobs_state.archived_job_count == 3000 - limit
+    assert list(jobs_state.active_job_ids) == [running.internal_id]
+    assert running_jobs_power_kw(jobs_state) == 1.5
+
+    newest = jobs_state.jobs[jobs_state.history_job_ids[-1]]
+    assert find_job_key(jobs_state, newest.job_id) == newest.internal_id
+    assert find_job_key(jobs_state, running.job_id) == running.internal_id
+    assert find_job_key(jobs_state, "CJ1") is None
+    # A fresh index answers misses without rebuilding; a new display id marks it stale.
+    index = jobs_state.display_index
+    assert not index.stale and find_job_key(jobs_state, "CJ1") is None
+    assert jobs_state.display_index is index
+    queued = _enqueue(jobs_state)
+    assert find_job_key(jobs_state, queued.job_id) == queued.internal_id
+    assert jobs_state.display_index is not index and not jobs_state.display_index.stale
+    restored = pickle.loads(pickle.dumps(jobs_state))
+    assert restored.display_index.stale and find_job_key(restored, newest.job_id) == newest.internal_id
+
+
+def _assert_legacy_save_is_trimmed() -> None:
+    legacy = JobManagerState()
+    for idx in range(1, 501):
+        key = f"JOB{idx}"
+        legacy.jobs[key] = Job(
+            job_id=f"CJ{idx}",
+            job_type=JobType.SCAN,
+            status=JobStatus.COMPLETED,
+            eta_s=0.0,
+            internal_id=key,
+            terminal_seq=idx,
+        )
+    state = {name: getattr(legacy, name) for name in ("jobs", "next_job_seq", "next_active_job_seq", "next_terminal_job_seq")}
+    state["active_job_ids"] = []
+    migrated = JobManagerState.__new__(JobManagerState)
+    migrated.__setstate__((None, state))
+    assert len(migrated.jobs) == Balance.JOB_HISTORY_MAX
+    assert migrated.history_job_ids[-1] == "JOB500"
+    assert migrated.archived_job_count == 500 - Balance.JOB_HISTORY_MAX
+
+
+def _assert_engine_and_save() -> None:
+    state = create_initial_state_prologue()
+    engine = Engine()
+    for _ in range(Balance.JOB_HISTORY_MAX + 50):
+        job = _enqueue(state.jobs)
+        finalize_job(state.jobs, job.internal_id, JobStatus.COMPLETED)
+    engine.tick(state, 1.0)
+    assert len(state.jobs.jobs) <= Balance.JOB_HISTORY_MAX + len(state.jobs.active_job_ids)
+
+    out = io.StringIO()
+    with redirect_stdout(out):
+        repl.render_jobs(state, limit=None)
+    assert "50 older jobs archived" in out.getvalue(), out.getvalue()
+
+    with TemporaryDirectory() as tmp_dir:
+        slot_path = Path(tmp_dir) / "slot.dat"
+        # A save that fails does not archive the jobs it would have dropped.
+        blocker = Path(tmp_dir) / "slot.dat.tmp"
+        blocker.mkdir()
+        try:
+            save_single_slot(state, slot_path)
+        except SaveLoadError:
+            pass
+        else:
+            raise AssertionError("save through a directory should fail")
+        blocker.rmdir()
+        assert load_job_archive(slot_path) == []
+
+        save_single_slot(state, slot_path)
+        assert not state.jobs.pending_archive
+        records = load_job_archive(slot_path)
+        assert len(records) == 50 and records[0]["job_id"] == "CJ1", records[:1]
+        save_single_slot(state, slot_path)
+        assert len(load_job_archive(slot_path)) == 50
+        loaded = load_single_slot(slot_path)
+        assert loaded is not None
+        assert list(loaded.state.jobs.history_job_ids) == list(state.jobs.history_job_ids)
+
+
+def main() -> None:
+    _assert_history_is_bounded()
+    _assert_legacy_save_is_trimmed()
+    _assert_engine_and_save()
+    print("JOB HISTORY SMOKE PASSED")
+
+
+if __name__ == "__main__":
+    main()
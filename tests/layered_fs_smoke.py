@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import pickle
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from retorno.bootstrap import create_initial_state_prologue
+from retorno.core.lore import deliver_captured_signal
+from retorno.io.save_load import append_save_delta, load_single_slot, save_single_slot
+from retorno.model.os import FSNode, FSNodeType, LayeredFS, OSState, list_dir, read_file
+
+_MANUAL = "/manuals/commands/about.en.txt"
+
+
+def _assert_layers() -> None:
+    state = create_initial_state_prologue()
+    fs = state.os.fs
+    assert isinstance(fs, LayeredFS) and not fs.overlay, "A new game starts with an empty overlay"
+    assert _MANUAL in fs and fs[_MANUAL].content
+    assert "about.en.txt" in list_dir(fs, "/manuals/commands")
+    assert any(path.startswith("/mail/inbox/") for path in fs), "Ship mail comes from the base layer"
+    assert read_file(fs, _MANUAL, state.os.auth_levels) == fs.base[_MANUAL].content
+
+    path = deliver_captured_signal(state, "lore/archive_01/logs/last_signal.en.txt", "en")
+    assert list(fs.overlay) == ["/logs/signals", path]
+    del fs[_MANUAL]
+    assert _MANUAL not in fs and _MANUAL in fs.whiteouts and _MANUAL not in list(fs)
+    try:
+        fs[_MANUAL]
+    except KeyError:
+        pass
+    else:
+        raise AssertionError("Whiteout must hide the base entry")
+    assert len(fs) == len(dict(fs.items()))
+
+    # Saves hold the overlay and whiteouts only; the base is resolved again on load.
+    blob = pickle.dumps(state)
+    assert fs.base["/manuals/commands/alerts.en.txt"].content.encode("utf-8") not in blob
+    clone = pickle.loads(blob)
+    assert clone.os.fs == fs and clone.os.fs.whiteouts == {_MANUAL}
+    fs[_MANUAL] = FSNode(path=_MANUAL, node_type=FSNodeType.FILE, content="patched")
+    assert _MANUAL not in fs.whiteouts and fs[_MANUAL].content == "patched"
+
+
+def _assert_legacy_migration() -> None:
+    base = create_initial_state_prologue().os.fs.base
+    legacy_fs = {path: FSNode(path=node.path, node_type=node.node_type, content="old text", access=node.access) for path, node in base.items()}
+    legacy_fs["/mail/inbox/9999.en.txt"] = FSNode(path="/mail/inbox/9999.en.txt", node_type=FSNodeType.FILE, content="kept")
+    migrated = OSState.__new__(OSState)
+    migrated.__setstate__((None, {"fs": legacy_fs}))
+    assert isinstance(migrated.fs, LayeredFS)
+    assert list(migrated.fs.overlay) == ["/mail/inbox/9999.en.txt"]
+    assert migrated.fs[_MANUAL].content == base[_MANUAL].content, "Manuals come from the current data files"
+
+
+def _assert_delta_saves() -> None:
+    state = create_initial_state_prologue()
+    with TemporaryDirectory() as tmp_dir:
+        slot_path = Path(tmp_dir) / "slot.dat"
+        save_single_slot(state, slot_path)
+        del state.os.fs[_MANUAL]
+        deliver_captured_signal(state, "lore/archive_01/logs/last_signal.en.txt", "en")
+        append_save_delta(state, slot_path)
+        loaded = load_single_slot(slot_path)
+        assert loaded is not None and loaded.deltas_replayed == 1
+        fs = loaded.state.os.fs
+        assert fs.whiteouts == {_MANUAL} and fs.overlay.keys() == state.os.fs.overlay.keys()
+        assert fs == state.os.fs
+
+
+def main() -> None:
+    _assert_layers()
+    _assert_legacy_migration()
+    _assert_delta_saves()
+    print("LAYERED FS SMOKE PASSED")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from retorno.bootstrap import create_initial_state_sandbox
+from retorno.core import lore
+from retorno.worldgen.generator import ensure_sector_generated
+
+
+def _reference_candidates(state, piece_entry: dict) -> list[str]:
+    # The per-(piece, node) loop before evaluation caching.
+    authored = lore._location_node_ids()
+    rules = piece_entry.get("placement_rules") or {}
+    avoid_ids = set(str(x) for x in (rules.get("avoid_node_ids") or []))
+    require_kinds = set(str(x) for x in (rules.get("require_kind_any") or []))
+    candidates_cfg = set(str(x) for x in (rules.get("candidates") or []))
+    max_hops = int(rules.get("max_hops_from_start", 0) or 0)
+    out = []
+    for node_id, pool in sorted(state.world.node_pools.items()):
+        node = state.world.space.nodes.get(node_id)
+        if not pool.window_open or pool.node_cleaned or node_id in avoid_ids or node is None:
+            continue
+        if require_kinds and node.kind not in require_kinds:
+            continue
+        if not lore._node_matches_candidates(node_id, node, candidates_cfg, authored):
+            continue
+        if max_hops > 0:
+            hop = lore._hop_distance_from_start(state, node_id, max_hops)
+            if hop is None or hop > max_hops:
+                continue
+        if not lore.piece_constraints_ok(piece_entry["piece"], lore.build_lore_context(state, node_id)):
+            continue
+        if not any(lore._channel_feasible_for_node(ch, node) for ch in piece_entry.get("channels", [])):
+            continue
+        out.append(node_id)
+    return out
+
+
+def _pieces_with_rules() -> list[dict]:
+    entries = list(lore.get_lore_piece_registry().entries)
+    kinds = (["station"], ["relay", "derelict"], ["ship", "station", "relay"], [])
+    for idx, kind_any in enumerate(kinds):
+        for hops in (0, 3):
+            entries.append(
+                {
+                    "piece_key": f"single:cache_test_{idx}_{hops}",
+                    "role": "single",
+                    "piece": {"constraints": {"min_dist_ly": 1.0} if idx % 2 else {}},
+                    "channels": ["salvage_data", "uplink_only"],
+                    "placement_rules": {"require_kind_any": kind_any, "max_hops_from_start": hops},
+                }
+            )
+    return entries
+
+
+def main() -> None:
+    state = create_initial_state_sandbox()
+    for sector_id in ("S+000_+000_+000", "S+001_+000_+000", "S+000_+001_+000"):
+        ensure_sector_generated(state, sector_id)
+    state.world.known_nodes |= set(state.world.space.nodes)
+    state.world.known_contacts |= set(state.world.space.nodes)
+    lore.sync_node_pools_for_known_nodes(state)
+    closed = sorted(state.world.node_pools)[:3]
+    for node_id in closed:
+        lore.close_window_on_orbit_entry(state, node_id)
+
+    assert lore._location_node_ids() is lore._location_node_ids()
+
+    calls: list[str] = []
+    original = lore.build_lore_context
+
+    def counting(state, node_id):
+        calls.append(node_id)
+        return original(state, node_id)
+
+    evaluation = lore._LoreEvaluation()
+    entries = _pieces_with_rules()
+    lore.build_lore_context = counting
+    try:
+        shared = [lore._candidate_nodes_for_piece(state, entry, evaluation) for entry in entries]
+    finally:
+        lore.build_lore_context = original
+    assert shared == [_reference_candidates(state, entry) for entry in entries]
+    assert any(shared) and not any(node_id in closed for found in shared for node_id in found)
+    assert len(calls) == len(set(calls)), "One LoreContext per node per pass"
+
+    # A closed window after pools_changed() drops the node from later pieces.
+    victim = evaluation.open_pool_nodes(state, set())[0]
+    lore.close_window_on_orbit_entry(state, victim)
+    evaluation.pools_changed()
+    assert victim not in evaluation.open_pool_nodes(state, set())
+    assert [lore._candidate_nodes_for_piece(state, entry, evaluation) for entry in entries] == [
+        _reference_candidates(state, entry) for entry in entries
+    ]
+    print("LORE EVALUATION CACHE SMOKE PASSED")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from retorno.bootstrap import create_initial_state_sandbox
+from retorno.config.balance import Balance
+from retorno.core import lore
+from retorno.core.engine import Engine
+from retorno.core.exploration_recovery import _drop_hidden_node
+from retorno.model.world import SpaceNode
+from retorno.worldgen.generator import ensure_sector_generated
+
+
+def _naive_hops(state, target_id: str, max_hops: int) -> int | None:
+    # The original per-call BFS.
+    nodes = state.world.space.nodes
+    start_id = lore._start_node_for_hops(state)
+    if start_id not in nodes or target_id not in nodes:
+        return None
+    visited = {start_id}
+    queue = [(start_id, 0)]
+    while queue:
+        nid, dist = queue.pop(0)
+        if nid == target_id:
+            return dist
+        if dist >= max_hops:
+            continue
+        for nxt in sorted(nodes[nid].links):
+            if nxt not in visited and nxt in nodes:
+                visited.add(nxt)
+                queue.append((nxt, dist + 1))
+    return None
+
+
+def _assert_matches_naive(state) -> None:
+    for max_hops in (1, 2, 4, 8):
+        for node_id in sorted(state.world.space.nodes):
+            assert lore._hop_distance_from_start(state, node_id, max_hops) == _naive_hops(state, node_id, max_hops), (node_id, max_hops)
+
+
+def main() -> None:
+    original = Balance.STATE_VERSIONS_DEBUG_ASSERT
+    Balance.STATE_VERSIONS_DEBUG_ASSERT = True
+    try:
+        state = create_initial_state_sandbox()
+        engine = Engine()
+        for _ in range(50):
+            engine.tick(state, 60.0)
+        _assert_matches_naive(state)
+        entry = state.versions.memo[lore._HOP_DISTANCES_MEMO_SLOT]
+        assert entry[3] == 8, "One map serves every bound up to the deepest one asked for"
+        lore._hop_distance_from_start(state, sorted(state.world.space.nodes)[0], 2)
+        assert state.versions.memo[lore._HOP_DISTANCES_MEMO_SLOT] is entry
+
+        # Worldgen, ad-hoc links and dropped nodes all invalidate the map.
+        revision = state.world.space.links_revision
+        ensure_sector_generated(state, "S+001_+001_+000")
+        _assert_matches_naive(state)
+        anchor = state.world.space.nodes[lore._start_node_for_hops(state)]
+        node = SpaceNode(node_id="HOP_TEST", name="Hop Test", kind="relay", x_ly=anchor.x_ly + 0.5, y_ly=anchor.y_ly, z_ly=anchor.z_ly)
+        node.links.add(anchor.node_id)
+        anchor.links.add(node.node_id)
+        state.world.space.nodes[node.node_id] = node
+        state.world.space.links_changed()
+        assert lore._hop_distance_from_start(state, "HOP_TEST", 2) == 1
+        _drop_hidden_node(state, "HOP_TEST")
+        assert lore._hop_distance_from_start(state, "HOP_TEST", 2) is None
+        _assert_matches_naive(state)
+        assert state.world.space.links_revision > revision
+    finally:
+        Balance.STATE_VERSIONS_DEBUG_ASSERT = original
+    print("LORE HOP DISTANCE SMOKE PASSED")
+
+
+if __name__ == "__main__":
+    main()
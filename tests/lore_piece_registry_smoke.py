@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import retorno.core.lore as lore_mod
+from retorno.bootstrap import create_initial_state_sandbox
+from retorno.core.lore import LorePieceRegistry, get_lore_piece_registry
+
+
+def main() -> None:
+    registry = get_lore_piece_registry()
+    assert registry is get_lore_piece_registry(), "Expected registry to be reused while content is unchanged"
+
+    arcs = [
+        {
+            "arc_id": "smoke_arc",
+            "primary_intel": {"id": "p1", "force": True, "force_policy": "hard", "line": "LINK: A -> B"},
+            "secondary_lore_docs": [
+                {"id": "d1", "force": False, "allowed_channels": ["salvage_data"]},
+                {"id": "d2", "force": True, "force_policy": "soft", "allowed_channels": ["ship_os_mail"]},
+            ],
+        }
+    ]
+    singles = [{"single_id": "s1", "channels": ["captured_signal"]}]
+    original_arcs = lore_mod.load_arcs
+    original_singles = lore_mod.load_singles
+    lore_mod.load_arcs = lambda: arcs
+    lore_mod.load_singles = lambda: singles
+    try:
+        custom = get_lore_piece_registry()
+        assert custom is not registry, "Expected registry rebuild when loader output changes"
+        assert custom is get_lore_piece_registry()
+    finally:
+        lore_mod.load_arcs = original_arcs
+        lore_mod.load_singles = original_singles
+
+    assert isinstance(custom, LorePieceRegistry)
+    assert set(custom.by_key) == {"arc:smoke_arc:p1", "arc:smoke_arc:d1", "arc:smoke_arc:d2", "single:s1"}
+    assert custom.by_role["secondary"] == ["arc:smoke_arc:d1", "arc:smoke_arc:d2"], custom.by_role
+    assert custom.by_force_policy == {"hard": ["arc:smoke_arc:p1"], "soft": ["arc:smoke_arc:d2"]}
+    assert custom.by_channel["captured_signal"] == ["arc:smoke_arc:p1", "single:s1"], custom.by_channel
+
+    state = create_initial_state_sandbox()
+    placements = state.world.lore_placements
+    placed = placements.piece_to_node
+    placed.clear()
+    placed["arc:smoke_arc:p1"] = "ECHO_7"
+    placements.placements_changed()
+    pending = custom.pending(state)
+    assert [e["piece_key"] for e in pending.forced()] == ["arc:smoke_arc:d2"]
+    assert [e["piece_key"] for e in pending.non_forced()] == ["arc:smoke_arc:d1", "single:s1"]
+    assert custom.pending(state) is pending, "Expected pending pieces to persist across ticks"
+
+    # Placements through the scheduler shrink the same pending set.
+    lore_mod.sync_node_pools_for_known_nodes(state)
+    assert lore_mod._assign_piece_to_node(state, custom.by_key["single:s1"], "ECHO_7")
+    assert custom.pending(state) is pending
+    assert [e["piece_key"] for e in pending.non_forced()] == ["arc:smoke_arc:d1"]
+    # Writes made elsewhere are picked up by a rebuild, including a swap that keeps the size.
+    placed["arc:smoke_arc:d2"] = "ECHO_7"
+    placements.placements_changed()
+    rebuilt = custom.pending(state)
+    assert rebuilt is not pending and rebuilt.forced() == []
+    del placed["arc:smoke_arc:d2"]
+    placed["arc:smoke_arc:d1"] = "ECHO_7"
+    placements.placements_changed()
+    swapped = custom.pending(state)
+    assert swapped is not rebuilt
+    assert [e["piece_key"] for e in swapped.forced()] == ["arc:smoke_arc:d2"] and swapped.non_forced() == []
+    # A set that missed a write is not patched by the next placement; it is rebuilt.
+    placed["arc:smoke_arc:d2"] = "ECHO_7"
+    placements.placements_changed()
+    del placed["arc:smoke_arc:d1"]
+    placements.placements_changed()
+    assert lore_mod._assign_piece_to_node(state, custom.by_key["arc:smoke_arc:d1"], "ECHO_7")
+    assert custom.pending(state) is not swapped
+
+    print("LORE PIECE REGISTRY SMOKE PASSED")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import pickle
+
+from retorno.bootstrap import create_initial_state_sandbox
+from retorno.config.balance import Balance
+from retorno.core.lore import (
+    mark_node_completion_dirty,
+    recompute_dirty_node_completion,
+    run_lore_scheduler_tick,
+)
+
+
+def main() -> None:
+    state = create_initial_state_sandbox()
+    run_lore_scheduler_tick(state)
+    assert not state.world.completion_dirty_nodes, state.world.completion_dirty_nodes
+
+    node_id = next(
+        nid
+        for nid, pool in sorted(state.world.node_pools.items())
+        if nid in state.world.space.nodes and pool.scrap_complete
+    )
+    node = state.world.space.nodes[node_id]
+    pool = state.world.node_pools[node_id]
+
+    node.salvage_scrap_available = 5
+    original_flag = Balance.LORE_COMPLETION_DEBUG_ASSERT
+    Balance.LORE_COMPLETION_DEBUG_ASSERT = True
+    try:
+        try:
+            recompute_dirty_node_completion(state)
+        except AssertionError as exc:
+            assert node_id in str(exc), exc
+        else:
+            raise AssertionError("Expected debug assertion for an unmarked completion change")
+
+        mark_node_completion_dirty(state, node_id)
+        recompute_dirty_node_completion(state)
+        assert pool.scrap_complete is False and pool.node_cleaned is False, pool
+        assert not state.world.completion_dirty_nodes
+    finally:
+        Balance.LORE_COMPLETION_DEBUG_ASSERT = original_flag
+
+    loaded = pickle.loads(pickle.dumps(state))
+    assert loaded.world.completion_dirty_nodes == set(loaded.world.node_pools), (
+        "Loaded saves should recompute every node pool once"
+    )
+
+    print("NODE COMPLETION DIRTY SMOKE PASSED")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import asyncio
+import os
+
+from textual.widgets import RichLog
+
+from retorno.bootstrap import create_initial_state_prologue
+from retorno.cli import repl
+from retorno.core.engine import Engine
+from retorno.core.gamestate import GameState
+from retorno.model.jobs import JobType, TargetRef
+from retorno.model.os import Locale
+from retorno.runtime.loop import GameLoop
+from retorno.ui_textual import presenter
+from retorno.ui_textual import app as textual_app
+from retorno.ui_textual.app import RetornoTextualApp
+
+
+def _legacy_status_lines(state) -> list[str]:
+    lines = presenter._capture_output(repl.render_status, state)
+    sys_lines = []
+    in_systems = False
+    for line in lines:
+        if line.strip().lower() == "systems:":
+            in_systems = True
+            continue
+        if in_systems and line.strip().startswith("-"):
+            compact = line.strip()[2:].replace("state=", "").replace("health=", "")
+            parts = [p for p in compact.split() if not (p.startswith("svc=") or p.startswith("running="))]
+            sys_lines.append(" ".join(parts))
+    return sys_lines if sys_lines else lines
+
+
+def _legacy_alerts_lines(state) -> list[str]:
+    return presenter._capture_output(repl.render_alerts, state)[1:]
+
+
+def _legacy_jobs_lines(state) -> list[str]:
+    lines = presenter._capture_output(repl.render_jobs, state)[1:]
+    if lines[0].strip().lower().startswith("active"):
+        lines[0] = "Active jobs (queued/running):"
+    else:
+        lines.insert(0, "Active jobs (queued/running):")
+    filtered = []
+    for line in lines:
+        if line.strip().lower().startswith("recent complete/failed"):
+            break
+        filtered.append(line)
+    return filtered
+
+
+def _assert_matches_stdout_render(state) -> None:
+    assert presenter.build_status_lines(state) == _legacy_status_lines(state)
+    assert presenter.build_alerts_lines(state) == _legacy_alerts_lines(state)
+    assert presenter.build_jobs_lines(state) == _legacy_jobs_lines(state)
+
+
+def _assert_model_matches_legacy_text() -> None:
+    engine = Engine()
+    state = create_initial_state_prologue()
+    _assert_matches_stdout_render(GameState())
+    _assert_matches_stdout_render(state)
+    for eta in (30.0, 40.0):
+        engine._enqueue_job(
+            state,
+            JobType.RECALL_DRONE,
+            TargetRef(kind="drone", id="D1"),
+            owner_id="D1",
+            eta_s=eta,
+            params={"drone_id": "D1", "emergency": eta > 35.0},
+        )
+    for locale in (Locale.EN, Locale.ES):
+        state.os.locale = locale
+        for _ in range(40):
+            engine.tick(state, 1.0)
+            _assert_matches_stdout_render(state)
+    model = presenter.build_panel_model(state)
+    assert all(isinstance(row, presenter.SystemRow) for row in model.status)
+    assert model.status[0].key == next(iter(state.ship.systems))
+
+
+def _assert_rows_memoized() -> None:
+    state = create_initial_state_prologue()
+    loop = GameLoop(Engine(), state)
+    status = presenter.build_status_rows(state)
+    jobs = presenter.build_jobs_rows(state)
+    with loop.with_lock(read_only=True):
+        pass
+    assert presenter.build_status_rows(state) is status
+    assert presenter.build_jobs_rows(state) is jobs
+    with loop.with_lock():
+        pass
+    assert presenter.build_status_rows(state) is not status
+    status = presenter.build_status_rows(state)
+    state.os.locale = Locale.ES
+    assert presenter.build_status_rows(state) is status
+    assert presenter.build_jobs_rows(state) is not jobs
+
+
+async def _run_app() -> None:
+    old_scenario = os.environ.get("RETORNO_SCENARIO")
+    try:
+        os.environ["RETORNO_SCENARIO"] = "sandbox"
+        app = RetornoTextualApp(force_new_game=True)
+        app.loop.state.os.debug_enabled = True
+        app.loop.state.os.audio.enabled = False
+        app.loop.state.os.audio.ambient_enabled = False
+        app._play_startup_sequence = False
+        app._startup_panel_blackout = False
+
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            app.refresh_panels()
+            jobs_widget = app.query_one("#jobs", RichLog)
+            status_widget = app.query_one("#status", RichLog)
+            status_strips = list(status_widget.lines)
+            status_rows = app._panel_rendered["status"].rows
+
+            # Nothing changed: no rebuild and no widget writes.
+            app.refresh_panels()
+            assert app._panel_rendered["status"].rows is status_rows
+            assert all(a is b for a, b in zip(status_widget.lines, status_strips))
+
+            with app.loop.with_lock() as state:
+                Engine()._enqueue_job(
+                    state,
+                    JobType.RECALL_DRONE,
+                    TargetRef(kind="drone", id="D1"),
+                    owner_id="D1",
+                    eta_s=30.0,
+                    params={"drone_id": "D1"},
+                )
+            app.refresh_panels()
+            assert app._panel_rendered["status"].rows is not status_rows
+            assert app._panel_rendered["jobs"].lines == tuple(presenter.build_jobs_lines(app.loop.state))
+            header_strip = jobs_widget.lines[0]
+            job_strips = len(jobs_widget.lines)
+
+            # A later change only rewrites rows after the first one that differs.
+            app.loop.step(1.0)
+            app.refresh_panels()
+            assert jobs_widget.lines[0] is header_strip
+            assert len(jobs_widget.lines) == job_strips
+            assert all(a is b for a, b in zip(status_widget.lines, status_strips[:1]))
+            rendered = app._panel_rendered["jobs"]
+            assert rendered.lines == tuple(presenter.build_jobs_lines(app.loop.state))
+            assert rendered.strip_counts is not None and sum(rendered.strip_counts) == len(jobs_widget.lines)
+
+            # Without the RichLog internals the panel falls back to a full rewrite.
+            real_truncate = textual_app._truncate_rich_log
+            textual_app._truncate_rich_log = lambda widget, keep_strips: False
+            try:
+                app.loop.step(1.0)
+                app.refresh_panels()
+            finally:
+                textual_app._truncate_rich_log = real_truncate
+            assert jobs_widget.lines[0] is not header_strip
+            rendered = app._panel_rendered["jobs"]
+            assert rendered.lines == tuple(presenter.build_jobs_lines(app.loop.state))
+            assert rendered.strip_counts is not None and sum(rendered.strip_counts) == len(jobs_widget.lines)
+    finally:
+        if old_scenario is None:
+            os.environ.pop("RETORNO_SCENARIO", None)
+        else:
+            os.environ["RETORNO_SCENARIO"] = old_scenario
+
+
+def main() -> None:
+    _assert_model_matches_legacy_text()
+    _assert_rows_memoized()
+    assert not textual_app._truncate_rich_log(object(), 0)
+    asyncio.run(_run_app())
+    print("PANEL MODEL SMOKE PASSED")
+
+
+if __name__ == "__main__":
+    main()
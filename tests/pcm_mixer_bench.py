@@ -0,0 +1,80 @@
+"""CPU time the PCM block mixer spends per second of mixed audio.
+
+Run with `PYTHONPATH=src python tests/pcm_mixer_bench.py [seconds]`. Voices are
+synthetic (no ffmpeg needed): one looping ambient bed with a crossfade, one
+looping music bed, and one-shot cues with fades for the rest.
+"""
+
+from __future__ import annotations
+
+import array
+import math
+import sys
+import time
+from pathlib import Path
+
+from retorno.audio.config import AudioCueConfig
+from retorno.audio.manager import PcmMixerAudioBackend, _DecodedCue, _PcmBlockMixer, _Voice
+
+_RATE = PcmMixerAudioBackend._OUTPUT_SAMPLE_RATE
+_CHANNELS = PcmMixerAudioBackend._OUTPUT_CHANNELS
+_CHUNK = PcmMixerAudioBackend._CHUNK_FRAMES
+
+
+def _decoded(seconds: float, freq_hz: float) -> _DecodedCue:
+    frames = int(seconds * _RATE)
+    step = 2.0 * math.pi * freq_hz / _RATE
+    samples = array.array("f", [0.0]) * (frames * _CHANNELS)
+    for idx in range(frames):
+        value = 0.4 * math.sin(idx * step)
+        samples[idx * _CHANNELS] = value
+        samples[idx * _CHANNELS + 1] = value
+    return _DecodedCue(samples=samples, frame_count=frames, sample_rate=_RATE, channels=_CHANNELS)
+
+
+def _voices(count: int, decoded: dict[str, _DecodedCue]) -> list[_Voice]:
+    voices: list[_Voice] = []
+    for idx in range(count):
+        if idx == 0:
+            cue = AudioCueConfig("hum", Path("hum.wav"), mode="loop", channel="ambient", fade_in_s=0.11, loop_crossfade_s=0.015)
+            voices.append(_Voice("ambient", cue, decoded["hum"], loop=True))
+        elif idx == 1:
+            cue = AudioCueConfig("track", Path("track.ogg"), mode="loop", channel="music", volume=0.6, fade_in_s=0.0)
+            voices.append(_Voice("music", cue, decoded["track"], loop=True))
+        else:
+            cue = AudioCueConfig("ping", Path("ping.wav"), channel="sfx", fade_in_s=0.003, fade_out_s=0.03)
+            voices.append(_Voice(f"sfx#{idx}", cue, decoded["ping"], loop=False))
+    return voices
+
+
+def _cpu_ms_per_audio_second(mixer: _PcmBlockMixer, voice_count: int, seconds: float, decoded) -> float:
+    chunks = max(1, int(seconds * _RATE / _CHUNK))
+    gains = {"ambient": 0.82, "music": 1.0, "sfx": 1.0}
+    voices = _voices(voice_count, decoded)
+    started = time.process_time()
+    for _ in range(chunks):
+        _, finished = mixer.mix(voices, gains)
+        if finished:
+            # Retrigger one-shots so the voice count stays constant.
+            for voice in voices:
+                if voice.channel in finished:
+                    voice.position_frames = 0
+    elapsed = time.process_time() - started
+    return elapsed * 1000.0 / (chunks * _CHUNK / _RATE)
+
+
+def main() -> None:
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    decoded = {"hum": _decoded(2.0, 60.0), "track": _decoded(8.0, 220.0), "ping": _decoded(0.4, 880.0)}
+    kernels = [("array", False)]
+    if _PcmBlockMixer(_RATE, _CHANNELS, _CHUNK).use_numpy:
+        kernels.append(("numpy", True))
+    for label, use_numpy in kernels:
+        mixer = _PcmBlockMixer(_RATE, _CHANNELS, _CHUNK, use_numpy=use_numpy)
+        for voice_count in (1, 4, 8):
+            ms = _cpu_ms_per_audio_second(mixer, voice_count, seconds, decoded)
+            print(f"{label:>5} voices={voice_count}: {ms:7.2f} ms CPU / s audio")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import array
+import copy
+import math
+from pathlib import Path
+
+from retorno.audio.config import AudioCueConfig
+from retorno.audio.manager import _DecodedCue, _PcmBlockMixer, _Voice
+
+_RATE = 1000
+_CHUNK = 64
+
+
+def _decoded(frames: int, freq: float, amp: float = 0.9) -> _DecodedCue:
+    samples = array.array("f")
+    for idx in range(frames):
+        samples.append(amp * math.sin(idx * freq))
+        samples.append(amp * math.cos(idx * freq * 0.5))
+    return _DecodedCue(samples=samples, frame_count=frames, sample_rate=_RATE, channels=2)
+
+
+def _voices() -> list[_Voice]:
+    def cue(cue_id: str, **kwargs) -> AudioCueConfig:
+        return AudioCueConfig(cue_id=cue_id, path=Path(f"{cue_id}.wav"), **kwargs)
+
+    return [
+        _Voice("ambient", cue("hum", mode="loop", channel="ambient", volume=0.8, fade_in_s=0.09, loop_crossfade_s=0.02), _decoded(150, 0.21), True),
+        _Voice("music", cue("track", mode="loop", channel="music", volume=0.6, fade_in_s=0.0, loop_crossfade_s=0.0), _decoded(97, 0.05), True),
+        _Voice("sfx#0", cue("ping", channel="sfx", volume=1.0, fade_in_s=0.005, fade_out_s=0.03), _decoded(140, 0.7), False),
+        _Voice("sfx#1", cue("blip", channel="sfx", volume=1.0, fade_in_s=0.0, fade_out_s=0.0), _decoded(20, 1.3, amp=1.0), False),
+    ]
+
+
+def _reference_mix(voices: list[_Voice], channel_gains: dict[str, float]) -> tuple[bytes, set[str]]:
+    """The per-sample mixer the block mixer replaced, kept as the behavioral reference."""
+    mixed = [0.0] * (_CHUNK * 2)
+    finished: set[str] = set()
+    for voice in voices:
+        fade_in_frames = max(0, int(round(voice.cue.fade_in_s * _RATE)))
+        fade_out_frames = max(0, int(round(voice.cue.fade_out_s * _RATE)))
+        total_frames = voice.decoded.frame_count
+        loop_crossfade_frames = 0
+        if voice.loop:
+            loop_crossfade_frames = max(0, int(round(voice.cue.loop_crossfade_s * _RATE)))
+            loop_crossfade_frames = min(loop_crossfade_frames, max(0, total_frames // 2)) if total_frames > 1 else 0
+        rendered_frames = 0
+        for frame_idx in range(_CHUNK):
+            src_frame = voice.position_frames if voice.loop else voice.position_frames + frame_idx
+            if not voice.loop and src_frame >= total_frames:
+                finished.add(voice.channel)
+                break
+            gain = float(voice.cue.volume) * float(channel_gains.get(voice.channel.split("#", 1)[0], 1.0))
+            if fade_in_frames > 0:
+                age_frame = voice.played_frames_total + frame_idx if voice.loop else src_frame
+                if age_frame < fade_in_frames:
+                    gain *= age_frame / fade_in_frames
+            if not voice.loop and fade_out_frames > 0 and src_frame >= max(0, total_frames - fade_out_frames):
+                gain *= max(0.0, (total_frames - src_frame) / fade_out_frames)
+            left = voice.decoded.samples[src_frame * 2]
+            right = voice.decoded.samples[src_frame * 2 + 1]
+            if voice.loop and loop_crossfade_frames > 0 and src_frame >= total_frames - loop_crossfade_frames:
+                crossfade_idx = src_frame - (total_frames - loop_crossfade_frames)
+                progress = (crossfade_idx + 1) / (loop_crossfade_frames + 1)
+                wrap_base = min(crossfade_idx, total_frames - 1) * 2
+                left = (left * (1.0 - progress)) + (voice.decoded.samples[wrap_base] * progress)
+                right = (right * (1.0 - progress)) + (voice.decoded.samples[wrap_base + 1] * progress)
+            mixed[frame_idx * 2] += left * gain
+            mixed[frame_idx * 2 + 1] += right * gain
+            rendered_frames += 1
+            if voice.loop:
+                voice.position_frames += 1
+                if voice.position_frames >= total_frames:
+                    voice.position_frames = loop_crossfade_frames
+        if not voice.loop:
+            voice.position_frames += rendered_frames
+        voice.played_frames_total += rendered_frames
+        if not voice.loop and voice.position_frames >= total_frames:
+            finished.add(voice.channel)
+    clipped = [max(-1.0, min(1.0, sample)) for sample in mixed]
+    return array.array("f", clipped).tobytes(), finished
+
+
+def _assert_matches_reference(use_numpy: bool) -> None:
+    mixer = _PcmBlockMixer(_RATE, 2, _CHUNK, use_numpy=use_numpy)
+    if use_numpy and not mixer.use_numpy:
+        return
+    gains = {"sfx": 0.7, "music": 0.5}
+    expected_voices = _voices()
+    actual_voices = copy.deepcopy(expected_voices)
+    for _ in range(12):
+        expected, expected_done = _reference_mix(expected_voices, gains)
+        payload, done = mixer.mix(actual_voices, gains)
+        got = array.array("f", bytes(payload))
+        want = array.array("f", expected)
+        assert len(got) == len(want) == _CHUNK * 2
+        assert max(abs(a - b) for a, b in zip(got, want)) <= 1e-6
+        assert set(done) == expected_done, (done, expected_done)
+        for want_voice, got_voice in zip(expected_voices, actual_voices):
+            assert (got_voice.position_frames, got_voice.played_frames_total) == (
+                want_voice.position_frames,
+                want_voice.played_frames_total,
+            ), got_voice.channel
+        expected_voices = [voice for voice in expected_voices if voice.channel not in expected_done]
+        actual_voices = [voice for voice in actual_voices if voice.channel not in done]
+    assert [voice.channel for voice in actual_voices] == ["ambient", "music"]
+
+
+def main() -> None:
+    _assert_matches_reference(use_numpy=False)
+    _assert_matches_reference(use_numpy=True)
+    print("PCM MIXER SMOKE PASSED")
+
+
+if __name__ == "__main__":
+    main()
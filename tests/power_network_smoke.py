@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from retorno.bootstrap import create_initial_state_prologue
+from retorno.config.balance import Balance
+from retorno.core.engine import Engine
+from retorno.core.power_network import PowerNetwork, system_load_kw
+from retorno.model.events import EventType
+from retorno.model.jobs import Job, JobStatus, JobType, allocate_job_ids
+from retorno.model.systems import SystemState
+
+
+def _brute_load_kw(state) -> float:
+    job_kw = sum(
+        job.power_draw_kw for job in state.jobs.jobs.values() if job.status == JobStatus.RUNNING
+    )
+    return sum(system_load_kw(system, state.ship.op_mode) for system in state.ship.systems.values()) + job_kw
+
+
+def _assert_view_tracks_changes() -> None:
+    state = create_initial_state_prologue()
+    network = PowerNetwork(state)
+    assert network.p_load == _brute_load_kw(state)
+    assert not network.is_stale()
+
+    job_key, job_id = allocate_job_ids(state.jobs)
+    state.jobs.jobs[job_key] = Job(
+        job_id=job_id,
+        job_type=JobType.CARGO_AUDIT,
+        status=JobStatus.RUNNING,
+        eta_s=10.0,
+        power_draw_kw=0.75,
+        internal_id=job_key,
+    )
+    state.jobs.active_job_ids.append(job_key)
+    assert network.is_stale()
+    network.refresh()
+    assert network.p_load == _brute_load_kw(state)
+
+    powered = next(system for system in state.ship.systems.values() if system.state == SystemState.NOMINAL)
+    powered.state = SystemState.DAMAGED
+    assert network.is_stale()
+    network.refresh()
+    shed = network.shed_order()
+    assert [system.priority for system in shed] == sorted((system.priority for system in shed), reverse=True)
+    victim = next(system for system in shed if system.state != SystemState.OFFLINE and system.priority > 1)
+    network.take_offline(victim)
+    assert victim.forced_offline and victim.auto_offline_reason == "load_shed"
+    assert not network.is_stale()
+    assert network.p_load == _brute_load_kw(state)
+
+
+def _assert_tick_sheds_against_view() -> None:
+    state = create_initial_state_prologue()
+    engine = Engine()
+    state.ship.power.p_gen_base_kw = 0.0
+    state.ship.power.p_discharge_max_kw = 0.5
+    state.ship.power.e_batt_kwh = state.ship.power.e_batt_max_kwh * 0.05
+    shed_ids: list[str] = []
+    for _ in range(30):
+        for event in engine.tick(state, 5.0):
+            if event.type == EventType.SYSTEM_STATE_CHANGED and event.data.get("cause") == "load_shed":
+                shed_ids.append(event.source.id)
+    assert shed_ids, "deficit should shed load"
+    assert len(shed_ids) == len(set(shed_ids)), shed_ids
+    assert state.ship.power.p_load_kw == _brute_load_kw(state)
+
+
+def main() -> None:
+    original = Balance.POWER_NETWORK_DEBUG_ASSERT
+    Balance.POWER_NETWORK_DEBUG_ASSERT = True
+    try:
+        _assert_view_tracks_changes()
+        _assert_tick_sheds_against_view()
+    finally:
+        Balance.POWER_NETWORK_DEBUG_ASSERT = original
+    print("POWER NETWORK SMOKE PASSED")
+
+
+if __name__ == "__main__":
+    main()
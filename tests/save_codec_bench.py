@@ -0,0 +1,74 @@
+"""Save and load size/time per save codec on a synthetic late-game state.
+
+Run with `PYTHONPATH=src python tests/save_codec_bench.py [sectors]`. The state
+has a few hundred generated sectors worth of nodes and pools, authored logs
+in os.fs, a long intel list and a full job history.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from retorno.bootstrap import create_initial_state_sandbox
+from retorno.config.balance import Balance
+from retorno.core.lore import deliver_captured_signal, sync_node_pools_for_known_nodes
+from retorno.io.save_load import load_single_slot, save_single_slot
+from retorno.model.world import record_intel, sector_id_for_cell
+from retorno.runtime.data_loader import load_authored_texts
+from retorno.worldgen.generator import ensure_sector_generated
+
+
+def _late_game_state(radius: int):
+    state = create_initial_state_sandbox()
+    for x in range(-radius, radius + 1):
+        for y in range(-radius, radius + 1):
+            ensure_sector_generated(state, sector_id_for_cell((x, y, 0)))
+    world = state.world
+    world.known_nodes.update(world.space.nodes)
+    world.known_contacts.update(world.space.nodes)
+    sync_node_pools_for_known_nodes(state)
+    node_ids = sorted(world.space.nodes)
+    for idx, node_id in enumerate(node_ids):
+        record_intel(world, t=float(idx), kind="node", confidence=0.8, source_kind="log", to_id=node_id)
+        record_intel(world, t=float(idx), kind="link", confidence=0.6, source_kind="uplink", from_id=node_ids[idx - 1], to_id=node_id)
+    for content_ref, _ in sorted(load_authored_texts().values()):
+        for _ in range(3):
+            deliver_captured_signal(state, content_ref, "en")
+            state.events.next_event_seq += 1
+    return state
+
+
+def _measure(state, path: Path) -> tuple[int, float, float]:
+    started = time.perf_counter()
+    save_single_slot(state, path)
+    saved = time.perf_counter() - started
+    started = time.perf_counter()
+    loaded = load_single_slot(path)
+    load_s = time.perf_counter() - started
+    assert loaded is not None
+    return path.stat().st_size, saved, load_s
+
+
+def main() -> None:
+    radius = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    state = _late_game_state(radius)
+    print(
+        f"nodes={len(state.world.space.nodes)} pools={len(state.world.node_pools)} "
+        f"fs={len(state.os.fs)} intel={len(state.world.intel)}"
+    )
+    original = Balance.SAVE_CODEC
+    try:
+        with TemporaryDirectory() as tmp_dir:
+            for codec in (None, "zlib", "lzma"):
+                Balance.SAVE_CODEC = codec
+                size, save_s, load_s = _measure(state, Path(tmp_dir) / f"{codec or 'raw'}.dat")
+                print(f"{codec or 'raw':>5}: {size / 1024:9.1f} KiB  save {save_s * 1000:8.1f} ms  load {load_s * 1000:8.1f} ms")
+    finally:
+        Balance.SAVE_CODEC = original
+
+
+if __name__ == "__main__":
+    main()
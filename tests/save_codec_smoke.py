@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import pickle
+import zlib
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from retorno.bootstrap import create_initial_state_prologue
+from retorno.config.balance import Balance
+from retorno.core.engine import Engine
+from retorno.core.lore import deliver_captured_signal
+from retorno.io import save_load
+from retorno.io.save_load import SaveLoadError, append_save_delta, load_single_slot, save_single_slot
+from retorno.model.ship_layout import apply_retorno_canonical_layout
+from retorno.runtime.data_loader import load_authored_texts
+
+
+def _reference(state):
+    clone = pickle.loads(pickle.dumps(state))
+    apply_retorno_canonical_layout(clone)
+    return clone
+
+
+def _state_with_authored_text():
+    state = create_initial_state_prologue()
+    text, (content_ref, _) = max(load_authored_texts().items(), key=lambda item: len(item[0]))
+    path = deliver_captured_signal(state, content_ref, "en")
+    assert state.os.fs[path].content == text
+    return state, text
+
+
+def main() -> None:
+    original = (Balance.SAVE_CODEC, Balance.SAVE_MMAP_MIN_BYTES)
+    try:
+        with TemporaryDirectory() as tmp_dir:
+            state, text = _state_with_authored_text()
+            raw_path = Path(tmp_dir) / "raw.dat"
+            save_single_slot(state, raw_path)
+            assert raw_path.read_bytes().startswith(b"RETORNO_SAVE_V2\n")
+
+            for codec in ("zlib", "lzma"):
+                Balance.SAVE_CODEC = codec
+                slot_path = Path(tmp_dir) / f"{codec}.dat"
+                save_single_slot(state, slot_path)
+                raw = slot_path.read_bytes()
+                assert raw.startswith(b"RETORNO_SAVE_V3\n" + codec.encode() + b"\n"), raw[:40]
+                assert len(raw) < raw_path.stat().st_size / 2, (codec, len(raw), raw_path.stat().st_size)
+                if codec == "zlib":
+                    payload = zlib.decompress(raw.split(b"\n", 3)[3])
+                    assert text.encode("utf-8") not in payload, "Authored text must be stored by reference"
+
+                for mmap_min in (Balance.SAVE_MMAP_MIN_BYTES, 1):
+                    Balance.SAVE_MMAP_MIN_BYTES = mmap_min
+                    loaded = load_single_slot(slot_path)
+                    assert loaded is not None and loaded.state == _reference(state), (codec, mmap_min)
+
+                # Delta records stack on a compressed base.
+                Engine().tick(loaded.state, 5.0)
+                append_save_delta(loaded.state, slot_path)
+                replayed = load_single_slot(slot_path)
+                assert replayed is not None and replayed.deltas_replayed == 1
+                assert replayed.state == _reference(loaded.state)
+
+                # Corruption is caught by the checksum before decompressing; the backup still loads.
+                save_single_slot(replayed.state, slot_path)
+                corrupt = bytearray(slot_path.read_bytes())
+                corrupt[-10] ^= 0xFF
+                slot_path.write_bytes(bytes(corrupt))
+                recovered = load_single_slot(slot_path)
+                assert recovered is not None and recovered.source == "backup"
+                assert recovered.state == _reference(loaded.state)
+                Balance.SAVE_MMAP_MIN_BYTES = original[1]
+
+            # A save whose authored file has since changed loads the current text.
+            Balance.SAVE_CODEC = "zlib"
+            stale_path = Path(tmp_dir) / "stale.dat"
+            real_texts = save_load.load_authored_texts
+            save_load.load_authored_texts = lambda: {
+                stored: (content_ref, "0" * 64) for stored, (content_ref, _) in real_texts().items()
+            }
+            try:
+                save_single_slot(state, stale_path)
+            finally:
+                save_load.load_authored_texts = real_texts
+            stale = load_single_slot(stale_path)
+            assert stale is not None and stale.source == "primary"
+            assert stale.state == _reference(state)
+            assert stale.changed_content_refs and all(ref.endswith(".txt") for ref in stale.changed_content_refs)
+            fresh = load_single_slot(Path(tmp_dir) / "zlib.dat")
+            assert fresh is not None and fresh.changed_content_refs == ()
+
+            # A referenced file that no longer exists fails the load instead of blanking the text.
+            missing_path = Path(tmp_dir) / "missing.dat"
+            save_load.load_authored_texts = lambda: {
+                stored: ("gone/" + content_ref, digest) for stored, (content_ref, digest) in real_texts().items()
+            }
+            try:
+                save_single_slot(state, missing_path)
+            finally:
+                save_load.load_authored_texts = real_texts
+            try:
+                load_single_slot(missing_path)
+            except SaveLoadError as exc:
+                assert "missing" in str(exc), exc
+            else:
+                raise AssertionError("a save referencing a missing authored file must not load")
+
+            # The plain V2 format still loads, mapped or not.
+            Balance.SAVE_MMAP_MIN_BYTES = 1
+            loaded = load_single_slot(raw_path)
+            assert loaded is not None and loaded.state == _reference(state)
+    finally:
+        Balance.SAVE_CODEC, Balance.SAVE_MMAP_MIN_BYTES = original
+    print("SAVE CODEC SMOKE PASSED")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import pickle
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from retorno.bootstrap import create_initial_state_prologue
+from retorno.config.balance import Balance
+from retorno.core.actions import DroneDeploy
+from retorno.core.engine import Engine
+from retorno.core.versions import bump_versions
+from retorno.io.save_load import _read_delta_log, append_save_delta, capture_save, load_single_slot, save_single_slot
+from retorno.model.ship_layout import apply_retorno_canonical_layout
+from retorno.model.os import FSNode, FSNodeType
+
+
+def _reference(state):
+    clone = pickle.loads(pickle.dumps(state))
+    apply_retorno_canonical_layout(clone)
+    return clone
+
+
+def _last_record(slot_path: Path) -> dict:
+    checksum = slot_path.read_bytes().split(b"\n", 2)[1]
+    records, _ = _read_delta_log(Path(str(slot_path) + ".delta"), checksum)
+    return pickle.loads(records[-1])
+
+
+def _advance(engine: Engine, state, seconds: int) -> None:
+    for _ in range(seconds):
+        engine.tick(state, 1.0)
+
+
+def main() -> None:
+    engine = Engine()
+    original_records = Balance.SAVE_DELTA_COMPACT_RECORDS
+    original_ratio = Balance.SAVE_DELTA_COMPACT_RATIO
+    original_assert = Balance.STATE_VERSIONS_DEBUG_ASSERT
+    # Skipped sections are re-pickled and checked against the last save.
+    Balance.STATE_VERSIONS_DEBUG_ASSERT = True
+    # This state is small enough that the size ratio would compact almost every time.
+    Balance.SAVE_DELTA_COMPACT_RATIO = 100.0
+    with TemporaryDirectory() as tmp_dir:
+        slot_path = (Path(tmp_dir) / "slot.dat").resolve()
+        delta_path = Path(str(slot_path) + ".delta")
+        state = create_initial_state_prologue()
+        save_single_slot(state, slot_path)
+        base_size = slot_path.stat().st_size
+
+        snapshots = []
+        engine.apply_action(state, DroneDeploy(drone_id="D1", sector_id="PWR-A2"))
+        _advance(engine, state, 5)
+        append_save_delta(state, slot_path)
+        snapshots.append(_reference(state))
+        record = _last_record(slot_path)
+        assert {"meta", "os"}.isdisjoint(record["sections"]), sorted(record["sections"])
+        assert "fs" not in record["keyed"], "Unchanged fs entries must not be rewritten"
+
+        state.os.fs["/logs/delta_test.txt"] = FSNode(path="/logs/delta_test.txt", node_type=FSNodeType.FILE, content="x")
+        bump_versions(state, "fs")
+        _advance(engine, state, 30)
+        append_save_delta(state, slot_path)
+        snapshots.append(_reference(state))
+        assert list(_last_record(slot_path)["keyed"]["fs"]["set"]) == ["/logs/delta_test.txt"]
+        del state.os.fs["/logs/delta_test.txt"]
+        bump_versions(state, "fs")
+        _advance(engine, state, 3)
+        append_save_delta(state, slot_path)
+        snapshots.append(_reference(state))
+        assert slot_path.stat().st_size == base_size, "Deltas must not rewrite the base save"
+        # Sections whose version counters did not move since the last save are not pickled again.
+        idle = capture_save(state, slot_path)
+        assert {"world", "jobs"}.isdisjoint(idle.blobs) and not idle.keyed_blobs, sorted(idle.blobs)
+
+        loaded = load_single_slot(slot_path)
+        assert loaded is not None and loaded.source == "primary"
+        assert loaded.deltas_replayed == 3, loaded.deltas_replayed
+        assert loaded.state == snapshots[-1], "Replayed deltas must rebuild the saved state"
+        assert "/logs/delta_test.txt" not in loaded.state.os.fs
+
+        # A crash mid-append leaves a torn record; replay keeps the ones before it.
+        raw = delta_path.read_bytes()
+        delta_path.write_bytes(raw[:-7])
+        torn = load_single_slot(slot_path)
+        assert torn is not None and torn.deltas_replayed == 2
+        assert torn.state == snapshots[1]
+        # The loaded state resumes with a fresh base instead of appending after the tear.
+        _advance(engine, torn.state, 2)
+        append_save_delta(torn.state, slot_path)
+        assert not delta_path.exists()
+        backup = Path(str(slot_path) + ".bak")
+        assert Path(str(backup) + ".delta").exists(), "The backup keeps its delta log"
+        resumed = load_single_slot(slot_path)
+        assert resumed is not None and resumed.deltas_replayed == 0 and resumed.state == _reference(torn.state)
+
+        # Loaded states keep appending; the log folds into a new base past the record cap.
+        Balance.SAVE_DELTA_COMPACT_RECORDS = 2
+        try:
+            state = resumed.state
+            for step in range(3):
+                _advance(engine, state, 4)
+                append_save_delta(state, slot_path)
+                assert delta_path.exists() == (step < 2), step
+            final = _reference(state)
+        finally:
+            Balance.SAVE_DELTA_COMPACT_RECORDS = original_records
+            Balance.SAVE_DELTA_COMPACT_RATIO = original_ratio
+            Balance.STATE_VERSIONS_DEBUG_ASSERT = original_assert
+
+        # The backup base plus its log is the state before compaction.
+        slot_path.write_bytes(b"garbage")
+        recovered = load_single_slot(slot_path)
+        assert recovered is not None and recovered.source == "backup" and recovered.deltas_replayed == 2
+        assert recovered.state.clock.t == final.clock.t - 4.0
+    print("SAVE DELTA SMOKE PASSED")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import copy
+
+import retorno.worldgen.generator as generator
+from retorno.bootstrap import create_initial_state_prologue
+from retorno.model.world import sector_id_for_pos
+
+
+def _snapshot(state) -> tuple:
+    return (
+        sorted(state.world.generated_sectors),
+        sorted(state.world.space.nodes),
+        sorted((node_id, sorted(node.links)) for node_id, node in state.world.space.nodes.items()),
+        sorted(state.world.intersector_link_pairs),
+    )
+
+
+def main() -> None:
+    state = create_initial_state_prologue()
+    sector_id = sector_id_for_pos(25.0, 5.0, 0.0)
+    generator.ensure_sector_generated(state, sector_id)
+    # Settle the whole neighborhood so the centre cluster is fully linked.
+    for neighbor_id in generator._neighbor_sector_ids_2d(sector_id, radius=1, include_self=False):
+        generator.ensure_sector_generated(state, neighbor_id)
+    before = _snapshot(state)
+    reference = copy.deepcopy(state)
+
+    generator.reset_sector_cluster_stats()
+    original_loader = generator.load_worldgen_templates
+
+    def _fail_loader():
+        raise AssertionError("settled cluster must not reload templates")
+
+    generator.load_worldgen_templates = _fail_loader
+    try:
+        for _ in range(5):
+            generator.ensure_sector_generated(state, sector_id)
+    finally:
+        generator.load_worldgen_templates = original_loader
+
+    stats = generator.sector_cluster_stats()
+    assert stats == {"fast_path": 5, "full_pass": 0}, stats
+    assert sector_id in state.world.settled_sectors
+    assert _snapshot(state) == before
+
+    # The full pass on an equal copy changes nothing either.
+    generator._ensure_sector_cluster_generated(reference, [sector_id])
+    assert _snapshot(reference) == before
+
+    # An edge sector still has ungenerated neighbours and takes the full pass.
+    edge_id = generator._neighbor_sector_ids_2d(sector_id, radius=2, include_self=False)[0]
+    generator.ensure_sector_generated(state, edge_id)
+    assert generator.sector_cluster_stats()["full_pass"] == 1
+    print("SECTOR CLUSTER FAST PATH SMOKE PASSED")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import pickle
+
+from retorno.bootstrap import create_initial_state_prologue
+from retorno.config.balance import Balance
+from retorno.model.world import SpaceNode, sector_id_for_pos
+from retorno.worldgen.generator import _existing_sector_signature, ensure_sector_generated, sync_sector_state_for_node
+
+
+def _brute_sector_ids(state, sector_id: str) -> list[str]:
+    return sorted(
+        node_id
+        for node_id, node in state.world.space.nodes.items()
+        if sector_id_for_pos(node.x_ly, node.y_ly, node.z_ly) == sector_id
+    )
+
+
+def _assert_generation_keeps_membership(state) -> list[str]:
+    sector_ids = [sector_id_for_pos(x * 10.0 + 5.0, 5.0, 0.0) for x in range(-3, 4)]
+    for sector_id in sector_ids:
+        ensure_sector_generated(state, sector_id)
+    assert not state.world.sector_membership_issues(), state.world.sector_membership_issues()
+    for sector_id in state.world.sector_states:
+        assert state.world.sector_node_ids(sector_id) == _brute_sector_ids(state, sector_id), sector_id
+    return sector_ids
+
+
+def _assert_insert_and_remove(state, sector_id: str) -> None:
+    from retorno.core.exploration_recovery import _drop_hidden_node
+
+    x = float(sector_id[1:].split("_")[0]) * 10.0 + 1.25
+    node = SpaceNode(node_id="MEMBER_TEST", name="Member Test", kind="derelict", x_ly=x, y_ly=1.25, z_ly=0.0)
+    state.world.space.nodes[node.node_id] = node
+    assert state.world.node_sector_id(node.node_id) == sector_id
+    sync_sector_state_for_node(state, node.node_id)
+    assert node.node_id in state.world.sector_states[sector_id].node_ids
+    assert not state.world.sector_membership_issues()
+
+    _drop_hidden_node(state, node.node_id)
+    assert node.node_id not in state.world.sector_states[sector_id].node_ids
+    assert state.world.node_sector_id(node.node_id) is None
+    assert not state.world.sector_membership_issues()
+
+
+def _assert_nav_point_in_worldgen_view(state) -> None:
+    # Worldgen inputs still see the nav point; stored membership does not.
+    sector_id = sector_id_for_pos(95.0, 95.0, 0.0)
+    assert sector_id not in state.world.sector_states
+    tmp = SpaceNode(node_id="NAV_PT_TEST", name="Nav Point", kind="transit", x_ly=95.0, y_ly=95.0, z_ly=0.0)
+    state.world.space.nodes[tmp.node_id] = tmp
+    state.world.active_tmp_node_id = tmp.node_id
+    assert _existing_sector_signature(state, sector_id) == (("transit", False),)
+    ensure_sector_generated(state, sector_id)
+    assert tmp.node_id not in state.world.sector_states[sector_id].node_ids
+    assert ("transit", False) in _existing_sector_signature(state, sector_id)
+    assert not state.world.sector_membership_issues()
+
+
+def _assert_save_migration(state, sector_id: str) -> None:
+    # Older saves could carry partial node lists; loading rebuilds them.
+    expected = list(state.world.sector_states[sector_id].node_ids)
+    assert expected
+    state.world.sector_states[sector_id].node_ids = expected[:-1]
+    assert state.world.sector_membership_issues()
+    loaded = pickle.loads(pickle.dumps(state))
+    assert loaded.world.sector_states[sector_id].node_ids == expected
+    assert not loaded.world.sector_membership_issues()
+
+
+def main() -> None:
+    original = Balance.SECTOR_MEMBERSHIP_DEBUG_ASSERT
+    Balance.SECTOR_MEMBERSHIP_DEBUG_ASSERT = True
+    try:
+        state = create_initial_state_prologue()
+        sector_ids = _assert_generation_keeps_membership(state)
+        populated = next(sector_id for sector_id in sector_ids if state.world.sector_node_ids(sector_id))
+        _assert_insert_and_remove(state, populated)
+        _assert_nav_point_in_worldgen_view(state)
+        _assert_save_migration(state, populated)
+    finally:
+        Balance.SECTOR_MEMBERSHIP_DEBUG_ASSERT = original
+    print("SECTOR MEMBERSHIP SMOKE PASSED")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import copy
+import math
+import pickle
+import random
+
+from retorno.model.world import NodeMap, SpaceGraph, SpaceNode, sector_id_for_pos
+
+
+def _random_graph(seed: int, count: int) -> SpaceGraph:
+    rng = random.Random(seed)
+    graph = SpaceGraph()
+    for idx in range(count):
+        graph.nodes[f"N{idx:03d}"] = SpaceNode(
+            node_id=f"N{idx:03d}",
+            name=f"Node {idx}",
+            kind="derelict",
+            x_ly=rng.uniform(-40.0, 40.0),
+            y_ly=rng.uniform(-40.0, 40.0),
+            z_ly=rng.uniform(-4.0, 4.0),
+        )
+    return graph
+
+
+def _dist(node: SpaceNode, pos: tuple[float, float, float]) -> float:
+    return math.sqrt((node.x_ly - pos[0]) ** 2 + (node.y_ly - pos[1]) ** 2 + (node.z_ly - pos[2]) ** 2)
+
+
+def _brute_within(graph: SpaceGraph, pos, radius: float) -> list[str]:
+    return [node_id for node_id, node in graph.nodes.items() if _dist(node, pos) <= radius]
+
+
+def _assert_queries_match_brute_force(graph: SpaceGraph) -> None:
+    rng = random.Random(7)
+    for _ in range(50):
+        pos = (rng.uniform(-45.0, 45.0), rng.uniform(-45.0, 45.0), rng.uniform(-5.0, 5.0))
+        radius = rng.uniform(0.5, 25.0)
+        assert graph.nodes_within(pos, radius) == _brute_within(graph, pos, radius)
+
+        k = rng.randint(1, 8)
+        brute = sorted((_dist(node, pos), node_id) for node_id, node in graph.nodes.items())[:k]
+        got = graph.nearest_nodes(pos, k)
+        assert [node_id for _, node_id in got] == [node_id for _, node_id in brute], (got, brute)
+        capped = graph.nearest_nodes(pos, k, max_radius_ly=radius)
+        assert capped == [item for item in got if item[0] <= radius]
+
+    for node_id, node in graph.nodes.items():
+        sector_id = sector_id_for_pos(node.x_ly, node.y_ly, node.z_ly)
+        expected = [
+            other_id
+            for other_id, other in graph.nodes.items()
+            if sector_id_for_pos(other.x_ly, other.y_ly, other.z_ly) == sector_id
+        ]
+        assert graph.sector_node_ids(sector_id) == expected, sector_id
+
+
+def _assert_nearest_reaches_far_cells(graph: SpaceGraph) -> None:
+    # Shells past the grid's size switch to one pass over the occupied cells.
+    far = SpaceNode(node_id="FAR", name="Far", kind="relay", x_ly=2000.0, y_ly=-900.0, z_ly=50.0)
+    graph.nodes["FAR"] = far
+    for pos, k in (((0.0, 0.0, 0.0), len(graph.nodes)), ((2500.0, 0.0, 0.0), 3), ((1990.0, -900.0, 50.0), 1)):
+        brute = sorted((_dist(node, pos), node_id) for node_id, node in graph.nodes.items())[:k]
+        got = graph.nearest_nodes(pos, k)
+        assert [node_id for _, node_id in got] == [node_id for _, node_id in brute], (pos, got[:3], brute[:3])
+        for radius in (5.0, 15.0, 600.0):
+            capped = graph.nearest_nodes(pos, k, max_radius_ly=radius)
+            assert capped == [item for item in got if item[0] <= radius], (pos, radius)
+    del graph.nodes["FAR"]
+
+
+def _assert_index_follows_writes(graph: SpaceGraph) -> None:
+    first_id = next(iter(graph.nodes))
+    first = graph.nodes[first_id]
+    pos = (first.x_ly, first.y_ly, first.z_ly)
+    assert first_id in graph.nodes_within(pos, 0.0)
+
+    del graph.nodes[first_id]
+    assert first_id not in graph.nodes_within(pos, 0.0)
+    graph.nodes[first_id] = first
+    assert first_id in graph.nodes_within(pos, 0.0)
+    graph.nodes.pop(first_id)
+    assert first_id not in graph.nodes_within(pos, 0.0)
+
+    moved = SpaceNode(node_id=first_id, name="Moved", kind="station", x_ly=300.0, y_ly=0.0, z_ly=0.0)
+    graph.nodes[first_id] = first
+    graph.nodes[first_id] = moved
+    assert first_id not in graph.nodes_within(pos, 0.0)
+    assert graph.nodes_within((300.0, 0.0, 0.0), 0.5) == [first_id]
+    assert len(graph.spatial_index()) == len(graph.nodes)
+
+
+def _assert_copies_and_saves_keep_index(graph: SpaceGraph) -> None:
+    pos = (0.0, 0.0, 0.0)
+    expected = graph.nodes_within(pos, 20.0)
+    for clone in (pickle.loads(pickle.dumps(graph)), copy.deepcopy(graph)):
+        assert isinstance(clone.nodes, NodeMap)
+        assert clone.nodes_within(pos, 20.0) == expected
+
+    # Saves written before the index existed store `nodes` as a plain dict.
+    legacy = SpaceGraph.__new__(SpaceGraph)
+    legacy.__setstate__((None, {"nodes": dict(graph.nodes), "edges": {}}))
+    assert isinstance(legacy.nodes, NodeMap)
+    assert legacy.nodes_within(pos, 20.0) == expected
+
+    # Tests and tools sometimes assign a plain dict directly.
+    graph.nodes = dict(graph.nodes)
+    assert graph.nodes_within(pos, 20.0) == expected
+
+
+def main() -> None:
+    graph = _random_graph(seed=1234, count=400)
+    _assert_queries_match_brute_force(graph)
+    _assert_nearest_reaches_far_cells(graph)
+    _assert_index_follows_writes(graph)
+    _assert_copies_and_saves_keep_index(graph)
+    print("SPATIAL INDEX SMOKE PASSED")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import pickle
+
+from retorno.bootstrap import create_initial_state_sandbox
+from retorno.cli import repl
+from retorno.config.balance import Balance
+from retorno.core.actions import Dock, RouteSolve, Scan, Travel
+from retorno.core.engine import Engine
+from retorno.core.exploration_recovery import has_exploration_frontier
+from retorno.core.gamestate import GameState
+from retorno.core.lore import recompute_all_node_completion
+from retorno.model.world import ExplorationRecoveryState, SpaceNode
+from retorno.core.versions import VERSION_PARTS, memoize_on_versions, versions_stamp
+from retorno.runtime.loop import GameLoop
+from retorno.ui_textual import presenter
+
+_CALLS: list[tuple[str, ...]] = []
+
+
+@memoize_on_versions("links", extra=lambda state: state.os.locale.value)
+def _counted_view(state, *args) -> tuple[str, ...]:
+    _CALLS.append(args)
+    return tuple(sorted(state.world.known_links))
+
+
+def _assert_memo_helper() -> None:
+    state = create_initial_state_sandbox()
+    first = _counted_view(state, "a")
+    assert _counted_view(state, "a") is first
+    _counted_view(state, "b")
+    assert _CALLS == [("a",), ("b",)]
+    state.versions.world += 1
+    assert _counted_view(state, "a") is first
+    state.versions.links += 1
+    _counted_view(state, "a")
+    assert len(_CALLS) == 3
+
+    # Memo tables never reach a save; counters do, and old saves default them.
+    clone = pickle.loads(pickle.dumps(state))
+    assert not clone.versions.memo and clone.versions.links == state.versions.links
+    legacy = GameState.__new__(GameState)
+    slots = dict(clone.__getstate__()[1])
+    slots.pop("versions")
+    legacy.__setstate__((None, slots))
+    assert versions_stamp(legacy, VERSION_PARTS) == (0,) * len(VERSION_PARTS)
+
+
+def _assert_bump_points() -> None:
+    state = create_initial_state_sandbox()
+    loop = GameLoop(Engine(), state)
+    before = versions_stamp(state, VERSION_PARTS)
+    with loop.with_lock(read_only=True):
+        pass
+    assert versions_stamp(state, VERSION_PARTS) == before
+    with loop.with_lock():
+        pass
+    assert all(after > old for after, old in zip(versions_stamp(state, VERSION_PARTS), before))
+
+    idle = versions_stamp(state, ("links", "fs"))
+    systems = state.versions.systems
+    loop.step(1.0)
+    assert state.versions.systems > systems
+    assert versions_stamp(state, ("links", "fs")) == idle
+
+
+def _views(state) -> None:
+    has_exploration_frontier(state)
+    recompute_all_node_completion(state)
+    repl._collect_known_contact_entries(state)
+    repl._known_contact_ids_for_completion(state)
+    repl._route_solve_targets_for_completion(state)
+    repl._travel_targets_for_completion(state)
+    presenter.build_panel_model(state)
+
+
+def _blocked_state():
+    state = create_initial_state_sandbox()
+    anchor = SpaceNode(node_id="RECOVERY_ANCHOR_TEST", name="Recovery Anchor", kind="derelict", region="disk", x_ly=0.0, y_ly=0.0, z_ly=0.0, is_hub=True, is_topology_hub=True)
+    world = state.world
+    world.space.nodes = {anchor.node_id: anchor}
+    world.current_node_id = state.ship.current_node_id = anchor.node_id
+    world.current_pos_ly = (0.0, 0.0, 0.0)
+    state.ship.docked_node_id = None
+    state.ship.cruise_speed_ly_per_year = 1000.0
+    world.known_nodes = {anchor.node_id}
+    world.known_contacts = {anchor.node_id}
+    world.known_intel = {}
+    world.known_links = {anchor.node_id: set()}
+    world.visited_nodes = {anchor.node_id}
+    world.forced_hidden_nodes = set()
+    world.generated_sectors = set()
+    world.sector_states = {}
+    world.intersector_link_pairs = set()
+    world.node_pools = {}
+    world.dead_nodes = {}
+    world.exploration_recovery = ExplorationRecoveryState()
+    return state
+
+
+def _run_until_idle(engine: Engine, state) -> None:
+    while state.jobs.active_job_ids or state.ship.in_transit:
+        if state.ship.in_transit:
+            remaining = state.ship.arrival_t - state.clock.t
+        else:
+            remaining = max(float(state.jobs.jobs[job_id].eta_s) for job_id in state.jobs.active_job_ids)
+        # A few steps per job or leg, each followed by cross-checked reads.
+        engine.tick(state, max(1.0, remaining / 4.0 + 0.5))
+        _views(state)
+        _views(state)
+
+
+def _assert_views_stay_fresh() -> None:
+    """Drive scan, intel import, route solve, travel and dock with every memo hit cross-checked."""
+    engine = Engine()
+    state = create_initial_state_sandbox()
+    engine.apply_action(state, Scan())
+    for step in range(600):
+        engine.tick(state, 1.0)
+        _views(state)
+        _views(state)
+        if step % 100 == 99:
+            engine.apply_action(state, Scan())
+
+    state = _blocked_state()
+    _views(state)
+    assert repl.ensure_exploration_recovery(state, "scan")
+    _views(state)
+    recovery = state.world.exploration_recovery
+    entry_id = recovery.entry_node_id
+    repl._auto_import_intel_from_text(state, state.os.fs[recovery.passive_hint_path].content, recovery.passive_hint_path)
+    _views(state)
+    assert entry_id in repl._known_contact_ids_for_completion(state)
+    engine.apply_action(state, RouteSolve(node_id=entry_id))
+    _run_until_idle(engine, state)
+    assert entry_id in repl._travel_targets_for_completion(state)
+    engine.apply_action(state, Travel(node_id=entry_id))
+    _run_until_idle(engine, state)
+    assert state.world.current_node_id == entry_id
+    engine.apply_action(state, Dock(node_id=entry_id))
+    _run_until_idle(engine, state)
+    assert recovery.dock_hint_path in state.os.fs
+    repl._auto_import_intel_from_text(state, state.os.fs[recovery.dock_hint_path].content, recovery.dock_hint_path)
+    _views(state)
+    assert recovery.gateway_node_id in repl._travel_targets_for_completion(state)
+
+
+def main() -> None:
+    _assert_memo_helper()
+    original = Balance.STATE_VERSIONS_DEBUG_ASSERT
+    Balance.STATE_VERSIONS_DEBUG_ASSERT = True
+    try:
+        _assert_bump_points()
+        _assert_views_stay_fresh()
+    finally:
+        Balance.STATE_VERSIONS_DEBUG_ASSERT = original
+    print("STATE VERSIONS SMOKE PASSED")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 
+from retorno.core.versions import bump_all_versions
 from retorno.ui_textual.app import RetornoTextualApp
 from retorno.model.systems import SystemState
 from retorno.model.world import SpaceNode, add_known_link, region_for_pos
@@ -107,6 +108,8 @@ def main() -> None:
         state.world.known_nodes = {"ECHO_7", "UNKNOWN"}
         state.world.known_contacts = {"ECHO_7", "UNKNOWN"}
         state.world.known_links = {"UNKNOWN": {"ECHO_7"}}
+        # Direct writes bypass the engine, so invalidate memoized views by hand.
+        bump_all_versions(state)
 
         route_unknown_origin_candidates = set(app._get_completion_candidates(state, "route solve ", ""))
         assert route_unknown_origin_candidates == set(), route_unknown_origin_candidates
@@ -0,0 +1,37 @@
+"""Wall time to create node pools after a scan reveals a large known map.
+
+Run with `PYTHONPATH=src python tests/uplink_route_pool_bench.py [radius]`. Sectors
+within `radius` of the origin are generated, every node becomes a known
+contact, and one `sync_node_pools_for_known_nodes` call builds a pool (with
+its uplink route pool) for each of them.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from retorno.bootstrap import create_initial_state_sandbox
+from retorno.core import lore
+from retorno.worldgen.generator import ensure_sector_generated
+
+
+def main() -> None:
+    radius = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    state = create_initial_state_sandbox()
+    lore.sync_node_pools_for_known_nodes(state)
+    for sx in range(-radius, radius + 1):
+        for sy in range(-radius, radius + 1):
+            ensure_sector_generated(state, f"S{sx:+04d}_{sy:+04d}_+000")
+    state.world.known_nodes |= set(state.world.space.nodes)
+    state.world.known_contacts |= set(state.world.space.nodes)
+    new_pools = len(state.world.known_contacts - set(state.world.node_pools))
+    started = time.perf_counter()
+    lore.sync_node_pools_for_known_nodes(state)
+    elapsed = time.perf_counter() - started
+    hubs = sum(1 for pool in state.world.node_pools.values() if pool.uplink_route_pool)
+    print(f"nodes={len(state.world.space.nodes)} new_pools={new_pools} with_routes={hubs}: {elapsed * 1000.0:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from retorno.bootstrap import create_initial_state_sandbox
+from retorno.core import lore
+from retorno.model.world import SpaceNode, sector_id_for_pos
+from retorno.worldgen.generator import ensure_sector_generated
+
+
+def _reference_weights(state, node_id: str) -> dict[str, int]:
+    # The full known/space scan that built uplink candidates before the index.
+    node = state.world.space.nodes[node_id]
+    current = sector_id_for_pos(node.x_ly, node.y_ly, node.z_ly)
+    sx, sy, sz = lore._parse_sector_id(current)
+    neighbors = {f"S{sx+dx:+04d}_{sy+dy:+04d}_{sz:+04d}" for dx in (-1, 0, 1) for dy in (-1, 0, 1)}
+    excluded = set(state.world.known_links.get(node_id, set())) | lore._locked_primary_targets(state) | {node_id}
+    authored = lore._location_node_ids()
+    out: dict[str, int] = {}
+
+    def add(nid: str, weight: int) -> None:
+        if not lore._is_hidden_origin_placeholder(nid) and nid not in excluded and weight > out.get(nid, 0):
+            out[nid] = weight
+
+    for nid in state.world.known_nodes:
+        n = state.world.space.nodes.get(nid)
+        add(nid, 10 if n and n.is_hub else 2 if n and n.kind in {"ship", "derelict"} else 1)
+    for nid, n in state.world.space.nodes.items():
+        sid = sector_id_for_pos(n.x_ly, n.y_ly, n.z_ly)
+        if n.is_hub and sid == current:
+            add(nid, 6)
+        if n.is_hub and sid in neighbors:
+            add(nid, 5)
+        if n.kind == "derelict":
+            add(nid, 1)
+        if nid not in authored and n.kind in {"relay", "station", "waystation"} and sid in neighbors:
+            add(nid, 4)
+    return out
+
+
+def _indexed_weights(state, node_id: str) -> dict[str, int]:
+    captured: list[list[tuple[str, int]]] = []
+    original = lore._merge_uplink_candidates
+
+    def capture(*args):
+        merged = original(*args)
+        captured.append(merged)
+        return merged
+
+    lore._merge_uplink_candidates = capture
+    try:
+        lore._precompute_uplink_route_pool_for_node(state, node_id)
+    finally:
+        lore._merge_uplink_candidates = original
+    assert captured[0] == sorted(captured[0])
+    return dict(captured[0])
+
+
+def _assert_node_map_index() -> None:
+    state = create_initial_state_sandbox()
+    nodes = state.world.space.nodes
+    derelicts = {nid for nid, n in nodes.items() if n.kind == "derelict"}
+    assert state.world.space.node_ids_of_kind("derelict") == derelicts
+    revision = nodes.revision
+    wreck = SpaceNode(node_id="WRECK_TEST", name="Wreck", kind="derelict", x_ly=1.0)
+    nodes["WRECK_TEST"] = wreck
+    assert "WRECK_TEST" in state.world.space.node_ids_of_kind("derelict") and nodes.revision > revision
+    nodes["WRECK_TEST"] = SpaceNode(node_id="WRECK_TEST", name="Relay", kind="relay", x_ly=1.0)
+    assert "WRECK_TEST" not in state.world.space.node_ids_of_kind("derelict")
+    assert "WRECK_TEST" in state.world.space.node_ids_of_kind("relay")
+    nodes.pop("WRECK_TEST")
+    assert "WRECK_TEST" not in state.world.space.node_ids_of_kind("relay")
+    assert nodes.copy().by_kind == nodes.by_kind
+
+
+def main() -> None:
+    _assert_node_map_index()
+
+    state = create_initial_state_sandbox()
+    for sx in range(-3, 4):
+        for sy in range(-3, 4):
+            ensure_sector_generated(state, f"S{sx:+04d}_{sy:+04d}_+000")
+    nodes = state.world.space.nodes
+    hubs = sorted(nid for nid, n in nodes.items() if n.kind in {"relay", "station", "waystation"})
+    known = sorted(nodes)[::2]
+    state.world.known_nodes |= set(known)
+    checked = 0
+    for node_id in hubs[::3]:
+        assert _indexed_weights(state, node_id) == _reference_weights(state, node_id), node_id
+        checked += 1
+    assert checked >= 5
+
+    # Any write to known_nodes invalidates the shared base table, without a
+    # world version bump and even when the known set keeps its size.
+    node_id = hubs[0]
+    swapped_out = known[0]
+    swapped_in = next(nid for nid in hubs if nid not in state.world.known_nodes)
+    state.world.known_nodes.discard(swapped_out)
+    state.world.known_nodes.add(swapped_in)
+    assert _indexed_weights(state, node_id) == _reference_weights(state, node_id)
+    state.world.known_nodes |= set(nodes)
+    assert _indexed_weights(state, node_id) == _reference_weights(state, node_id)
+    # A plain set assigned by a caller is re-wrapped and counted from then on.
+    state.world.known_nodes = set(known)
+    assert _indexed_weights(state, node_id) == _reference_weights(state, node_id)
+    state.world.known_nodes.add(swapped_out)
+    assert _indexed_weights(state, node_id) == _reference_weights(state, node_id)
+    assert lore._precompute_uplink_route_pool_for_node(state, node_id) == lore._precompute_uplink_route_pool_for_node(state, node_id)
+    print("UPLINK ROUTE POOL SMOKE PASSED")
+
+
+if __name__ == "__main__":
+    main()
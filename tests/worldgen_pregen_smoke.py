@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import copy
+import dataclasses
+import io
+from contextlib import redirect_stdout
+
+import retorno.worldgen.generator as generator
+from retorno.bootstrap import create_initial_state_prologue
+from retorno.cli import repl
+from retorno.cli.parser import parse_command
+from retorno.model.world import SpaceNode, sector_id_for_pos
+
+
+def _canonical(value):
+    if isinstance(value, (set, frozenset)):
+        return sorted(_canonical(item) for item in value)
+    if isinstance(value, dict):
+        return [(key, _canonical(item)) for key, item in value.items()]
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    if dataclasses.is_dataclass(value):
+        return [(f.name, _canonical(getattr(value, f.name))) for f in dataclasses.fields(value)]
+    return value
+
+
+def _world_bytes(state) -> bytes:
+    # Worker-built nodes do not share string objects with the main process, so
+    # compare a canonical dump rather than raw pickle memo layout.
+    world = state.world
+    return repr(
+        _canonical(
+            (
+                world.space.nodes,
+                sorted(world.generated_sectors),
+                sorted(world.sector_states.items()),
+                world.intersector_link_pairs,
+                world.sparse_guardrail_done,
+            )
+        )
+    ).encode("utf-8")
+
+
+def _lazy(state, center: str, radius: int) -> None:
+    for sector_id in generator.pregen_sector_order(center, radius):
+        generator.ensure_sector_generated(state, sector_id)
+
+
+def _assert_matches_lazy(state, center: str, radius: int, workers: int) -> None:
+    lazy = copy.deepcopy(state)
+    _lazy(lazy, center, radius)
+    generated = generator.pregenerate_sectors(state, center, radius, workers=workers)
+    assert generated, "pregen should materialize new sectors"
+    assert _world_bytes(state) == _world_bytes(lazy)
+
+
+def _plan_inputs(state, sector_id: str):
+    region = generator.region_for_pos(*generator._sector_center(sector_id))
+    return generator._SectorPlanInputs(
+        seed=state.meta.rng_seed,
+        sector_id=sector_id,
+        archetype=generator._select_archetype(state, sector_id, region, generator.load_worldgen_templates()),
+        sector_region=region,
+        existing=(),
+        force_playable_hub=False,
+    )
+
+
+def _assert_collision_falls_back() -> None:
+    state = create_initial_state_prologue()
+    center = sector_id_for_pos(55.0, 55.0, 0.0)
+    planned = next(
+        nodes
+        for nodes in (
+            generator._plan_sector_nodes(_plan_inputs(state, sector_id))
+            for sector_id in generator.pregen_sector_order(center, 1)
+        )
+        if nodes
+    )
+    planned_id = planned[0].node_id
+    # Occupy the planned id elsewhere so the merge has to rebuild that node serially.
+    state.world.space.nodes[planned_id] = SpaceNode(
+        node_id=planned_id, name="Squatter", kind="derelict", x_ly=-500.0, y_ly=-500.0, z_ly=0.0
+    )
+    _assert_matches_lazy(state, center, 1, workers=1)
+    assert state.world.space.nodes[planned_id].name == "Squatter"
+
+
+def main() -> None:
+    state = create_initial_state_prologue()
+    center = sector_id_for_pos(*state.world.current_pos_ly)
+    _assert_matches_lazy(state, center, 2, workers=2)
+    _assert_collision_falls_back()
+
+    assert parse_command("debug worldgen pregen 1") == ("DEBUG_WORLDGEN_PREGEN", 1)
+    fresh = create_initial_state_prologue()
+    out = io.StringIO()
+    with redirect_stdout(out):
+        repl.render_debug_worldgen_pregen(fresh, 1)
+    assert "generated_sectors:" in out.getvalue(), out.getvalue()
+    print("WORLDGEN PREGEN SMOKE PASSED")
+
+
+if __name__ == "__main__":
+    main()